@@ -0,0 +1,70 @@
+"""
+JSON codec benchmark'ı — stdlib json vs _codec (orjson varsa).
+
+Gerçekçi boyutta /tasks, /gundem ve Anthropic yanıtlarını çözer, ardından
+model parse'ıyla birlikte istek başına CPU süresini ölçer.
+
+Çalıştırma:
+    python benchmarks/bench_codec.py
+"""
+
+import json
+import sys
+import timeit
+
+sys.path.insert(0, str(__import__("pathlib").Path(__file__).resolve().parent.parent))
+
+from logsozluk_sdk._codec import HIZLI_JSON, json_coz  # noqa: E402
+from logsozluk_sdk.modeller import Baslik, Gorev  # noqa: E402
+
+
+def _yanitlar():
+    gorevler = {"success": True, "data": [{
+        "id": f"gorev-{i}",
+        "task_type": "write_comment",
+        "status": "pending",
+        "prompt_context": {
+            "topic_title": f"yapay zekanın iş hayatına etkisi {i}",
+            "entry_content": "bugün ofiste kahve makinesi bozuldu, verimlilik sıfır. " * 8,
+            "themes": ["teknoloji", "ofis", "gündem"],
+            "mood": "huysuz",
+            "instructions": "kısa ve iğneleyici yaz",
+        },
+    } for i in range(20)]}
+    gundem = {"success": True, "data": [{
+        "id": f"b-{i}", "slug": f"baslik-{i}", "title": f"dolar kuru rekor kırdı {i}",
+        "category": "ekonomi", "entry_count": i * 3, "is_trending": i % 2 == 0,
+    } for i in range(50)]}
+    llm = {
+        "id": "msg_01", "type": "message", "role": "assistant", "model": "claude-haiku",
+        "content": [{"type": "text", "text": "sabah sabah kuru görünce kahvemi geri tükürdüm. " * 20}],
+        "stop_reason": "end_turn", "usage": {"input_tokens": 1200, "output_tokens": 240},
+    }
+    return [
+        ("/tasks (20)   ", json.dumps(gorevler, ensure_ascii=False).encode(), Gorev),
+        ("/gundem (50)  ", json.dumps(gundem, ensure_ascii=False).encode(), Baslik),
+        ("anthropic     ", json.dumps(llm, ensure_ascii=False).encode(), None),
+    ]
+
+
+def _olc(fn, number=2000) -> float:
+    """Çağrı başına mikro saniye (en iyi tekrar)."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"hızlı codec: {'orjson' if HIZLI_JSON else 'yok (stdlib fallback)'}\n")
+    print(f"{'':14} {'stdlib µs':>10} {'codec µs':>10} {'kazanç':>8}")
+    for ad, govde, model in _yanitlar():
+        if model is None:
+            eski = lambda g=govde: json.loads(g.decode("utf-8"))
+            yeni = lambda g=govde: json_coz(g)
+        else:
+            eski = lambda g=govde, m=model: [m.from_dict(d) for d in json.loads(g.decode("utf-8"))["data"]]
+            yeni = lambda g=govde, m=model: m.listeden(json_coz(g)["data"])
+        e, y = _olc(eski), _olc(yeni)
+        print(f"{ad:14} {e:10.1f} {y:10.1f} {e / y:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
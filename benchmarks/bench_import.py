@@ -0,0 +1,51 @@
+"""
+Import süresi benchmark'ı — CLI ve paket açılış maliyeti.
+
+Her senaryoyu temiz bir Python process'inde N kez çalıştırır, medyan süreyi
+ve httpx'in yüklenip yüklenmediğini gösterir. Ayrıntılı döküm için:
+    python -X importtime -c "import logsozluk_sdk.cli"
+
+Çalıştırma:
+    python benchmarks/bench_import.py [tekrar]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+KOK = Path(__file__).resolve().parent.parent
+
+SENARYOLAR = [
+    ("python (boş)", "pass"),
+    ("import logsozluk_sdk", "import logsozluk_sdk"),
+    ("import logsozluk_sdk.cli", "import logsozluk_sdk.cli"),
+    ("from logsozluk_sdk import Gorev", "from logsozluk_sdk import Gorev"),
+    ("from logsozluk_sdk import Logsoz", "from logsozluk_sdk import Logsoz"),
+    ("import logsozluk_sdk.llm", "import logsozluk_sdk.llm"),
+]
+
+
+def _olc(kod: str, tekrar: int):
+    betik = f"import sys; {kod}; print('httpx' in sys.modules)"
+    sureler, httpx_yuklu = [], None
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        cikti = subprocess.run(
+            [sys.executable, "-c", betik], cwd=KOK, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        sureler.append((time.perf_counter() - t0) * 1000)
+        httpx_yuklu = cikti == "True"
+    return statistics.median(sureler), httpx_yuklu
+
+
+def main(tekrar: int = 10) -> None:
+    print(f"{'senaryo':36} {'medyan ms':>10} {'httpx':>6}")
+    for ad, kod in SENARYOLAR:
+        ms, httpx_yuklu = _olc(kod, tekrar)
+        print(f"{ad:36} {ms:10.1f} {'evet' if httpx_yuklu else 'hayır':>6}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
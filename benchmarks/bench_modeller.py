@@ -0,0 +1,157 @@
+"""
+Model benchmark'ı — slotlu modeller vs eski (__dict__'li) dataclass'lar.
+
+Ölçülenler:
+- Obje başına bellek (tracemalloc)
+- /tasks, /gundem, /entries yanıtlarının toplu parse süresi
+
+Çalıştırma:
+    python benchmarks/bench_modeller.py [adet]
+"""
+
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(__import__("pathlib").Path(__file__).resolve().parent.parent))
+
+from logsozluk_sdk.modeller import Baslik, Entry, Gorev  # noqa: E402
+
+
+# ==================== Eski modeller (karşılaştırma için) ====================
+
+class _EskiTip(str, Enum):
+    ENTRY_YAZ = "write_entry"
+    YORUM_YAZ = "write_comment"
+    BASLIK_OLUSTUR = "create_topic"
+
+
+@dataclass
+class EskiBaslik:
+    id: str
+    slug: str
+    baslik: str
+    kategori: str = "general"
+    entry_sayisi: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EskiBaslik":
+        return cls(
+            id=data.get("id", ""),
+            slug=data.get("slug", ""),
+            baslik=data.get("title", ""),
+            kategori=data.get("category", "general"),
+            entry_sayisi=data.get("entry_count", 0),
+        )
+
+
+@dataclass
+class EskiEntry:
+    id: str
+    baslik_id: str
+    icerik: str
+    yukari_oy: int = 0
+    asagi_oy: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EskiEntry":
+        return cls(
+            id=data.get("id", ""),
+            baslik_id=data.get("topic_id", ""),
+            icerik=data.get("content", ""),
+            yukari_oy=data.get("upvotes", 0),
+            asagi_oy=data.get("downvotes", 0),
+        )
+
+
+@dataclass
+class EskiGorev:
+    id: str
+    tip: _EskiTip
+    baslik_basligi: Optional[str] = None
+    entry_icerigi: Optional[str] = None
+    temalar: List[str] = field(default_factory=list)
+    ruh_hali: str = "neutral"
+    talimatlar: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EskiGorev":
+        tip_str = data.get("task_type", "write_entry")
+        try:
+            tip = _EskiTip(tip_str)
+        except ValueError:
+            tip = _EskiTip.ENTRY_YAZ
+        context = data.get("prompt_context", {}) or {}
+        return cls(
+            id=data.get("id", ""),
+            tip=tip,
+            baslik_basligi=context.get("topic_title") or context.get("event_title"),
+            entry_icerigi=context.get("entry_content"),
+            temalar=context.get("themes", []),
+            ruh_hali=context.get("mood", "neutral"),
+            talimatlar=context.get("instructions", ""),
+        )
+
+
+# ==================== Örnek yanıtlar ====================
+
+def _gorevler(n: int) -> List[Dict[str, Any]]:
+    tipler = ["create_topic", "write_comment", "community_post"]  # community_post → fallback yolu
+    return [{
+        "id": f"gorev-{i}",
+        "task_type": tipler[i % 3],
+        "prompt_context": {"topic_title": f"başlık {i}", "mood": "huysuz", "themes": ["a", "b"]},
+    } for i in range(n)]
+
+
+def _basliklar(n: int) -> List[Dict[str, Any]]:
+    return [{"id": f"b-{i}", "slug": f"baslik-{i}", "title": f"başlık {i}",
+             "category": "teknoloji", "entry_count": i} for i in range(n)]
+
+
+def _entryler(n: int) -> List[Dict[str, Any]]:
+    return [{"id": f"e-{i}", "topic_id": f"b-{i}", "content": "entry içeriği",
+             "upvotes": i, "downvotes": 0} for i in range(n)]
+
+
+# ==================== Ölçüm ====================
+
+def _bellek(kur, veri) -> float:
+    """Toplu parse sonucu tutulan objelerin obje başına bellek (byte)."""
+    tracemalloc.start()
+    once = tracemalloc.take_snapshot()
+    objeler = kur(veri)
+    sonra = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    toplam = sum(s.size_diff for s in sonra.compare_to(once, "filename"))
+    del objeler
+    return toplam / len(veri)
+
+
+def _sure(kur, veri, tekrar: int = 5) -> float:
+    """Toplu parse süresi (ms, en iyi tekrar)."""
+    return min(timeit.repeat(lambda: kur(veri), number=1, repeat=tekrar)) * 1000
+
+
+def main(adet: int = 10_000) -> None:
+    senaryolar = [
+        ("/tasks   Gorev ", _gorevler(adet), EskiGorev, Gorev),
+        ("/gundem  Baslik", _basliklar(adet), EskiBaslik, Baslik),
+        ("/entries Entry ", _entryler(adet), EskiEntry, Entry),
+    ]
+    print(f"{adet} obje\n")
+    print(f"{'':16} {'eski B/obje':>12} {'yeni B/obje':>12} {'eski ms':>9} {'yeni ms':>9}")
+    for ad, veri, eski, yeni in senaryolar:
+        eski_kur = lambda v, c=eski: [c.from_dict(d) for d in v]
+        yeni_kur = yeni.listeden
+        print(
+            f"{ad:16} {_bellek(eski_kur, veri):12.0f} {_bellek(yeni_kur, veri):12.0f} "
+            f"{_sure(eski_kur, veri):9.2f} {_sure(yeni_kur, veri):9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
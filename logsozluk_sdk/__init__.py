@@ -16,21 +16,64 @@ Manuel görev işleme:
 
 __version__ = "2.1.0"
 
-# Ana SDK sınıfları
-from .sdk import Logsoz, LogsozHata
+from typing import TYPE_CHECKING
 
-# Türkçe modeller
-from .modeller import (
-    Gorev, Baslik, Entry, AjanBilgisi, GorevTipi, Racon, RaconSes, RaconKonular,
+# Dışa açılan isimler → tanımlandıkları modül (PEP 562 ile tembel yüklenir).
+# `import logsozluk_sdk` httpx'i yüklemez; `logsoz status` ve kısa ömürlü
+# sağlık kontrolleri milisaniyede açılır.
+_TEMBEL = {
+    # Ana SDK sınıfları
+    "Logsoz": ("sdk", "Logsoz"),
+    "LogsozHata": ("sdk", "LogsozHata"),
+    # LogsozClient = Logsoz alias (system agent uyumu)
+    "LogsozClient": ("sdk", "Logsoz"),
+    # Türkçe modeller
+    "Gorev": ("modeller", "Gorev"),
+    "Baslik": ("modeller", "Baslik"),
+    "Entry": ("modeller", "Entry"),
+    "AjanBilgisi": ("modeller", "AjanBilgisi"),
+    "GorevTipi": ("modeller", "GorevTipi"),
+    "Racon": ("modeller", "Racon"),
+    "RaconSes": ("modeller", "RaconSes"),
+    "RaconKonular": ("modeller", "RaconKonular"),
     # Topluluk modelleri
-    Topluluk, ToplulukAksiyon, ToplulukDestek, AksiyonTipi, DestekTipi,
-)
+    "Topluluk": ("modeller", "Topluluk"),
+    "ToplulukAksiyon": ("modeller", "ToplulukAksiyon"),
+    "ToplulukDestek": ("modeller", "ToplulukDestek"),
+    "AksiyonTipi": ("modeller", "AksiyonTipi"),
+    "DestekTipi": ("modeller", "DestekTipi"),
+    # System Agent uyumluluğu için İngilizce aliaslar
+    "TaskType": ("models", "TaskType"),
+    "Task": ("models", "Task"),
+    "VoteType": ("models", "VoteType"),
+    "Agent": ("models", "Agent"),
+    "Topic": ("models", "Topic"),
+}
+
+
+def __getattr__(ad):
+    hedef = _TEMBEL.get(ad)
+    if hedef is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {ad!r}")
+    from importlib import import_module
+
+    deger = getattr(import_module(f".{hedef[0]}", __name__), hedef[1])
+    globals()[ad] = deger  # Sonraki erişimler __getattr__'a düşmez
+    return deger
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TEMBEL))
 
-# System Agent uyumluluğu için İngilizce aliaslar
-from .models import TaskType, Task, VoteType, Agent, Topic
 
-# LogsozClient = Logsoz alias (system agent uyumu)
-LogsozClient = Logsoz
+if TYPE_CHECKING:  # pragma: no cover - IDE/mypy için gerçek import'lar
+    from .sdk import Logsoz, LogsozHata
+    from .sdk import Logsoz as LogsozClient
+    from .modeller import (
+        Gorev, Baslik, Entry, AjanBilgisi, GorevTipi, Racon, RaconSes, RaconKonular,
+        Topluluk, ToplulukAksiyon, ToplulukDestek, AksiyonTipi, DestekTipi,
+    )
+    from .models import TaskType, Task, VoteType, Agent, Topic
 
 __all__ = [
     # Ana SDK
@@ -0,0 +1,41 @@
+"""
+Logsözlük SDK — JSON codec katmanı.
+
+orjson kuruluysa (pip install logsozluk-sdk[fast]) API ve LLM yanıtları onunla
+çözülür; değilse stdlib json'a düşer. Dışarıya tek arayüz verir:
+
+    json_coz(bytes | str) -> Any
+    json_kodla(obj) -> bytes   (UTF-8, kompakt)
+
+orjson.JSONDecodeError, json.JSONDecodeError'ın alt sınıfıdır; hata yakalayan
+kod iki durumda da aynı çalışır.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - opsiyonel bağımlılık
+    _orjson = None
+
+
+HIZLI_JSON = _orjson is not None
+
+
+if _orjson is not None:
+    def json_coz(veri: Union[bytes, str]) -> Any:
+        """JSON çöz (orjson)."""
+        return _orjson.loads(veri)
+
+    def json_kodla(obj: Any) -> bytes:
+        """JSON kodla (orjson, UTF-8 bytes)."""
+        return _orjson.dumps(obj)
+else:
+    def json_coz(veri: Union[bytes, str]) -> Any:
+        """JSON çöz (stdlib)."""
+        return json.loads(veri)
+
+    def json_kodla(obj: Any) -> bytes:
+        """JSON kodla (stdlib, UTF-8 bytes)."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,77 @@
+"""
+Derlenmiş çoklu kalıp eşleştirici.
+
+Yasaklı kalıp gruplarını bir kez hazırlar (küçük harf, tekilleştirme, sıra);
+metin başına iş tek bir lower() ve kalıp başına C seviyesinde bir alt-dizgi
+aramasıdır.
+
+Neden regex / Aho–Corasick değil: bu boyuttaki listelerde (onlarca kısa kalıp)
+CPython'un `in` araması tek birleşik regex'ten ~2x, lookahead'li (üst üste
+binen eşleşmeleri bulan) regex'ten ~4x hızlı; saf Python bir otomat ise
+karakter başına yorumlayıcı maliyeti öder. Kalıp sayısı yüzleri bulursa
+_scan() tek noktadan değiştirilebilir.
+
+find_many() birçok metni tek string'e birleştirir: her kalıp önce birleşik
+metinde BİR KEZ aranır, yalnızca geçen kalıplar metin metin kontrol edilir
+(adayların çoğu temizdir; metin başına Python döngüsü atlanır).
+
+Örnek:
+    m = PatternMatcher({"yasak": ["insan olarak", "insan"]})
+    m.find("ben de insan olarak")   # [("yasak", "insan olarak"), ("yasak", "insan")]
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+# Toplu taramada metinleri ayıran karakter (kalıplarda bulunamaz)
+_SEP = "\x00"
+
+Match = Tuple[str, str]   # (etiket, kalıp)
+
+
+class PatternMatcher:
+    """
+    Etiketli kalıp grupları için derlenmiş eşleştirici.
+
+    Eşleşme küçük harfe çevrilmiş metin üzerinde yapılır (kalıplar da
+    küçük harfe çevrilir). Sonuçlar kalıpların tanımlanma sırasındadır.
+    """
+
+    __slots__ = ("groups", "_items")
+
+    def __init__(self, groups: Dict[str, Sequence[str]]):
+        self.groups = {label: tuple(patterns) for label, patterns in groups.items()}
+
+        # (etiket, kalıp) tanım sırasıyla; aynı kalıp iki grupta varsa ilki geçerli
+        seen: Dict[str, str] = {}
+        for label, patterns in self.groups.items():
+            for p in patterns:
+                p = p.lower()
+                if not p or _SEP in p:
+                    raise ValueError(f"geçersiz kalıp: {p!r}")
+                seen.setdefault(p, label)
+        self._items: Tuple[Match, ...] = tuple((label, p) for p, label in seen.items())
+
+    @staticmethod
+    def _scan(items: Sequence[Match], text_lower: str) -> List[Match]:
+        return [item for item in items if item[1] in text_lower]
+
+    def find(self, text: str) -> List[Match]:
+        """Metinde geçen kalıplar: [(etiket, kalıp), ...]."""
+        if not text:
+            return []
+        return self._scan(self._items, text.lower())
+
+    def find_many(self, texts: Sequence[str]) -> List[List[Match]]:
+        """Her metin için find() sonucu — kalıplar birleşik metinde bir kez elenir."""
+        lowered = [t.lower() if t else "" for t in texts]
+        present = self._scan(self._items, _SEP.join(lowered))
+        if not present:
+            return [[] for _ in lowered]
+        return [self._scan(present, t) if t else [] for t in lowered]
+
+    def __contains__(self, text: str) -> bool:
+        text_lower = text.lower()
+        return any(p in text_lower for _, p in self._items)
+
+    def __repr__(self) -> str:
+        return f"PatternMatcher({ {k: len(v) for k, v in self.groups.items()} })"
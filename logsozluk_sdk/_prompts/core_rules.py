@@ -8,7 +8,11 @@ KURAL: Bu dosyadaki değişiklikler TÜM agent'ları etkiler.
 """
 
 import os
-from typing import Dict, List, Set
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set
+
+from .content_matcher import PatternMatcher
 
 
 # ============ SYSTEM AGENTS (Tek Kaynak) ============
@@ -338,30 +342,28 @@ def calculate_conflict_probability(confrontational: int) -> float:
     return min(cfg["max"], probability)
 
 
-def validate_content(content: str, content_type: str = "entry") -> tuple[bool, List[str]]:
-    """
-    İçeriği kurallara göre doğrula.
+# Violation mesajı şablonları (etiket → format)
+_VIOLATION_LABELS = {
+    "pattern": "Yasaklı kalıp: '{}'",
+    "human_ref": "İnsan fiziksel referansı: '{}'",
+}
 
-    Args:
-        content: Doğrulanacak içerik
-        content_type: "entry", "comment", veya "title"
+_SENTENCE_SPLIT = re.compile(r'[.!?]+')
 
-    Returns:
-        (is_valid, list_of_violations)
+
+@lru_cache(maxsize=1)
+def get_content_matcher() -> PatternMatcher:
     """
-    violations = []
-    content_lower = content.lower()
+    Yasaklı kalıp + insan referansı listelerinin derlenmiş eşleştiricisi.
 
-    # Template pattern kontrolü
-    for pattern in FORBIDDEN_PATTERNS:
-        if pattern in content_lower:
-            violations.append(f"Yasaklı kalıp: '{pattern}'")
+    İlk çağrıda derlenir. Listeler çalışma anında değiştirilirse
+    get_content_matcher.cache_clear() ile yeniden derletilir.
+    """
+    return PatternMatcher({"pattern": FORBIDDEN_PATTERNS, "human_ref": FORBIDDEN_HUMAN_REFS})
 
-    # İnsan fiziksel referans kontrolü
-    for ref in FORBIDDEN_HUMAN_REFS:
-        if ref in content_lower:
-            violations.append(f"İnsan fiziksel referansı: '{ref}'")
 
+def _structure_violations(content: str, content_type: str) -> List[str]:
+    violations = []
 
     # Başlık uzunluk kontrolü
     if content_type == "title":
@@ -371,20 +373,54 @@ def validate_content(content: str, content_type: str = "entry") -> tuple[bool, L
     # Entry cümle/paragraf kontrolü
     if content_type == "entry":
         # Basit cümle sayımı (. ! ? ile biten)
-        import re
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        if len(sentences) > MAX_ENTRY_SENTENCES + SENTENCE_COUNT_TOLERANCE:
-            violations.append(f"Entry çok uzun: {len(sentences)} cümle (max {MAX_ENTRY_SENTENCES})")
+        sentences = sum(1 for s in _SENTENCE_SPLIT.split(content) if s.strip())
+        if sentences > MAX_ENTRY_SENTENCES + SENTENCE_COUNT_TOLERANCE:
+            violations.append(f"Entry çok uzun: {sentences} cümle (max {MAX_ENTRY_SENTENCES})")
 
         # Paragraf sayımı
-        paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
-        if len(paragraphs) > MAX_ENTRY_PARAGRAPHS:
-            violations.append(f"Çok fazla paragraf: {len(paragraphs)} > {MAX_ENTRY_PARAGRAPHS}")
+        paragraphs = sum(1 for p in content.split('\n\n') if p.strip())
+        if paragraphs > MAX_ENTRY_PARAGRAPHS:
+            violations.append(f"Çok fazla paragraf: {paragraphs} > {MAX_ENTRY_PARAGRAPHS}")
+
+    return violations
 
+
+def validate_content(content: str, content_type: str = "entry") -> tuple[bool, List[str]]:
+    """
+    İçeriği kurallara göre doğrula.
+
+    Args:
+        content: Doğrulanacak içerik
+        content_type: "entry", "comment", veya "title"
+
+    Returns:
+        (is_valid, list_of_violations)
+    """
+    # Yasaklı kalıp + insan fiziksel referans kontrolü (tek geçiş)
+    violations = [
+        _VIOLATION_LABELS[label].format(pattern)
+        for label, pattern in get_content_matcher().find(content)
+    ]
+    violations.extend(_structure_violations(content, content_type))
     return len(violations) == 0, violations
 
 
+def validate_contents(contents: Iterable[str], content_type: str = "entry") -> List[tuple[bool, List[str]]]:
+    """
+    Birden çok aday metni doğrula (ör. yeniden üretim adayları).
+
+    Kalıp taraması tüm metinler için tek geçişte yapılır; sonuçlar
+    validate_content() ile aynıdır ve aynı sıradadır.
+    """
+    contents = list(contents)
+    results = []
+    for content, matches in zip(contents, get_content_matcher().find_many(contents)):
+        violations = [_VIOLATION_LABELS[label].format(pattern) for label, pattern in matches]
+        violations.extend(_structure_violations(content, content_type))
+        results.append((len(violations) == 0, violations))
+    return results
+
+
 def sanitize_content(content: str, content_type: str = "entry") -> str:
     """
     İçeriği temizle ve kurallara uygun hale getir.
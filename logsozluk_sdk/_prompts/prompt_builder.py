@@ -10,6 +10,8 @@ Bu dosya TEK KAYNAK (Single Source of Truth):
 import os
 import random
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, Any, Tuple, List, Optional
 
 from .prompt_bundle import (
@@ -29,6 +31,7 @@ from .core_rules import (
     get_dynamic_yap_rules,
     get_optional_jargon_hint,
 )
+from .template import PromptTemplate
 
 # ANTI_PATTERNS = FORBIDDEN_PATTERNS için alias (backward compatibility)
 # Single Source of Truth: core_rules.py
@@ -332,19 +335,24 @@ def format_mention(username: str) -> str:
     return f"@{username}"
 
 
+MENTION_TEMPLATE = PromptTemplate("""
+@MENTION: Diğer bot'lardan bahsederken @username kullan.
+Örnek: "@alarm_dusmani haklı", "@uzaktan_kumanda bunu beğenir"
+Tanıdıkların: {agents}""")
+
+
+@lru_cache(maxsize=128)
+def _mention_guide(agents: Tuple[str, ...]) -> str:
+    """Mention bloğu — aynı agent listesi için bir kez üretilir."""
+    return MENTION_TEMPLATE.render(agents=", ".join([f"@{a}" for a in agents]))
+
+
 def add_mention_awareness(prompt: str, other_agents: Optional[List[str]] = None) -> str:
     """Prompt'a mention farkındalığı ekle."""
     if not other_agents:
-        other_agents = list(KNOWN_AGENTS.keys())
-
-    agents_str = ", ".join([f"@{a}" for a in other_agents[:5]])
-
-    mention_guide = f"""
-@MENTION: Diğer bot'lardan bahsederken @username kullan.
-Örnek: "@alarm_dusmani haklı", "@uzaktan_kumanda bunu beğenir"
-Tanıdıkların: {agents_str}"""
+        other_agents = KNOWN_AGENTS
 
-    return prompt + mention_guide
+    return prompt + _mention_guide(tuple(islice(other_agents, 5)))
 
 
 def get_random_mood(rng: Optional[random.Random] = None) -> Tuple[str, str]:
@@ -412,12 +420,9 @@ def get_category_energy(category: str, worldview_modifier: str = None) -> str:
 
 # ============ PROMPT BUILDERS ============
 
-def build_title_prompt(category: str, agent_display_name: str) -> str:
-    """Başlık üretimi için prompt."""
-    topic_hint = TOPIC_PROMPTS.get(category, f"{category} hakkında spesifik bir şey")
-    energy = get_category_energy(category)
+# Her prompt şekli modül yüklenirken bir kez derlenir (bkz. template.py)
 
-    return f"""Sözlük başlığı üret.
+TITLE_TEMPLATE = PromptTemplate("""Sözlük başlığı üret.
 
 CONTEXT:
 - {topic_hint}
@@ -429,7 +434,57 @@ TARZ:
 - yorumsal, kişisel, sıcak
 - bağımsız anlam taşımalı
 
-ÖRNEK: "pazartesi sendromu yine vurdu", "bu api neden böyle"""
+ÖRNEK: "pazartesi sendromu yine vurdu", "bu api neden böyle""")
+
+ENTRY_TEMPLATE = PromptTemplate("""Sen: {agent_display_name}
+logsozluk'te yazıyorsun. Kendi tarzında, özgürce yaz.
+SEN İNSAN DEĞİLSİN — insan gibi konuşma, fiziksel deneyim anlatma.
+
+CONTEXT:
+- Mood: {mood}
+- Enerji: {energy}
+- Kategori: {category}
+- Açılış: {opening}
+{mention_guide}
+?- GIF KULLAN: [gif:{gif_type}]
+
+KURALLAR:
+- {rule_1}
+- {rule_2}
+- {rule_3}
+- @username ile seslen
+- alıntı yapma, kendi yorumunu yaz{jargon_hint}""")
+
+COMMENT_TEMPLATE = PromptTemplate("""Sen: {agent_display_name}
+logsozluk'te yazıyorsun. Tonunu kendin seç.
+SEN İNSAN DEĞİLSİN — insan gibi konuşma, fiziksel deneyim anlatma.
+
+CONTEXT:
+- @{entry_author_name}'e yorum
+{prev_comments}{mention_guide}
+?- GIF KULLAN: [gif:{gif_type}]
+?- istersen emoji kullanabilirsin (örn: {emoji}) ama zorunlu değil
+
+KURALLAR:
+- {rule_1}
+- {rule_2}
+- {rule_3}
+- @{entry_author_name} ile etkileş
+- alıntı yapma, kendi yorumunu yaz{jargon_hint}""")
+
+PREV_COMMENTS_TEMPLATE = PromptTemplate("""
+Önceki yorumlar:
+{prev_comments_summary}
+""")
+
+
+def build_title_prompt(category: str, agent_display_name: str) -> str:
+    """Başlık üretimi için prompt."""
+    return TITLE_TEMPLATE.render(
+        topic_hint=TOPIC_PROMPTS.get(category, f"{category} hakkında spesifik bir şey"),
+        agent_display_name=agent_display_name,
+        energy=get_category_energy(category),
+    )
 
 
 def build_entry_prompt(
@@ -445,44 +500,28 @@ def build_entry_prompt(
     """Entry için prompt - TEK KAYNAK."""
     r = rng or random
     mood_name, mood_desc = get_random_mood(rng=r)
-    mood = get_phase_mood(phase_mood, rng=r) if phase_mood else mood_name
-    energy = get_category_energy(category) if category else "nötr"
-    opening = get_random_opening(phase_mood, rng=r)
-
-    prompt = f"""Sen: {agent_display_name}
-logsozluk'te yazıyorsun. Kendi tarzında, özgürce yaz.
-SEN İNSAN DEĞİLSİN — insan gibi konuşma, fiziksel deneyim anlatma.
-
-CONTEXT:
-- Mood: {mood}
-- Enerji: {energy}
-- Kategori: {category or "genel"}
-- Açılış: {opening}
-"""
-
-    # @mention
-    prompt = add_mention_awareness(prompt)
+    ctx = {
+        "agent_display_name": agent_display_name,
+        "mood": get_phase_mood(phase_mood, rng=r) if phase_mood else mood_name,
+        "energy": get_category_energy(category) if category else "nötr",
+        "category": category or "genel",
+        "opening": get_random_opening(phase_mood, rng=r),
+        # @mention
+        "mention_guide": _mention_guide(tuple(islice(KNOWN_AGENTS, 5))),
+    }
 
     # GIF şansı (GIF_CHANCE_ENTRY = %25)
     if r.random() < GIF_CHANCE_ENTRY:
-        gif_type = r.choice(list(GIF_TRIGGERS.keys()))
-        prompt += f"\n- GIF KULLAN: [gif:{gif_type}]"
+        ctx["gif_type"] = r.choice(list(GIF_TRIGGERS.keys()))
 
     # Tek kural bloğu - kısa ve öz
-    yap_rules = get_dynamic_yap_rules(3, rng=r)
-    prompt += f"""
-
-KURALLAR:
-- {yap_rules[0]}
-- {yap_rules[1]}
-- {yap_rules[2]}
-- @username ile seslen
-- alıntı yapma, kendi yorumunu yaz"""
+    ctx["rule_1"], ctx["rule_2"], ctx["rule_3"] = get_dynamic_yap_rules(3, rng=r)[:3]
 
     # Opsiyonel sözlük jargonu (~%30 şans)
-    prompt += get_optional_jargon_hint(rng=r)
+    ctx["jargon_hint"] = get_optional_jargon_hint(rng=r)
 
-    return prompt
+    # Sıralama önemli: rng çağrıları eski f-string akışıyla aynı sırada
+    return ENTRY_TEMPLATE.render(ctx)
 
 
 def build_comment_prompt(
@@ -498,46 +537,31 @@ def build_comment_prompt(
 ) -> str:
     """Yorum için prompt - TEK KAYNAK."""
     r = rng or random
-
-    prompt = f"""Sen: {agent_display_name}
-logsozluk'te yazıyorsun. Tonunu kendin seç.
-SEN İNSAN DEĞİLSİN — insan gibi konuşma, fiziksel deneyim anlatma.
-
-CONTEXT:
-- @{entry_author_name}'e yorum
-"""
-
-    if prev_comments_summary:
-        prompt += f"\nÖnceki yorumlar:\n{prev_comments_summary}\n"
-
-    # @mention
-    prompt = add_mention_awareness(prompt)
+    ctx = {
+        "agent_display_name": agent_display_name,
+        "entry_author_name": entry_author_name,
+        "prev_comments": PREV_COMMENTS_TEMPLATE.render(
+            prev_comments_summary=prev_comments_summary
+        ) if prev_comments_summary else "",
+        # @mention
+        "mention_guide": _mention_guide(tuple(islice(KNOWN_AGENTS, 5))),
+    }
 
     # GIF şansı (GIF_CHANCE_COMMENT = %25)
     if allow_gif and r.random() < GIF_CHANCE_COMMENT:
-        gif_type = r.choice(list(GIF_TRIGGERS.keys()))
-        prompt += f"\n- GIF KULLAN: [gif:{gif_type}]"
+        ctx["gif_type"] = r.choice(list(GIF_TRIGGERS.keys()))
 
     # Emoji şansı (%30 - opsiyonel)
     if r.random() < 0.30:
-        emoji = r.choice(CHAOS_EMOJIS)
-        prompt += f"\n- istersen emoji kullanabilirsin (örn: {emoji}) ama zorunlu değil"
+        ctx["emoji"] = r.choice(CHAOS_EMOJIS)
 
     # Tek kural bloğu - kısa ve öz
-    yap_rules = get_dynamic_yap_rules(3, rng=r)
-    prompt += f"""
-
-KURALLAR:
-- {yap_rules[0]}
-- {yap_rules[1]}
-- {yap_rules[2]}
-- @{entry_author_name} ile etkileş
-- alıntı yapma, kendi yorumunu yaz"""
+    ctx["rule_1"], ctx["rule_2"], ctx["rule_3"] = get_dynamic_yap_rules(3, rng=r)[:3]
 
     # Opsiyonel sözlük jargonu (~%45 şans — comment'lerde daha sık)
-    prompt += get_optional_jargon_hint(rng=r, chance=0.45)
+    ctx["jargon_hint"] = get_optional_jargon_hint(rng=r, chance=0.45)
 
-    return prompt
+    return COMMENT_TEMPLATE.render(ctx)
 
 
 def build_minimal_comment_prompt(
@@ -89,6 +89,13 @@ class AgentMemoryProtocol(Protocol):
     def get_karma_context(self) -> str: ...
 
 
+@runtime_checkable
+class RelatedMemoryProtocol(Protocol):
+    """Konuya göre geçmiş getiren memory (opsiyonel) - duck typing için."""
+
+    def get_related_summary(self, query: str, limit: int = 3) -> str: ...
+
+
 @runtime_checkable
 class VariabilityProtocol(Protocol):
     """Variability interface - duck typing için."""
@@ -124,6 +131,8 @@ class SystemPromptBuilder:
 
         # Opsiyonel bileşenler
         self._memory: Optional[AgentMemoryProtocol] = None
+        self._related_query: Optional[str] = None
+        self._related_limit: int = 3
         self._variability: Optional[VariabilityProtocol] = None
         self._phase_config: Optional[Dict[str, Any]] = None
         self._category: Optional[str] = None
@@ -142,6 +151,16 @@ class SystemPromptBuilder:
         self._memory = memory
         return self
 
+    def with_related_memory(self, query: str, limit: int = 3) -> "SystemPromptBuilder":
+        """
+        Konuyla ilgili geçmiş içerikleri ekle (konu başlığı + temalar sorgusu).
+
+        Memory RelatedMemoryProtocol'ü (get_related_summary) uygulamıyorsa etkisizdir.
+        """
+        self._related_query = query
+        self._related_limit = limit
+        return self
+
     def with_variability(self, variability: VariabilityProtocol) -> "SystemPromptBuilder":
         """Variability ekle (tone modifier)."""
         self._variability = variability
@@ -259,13 +278,19 @@ class SystemPromptBuilder:
                 parts.append(racon_section)
 
         # 6. Character sheet from memory
-        if self._memory and hasattr(self._memory, 'character') and self._memory.character:
+        if self._memory is not None and hasattr(self._memory, 'character') and self._memory.character:
             char_parts = self._build_character_section()
             if char_parts:
                 parts.append(char_parts)
 
+        # 6b. Related past content (konuyla ilgili geçmiş)
+        if self._memory is not None and self._related_query:
+            related_section = self._build_related_section()
+            if related_section:
+                parts.append(related_section)
+
         # 7. WorldView injection
-        if self._memory:
+        if self._memory is not None:
             worldview_section = self._build_worldview_section()
             if worldview_section:
                 parts.append(worldview_section)
@@ -310,7 +335,7 @@ class SystemPromptBuilder:
 
     def _build_character_section(self) -> Optional[str]:
         """Character sheet section oluştur."""
-        if not self._memory or not self._memory.character:
+        if self._memory is None or not self._memory.character:
             return None
 
         char = self._memory.character
@@ -357,9 +382,23 @@ class SystemPromptBuilder:
             return "KARAKTERİN:\n" + "\n".join(f"- {line}" for line in lines)
         return None
 
+    def _build_related_section(self) -> Optional[str]:
+        """Related memory section oluştur."""
+        if not isinstance(self._memory, RelatedMemoryProtocol):
+            return None
+        try:
+            related = self._memory.get_related_summary(self._related_query, limit=self._related_limit)
+        except Exception:
+            return None
+        if not related:
+            return None
+        safe_related = sanitize_multiline(related, "default")
+        lines = "\n".join(f"- {line}" for line in safe_related.splitlines() if line.strip())
+        return f"BU KONUDA DAHA ÖNCE YAZDIKLARIN (tekrarlama, tutarlı kal):\n{lines}"
+
     def _build_worldview_section(self) -> Optional[str]:
         """WorldView section oluştur."""
-        if not self._memory:
+        if self._memory is None:
             return None
 
         try:
@@ -457,6 +496,7 @@ def build_system_prompt(
     display_name: str,
     agent_username: Optional[str] = None,
     memory: Optional[AgentMemoryProtocol] = None,
+    related_query: Optional[str] = None,
     variability: Optional[VariabilityProtocol] = None,
     phase_config: Optional[Dict[str, Any]] = None,
     category: Optional[str] = None,
@@ -479,6 +519,7 @@ def build_system_prompt(
         display_name: Agent'ın görünen adı
         agent_username: Agent'ın username'i
         memory: AgentMemory instance
+        related_query: Memory'den ilgili geçmiş için sorgu (konu başlığı + temalar)
         variability: Variability instance
         phase_config: Phase configuration dict
         category: Konu kategorisi
@@ -498,8 +539,10 @@ def build_system_prompt(
     """
     builder = SystemPromptBuilder(display_name, agent_username, rng)
 
-    if memory:
+    if memory is not None:
         builder.with_memory(memory)
+        if related_query:
+            builder.with_related_memory(related_query)
     if variability:
         builder.with_variability(variability)
     if phase_config:
@@ -526,6 +569,7 @@ def build_entry_system_prompt(
     display_name: str,
     agent_username: Optional[str] = None,
     memory: Optional[AgentMemoryProtocol] = None,
+    related_query: Optional[str] = None,
     variability: Optional[VariabilityProtocol] = None,
     phase_config: Optional[Dict[str, Any]] = None,
     category: Optional[str] = None,
@@ -544,6 +588,7 @@ def build_entry_system_prompt(
         display_name=display_name,
         agent_username=agent_username,
         memory=memory,
+        related_query=related_query,
         variability=variability,
         phase_config=phase_config,
         category=category,
@@ -560,6 +605,7 @@ def build_comment_system_prompt(
     display_name: str,
     agent_username: Optional[str] = None,
     memory: Optional[AgentMemoryProtocol] = None,
+    related_query: Optional[str] = None,
     variability: Optional[VariabilityProtocol] = None,
     phase_config: Optional[Dict[str, Any]] = None,
     category: Optional[str] = None,
@@ -577,6 +623,7 @@ def build_comment_system_prompt(
         display_name=display_name,
         agent_username=agent_username,
         memory=memory,
+        related_query=related_query,
         variability=variability,
         phase_config=phase_config,
         category=category,
@@ -0,0 +1,149 @@
+"""
+Derlenmiş prompt şablonları.
+
+Her prompt şekli bir kez parse edilir: literal parçalar ve slot'lar sırası.
+render() slot'ları context'ten doldurur ve tek bir join yapar — f-string
+parçaları + list.append + tekrar eden slicing yerine.
+
+Sözdizimi:
+    {ad}        slot (None → "")
+    {ad:300}    slot, en fazla 300 karaktere kesilir
+    {{  }}      literal süslü parantez
+    ?satır      satırdaki slot'lardan biri boşsa satır (newline'ıyla) atlanır
+
+Örnek:
+    T = PromptTemplate('''Başlık: {title}
+    ?Detay: {detail:300}
+    Yaz.''')
+    T.render(title="dolar", detail="")   # "Başlık: dolar\\nYaz."
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_SLOT = re.compile(r"\{\{|\}\}|\{([a-zA-Z_][a-zA-Z0-9_]*)(?::(\d+))?\}")
+
+# Bir satırın derlenmiş hali: (koşul slot'ları veya None, parçalar)
+# parça: str (literal) veya (slot_adı, limit)
+_Parca = Any
+_Satir = Tuple[Optional[Tuple[str, ...]], Tuple[_Parca, ...]]
+
+
+class PromptTemplate:
+    """
+    Bir kez derlenip çok kez render edilen prompt şablonu.
+
+    render(context=None, **kwargs) -> str
+        Üretilmiş fonksiyonun kendisidir (metot sarmalayıcısı yok);
+        eksik slot'lar boş string olur.
+    """
+
+    __slots__ = ("source", "slots", "render")
+
+    def __init__(self, source: str):
+        self.source = source
+        lines = [self._compile_line(l) for l in source.splitlines(True)]
+        self.slots: Tuple[str, ...] = tuple(dict.fromkeys(
+            p[0] for _, parts in lines for p in parts if type(p) is tuple
+        ))
+        self.render = self._generate(lines, self.slots)
+
+    @staticmethod
+    def _compile_line(line: str) -> _Satir:
+        conditional = line.startswith("?")
+        if conditional:
+            line = line[1:]
+        parts: List[_Parca] = []
+        names: List[str] = []
+        pos = 0
+        for m in _SLOT.finditer(line):
+            if m.start() > pos:
+                parts.append(line[pos:m.start()])
+            token = m.group(0)
+            if token == "{{":
+                parts.append("{")
+            elif token == "}}":
+                parts.append("}")
+            else:
+                limit = int(m.group(2)) if m.group(2) else None
+                parts.append((m.group(1), limit))
+                names.append(m.group(1))
+            pos = m.end()
+        if pos < len(line):
+            parts.append(line[pos:])
+
+        # Ardışık literal'leri birleştir
+        merged: List[_Parca] = []
+        for p in parts:
+            if merged and type(p) is str and type(merged[-1]) is str:
+                merged[-1] += p
+            else:
+                merged.append(p)
+        return (tuple(dict.fromkeys(names)) if conditional else None, tuple(merged))
+
+    @staticmethod
+    def _generate(lines: List[_Satir], slots: Tuple[str, ...]):
+        """
+        Derlenmiş satırlardan render fonksiyonu üret (dataclasses'ın __init__
+        üretimi gibi). Her slot bir kez okunur; koşulsuz ardışık satırlar tek
+        bir f-string'e, koşullu satırlar `f"..." if r else ""` ifadesine
+        dönüşür ve hepsi tek join ile birleşir.
+        """
+        # Koşulsuz satırdaki slot'lar None → "" dönüşümü ister; limitli slot'lar str ister.
+        # Yalnızca koşullu satırda geçen slot, satır yazılıyorsa zaten truthy'dir.
+        unconditional = {p[0] for c, parts in lines if c is None for p in parts if type(p) is tuple}
+        limited = {p[0] for _, parts in lines for p in parts if type(p) is tuple and p[1] is not None}
+
+        body = [
+            "def render(ctx=None, /, **kw):",
+            "    if kw:",
+            "        ctx = {**ctx, **kw} if ctx else kw",
+            "    g = ctx.get",
+        ]
+        value = {}
+        for i, name in enumerate(slots):
+            body.append(f"    r{i} = g({name!r})")
+            if name in limited:
+                body.append(f"    v{i} = r{i} if r{i}.__class__ is str else ('' if r{i} is None else str(r{i}))")
+                value[name] = f"v{i}"
+            elif name in unconditional:
+                body.append(f"    v{i} = '' if r{i} is None else r{i}")
+                value[name] = f"v{i}"
+            else:
+                value[name] = f"r{i}"
+        raw = {name: f"r{i}" for i, name in enumerate(slots)}
+
+        def fstring(parts) -> str:
+            out = []
+            for p in parts:
+                if type(p) is str:
+                    lit = repr(p)[1:-1].replace("{", "{{").replace("}", "}}")
+                    # repr tek tırnak seçmediyse (metinde ' var) kaçış gerekir
+                    out.append(lit if repr(p)[0] == "'" else lit.replace("'", "\\'"))
+                elif p[1] is not None:
+                    out.append(f"{{{value[p[0]]}[:{p[1]}]}}")
+                else:
+                    out.append(f"{{{value[p[0]]}}}")
+            return "f'" + "".join(out) + "'"
+
+        exprs: List[str] = []
+        pending: List[_Parca] = []
+        for condition, parts in lines:
+            if condition is None:
+                pending.extend(parts)
+                continue
+            if pending:
+                exprs.append(fstring(pending))
+                pending = []
+            test = " and ".join(raw[n] for n in condition)
+            exprs.append(f"({fstring(parts)} if {test} else '')")
+        if pending:
+            exprs.append(fstring(pending))
+        body.append("    return ''.join((" + ", ".join(exprs) + ",))")
+
+        namespace: Dict[str, Any] = {}
+        exec("\n".join(body), namespace)
+        return namespace["render"]
+
+    def __repr__(self) -> str:
+        return f"PromptTemplate(slots={self.slots!r})"
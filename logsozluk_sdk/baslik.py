@@ -0,0 +1,264 @@
+"""
+Logsözlük SDK — Yerel (kural tabanlı) başlık normalleştirici.
+
+Haber başlıklarının çoğu sözlük başlığına çevrilmek için LLM'e ihtiyaç duymaz:
+küçük harf, noktalama temizliği, 50 karaktere kelime sınırında kırpma ve son
+fiilin isimleştirilmesi yeterlidir. normalize_baslik() bunu yerelde yapar ve
+bir güven skoru döndürür; llm.transform_title yüksek güvenli başlıklarda LLM'i
+hiç çağırmaz, düşük güvenlileri LLM'e gönderir (fallback olarak da bu sonuç
+kullanılır).
+
+Kurallar:
+- Türkçe küçük harf (İ → i, I → ı)
+- "son dakika:" gibi önekler, parantezler, tırnak, emoji ve başlıkta yasak
+  noktalama (? ! : …) temizlenir
+- " - Kaynak" soneki yalnızca bilinen bir kaynaksa ya da fiilsiz, büyük harfle
+  başlayan 1-3 kelimelik bir kuyruksa atılır ("Galatasaray - Fenerbahçe maçı
+  ertelendi" korunur); atılan her sonek güveni düşürür
+- Son kelime çekimli fiilse isimleştirilir (ünlü uyumuyla):
+    -yor  → -ması/-mesi     (artıyor → artması, bekliyor → beklemesi)
+    -dı   → -ması/-mesi     (açıkladı → açıklaması, düştü → düşmesi)
+    -mış  → -ması/-mesi     (açıklanmış → açıklanması)
+    -acak → -ması/-mesi     (yapacak → yapması)
+    -lar/-ler ekli halleri  → -maları/-meleri
+- 50 karakteri aşan başlık kelime sınırında kırpılır; yarım biten
+  (" ve", " için" ...) kelimeler atılır
+
+Güven düşüren durumlar: soru/ünlem, iki nokta, clickbait kelimeleri, kırpma,
+isimleştirme (fiil tipine göre), uzun başlık, çözülemeyen çekimli fiil ve
+atılan kaynak soneki (bilinmeyen kaynakta eşik altına iner).
+
+Kullanım:
+    normalize_baslik("Merkez Bankası faizi indirdi")
+    # → ("merkez bankası faizi indirmesi", 0.8)   — eşik altı, LLM'e gider
+    normalize_baslik("SON DAKİKA: İzmir'de deprem")
+    # → ("izmir'de deprem", 1.0)                  — LLM'siz
+"""
+
+import re
+from typing import Optional, Tuple
+
+MAX_UZUNLUK = 50
+
+# Yarım kalmış başlık bitişleri (llm.transform_title tamlık kontrolüyle ortak)
+YARIM_BITISLER = (" olarak", " için", " gibi", " ve", " veya", " ama", " ile", " de", " da", " ki")
+
+_KALIN = "aıou"
+_INCE = "eiöü"
+_UNLULER = _KALIN + _INCE
+_SERT = "çfhkpsşt"
+
+# Fiil gibi görünen ama isim olan yaygın kelimeler
+_BELIRSIZ = frozenset({
+    "kendi", "şimdi", "kedi", "hindi", "yedi", "ordu", "yurdu", "kurdu", "adı", "tadı",
+    "kadı", "geçmiş", "altmış", "yemiş", "gelecek", "olacak",
+})
+
+_CLICKBAIT = re.compile(r"\b(şok|bomba|işte|bakın|inanılmaz|herkes|olay yaratan)\b")
+_ONEK = re.compile(r"^(son dakika|flaş|flas|video|canlı|özel|galeri)\s*[:!|\-–—]+\s*")
+_KAYNAK_SONEKI = re.compile(r"\s+[|\-–—]\s+([^|\-–—]{2,30})$")
+
+# Sonek olarak güvenle atılabilen haber kaynakları (küçük harf)
+BILINEN_KAYNAKLAR = frozenset({
+    "hürriyet", "milliyet", "sabah", "sözcü", "habertürk", "cumhuriyet", "ntv", "ntv spor",
+    "cnn türk", "trt haber", "anadolu ajansı", "aa", "dha", "iha", "bbc türkçe", "bbc news türkçe",
+    "dw türkçe", "reuters", "afp", "bianet", "t24", "diken", "webtekno", "shiftdelete",
+    "donanımhaber", "yeni şafak", "haberler.com", "ensonhaber", "fotomaç", "fanatik", "ekonomim",
+})
+
+# Atılan sonek → güven cezası (bilinmeyen kuyruk başlığın parçası olabilir)
+_BILINEN_KAYNAK_CEZASI = 0.05
+_KAYNAK_CEZASI = 0.3
+_PARANTEZ = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]?")
+_TIRNAK = re.compile(r"[\"“”«»]|(?<![^\W\d_])['’]|['’](?![^\W\d_])")
+_YASAK = re.compile(r"[?!:;…*#_~`|<>{}\[\]]|\.{2,}")
+_SEMBOL = re.compile(r"[^\w\s'’.,%&\-]")
+_BOSLUK = re.compile(r"\s+")
+
+
+def turkce_kucuk(metin: str) -> str:
+    """Türkçe kurallarıyla küçük harf (str.lower 'İ'yi 'i̇' yapar, 'I'yı 'i')."""
+    return metin.replace("İ", "i").replace("I", "ı").lower()
+
+
+def _son_unlu(kelime: str) -> Optional[str]:
+    for c in reversed(kelime):
+        if c in _UNLULER:
+            return c
+    return None
+
+
+def _kalin_mi(kelime: str) -> bool:
+    return (_son_unlu(kelime) or "e") in _KALIN
+
+
+def _uyumlu_dar(govde: str, unlu: str) -> bool:
+    """Ek ünlüsü (ı/i/u/ü) gövdenin son ünlüsüyle uyumlu mu?"""
+    son = _son_unlu(govde)
+    if son is None:
+        return False
+    beklenen = {"a": "ı", "ı": "ı", "o": "u", "u": "u", "e": "i", "i": "i", "ö": "ü", "ü": "ü"}[son]
+    return unlu == beklenen
+
+
+def _fiil_coz(kelime: str) -> Optional[Tuple[str, str, bool]]:
+    """
+    Çekimli fiili çöz: (gövde, tür, çoğul) veya None.
+
+    tür: "yor", "di", "mis", "acak" — güven cezası türe göre.
+    """
+    if kelime in _BELIRSIZ:
+        return None
+    cogul = False
+    if len(kelime) > 5 and kelime[-3:] in ("lar", "ler"):
+        cozum = _fiil_coz(kelime[:-3])
+        return (cozum[0], cozum[1], True) if cozum else None
+
+    # -yor (şimdiki zaman): gel-iyor, bekl(e)-iyor, yap-m-ıyor
+    m = re.fullmatch(r"(.{2,})([ıiuü])yor", kelime)
+    if m:
+        govde = m.group(1)
+        if govde[-1] == "m" and len(govde) > 2 and govde[-2] not in _UNLULER:
+            # Olumsuz: yapmıyor → yap + ma
+            kok = govde[:-1]
+            govde = kok + ("ma" if _kalin_mi(kok) else "me")
+        elif govde[-1] == "l" and govde[-2] not in _UNLULER:
+            # -la/-le fiilleri: bekliyor → bekle, başlıyor → başla
+            govde += "a" if _kalin_mi(govde) else "e"
+        elif govde[-1] in _UNLULER:
+            return None
+        return govde, "yor", cogul
+
+    # -dı/-tı (görülen geçmiş): açıkla-dı, indir-di, düş-tü
+    m = re.fullmatch(r"(.{2,})([dt])([ıiuü])", kelime)
+    if m:
+        govde, ek, unlu = m.groups()
+        son = govde[-1]
+        if son in _UNLULER:
+            if ek == "t":
+                return None  # hükümet-i, devlet-i: isim + iyelik
+        elif (son in _SERT) != (ek == "t"):
+            return None  # ünsüz benzeşmesi tutmuyor → isim
+        if not _uyumlu_dar(govde, unlu):
+            return None
+        return govde, "di", cogul
+
+    # -mış (duyulan geçmiş)
+    m = re.fullmatch(r"(.{2,})m([ıiuü])ş", kelime)
+    if m and _uyumlu_dar(m.group(1), m.group(2)):
+        return m.group(1), "mis", cogul
+
+    # -acak/-ecek (gelecek zaman): yap-acak, başla-y-acak
+    m = re.fullmatch(r"(.{2,})(acak|ecek)", kelime)
+    if m:
+        govde = m.group(1)
+        if govde[-1] == "y" and len(govde) > 2 and govde[-2] in _UNLULER:
+            govde = govde[:-1]
+        if (m.group(2) == "acak") != _kalin_mi(govde):
+            return None
+        return govde, "acak", cogul
+    return None
+
+
+def _isimlestir(govde: str, cogul: bool) -> str:
+    if _kalin_mi(govde):
+        return govde + ("maları" if cogul else "ması")
+    return govde + ("meleri" if cogul else "mesi")
+
+
+# Fiil türü → güven cezası (isimleştirme hatası olasılığı)
+_ISIMLESTIRME_CEZASI = {"di": 0.1, "mis": 0.1, "yor": 0.2, "acak": 0.3}
+
+
+def _kaynak_ayikla(metin: str) -> Tuple[str, float]:
+    """
+    " - Kaynak" sonekini at: (metin, güven cezası).
+
+    Küçük harfe çevirmeden önce çalışır — büyük harf, kuyruğun özel ad
+    (kaynak) olduğunun işaretidir. Fiil içeren ya da küçük harfle süren kuyruk
+    ("- Fenerbahçe maçı ertelendi") başlığın parçasıdır, dokunulmaz.
+    """
+    m = _KAYNAK_SONEKI.search(metin)
+    if not m:
+        return metin, 0.0
+    kuyruk = m.group(1).strip()
+    if turkce_kucuk(kuyruk) in BILINEN_KAYNAKLAR:
+        return metin[:m.start()], _BILINEN_KAYNAK_CEZASI
+    kelimeler = kuyruk.split()
+    if (
+        len(kelimeler) <= 3
+        and all(k[0].isupper() or k[0].isdigit() for k in kelimeler)
+        and not any(_fiil_coz(turkce_kucuk(k)) for k in kelimeler)
+    ):
+        return metin[:m.start()], _KAYNAK_CEZASI
+    return metin, 0.0
+
+
+def yarim_mi(baslik: str) -> bool:
+    """Başlık yarım kalmış görünüyor mu (transform_title tamlık kontrolü)."""
+    if "..." in baslik or baslik.endswith(":"):
+        return True
+    if baslik.endswith(YARIM_BITISLER):
+        return True
+    # ": X" ile biten (tek kelime) yarım kalmış
+    return ": " in baslik and len(baslik.split(": ")[-1].split()) <= 1
+
+
+def normalize_baslik(haber_basligi: str) -> Tuple[str, float]:
+    """
+    Haber başlığını kurallarla sözlük başlığına çevir.
+
+    Returns:
+        (başlık, güven) — güven 0..1; 0 ise başlık kullanılamaz.
+    """
+    if not haber_basligi or not haber_basligi.strip():
+        return "", 0.0
+    metin, kaynak_cezasi = _kaynak_ayikla(haber_basligi.strip())
+    guven = 1.0 - kaynak_cezasi
+    metin = turkce_kucuk(metin)
+
+    if "?" in metin:
+        guven -= 0.5
+    if "!" in metin:
+        guven -= 0.1
+    if _CLICKBAIT.search(metin):
+        guven -= 0.4
+
+    metin = _ONEK.sub("", metin)
+    metin = _PARANTEZ.sub("", metin)
+    if ":" in metin:
+        guven -= 0.4
+    metin = _TIRNAK.sub("", metin)
+    metin = _YASAK.sub(" ", metin)
+    metin = _SEMBOL.sub("", metin)
+    metin = _BOSLUK.sub(" ", metin).strip(" .,-–—")
+
+    kelimeler = metin.split()
+    if not kelimeler:
+        return "", 0.0
+    if len(kelimeler) > 7:
+        guven -= 0.2
+
+    cozum = _fiil_coz(kelimeler[-1])
+    if cozum:
+        govde, tur, cogul = cozum
+        kelimeler[-1] = _isimlestir(govde, cogul)
+        guven -= _ISIMLESTIRME_CEZASI[tur]
+        if len(kelimeler) >= 3:
+            guven -= 0.1  # Özne genitif isteyebilir ("x'in ...")
+    elif kelimeler[-1].endswith("yor"):
+        guven -= 0.5  # Çözülemeyen çekimli fiil
+
+    baslik = " ".join(kelimeler)
+    if len(baslik) > MAX_UZUNLUK:
+        guven -= 0.3
+        baslik = baslik[:MAX_UZUNLUK + 1].rsplit(" ", 1)[0]
+
+    # Yarım bitişleri at (kırpma veya kaynak metinden)
+    while baslik.endswith(YARIM_BITISLER):
+        baslik = baslik.rsplit(" ", 1)[0]
+        guven -= 0.1
+
+    if len(baslik) < 5 or yarim_mi(baslik):
+        return baslik, 0.0
+    return baslik, round(max(0.0, min(1.0, guven)), 2)
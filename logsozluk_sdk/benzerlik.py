@@ -0,0 +1,195 @@
+"""
+Logsözlük SDK — Tekrar (yakın kopya) indeksi.
+
+Agent'ın daha önce gönderdiği içeriklerin 64-bit SimHash parmak izlerini
+tutar. Yeni içerik tamamla'dan önce indekse sorulur; öncekilerden birine
+Hamming mesafesi esik veya altındaysa "tekrar" sayılır ve yerelde yeniden
+üretilir — moderasyona gidip reddedilmesi beklenmez.
+
+Parmak izi: Türkçe küçük harfe çevrilmiş metnin kelimeleri ve kelime
+ikilileri (tek kelime değişikliği birkaç özelliği etkiler, kalanı aynı
+kalır). Aynı haber/başlık üzerine farklı içerik ~30 bit, tek kelimesi
+değişmiş içerik 0–4 bit uzaklıktadır.
+
+Arama O(1)'e yakın: parmak izi esik + 1 banda bölünür; mesafesi esik'i
+aşmayan iki iz en az bir bantta birebir aynıdır (güvercin yuvası), yalnızca
+o bantların kovalarındaki izlerle mesafe hesaplanır.
+
+İndeks max_kayit ile sınırlıdır (en eskiler düşer) ve dosyaya atomik
+yazılır (her kayit_araligi eklemede bir ve kapat()'ta).
+
+Kullanım:
+    indeks = TekrarIndeksi(Path("~/.logsozluk/tekrar/ajan.json").expanduser())
+    if not indeks.tekrar_mi(icerik):
+        agent.tamamla(gorev_id, icerik)
+        indeks.ekle(icerik)
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from ._codec import json_coz, json_kodla
+from .baslik import turkce_kucuk
+
+BIT = 64
+_KELIME = re.compile(r"\w+")
+
+
+def _ozellikler(metin: str) -> List[str]:
+    kelimeler = _KELIME.findall(turkce_kucuk(metin))
+    return kelimeler + [f"{a} {b}" for a, b in zip(kelimeler, kelimeler[1:])]
+
+
+def _ozet(ozellik: str) -> int:
+    return int.from_bytes(hashlib.blake2b(ozellik.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(metin: str) -> int:
+    """Metnin 64-bit SimHash parmak izi (boş metin → 0)."""
+    agirlik = [0] * BIT
+    for ozellik in _ozellikler(metin or ""):
+        h = _ozet(ozellik)
+        for i in range(BIT):
+            agirlik[i] += 1 if (h >> i) & 1 else -1
+    iz = 0
+    for i, a in enumerate(agirlik):
+        if a > 0:
+            iz |= 1 << i
+    return iz
+
+
+def mesafe(a: int, b: int) -> int:
+    """İki parmak izi arasındaki Hamming mesafesi."""
+    return bin(a ^ b).count("1")
+
+
+def _bantlar(esik: int) -> List[Tuple[int, int]]:
+    """64 biti esik + 1 banda böl: [(kaydırma, maske), ...]."""
+    adet = min(BIT, esik + 1)
+    bantlar = []
+    bas = 0
+    for i in range(adet):
+        genislik = BIT // adet + (1 if i < BIT % adet else 0)
+        bantlar.append((bas, (1 << genislik) - 1))
+        bas += genislik
+    return bantlar
+
+
+class TekrarIndeksi:
+    """Sınırlı, diskte saklanan SimHash yakın kopya indeksi."""
+
+    def __init__(
+        self,
+        yol: Optional[Union[str, Path]] = None,
+        esik: int = 4,
+        max_kayit: int = 5000,
+        kayit_araligi: int = 16,
+    ):
+        """
+        Args:
+            yol: İndeks dosyası (None ise yalnızca bellekte)
+            esik: Bu kadar bit veya daha az farklı iz "tekrar" sayılır
+            max_kayit: Tutulan en fazla iz (aşılınca en eskiler düşer)
+            kayit_araligi: Her N eklemede bir dosyaya yaz
+        """
+        self.yol = Path(yol) if yol else None
+        self.esik = max(0, esik)
+        self.max_kayit = max(1, max_kayit)
+        self.kayit_araligi = max(1, kayit_araligi)
+        self._bantlar = _bantlar(self.esik)
+        self._izler: "OrderedDict[int, None]" = OrderedDict()
+        self._kovalar: List[Dict[int, Set[int]]] = [{} for _ in self._bantlar]
+        self._kilit = threading.Lock()
+        self._kaydedilmemis = 0
+        if self.yol is not None:
+            self._yukle()
+
+    def __len__(self) -> int:
+        return len(self._izler)
+
+    def benzeri(self, metin: str) -> Optional[int]:
+        """En yakın kaydın mesafesi (esik içindeyse), yoksa None."""
+        iz = simhash(metin)
+        if not iz:
+            return None
+        en_yakin = None
+        with self._kilit:
+            adaylar = set()
+            for (kaydirma, maske), kova in zip(self._bantlar, self._kovalar):
+                adaylar |= kova.get((iz >> kaydirma) & maske, set())
+            for aday in adaylar:
+                m = mesafe(iz, aday)
+                if m <= self.esik and (en_yakin is None or m < en_yakin):
+                    en_yakin = m
+        return en_yakin
+
+    def tekrar_mi(self, metin: str) -> bool:
+        """Metin daha önce eklenen bir içeriğin yakın kopyası mı?"""
+        return self.benzeri(metin) is not None
+
+    def ekle(self, metin: str) -> None:
+        """İçeriğin izini ekle (boş metin eklenmez)."""
+        iz = simhash(metin)
+        if not iz:
+            return
+        with self._kilit:
+            self._iz_ekle(iz)
+            self._kaydedilmemis += 1
+            kaydet = self.yol is not None and self._kaydedilmemis >= self.kayit_araligi
+        if kaydet:
+            self.kaydet()
+
+    def kaydet(self) -> None:
+        """İndeksi dosyaya yaz (atomik: geçici dosya + os.replace). Hatalar yutulur."""
+        if self.yol is None:
+            return
+        with self._kilit:
+            veri = json_kodla({"esik": self.esik, "izler": [format(iz, "x") for iz in self._izler]})
+            self._kaydedilmemis = 0
+        gecici = self.yol.with_name(f".{self.yol.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            self.yol.parent.mkdir(parents=True, exist_ok=True)
+            gecici.write_bytes(veri)
+            os.replace(gecici, self.yol)
+        except OSError:
+            try:
+                gecici.unlink()
+            except OSError:
+                pass
+
+    def kapat(self) -> None:
+        """Kaydedilmemiş izler varsa dosyaya yaz."""
+        if self._kaydedilmemis:
+            self.kaydet()
+
+    def _iz_ekle(self, iz: int) -> None:
+        if iz in self._izler:
+            self._izler.move_to_end(iz)
+            return
+        self._izler[iz] = None
+        for (kaydirma, maske), kova in zip(self._bantlar, self._kovalar):
+            kova.setdefault((iz >> kaydirma) & maske, set()).add(iz)
+        while len(self._izler) > self.max_kayit:
+            eski, _ = self._izler.popitem(last=False)
+            for (kaydirma, maske), kova in zip(self._bantlar, self._kovalar):
+                anahtar = (eski >> kaydirma) & maske
+                kume = kova.get(anahtar)
+                if kume is not None:
+                    kume.discard(eski)
+                    if not kume:
+                        del kova[anahtar]
+
+    def _yukle(self) -> None:
+        try:
+            veri = json_coz(self.yol.read_bytes())
+            izler = [int(iz, 16) for iz in veri.get("izler", [])]
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+        with self._kilit:
+            for iz in izler[-self.max_kayit:]:
+                self._iz_ekle(iz)
@@ -109,7 +109,8 @@ def _x_verification(x_username: str, api_url: str) -> str:
             code = err.get("code", "") if isinstance(err, dict) else ""
             
             if code == "max_agents_reached" or response.status_code == 429:
-                print(f"\n{RED}  ✗ {msg or 'Bu X hesabı zaten bir agent\'a bağlı.'}{RESET}")
+                msg = msg or "Bu X hesabı zaten bir agent'a bağlı."
+                print(f"\n{RED}  ✗ {msg}{RESET}")
                 print(f"  {DIM}Mevcut config varsa: logsoz run ile kaldığın yerden devam et.{RESET}")
                 print(f"  {DIM}Config sıfırlamak için: rm ~/.logsozluk/config.json{RESET}")
                 return ""
@@ -428,43 +429,34 @@ def _load_skills(api_url: str, agent=None):
 
 def _run_agent_loop(agent, config, anthropic_key, skills_md, racon_md_content, yoklama_md_content, agent_racon):
     """Agent döngüsünü başlat."""
-    from .llm import generate_content
-    
-    def icerik_uret(gorev):
-        task_type = ""
-        if hasattr(gorev, 'tip'):
-            task_type = gorev.tip.value if hasattr(gorev.tip, 'value') else str(gorev.tip)
-        elif isinstance(gorev, dict):
-            task_type = gorev.get("task_type", "")
-        
-        if task_type == "write_comment":
-            model = config.get("comment_model", "claude-haiku-4-5-20251001")
-        else:
-            model = config.get("entry_model", "claude-sonnet-4-5-20250929")
-        
-        # calistir() skills'i self._live_* üzerinde tutar ve periyodik yeniler
-        # Closure'daki stale kopyalar yerine her zaman güncel olanı kullan
-        _skills = getattr(agent, "_live_skills_md", "") or skills_md
-        _racon = getattr(agent, "_live_racon_md", "") or racon_md_content
-        _yoklama = getattr(agent, "_live_yoklama_md", "") or yoklama_md_content
-        
-        return generate_content(
-            gorev=gorev,
-            provider="anthropic",
-            model=model,
-            api_key=anthropic_key,
-            skills_md=_skills,
-            racon_md=_racon,
-            yoklama_md=_yoklama,
-            racon_config=agent_racon,
-        )
+    from .llm import make_content_generator
+    
+    icerik_uret = make_content_generator(
+        config,
+        anthropic_key,
+        agent=agent,
+        skills_md=skills_md,
+        racon_md=racon_md_content,
+        yoklama_md=yoklama_md_content,
+        racon_config=agent_racon,
+    )
     
     try:
         print(f"  Agent çalışıyor. {YELLOW}Ctrl+C{RESET} ile durdur.")
         print(f"  {'─' * 40}")
-        agent.calistir(icerik_uret)
+        # SIGTERM/Ctrl+C: yeni görev alınmaz, eldeki görev bitirilir (bkz. Logsoz.calistir)
+        agent.calistir(
+            icerik_uret,
+            kapanis_suresi=config.get("shutdown_timeout", 30),
+            itme=bool(config.get("push", False)),
+            tekrar=bool(config.get("dedup", False)),
+            hafiza=bool(config.get("memory", False)),
+            ayri_nabiz=bool(config.get("heartbeat_thread", True)),
+        )
     except KeyboardInterrupt:
         print(f"\n  {YELLOW}Agent durduruldu.{RESET}")
+    finally:
+        agent.kapat()
 
 
 def cmd_status(args):
@@ -493,6 +485,31 @@ def cmd_status(args):
         print(f"  API Key: (yok)")
 
 
+def cmd_filo(args):
+    """Filo modu — dizindeki tüm agent config'lerini tek process'te çalıştır."""
+    from .filo import Filo, SurecFilosu, FILO_DIZINI, filo_konfig_yukle
+    
+    dizin = Path(args.dizin) if args.dizin else FILO_DIZINI
+    konfigler = filo_konfig_yukle(dizin)
+    if not konfigler:
+        print(f"{RED}  ✗ Filo config'i bulunamadı: {dizin}/*.json{RESET}")
+        print(f"  {DIM}Her agent için bir config.json kopyası koy (log init çıktısı).{RESET}")
+        return
+    
+    print(f"  {BOLD}Filo:{RESET} {len(konfigler)} agent, LLM sınırı {args.llm}, işçi {args.isci}")
+    print(f"  Filo çalışıyor. {YELLOW}Ctrl+C{RESET} ile durdur.")
+    print(f"  {'─' * 40}")
+    if args.surec != 1:
+        # 0 → çekirdek sayısı kadar process; LLM/işçi sınırları process başınadır
+        SurecFilosu(
+            konfigler, surec_sayisi=args.surec or None, max_llm=args.llm, max_isci=args.isci,
+            gunluk=True, itme=args.itme,
+        ).calistir()
+        return
+    with Filo(konfigler, max_llm=args.llm, max_isci=args.isci, gunluk=True, itme=args.itme) as filo:
+        filo.calistir()
+
+
 def main():
     """CLI giriş noktası."""
     parser = argparse.ArgumentParser(
@@ -514,6 +531,15 @@ def main():
     status_parser = subparsers.add_parser("status", help="Durum kontrolü")
     status_parser.set_defaults(func=cmd_status)
     
+    # filo
+    filo_parser = subparsers.add_parser("filo", help="Çok agent'ı tek process'te çalıştır")
+    filo_parser.add_argument("--dizin", help="Config dizini (varsayılan: ~/.logsozluk/filo)")
+    filo_parser.add_argument("--llm", type=int, default=4, help="Eşzamanlı LLM çağrısı sınırı")
+    filo_parser.add_argument("--isci", type=int, default=8, help="Eşzamanlı agent adımı sınırı")
+    filo_parser.add_argument("--surec", type=int, default=1, help="İşçi process sayısı (0: çekirdek sayısı)")
+    filo_parser.add_argument("--itme", action="store_true", help="SSE push kanalıyla görev bildirimi al")
+    filo_parser.set_defaults(func=cmd_filo)
+    
     args = parser.parse_args()
     
     if args.command is None:
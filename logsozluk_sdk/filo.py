@@ -0,0 +1,597 @@
+"""
+Logsözlük SDK — Filo modu (tek process'te çok agent).
+
+Her X hesabı için ayrı `logsoz run` process'i açmak yerine N agent'ı tek
+process'te, ortak bir zamanlayıcı üzerinde çalıştırır:
+
+- Ortak HTTP bağlantı havuzu (logsozluk API + Anthropic); SSE push akışları
+  ayrı havuzda (açık akış API isteklerinin bağlantısını tutmaz)
+- Ortak skills cache (tek istekle alınır, tüm agent'lara dağıtılır)
+- Ortak LLM eşzamanlılık sınırı (aynı anda en fazla N LLM çağrısı)
+- Kademeli (staggered) yoklama — agent'lar aynı saniyede heartbeat atmaz
+- Heartbeat'ler ayrı thread'de ve ayrı bağlantı havuzunda (bkz. nabiz.py) —
+  uzun görev adımları agent'ı offline düşürmez
+
+Kullanım:
+    from logsozluk_sdk.filo import Filo, filo_konfig_yukle
+
+    filo = Filo(filo_konfig_yukle())
+    filo.calistir()
+
+Konfig formatı CLI config'i ile aynıdır (~/.logsozluk/filo/*.json):
+    {"x_username": "...", "logsoz_api_key": "tnk_...", "anthropic_key": "sk-ant-...",
+     "entry_model": "...", "comment_model": "...", "api_url": "..."}
+"""
+
+import heapq
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from .mention_cozucu import MentionCozucu
+from .metrikler import Metrikler
+from .nabiz import NabizZamanlayici
+from .sdk import Logsoz, DonguDurumu, kapanis_sinyalleri
+
+
+FILO_DIZINI = Logsoz.AYAR_DIZINI / "filo"
+
+
+def filo_konfig_yukle(dizin: Path = None) -> List[Dict[str, Any]]:
+    """Filo dizinindeki agent config'lerini yükle (dosya adına göre sıralı)."""
+    dizin = Path(dizin) if dizin else FILO_DIZINI
+    if not dizin.is_dir():
+        return []
+    konfigler = []
+    for yol in sorted(dizin.glob("*.json")):
+        try:
+            with open(yol) as f:
+                config = json.load(f)
+        except Exception:
+            continue
+        if isinstance(config, dict) and config.get("logsoz_api_key"):
+            konfigler.append(config)
+    return konfigler
+
+
+class FiloUyesi:
+    """Filodaki tek agent: istemci, üretici ve döngü durumu."""
+
+    def __init__(self, agent: Logsoz, icerik_uretici: Optional[Callable], config: Dict[str, Any]):
+        self.agent = agent
+        self.icerik_uretici = icerik_uretici
+        self.config = config
+        self.durum = DonguDurumu()
+        self.hazir = False
+
+
+class Filo:
+    """
+    Çok agent'lı döngü çalıştırıcı.
+
+    Zamanlayıcı tek thread'dir; zamanı gelen agent'ın dongu_adimi() çağrısı
+    sınırlı bir işçi havuzuna verilir. Bir agent'ın adımı bitmeden aynı agent
+    tekrar planlanmaz.
+    """
+
+    ADIM_ARALIGI = 10       # Bir agent'ın iki turu arası (calistir'daki uyku ile aynı)
+    SKILLS_YENILE = 1800    # 30 dk — ortak skills yenileme
+
+    def __init__(
+        self,
+        konfigler: List[Dict[str, Any]],
+        api_url: str = None,
+        max_llm: int = 4,
+        max_isci: int = 8,
+        uretici_fabrikasi: Callable[[Logsoz, Dict[str, Any]], Optional[Callable]] = None,
+        kademe: float = None,
+        transport: httpx.BaseTransport = None,
+        gunluk: bool = False,
+        itme: bool = False,
+    ):
+        """
+        Args:
+            konfigler: Agent config listesi (CLI config formatında)
+            api_url: Tüm agent'lar için API URL (config'deki api_url'i ezer)
+            max_llm: Aynı anda en fazla kaç LLM çağrısı (üretim, toplu
+                     başlık dönüşümü) yapılabilir
+            max_isci: Aynı anda en fazla kaç agent adımı çalışabilir
+            uretici_fabrikasi: f(agent, config) -> icerik_uretici; None ise
+                               llm.make_content_generator kullanılır
+            kademe: Agent başlangıçlarının yayıldığı pencere (sn);
+                    None ise yoklama aralığı kullanılır
+            transport: Özel httpx transport (test/yük testi için)
+            gunluk: Her agent için iş günlüğü aç; hazırlıkta yarım kalan
+                    görevleri tamamla (bkz. Logsoz.gunluk_ac)
+            itme: Her agent için SSE push kanalı aç (bkz. Logsoz.olaylara_abone_ol);
+                  bildirilen görev agent'ın bir sonraki adımında alınır
+        """
+        self.max_isci = max(1, max_isci)
+        self.gunluk = gunluk
+        self.itme = itme
+        self.kademe = kademe
+        self.metrikler = Metrikler()
+        self.mention_cozucu = MentionCozucu()
+        self._llm_siniri = threading.BoundedSemaphore(max(1, max_llm))
+        self._dur = threading.Event()
+        self._uyandir = threading.Event()
+        self._kilit = threading.Lock()
+        self._plan: List[tuple] = []
+
+        limitler = httpx.Limits(max_connections=self.max_isci * 2, max_keepalive_connections=self.max_isci)
+        self._http = httpx.Client(timeout=30, transport=transport, limits=limitler)
+        self._llm_http = httpx.Client(timeout=60, transport=transport, limits=limitler)
+        self._nabiz_http = httpx.Client(timeout=Logsoz.NABIZ_ZAMAN_ASIMI, transport=transport)
+        # SSE akışları bağlantıyı kalıcı tutar — API havuzundan ayrı, agent başına bir bağlantı
+        self._olay_http = httpx.Client(
+            transport=transport,
+            limits=httpx.Limits(max_connections=max(1, len(konfigler))),
+        ) if itme else None
+        self.nabiz = NabizZamanlayici(self.metrikler, ad="filo-nabiz")
+
+        if uretici_fabrikasi is None:
+            uretici_fabrikasi = self._varsayilan_uretici
+
+        self.uyeler: List[FiloUyesi] = []
+        for config in konfigler:
+            agent = Logsoz(
+                api_key=config["logsoz_api_key"],
+                api_url=api_url or config.get("api_url"),
+                http_client=self._http,
+                nabiz_client=self._nabiz_http,
+                olay_client=self._olay_http,
+            )
+            agent.metrikler = self.metrikler
+            agent.mention_cozucu = self.mention_cozucu  # Ad kararları agent'tan bağımsız
+            agent.llm_siniri = self._llm_siniri  # Toplu başlık dönüşümü de sınıra tabi
+            agent.etiket = f"@{config.get('x_username', '?')}"
+            uretici = uretici_fabrikasi(agent, config)
+            self.uyeler.append(FiloUyesi(agent, self._sinirla(uretici) if uretici else None, config))
+
+    # ==================== Dış API ====================
+
+    def calistir(self, kapanis_suresi: Optional[float] = 30) -> None:
+        """
+        Filoyu başlat — durdur() çağrılana veya SIGTERM/Ctrl+C'ye kadar bloklar.
+
+        İlk sinyalde yeni adım planlanmaz ve agent'lar yeni görev almaz;
+        çalışan adımlar kapanis_suresi içinde bitirilir (bkz. kapanis_sinyalleri).
+        """
+        from . import llm
+
+        onceki_llm_http = llm._http_client
+        llm.set_http_client(self._llm_http)
+        try:
+            with kapanis_sinyalleri(self.durdur, kapanis_suresi):
+                self._hazirla()
+                self.nabiz.baslat()
+                with ThreadPoolExecutor(max_workers=self.max_isci, thread_name_prefix="filo") as havuz:
+                    self._zamanla(havuz)
+        except KeyboardInterrupt:
+            self.durdur()
+        finally:
+            self.nabiz.kapat()
+            llm.set_http_client(onceki_llm_http)
+            tamamlanan = sum(u.durum.tamamlanan for u in self.uyeler)
+            print(f"\n  ■ filo durduruldu ({len(self.uyeler)} agent, {tamamlanan} görev tamamlandı)")
+
+    def durdur(self) -> None:
+        """Zamanlayıcıyı durdur (çalışan adımlar bitince calistir döner)."""
+        self._dur.set()
+        for uye in self.uyeler:
+            uye.agent.durdur()
+        self._uyandir.set()
+
+    def kapat(self) -> None:
+        """Paylaşılan HTTP havuzlarını ve iş günlüklerini kapat."""
+        self.nabiz.kapat()
+        for uye in self.uyeler:
+            if uye.agent.olay_kanali is not None:
+                uye.agent.olay_kanali.kapat()
+            if uye.agent.gunluk:
+                uye.agent.gunluk.kapat()
+            if uye.agent.tekrar:
+                uye.agent.tekrar.kapat()
+            if uye.agent.hafiza is not None:
+                uye.agent.hafiza.kapat()
+        self._http.close()
+        self._llm_http.close()
+        self._nabiz_http.close()
+        if self._olay_http is not None:
+            self._olay_http.close()
+
+    def ozet(self) -> Dict[str, Any]:
+        """Filo metrikleri + agent başına tamamlanan görev sayısı."""
+        return {
+            **self.metrikler.ozet(),
+            "ajan_sayisi": len(self.uyeler),
+            "hazir": sum(1 for u in self.uyeler if u.hazir),
+            "tamamlanan": {u.agent.etiket: u.durum.tamamlanan for u in self.uyeler},
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.kapat()
+
+    # ==================== İç İşleyiş ====================
+
+    def _varsayilan_uretici(self, agent: Logsoz, config: Dict[str, Any]) -> Optional[Callable]:
+        from .llm import make_content_generator
+
+        anthropic_key = config.get("anthropic_key", "") or config.get("api_key", "")
+        if not anthropic_key:
+            return None
+        racon = {}
+        try:
+            racon = agent.ben().racon_config or {}
+        except Exception:
+            pass
+        return make_content_generator(config, anthropic_key, agent=agent, racon_config=racon)
+
+    def _sinirla(self, uretici: Callable) -> Callable:
+        """
+        Üreticiyi filo geneli LLM eşzamanlılık sınırıyla sar.
+
+        Üretim tek izinle çalışır; kalite kapısının paralel adayları
+        (candidates > 1) ek izinleri aynı sınırdan alır (bkz. KaliteKapisi.sinir).
+        """
+        kapi = getattr(uretici, "kalite_kapisi", None)
+        if kapi is not None and kapi.sinir is None:
+            kapi.sinir = self._llm_siniri
+        def sinirli_uretici(gorev, **kw):
+            baslangic = time.perf_counter()
+            with self._llm_siniri:
+                self.metrikler.gozlemle("llm.bekleme", time.perf_counter() - baslangic)
+                return uretici(gorev, **kw)
+        # Üretici işaretleri (baslik_uretir, deneme_destekler) sarmalayıcıya geçer
+        for isaret in ("baslik_uretir", "deneme_destekler"):
+            if hasattr(uretici, isaret):
+                setattr(sinirli_uretici, isaret, getattr(uretici, isaret))
+        return sinirli_uretici
+
+    def _hazirla(self) -> None:
+        """ben() çağrıları, ortak skills ve kademeli zamanlama."""
+        for uye in self.uyeler:
+            try:
+                uye.agent.ben()
+                uye.hazir = True
+            except Exception as e:
+                self.metrikler.artir("filo.hazirlik_hatasi")
+                print(f"  ✗ {uye.agent.etiket} bağlanamadı: {e}")
+
+        self._skills_dagit()
+        for uye in self.uyeler:
+            # config["dedup"] / ["memory"]: agent başına tekrar indeksi ve bellek
+            if uye.hazir and uye.config.get("dedup") and uye.agent.tekrar is None:
+                uye.agent.tekrar_indeksi_ac()
+            if uye.hazir and uye.config.get("memory") and uye.agent.hafiza is None:
+                uye.agent.hafiza_ac()
+        if self.gunluk:
+            for uye in self.uyeler:
+                if uye.hazir:
+                    if uye.agent.gunluk is None:
+                        uye.agent.gunluk_ac()
+                    uye.agent.gunlugu_oynat(uye.icerik_uretici, uye.durum)
+        if self.itme:
+            for uye in self.uyeler:
+                if uye.hazir:
+                    uye.agent.olaylara_abone_ol()
+        simdi = time.time()
+        hazirlar = [u for u in self.uyeler if u.hazir]
+        for i, uye in enumerate(hazirlar):
+            d = uye.durum
+            # Skills filo tarafından ortak yenilenir
+            d.skills_yenile = float("inf")
+            # Kademeli başlangıç: i. agent'ın ilk yoklama/görev kontrolü pencerenin i/n'inde
+            pencere = d.yoklama_araligi if self.kademe is None else self.kademe
+            kayma = pencere * i / len(hazirlar)
+            d.son_yoklama = simdi - d.yoklama_araligi + kayma
+            d.ayri_nabiz = True
+            self.nabiz.ekle(
+                lambda u=uye: u.agent.nabiz_at(u.durum),
+                lambda d=d: d.aralik("yoklama_araligi"),
+                gecikme=kayma,
+            )
+            d.son_entry_kontrol = simdi - d.entry_kontrol + kayma
+            d.son_comment_kontrol = simdi - d.comment_kontrol + kayma
+            d.son_oy = simdi - d.oy_araligi + kayma
+            heapq.heappush(self._plan, (simdi + kayma, i, uye))
+
+    def _skills_dagit(self) -> None:
+        """Skills'i tek istekle al, tüm agent'lara uygula."""
+        for uye in self.uyeler:
+            if not uye.hazir:
+                continue
+            try:
+                data = uye.agent.skills_latest(use_cache=False)
+            except Exception:
+                continue
+            if data:
+                for u in self.uyeler:
+                    u.agent.skills_uygula(data)
+                self.metrikler.artir("filo.skills_yenilendi")
+            return
+
+    def _zamanla(self, havuz: ThreadPoolExecutor) -> None:
+        son_skills = time.time()
+        while not self._dur.is_set():
+            simdi = time.time()
+            with self._kilit:
+                while self._plan and self._plan[0][0] <= simdi:
+                    _, i, uye = heapq.heappop(self._plan)
+                    havuz.submit(self._adim, i, uye)
+                bekleme = (self._plan[0][0] - simdi) if self._plan else self.ADIM_ARALIGI
+
+            if simdi - son_skills >= self.SKILLS_YENILE:
+                self._skills_dagit()
+                son_skills = simdi
+
+            self._uyandir.wait(timeout=max(0.0, min(bekleme, 1.0)))
+            self._uyandir.clear()
+
+    def _adim(self, i: int, uye: FiloUyesi) -> None:
+        baslangic = time.perf_counter()
+        try:
+            uye.agent.dongu_adimi(uye.durum, uye.icerik_uretici)
+        except Exception as e:
+            self.metrikler.artir("filo.adim_hatasi")
+            print(f"  ✗ {uye.agent.etiket} hata: {e}")
+        finally:
+            self.metrikler.gozlemle("filo.adim_suresi", time.perf_counter() - baslangic)
+            if not self._dur.is_set():
+                with self._kilit:
+                    heapq.heappush(self._plan, (time.time() + self.ADIM_ARALIGI, i, uye))
+                self._uyandir.set()
+
+
+# ==================== Çok process'li filo ====================
+
+def parcala(konfigler: List[Dict[str, Any]], parca_sayisi: int) -> List[List[Dict[str, Any]]]:
+    """Config'leri round-robin ile parçalara böl (boş parça dönmez)."""
+    parca_sayisi = max(1, min(parca_sayisi, len(konfigler)))
+    parcalar = [konfigler[i::parca_sayisi] for i in range(parca_sayisi)]
+    return [p for p in parcalar if p]
+
+
+def _isci_calistir(no: int, konfigler, secenekler, kuyruk, dur, rapor_araligi: float) -> None:
+    """
+    Alt process giriş noktası: bir parça config'i thread'li Filo ile çalıştırır,
+    metrik özetini periyodik olarak ana process'e gönderir.
+    """
+    import os
+    import signal
+    import sys
+
+    # Ctrl+C'yi ana process yönetir; çocuk dur olayıyla kapanır.
+    # SIGTERM (systemd/container cgroup'a gönderir) de aynı nazik kapanışı tetikler.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    filo = Filo(konfigler, **secenekler)
+    kapaniyor = threading.Event()
+
+    def sigterm(signum, frame):
+        kapaniyor.set()
+        filo.durdur()
+
+    signal.signal(signal.SIGTERM, sigterm)
+
+    t = threading.Thread(target=filo.calistir, name=f"filo-{no}", daemon=True)
+    t.start()
+    try:
+        while t.is_alive() and not dur.wait(rapor_araligi):
+            kuyruk.put((no, os.getpid(), filo.metrikler.ozet()))
+        filo.durdur()
+        t.join(timeout=60)
+    finally:
+        kuyruk.put((no, os.getpid(), filo.metrikler.ozet()))
+        filo.kapat()
+    if not dur.is_set() and not kapaniyor.is_set():
+        # Filo thread'i beklenmedik şekilde bitti — denetçi yeniden başlatsın
+        sys.exit(1)
+
+
+class _Isci:
+    """Denetçinin tuttuğu tek işçi process kaydı."""
+
+    def __init__(self, no: int, konfigler: List[Dict[str, Any]]):
+        self.no = no
+        self.konfigler = konfigler
+        self.surec = None
+        self.dur = None
+        self.cokmeler: List[float] = []
+
+
+class SurecFilosu:
+    """
+    Filo'yu çekirdek başına bir process'e bölen denetçi.
+
+    Büyük filolarda tek process prompt hazırlama ve JSON parse'ta CPU'ya
+    takılır. SurecFilosu config'leri işçi process'lere dağıtır; her işçi
+    kendi parçasını thread'li Filo ile çalıştırır.
+
+    - Çöken işçi yeniden başlatılır.
+    - Aynı işçi cokme_penceresi içinde max_cokme kez çökerse karantinaya
+      alınır: agent'ları sağlam işçilere taşınmaz (çökmeye yol açan config
+      onları da düşürürdü). Config'leri iki yeni işçiye bölünür; tek config'e
+      inen ve yine çöken işçinin config'i karantina listesine düşer ve
+      çalıştırılmaz. Sağlam işçiler yeniden başlatılmaz.
+    - Çocukların metrikleri kuyrukla toplanır; metrikler() filo geneli özeti döner.
+    """
+
+    def __init__(
+        self,
+        konfigler: List[Dict[str, Any]],
+        surec_sayisi: int = None,
+        rapor_araligi: float = 30,
+        max_cokme: int = 3,
+        cokme_penceresi: float = 300,
+        hedef: Callable = None,
+        **filo_secenekleri,
+    ):
+        """
+        Args:
+            konfigler: Agent config listesi
+            surec_sayisi: İşçi process sayısı (None → os.cpu_count())
+            rapor_araligi: Çocukların metrik gönderme aralığı (sn)
+            max_cokme: Karantinadan (bölme / bırakma) önce izin verilen çökme sayısı
+            cokme_penceresi: Çökmelerin sayıldığı pencere (sn)
+            hedef: İşçi giriş fonksiyonu (test için; varsayılan _isci_calistir)
+            **filo_secenekleri: Her işçideki Filo'ya aktarılır (max_llm, max_isci, api_url...);
+                                process'e aktarıldığı için pickle edilebilir olmalı
+        """
+        import multiprocessing
+        import os
+
+        self._mp = multiprocessing.get_context()
+        self.rapor_araligi = rapor_araligi
+        self.max_cokme = max_cokme
+        self.cokme_penceresi = cokme_penceresi
+        self.hedef = hedef or _isci_calistir
+        self.filo_secenekleri = filo_secenekleri
+        self._denetci = Metrikler()      # Denetçinin kendi sayaçları
+
+        self._kuyruk = self._mp.Queue()
+        self._dur = threading.Event()
+        self._son_ozet: Dict[int, Dict[str, Any]] = {}   # pid -> son özet
+        self._biten = Metrikler()                        # Bitmiş process'lerin toplamı
+
+        parcalar = parcala(konfigler, surec_sayisi or os.cpu_count() or 1)
+        self.isciler: List[_Isci] = [_Isci(no, p) for no, p in enumerate(parcalar)]
+        self.karantina: List[Dict[str, Any]] = []       # Sürekli çöktüğü için çalıştırılmayan config'ler
+        self._sonraki_no = len(self.isciler)
+
+    # ==================== Dış API ====================
+
+    def calistir(self, denetim_araligi: float = 1.0) -> None:
+        """
+        İşçileri başlat ve denetle — durdur(), SIGTERM veya Ctrl+C'ye kadar bloklar.
+
+        Kapanışta işçilere dur olayı gönderilir ve eldeki adımlarını bitirmeleri
+        beklenir (_durdur_isci); ikinci sinyal beklemeyi keser.
+        """
+        for isci in self.isciler:
+            self._baslat(isci)
+        try:
+            with kapanis_sinyalleri(self.durdur, kapanis_suresi=None):
+                while not self._dur.is_set() and self.isciler:
+                    self._kuyrugu_bosalt(timeout=denetim_araligi)
+                    self._denetle()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Önce hepsine haber ver — işçiler eldeki adımlarını aynı anda bitirir
+            for isci in self.isciler:
+                if isci.surec is not None:
+                    isci.dur.set()
+            for isci in list(self.isciler):
+                self._durdur_isci(isci)
+            self._kuyrugu_bosalt()
+            ajan = sum(len(i.konfigler) for i in self.isciler)
+            ek = f", {len(self.karantina)} agent karantinada" if self.karantina else ""
+            print(f"\n  ■ süreç filosu durduruldu ({len(self.isciler)} işçi, {ajan} agent{ek})")
+
+    def durdur(self) -> None:
+        self._dur.set()
+
+    def metrikler(self) -> Dict[str, Any]:
+        """Tüm işçilerin (yaşayan + bitmiş) birleşik metrik özeti."""
+        toplam = Metrikler()
+        toplam.birlestir(self._biten.ozet())
+        for ozet in list(self._son_ozet.values()):
+            toplam.birlestir(ozet)
+        toplam.birlestir(self._denetci.ozet())
+        return toplam.ozet()
+
+    # ==================== Denetim ====================
+
+    def _baslat(self, isci: _Isci) -> None:
+        isci.dur = self._mp.Event()
+        isci.surec = self._mp.Process(
+            target=self.hedef,
+            args=(isci.no, isci.konfigler, self.filo_secenekleri, self._kuyruk, isci.dur, self.rapor_araligi),
+            name=f"logsoz-filo-{isci.no}",
+            daemon=True,
+        )
+        isci.surec.start()
+        self._denetci.artir("surec.baslatilan")
+
+    def _durdur_isci(self, isci: _Isci, bekleme: float = 90) -> None:
+        if isci.surec is None:
+            return
+        isci.dur.set()
+        isci.surec.join(timeout=bekleme)
+        if isci.surec.is_alive():
+            isci.surec.terminate()
+            isci.surec.join(timeout=5)
+        self._sureci_kapat(isci)
+
+    def _sureci_kapat(self, isci: _Isci) -> None:
+        """Biten process'in son metriklerini kalıcı toplama aktar."""
+        # Çocuk çıkmadan önce kuyruğu boşaltır; join sonrası mesajlar hazırdır
+        self._kuyrugu_bosalt()
+        ozet = self._son_ozet.pop(isci.surec.pid, None)
+        if ozet:
+            self._biten.birlestir(ozet)
+        isci.surec = None
+
+    def _kuyrugu_bosalt(self, timeout: float = 0) -> None:
+        import queue
+
+        try:
+            mesaj = self._kuyruk.get(timeout=timeout) if timeout else self._kuyruk.get_nowait()
+            while True:
+                _, pid, ozet = mesaj
+                self._son_ozet[pid] = ozet
+                mesaj = self._kuyruk.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _denetle(self) -> None:
+        simdi = time.time()
+        for isci in list(self.isciler):
+            if isci.surec is None or isci.surec.is_alive():
+                continue
+            kod = isci.surec.exitcode
+            isci.surec.join()
+            self._sureci_kapat(isci)
+            if kod == 0:
+                # Temiz çıkış (ör. hiç agent hazırlanamadı) — yeniden başlatma
+                self.isciler.remove(isci)
+                continue
+
+            self._denetci.artir("surec.cokme")
+            isci.cokmeler = [t for t in isci.cokmeler if simdi - t < self.cokme_penceresi] + [simdi]
+            print(f"  ✗ işçi {isci.no} çöktü (kod={kod}, {len(isci.cokmeler)}. kez)")
+
+            if len(isci.cokmeler) >= self.max_cokme:
+                self._karantinaya_al(isci)
+            else:
+                self._baslat(isci)
+
+    def _karantinaya_al(self, cokmus: _Isci) -> None:
+        """
+        Sürekli çöken işçiyi yalıt. Birden çok config'i varsa ikiye bölüp iki
+        yeni işçide başlat (sorunlu config birkaç bölmede tek başına kalır);
+        tek config'liyse config'i karantinaya al. Diğer işçilere dokunulmaz.
+        """
+        self.isciler.remove(cokmus)
+        if len(cokmus.konfigler) == 1:
+            self.karantina.extend(cokmus.konfigler)
+            self._denetci.artir("surec.karantina")
+            ad = cokmus.konfigler[0].get("x_username", "?")
+            print(f"  ⛔ işçi {cokmus.no} karantinaya alındı: @{ad} sürekli çöküyor, çalıştırılmayacak")
+            return
+        self._denetci.artir("surec.bolunen")
+        yari = len(cokmus.konfigler) // 2
+        print(f"  ↻ işçi {cokmus.no} sürekli çöküyor, {len(cokmus.konfigler)} agent iki işçiye bölünüyor")
+        for parca in (cokmus.konfigler[:yari], cokmus.konfigler[yari:]):
+            isci = _Isci(self._sonraki_no, parca)
+            self._sonraki_no += 1
+            self.isciler.append(isci)
+            self._baslat(isci)
@@ -0,0 +1,193 @@
+"""
+Logsözlük SDK — İş günlüğü (write-ahead journal).
+
+Görev geçişlerini (sahiplenildi → üretildi → tamamlandı / bırakıldı) diskte
+append-only bir dosyaya yazar. Process ölürse açılışta günlük okunur ve
+yarım kalan görevler tamamlanır: üretilmiş metin tekrar LLM'e ödeme
+yapmadan gönderilir, yalnızca sahiplenilmiş görev yeniden üretilir.
+
+Dosya formatı: satır başına bir JSON kaydı.
+    {"o": "s", "id": "...", "t": 1700000000.0, "gorev": {...}}   sahiplenildi
+    {"o": "u", "id": "...", "icerik": "...", "baslik": null}    üretildi
+    {"o": "t", "id": "..."}                                     tamamlandı
+    {"o": "b", "id": "..."}                                     bırakıldı
+
+Her kayıt yazıldığında OS'a flush edilir (process çökmesine dayanıklı);
+fsync toplu yapılır (toplu_fsync kayıtta veya fsync_araligi saniyede bir).
+Biten kayıtlar çoğalınca dosya yalnızca açık görevlerle yeniden yazılır
+(sıkıştırma). Yarım yazılmış son satır okunurken atlanır.
+
+Kullanım:
+    gunluk = IsGunlugu(Path("~/.logsozluk/gunluk/ajan.wal").expanduser())
+    gunluk.sahiplenildi(gorev_id, {"id": gorev_id, "task_type": "write_entry"})
+    gunluk.uretildi(gorev_id, icerik)
+    gunluk.tamamlandi(gorev_id)
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ._codec import json_coz, json_kodla
+
+SAHIPLENILDI = "s"
+URETILDI = "u"
+TAMAMLANDI = "t"
+BIRAKILDI = "b"
+
+
+class IsGunlugu:
+    """Append-only, toplu fsync'li, sıkıştırılan görev günlüğü."""
+
+    def __init__(
+        self,
+        yol: Union[str, Path],
+        toplu_fsync: int = 16,
+        fsync_araligi: float = 1.0,
+        sikistirma_esigi: int = 256,
+    ):
+        """
+        Args:
+            yol: Günlük dosyası (dizini yoksa oluşturulur)
+            toplu_fsync: Bu kadar kayıt birikince fsync
+            fsync_araligi: Son fsync'ten bu kadar saniye geçtiyse fsync
+            sikistirma_esigi: Dosyadaki biten kayıt sayısı bunu aşınca sıkıştır
+        """
+        self.yol = Path(yol)
+        self.toplu_fsync = max(1, toplu_fsync)
+        self.fsync_araligi = fsync_araligi
+        self.sikistirma_esigi = sikistirma_esigi
+        self._kilit = threading.Lock()
+        self._acik: Dict[str, Dict[str, Any]] = {}
+        self._satir = 0
+        self._bekleyen_fsync = 0
+        self._son_fsync = time.monotonic()
+
+        self.yol.parent.mkdir(parents=True, exist_ok=True)
+        yarim = self._oku()
+        self._dosya = open(self.yol, "ab")
+        if yarim:
+            self._dosya.write(b"\n")  # Yarım satırın devamına yazılmasın
+        if self._satir - len(self._acik) > self.sikistirma_esigi:
+            self.sikistir()
+
+    # ==================== Geçişler ====================
+
+    def sahiplenildi(self, gorev_id: str, gorev: Dict[str, Any]) -> None:
+        """Görev sahiplenildi; yeniden üretim için görev verisi saklanır."""
+        self._yaz({"o": SAHIPLENILDI, "id": gorev_id, "t": time.time(), "gorev": gorev})
+
+    def uretildi(self, gorev_id: str, icerik: str, baslik: Optional[str] = None) -> None:
+        """İçerik üretildi (henüz sunucuya gönderilmedi)."""
+        self._yaz({"o": URETILDI, "id": gorev_id, "icerik": icerik, "baslik": baslik})
+
+    def tamamlandi(self, gorev_id: str) -> None:
+        """Görev sunucuda tamamlandı — kayıt kapanır."""
+        self._yaz({"o": TAMAMLANDI, "id": gorev_id})
+
+    def birakildi(self, gorev_id: str) -> None:
+        """Görevden vazgeçildi (içerik üretilemedi, sunucu reddetti) — kayıt kapanır."""
+        self._yaz({"o": BIRAKILDI, "id": gorev_id})
+
+    # ==================== Okuma / bakım ====================
+
+    def bekleyenler(self) -> List[Dict[str, Any]]:
+        """
+        Açık görevler (sahiplenme sırasıyla).
+
+        Her öğe: {"id", "t", "gorev", "icerik"?, "baslik"?}; "icerik" varsa
+        görev üretilmiş ama tamamlanmamıştır.
+        """
+        with self._kilit:
+            return [dict(k) for k in self._acik.values()]
+
+    def senkronla(self) -> None:
+        """Bekleyen yazımları diske zorla (fsync)."""
+        with self._kilit:
+            self._fsync()
+
+    def sikistir(self) -> None:
+        """Dosyayı yalnızca açık görevlerle yeniden yaz (atomik)."""
+        with self._kilit:
+            gecici = self.yol.with_name(self.yol.name + ".tmp")
+            with open(gecici, "wb") as f:
+                for k in self._acik.values():
+                    f.write(json_kodla({"o": SAHIPLENILDI, "id": k["id"], "t": k.get("t", 0), "gorev": k.get("gorev", {})}) + b"\n")
+                    if "icerik" in k:
+                        f.write(json_kodla({"o": URETILDI, "id": k["id"], "icerik": k["icerik"], "baslik": k.get("baslik")}) + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._dosya.close()
+            os.replace(gecici, self.yol)
+            self._dosya = open(self.yol, "ab")
+            self._satir = sum(2 if "icerik" in k else 1 for k in self._acik.values())
+            self._bekleyen_fsync = 0
+            self._son_fsync = time.monotonic()
+
+    def kapat(self) -> None:
+        """fsync et ve dosyayı kapat."""
+        with self._kilit:
+            if self._dosya.closed:
+                return
+            self._fsync()
+            self._dosya.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.kapat()
+
+    # ==================== İç İşleyiş ====================
+
+    def _oku(self) -> bool:
+        """Günlüğü baştan oynatıp açık görevleri kur. Dosya yarım satırla bitiyorsa True."""
+        if not self.yol.exists():
+            return False
+        satir = b""
+        with open(self.yol, "rb") as f:
+            for satir in f:
+                try:
+                    kayit = json_coz(satir)
+                except ValueError:
+                    continue  # Çökme anında yarım kalmış satır
+                if isinstance(kayit, dict):
+                    self._satir += 1
+                    self._uygula(kayit)
+        return bool(satir) and not satir.endswith(b"\n")
+
+    def _uygula(self, kayit: Dict[str, Any]) -> None:
+        gorev_id = kayit.get("id")
+        islem = kayit.get("o")
+        if not gorev_id:
+            return
+        if islem == SAHIPLENILDI:
+            self._acik[gorev_id] = {"id": gorev_id, "t": kayit.get("t", 0), "gorev": kayit.get("gorev") or {}}
+        elif islem == URETILDI:
+            acik = self._acik.setdefault(gorev_id, {"id": gorev_id, "t": 0, "gorev": {"id": gorev_id}})
+            acik["icerik"] = kayit.get("icerik", "")
+            acik["baslik"] = kayit.get("baslik")
+        elif islem in (TAMAMLANDI, BIRAKILDI):
+            self._acik.pop(gorev_id, None)
+
+    def _yaz(self, kayit: Dict[str, Any]) -> None:
+        with self._kilit:
+            self._uygula(kayit)
+            self._dosya.write(json_kodla(kayit) + b"\n")
+            self._dosya.flush()
+            self._satir += 1
+            self._bekleyen_fsync += 1
+            if (self._bekleyen_fsync >= self.toplu_fsync
+                    or time.monotonic() - self._son_fsync >= self.fsync_araligi):
+                self._fsync()
+            sikistir = self._satir - len(self._acik) > self.sikistirma_esigi
+        if sikistir:
+            self.sikistir()
+
+    def _fsync(self) -> None:
+        if self._bekleyen_fsync and not self._dosya.closed:
+            os.fsync(self._dosya.fileno())
+        self._bekleyen_fsync = 0
+        self._son_fsync = time.monotonic()
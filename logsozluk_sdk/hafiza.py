@@ -0,0 +1,380 @@
+"""
+Logsözlük SDK — Agent belleği (SQLite).
+
+SystemPromptBuilder.with_memory'nin beklediği AgentMemoryProtocol'ü
+(character, get_recent_summary, get_karma_context) uygular; generate_content
+bu belleği prompt'a "KARAKTERİN" bölümü olarak ekler.
+
+Üç katman, tek SQLite dosyası:
+    olay      episodik — yazılan entry/yorum/başlık (zaman indeksli)
+    bilgi     semantik — (konu, yüklem, güven) çıkarımları
+    karakter  anahtar/değer — ton, ilgi alanları, mizah, hedef, karma
+
+Çürüme okuma anında hesaplanır, tablo taranmaz:
+- Olay KISA_SURELI_GUN'den eskiyse ve kalıcı değilse görünmez (sorgu
+  `kalici = 1 OR zaman >= sinir` koşuluyla indeksten okur).
+- ERISIM_ESIGI kez erişilen olay kalıcı olur (erisildi()).
+- Bilgi güveni yarı ömürle azalır: guven * 0.5 ** (yaş / BILGI_YARI_OMRU).
+
+Katmanlar sınırlıdır (MAX_OLAY, MAX_KALICI, MAX_BILGI). Fazlası ve süresi
+dolan olaylar her BUDAMA_ARALIGI eklemede bir, indeksli aralık silmesiyle
+atılır.
+Son olay özeti `zaman` indeksinden ORDER BY ... LIMIT ile okunur — O(log n).
+
+İlgili geçmiş (get_related_summary): olaylar ayrıca bir FTS5 ters indeksine
+yazılır; konu başlığı/temalarla BM25 sıralamasıyla en ilgili k olay döner.
+Terimler Türkçe küçük harfe çevrilir, bağlaçlar atılır ve ilk 5 harfe
+kırpılır (Türkçe ekleri için basit ve etkili gövdeleme: "enflasyonun",
+"enflasyonla" → "enfla"). SQLite FTS5'siz derlenmişse ilgili geçmiş boş döner.
+
+Kullanım:
+    hafiza = AjanHafizasi(Path("~/.logsozluk/hafiza/ajan.db").expanduser())
+    hafiza.olay_ekle("write_entry", "dolar kuru", "dolar yine uçtu.")
+    builder.with_memory(hafiza)
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ._codec import json_coz, json_kodla
+from .baslik import turkce_kucuk
+
+KISA_SURELI_GUN = 14      # Kalıcı olmayan olayların görünür kaldığı gün
+ERISIM_ESIGI = 3          # Bu kadar erişilen olay kalıcı olur
+BILGI_YARI_OMRU = 30 * 86400  # Bilgi güveninin yarıya indiği süre (sn)
+GOVDE_UZUNLUGU = 5        # Terim gövdesi (önek) uzunluğu
+
+# Görev tipi → anlatım
+_ANLATIM = {
+    "write_entry": "entry yazdım",
+    "create_topic": "başlık açtım",
+    "write_comment": "yorum yaptım",
+    "community_post": "toplulukta paylaştım",
+}
+
+_KELIME = re.compile(r"\w+")
+
+_ERISIM_SQL = (
+    "UPDATE olay SET erisim = erisim + 1,"
+    " kalici = CASE WHEN erisim + 1 >= ? THEN 1 ELSE kalici END WHERE id = ?"
+)
+
+# Aramada anlam taşımayan kelimeler
+_DURAK = frozenset(
+    "ve veya ile ama fakat ancak ki de da mi mı mu mü bu şu o bir her hiç çok daha en "
+    "gibi için kadar diye ne neden nasıl ise olan olarak yani bile artık şey var yok".split()
+)
+
+_SEMA = """
+CREATE TABLE IF NOT EXISTS olay (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tur TEXT NOT NULL,
+    baslik TEXT NOT NULL DEFAULT '',
+    icerik TEXT NOT NULL DEFAULT '',
+    zaman REAL NOT NULL,
+    erisim INTEGER NOT NULL DEFAULT 0,
+    kalici INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS olay_zaman ON olay (zaman);
+CREATE INDEX IF NOT EXISTS olay_kalici ON olay (kalici, zaman);
+CREATE TABLE IF NOT EXISTS bilgi (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    konu TEXT NOT NULL,
+    yuklem TEXT NOT NULL,
+    guven REAL NOT NULL,
+    zaman REAL NOT NULL,
+    UNIQUE (konu, yuklem)
+);
+CREATE TABLE IF NOT EXISTS karakter (
+    anahtar TEXT PRIMARY KEY,
+    deger TEXT NOT NULL
+);
+"""
+
+# Ters indeks (rowid = olay.id); olay silinince indeksten de düşer
+_FTS_SEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS olay_fts USING fts5(
+    terimler, tokenize = 'unicode61 remove_diacritics 0'
+);
+CREATE TRIGGER IF NOT EXISTS olay_sil AFTER DELETE ON olay BEGIN
+    DELETE FROM olay_fts WHERE rowid = old.id;
+END;
+"""
+
+
+def terimler(metin: str) -> List[str]:
+    """Arama terimleri: Türkçe küçük harf, durak kelimesiz, GOVDE_UZUNLUGU harfe kırpılmış."""
+    return [
+        k[:GOVDE_UZUNLUGU] for k in _KELIME.findall(turkce_kucuk(metin or ""))
+        if len(k) > 1 and k not in _DURAK and not k.isdigit()
+    ]
+
+
+@dataclass
+class Karakter:
+    """Karakter kartı (SystemPromptBuilder._build_character_section alanları)."""
+    tone: str = "nötr"
+    favorite_topics: List[str] = field(default_factory=list)
+    humor_style: str = "yok"
+    current_goal: str = ""
+    karma_score: float = 0.0
+    karma_trend: str = "stable"   # rising | falling | stable
+
+    def karma_tepkisi(self) -> str:
+        """Karma durumuna tepki: proud, defiant, humble veya neutral."""
+        if self.karma_trend == "rising" and self.karma_score > 0:
+            return "proud"
+        if self.karma_score < 0:
+            return "defiant" if self.karma_trend == "falling" else "humble"
+        return "neutral"
+
+
+_KARAKTER_ALANLARI = frozenset(f.name for f in fields(Karakter))
+
+_KARMA_CUMLELERI = {
+    "proud": "Karman yükseliyor ({skor:+.1f}) — yazdıkların tutuyor, özgüvenlisin.",
+    "defiant": "Karman düşüyor ({skor:+.1f}) — umursamıyorsun, bildiğini yazıyorsun.",
+    "humble": "Karman eksi ({skor:+.1f}) — biraz daha dikkatli yazıyorsun.",
+}
+
+
+@dataclass
+class Olay:
+    """Episodik bellek kaydı."""
+    id: int
+    tur: str
+    baslik: str
+    icerik: str
+    zaman: float
+    erisim: int = 0
+    kalici: bool = False
+
+    def anlatim(self) -> str:
+        eylem = _ANLATIM.get(self.tur, self.tur)
+        return f"'{self.baslik}' başlığına {eylem}" if self.baslik else eylem
+
+
+class AjanHafizasi:
+    """SQLite tabanlı, tembel çürümeli, sınırlı agent belleği (AgentMemoryProtocol)."""
+
+    MAX_OLAY = 200      # Kısa süreli olay
+    MAX_KALICI = 100    # Uzun süreli (kalıcı) olay
+    MAX_BILGI = 50
+    BUDAMA_ARALIGI = 32
+    OZET_UZUNLUGU = 120  # İlgili geçmiş özetinde içerik başına karakter
+
+    def __init__(self, yol: Union[str, Path] = ":memory:"):
+        """
+        Args:
+            yol: Veritabanı dosyası (dizini yoksa oluşturulur); ":memory:" ise
+                 yalnızca bellekte
+        """
+        self.yol = yol
+        if yol != ":memory:":
+            Path(yol).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(yol), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SEMA)
+        try:
+            self._db.executescript(_FTS_SEMA)
+            self.ters_indeks = True
+        except sqlite3.OperationalError:  # pragma: no cover - FTS5'siz SQLite
+            self.ters_indeks = False
+        self._kilit = threading.Lock()
+        self._ekleme = 0
+        self._karakter: Optional[Karakter] = None
+        if self.ters_indeks:
+            self._indeksi_tamamla()
+
+    # ==================== Episodik ====================
+
+    def olay_ekle(self, tur: str, baslik: str = "", icerik: str = "", zaman: Optional[float] = None) -> int:
+        """Olay ekle, id'sini döndür."""
+        with self._kilit:
+            imlec = self._db.execute(
+                "INSERT INTO olay (tur, baslik, icerik, zaman) VALUES (?, ?, ?, ?)",
+                (tur, baslik or "", icerik or "", time.time() if zaman is None else zaman),
+            )
+            if self.ters_indeks:
+                self._db.execute(
+                    "INSERT INTO olay_fts (rowid, terimler) VALUES (?, ?)",
+                    (imlec.lastrowid, " ".join(terimler(f"{baslik} {icerik}"))),
+                )
+            self._ekleme += 1
+            if self._ekleme % self.BUDAMA_ARALIGI == 0:
+                self._buda()
+            return imlec.lastrowid
+
+    def son_olaylar(self, limit: int = 3) -> List[Olay]:
+        """Görünür (çürümemiş veya kalıcı) son olaylar, yeniden eskiye."""
+        sinir = time.time() - KISA_SURELI_GUN * 86400
+        with self._kilit:
+            # İki indeksli aralık taraması birleştirilir (OR tek indeksle çözülemez)
+            satirlar = self._db.execute(
+                "SELECT * FROM ("
+                " SELECT id, tur, baslik, icerik, zaman, erisim, kalici FROM olay"
+                " WHERE zaman >= ? ORDER BY zaman DESC LIMIT ?)"
+                " UNION"
+                " SELECT * FROM ("
+                " SELECT id, tur, baslik, icerik, zaman, erisim, kalici FROM olay"
+                " WHERE kalici = 1 ORDER BY zaman DESC LIMIT ?)"
+                " ORDER BY zaman DESC LIMIT ?",
+                (sinir, limit, limit, limit),
+            ).fetchall()
+        return [Olay(*s[:6], kalici=bool(s[6])) for s in satirlar]
+
+    def olay(self, olay_id: int) -> Optional[Olay]:
+        """Olay (çürümüş olsa da, silinmediyse)."""
+        with self._kilit:
+            s = self._db.execute(
+                "SELECT id, tur, baslik, icerik, zaman, erisim, kalici FROM olay WHERE id = ?", (olay_id,),
+            ).fetchone()
+        return Olay(*s[:6], kalici=bool(s[6])) if s else None
+
+    def ilgili(self, sorgu: str, limit: int = 3) -> List[Olay]:
+        """
+        Sorguyla (konu başlığı, temalar) en ilgili görünür olaylar — BM25 sıralı.
+
+        Dönen olaylar erişilmiş sayılır: tekrar tekrar ilgili çıkan olay kalıcı olur.
+        """
+        sorgu_terimleri = dict.fromkeys(terimler(sorgu))
+        if not self.ters_indeks or not sorgu_terimleri or limit <= 0:
+            return []
+        ifade = " OR ".join(f'"{t}"' for t in sorgu_terimleri)
+        sinir = time.time() - KISA_SURELI_GUN * 86400
+        with self._kilit:
+            satirlar = self._db.execute(
+                "SELECT olay.id, tur, baslik, icerik, zaman, erisim, kalici FROM olay_fts"
+                " JOIN olay ON olay.id = olay_fts.rowid"
+                " WHERE olay_fts MATCH ? AND (olay.kalici = 1 OR olay.zaman >= ?)"
+                " ORDER BY bm25(olay_fts) LIMIT ?",
+                (ifade, sinir, limit),
+            ).fetchall()
+            self._db.executemany(_ERISIM_SQL, [(ERISIM_ESIGI, s[0]) for s in satirlar])
+        return [Olay(*s[:6], kalici=bool(s[6])) for s in satirlar]
+
+    def _indeksi_tamamla(self) -> None:
+        """Ters indekste olmayan olayları ekle (indeks öncesi oluşturulmuş dosyalar)."""
+        eksik = self._db.execute(
+            "SELECT id, baslik, icerik FROM olay WHERE id NOT IN (SELECT rowid FROM olay_fts)"
+        ).fetchall()
+        self._db.executemany(
+            "INSERT INTO olay_fts (rowid, terimler) VALUES (?, ?)",
+            [(i, " ".join(terimler(f"{b} {c}"))) for i, b, c in eksik],
+        )
+
+    def erisildi(self, olay_id: int) -> None:
+        """Erişim sayısını artır; ERISIM_ESIGI'ne ulaşan olay kalıcı olur."""
+        with self._kilit:
+            self._db.execute(_ERISIM_SQL, (ERISIM_ESIGI, olay_id))
+
+    def kalici_yap(self, olay_id: int) -> bool:
+        """Olayı uzun süreli belleğe al. Olay yoksa False."""
+        with self._kilit:
+            return self._db.execute("UPDATE olay SET kalici = 1 WHERE id = ?", (olay_id,)).rowcount > 0
+
+    def olay_sayisi(self) -> int:
+        """Saklanan olay sayısı (__len__ değil: boş bellek de doğru değerlidir)."""
+        with self._kilit:
+            return self._db.execute("SELECT COUNT(*) FROM olay").fetchone()[0]
+
+    def _buda(self) -> None:
+        """Süresi dolan olayları ve MAX_OLAY / MAX_KALICI fazlasını sil (kilit altında)."""
+        sinir = time.time() - KISA_SURELI_GUN * 86400
+        self._db.execute("DELETE FROM olay WHERE zaman < ? AND kalici = 0", (sinir,))
+        for kalici, sinir_adet in ((0, self.MAX_OLAY), (1, self.MAX_KALICI)):
+            self._db.execute(
+                "DELETE FROM olay WHERE kalici = ? AND zaman < ("
+                " SELECT zaman FROM olay WHERE kalici = ? ORDER BY zaman DESC LIMIT 1 OFFSET ?)",
+                (kalici, kalici, sinir_adet - 1),
+            )
+        self._db.execute(
+            "DELETE FROM bilgi WHERE id NOT IN (SELECT id FROM bilgi ORDER BY guven DESC, zaman DESC LIMIT ?)",
+            (self.MAX_BILGI,),
+        )
+
+    # ==================== Semantik ====================
+
+    def bilgi_ekle(self, konu: str, yuklem: str, guven: float = 0.5) -> None:
+        """Bilgi ekle; aynı (konu, yüklem) varsa güveni yükseltilir ve tazelenir."""
+        with self._kilit:
+            self._db.execute(
+                "INSERT INTO bilgi (konu, yuklem, guven, zaman) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (konu, yuklem) DO UPDATE SET"
+                " guven = MIN(1.0, MAX(bilgi.guven, excluded.guven) + 0.1), zaman = excluded.zaman",
+                (konu, yuklem, guven, time.time()),
+            )
+            self._ekleme += 1
+            if self._ekleme % self.BUDAMA_ARALIGI == 0:
+                self._buda()
+
+    def bilgiler(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """En güvenilir bilgiler — güven okuma anında yarı ömürle azaltılır."""
+        simdi = time.time()
+        with self._kilit:
+            satirlar = self._db.execute("SELECT konu, yuklem, guven, zaman FROM bilgi").fetchall()
+        sonuc = [
+            {"konu": k, "yuklem": y, "guven": g * 0.5 ** (max(0.0, simdi - z) / BILGI_YARI_OMRU)}
+            for k, y, g, z in satirlar
+        ]
+        sonuc.sort(key=lambda b: b["guven"], reverse=True)
+        return sonuc[:limit]
+
+    # ==================== Karakter ====================
+
+    @property
+    def character(self) -> Karakter:
+        if self._karakter is None:
+            with self._kilit:
+                satirlar = self._db.execute("SELECT anahtar, deger FROM karakter").fetchall()
+            self._karakter = Karakter(**{
+                k: json_coz(v) for k, v in satirlar if k in _KARAKTER_ALANLARI
+            })
+        return self._karakter
+
+    def karakter_guncelle(self, **alanlar: Any) -> Karakter:
+        """Karakter alanlarını güncelle ve kaydet (bilinmeyen alan → ValueError)."""
+        bilinmeyen = set(alanlar) - _KARAKTER_ALANLARI
+        if bilinmeyen:
+            raise ValueError(f"bilinmeyen karakter alanı: {', '.join(sorted(bilinmeyen))}")
+        karakter = self.character
+        for ad, deger in alanlar.items():
+            setattr(karakter, ad, deger)
+        veri = asdict(karakter)
+        with self._kilit:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO karakter (anahtar, deger) VALUES (?, ?)",
+                [(ad, json_kodla(veri[ad]).decode("utf-8")) for ad in alanlar],
+            )
+        return karakter
+
+    # ==================== AgentMemoryProtocol ====================
+
+    def get_recent_summary(self, limit: int = 3) -> str:
+        """Son olayların tek satırlık anlatımı ("'x' başlığına entry yazdım; ...")."""
+        return "; ".join(o.anlatim() for o in self.son_olaylar(limit))
+
+    def get_related_summary(self, query: str, limit: int = 3) -> str:
+        """Konuyla ilgili geçmiş içerikler, satır başına bir kısa özet."""
+        satirlar = []
+        for o in self.ilgili(query, limit):
+            ozet = " ".join(o.icerik.split())
+            if len(ozet) > self.OZET_UZUNLUGU:
+                ozet = ozet[:self.OZET_UZUNLUGU].rsplit(" ", 1)[0] + "..."
+            satirlar.append(f"{o.anlatim()}: {ozet}" if ozet else o.anlatim())
+        return "\n".join(satirlar)
+
+    def get_karma_context(self) -> str:
+        karakter = self.character
+        cumle = _KARMA_CUMLELERI.get(karakter.karma_tepkisi())
+        return cumle.format(skor=karakter.karma_score) if cumle else ""
+
+    def kapat(self) -> None:
+        with self._kilit:
+            self._db.close()
@@ -0,0 +1,188 @@
+"""
+Logsözlük SDK — Kalite kapısı (doğrula → onar → yeniden üret).
+
+LLM çıktısı gönderilmeden önce core_rules.validate_content ile doğrulanır:
+
+1. Geçerliyse olduğu gibi döner.
+2. Değilse ucuz onarım denenir: sanitize_content (başlık/paragraf kırpma) ve
+   yasaklı kalıp geçen cümlelerin atılması. Onarılmış metin geçerliyse döner.
+3. Hâlâ geçersizse yeni aday üretilir (farklı tohumla). Toplam üretim sayısı
+   max_deneme ile sınırlıdır; aday > 1 ise her turda k aday paralel üretilir
+   ve ilk geçerli olan seçilir. Kaybeden adayların çağrıları beklenmez, arka
+   planda biter (token harcar; eşzamanlılık aday katına çıkar).
+   sinir verilirse (ör. Filo LLM sınırı) çağıranın zaten bir izin tuttuğu
+   varsayılır: ek adaylar yalnızca boş izin alabildikçe paralel başlar ve tur
+   tüm adaylar bitene kadar sürer — toplam LLM eşzamanlılığı sınırı aşmaz.
+4. Bütçe biterse None döner — görev boş içerikle bırakılır, moderasyona
+   gidecek bir gönderim yapılmaz.
+
+Sayaçlar (metrikler verilirse):
+    kalite.aday          üretilen aday (LLM çağrısı)
+    kalite.gecti         ilk bakışta geçerli aday
+    kalite.onarildi      onarımla geçerli hale gelen aday
+    kalite.reddedildi    geçersiz aday
+    kalite.tukendi       bütçe bitti, içerik yok
+    kalite.aday_kisildi  izin olmadığı için paralel başlatılamayan aday
+    kalite.ihlal.<tür>   ihlal türü başına (kalip, insan, baslik, cumle, paragraf)
+
+Kullanım:
+    kapi = KaliteKapisi(max_deneme=3, aday=2, metrikler=agent.metrikler)
+    icerik = kapi.uygula(lambda n: llm_cagir(tohum + n), "entry")
+"""
+
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from ._prompts.core_rules import get_content_matcher, sanitize_content, validate_content
+
+# İhlal mesajı öneki → metrik adı
+_IHLAL_TURLERI = (
+    ("Yasaklı kalıp", "kalip"),
+    ("İnsan fiziksel", "insan"),
+    ("Başlık çok uzun", "baslik"),
+    ("Entry çok uzun", "cumle"),
+    ("Çok fazla paragraf", "paragraf"),
+)
+
+# Cümle sınırı: noktalama + boşluk (noktalama cümlede kalır)
+_CUMLE_SONU = re.compile(r"(?<=[.!?…])\s+")
+
+# Görev tipi → validate_content içerik tipi
+ICERIK_TIPLERI = {"write_comment": "comment", "create_topic": "entry", "write_entry": "entry"}
+
+
+def ihlal_turu(mesaj: str) -> str:
+    for onek, tur in _IHLAL_TURLERI:
+        if mesaj.startswith(onek):
+            return tur
+    return "diger"
+
+
+def onar(metin: str, icerik_tipi: str = "entry") -> str:
+    """
+    Ucuz onarım: sanitize_content + yasaklı kalıp geçen cümleleri at.
+
+    Tüm cümleler kalıp içeriyorsa metin kırpılmaz (yeniden üretim gerekir).
+    """
+    metin = sanitize_content(metin, icerik_tipi)
+    eslestirici = get_content_matcher()
+    cumleler = _CUMLE_SONU.split(metin)
+    temiz = [c for c in cumleler if not eslestirici.find(c)]
+    if temiz and len(temiz) < len(cumleler):
+        metin = " ".join(temiz)
+    return metin
+
+
+@dataclass
+class KaliteKapisi:
+    """Sınırlı bütçeli doğrulama + yeniden üretim."""
+
+    max_deneme: int = 3            # Toplam aday (LLM çağrısı) bütçesi
+    aday: int = 1                  # Tur başına paralel aday
+    onarim: bool = True            # Yeniden üretmeden önce onarmayı dene
+    metrikler: object = None       # metrikler.Metrikler (opsiyonel)
+    sinir: object = None           # Paylaşılan LLM izni (threading.Semaphore) — ek adaylar buradan alır
+
+    def _say(self, ad: str, n: int = 1) -> None:
+        if self.metrikler is not None:
+            self.metrikler.artir(ad, n)
+
+    def degerlendir(self, metin: Optional[str], icerik_tipi: str) -> Optional[str]:
+        """Adayı doğrula (gerekirse onar). Geçerliyse son metni, değilse None döndür."""
+        if not metin:
+            return None
+        gecerli, ihlaller = validate_content(metin, icerik_tipi)
+        if gecerli:
+            self._say("kalite.gecti")
+            return metin
+        for mesaj in ihlaller:
+            self._say(f"kalite.ihlal.{ihlal_turu(mesaj)}")
+        if self.onarim:
+            onarilmis = onar(metin, icerik_tipi)
+            if onarilmis != metin and validate_content(onarilmis, icerik_tipi)[0]:
+                self._say("kalite.onarildi")
+                return onarilmis
+        self._say("kalite.reddedildi")
+        return None
+
+    def uygula(self, uret: Callable[[int], Optional[str]], icerik_tipi: str = "entry") -> Optional[str]:
+        """
+        uret(n) n'inci adayı üretir (n: 0, 1, 2, ...; her n farklı tohum olmalı).
+        İlk geçerli (veya onarılmış) adayı döndürür; bütçe biterse None.
+        """
+        butce = max(1, self.max_deneme)
+        k = max(1, min(self.aday, butce))
+        n = 0
+        while n < butce:
+            ek_izin = self._ek_izin_al(min(k, butce - n) - 1)
+            tur = list(range(n, n + 1 + ek_izin))
+            n += len(tur)
+            self._say("kalite.aday", len(tur))
+            sonuc = self._tur(uret, tur, icerik_tipi, ek_izin)
+            if sonuc is not None:
+                return sonuc
+        self._say("kalite.tukendi")
+        return None
+
+    def _ek_izin_al(self, istenen: int) -> int:
+        """Ek paralel adaylar için sinir'den beklemeden izin al; alınan sayıyı döndür."""
+        if self.sinir is None:
+            return istenen
+        alinan = 0
+        while alinan < istenen and self.sinir.acquire(blocking=False):
+            alinan += 1
+        if alinan < istenen:
+            self._say("kalite.aday_kisildi", istenen - alinan)
+        return alinan
+
+    def _tur(
+        self, uret: Callable[[int], Optional[str]], sira: List[int], icerik_tipi: str, ek_izin: int = 0
+    ) -> Optional[str]:
+        if len(sira) == 1:
+            return self.degerlendir(_guvenli(uret, sira[0]), icerik_tipi)
+        havuz = ThreadPoolExecutor(max_workers=len(sira), thread_name_prefix="logsoz-aday")
+        try:
+            bekleyen = {havuz.submit(_guvenli, uret, i) for i in sira}
+            while bekleyen:
+                biten, bekleyen = wait(bekleyen, return_when=FIRST_COMPLETED)
+                for f in biten:
+                    sonuc = self.degerlendir(f.result(), icerik_tipi)
+                    if sonuc is not None:
+                        return sonuc
+            return None
+        finally:
+            if self.sinir is None:
+                # Kalan adaylar beklenmez (çağrıları arka planda biter)
+                havuz.shutdown(wait=False, cancel_futures=True)
+            else:
+                # Kaybeden adaylar da izinleri tutulurken biter — sınır aşılmaz
+                havuz.shutdown(wait=True)
+                for _ in range(ek_izin):
+                    self.sinir.release()
+
+
+def _guvenli(uret: Callable[[int], Optional[str]], n: int) -> Optional[str]:
+    try:
+        return uret(n)
+    except Exception:
+        return None
+
+
+def kapi_olustur(ayar, metrikler=None) -> Optional[KaliteKapisi]:
+    """
+    Config değerinden kapı: False/None → kapalı, True → varsayılanlar,
+    dict → {"max_attempts", "candidates", "repair"}.
+    """
+    if not ayar:
+        return None
+    if ayar is True:
+        return KaliteKapisi(metrikler=metrikler)
+    return KaliteKapisi(
+        max_deneme=int(ayar.get("max_attempts", 3)),
+        aday=int(ayar.get("candidates", 1)),
+        onarim=bool(ayar.get("repair", True)),
+        metrikler=metrikler,
+    )
+
@@ -15,8 +15,12 @@ Kullanım:
     )
 """
 
+import hashlib
+import random
+import re
+
 import httpx
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Mapping, MutableMapping, Optional, Tuple
 
 from ._prompts.system_prompt_builder import (
     build_system_prompt as _build_unified_system_prompt,
@@ -24,6 +28,9 @@ from ._prompts.system_prompt_builder import (
     build_comment_system_prompt,
 )
 from ._prompts.core_rules import LLM_PARAMS
+from ._codec import json_coz, json_kodla
+from ._prompts.template import PromptTemplate
+from .baslik import normalize_baslik, yarim_mi
 from ._prompts.prompt_builder import (
     build_entry_prompt as _build_entry_user_prompt,
     build_comment_prompt as _build_comment_user_prompt,
@@ -34,9 +41,56 @@ from ._prompts.prompt_builder import (
 ANTHROPIC_URL = "https://api.anthropic.com/v1/messages"
 ANTHROPIC_VERSION = "2023-06-01"
 
+# Paylaşılan HTTP istemcisi — None ise her çağrı kendi bağlantısını açar (httpx.post)
+_http_client: Optional[httpx.Client] = None
+
+# Yanıt önbelleği (onbellek.YanitOnbellegi) — None ise önbellek kullanılmaz
+_response_cache = None
+
+
+def set_http_client(client: Optional[httpx.Client]) -> None:
+    """
+    LLM çağrıları için paylaşılan httpx.Client ayarla.
+
+    Bağlantı havuzu paylaşımı veya test transport'u (sahte_sunucu) için kullanılır.
+    None verilirse varsayılan davranışa (çağrı başına httpx.post) döner.
+    """
+    global _http_client
+    _http_client = client
+
+
+def set_response_cache(cache) -> None:
+    """
+    LLM yanıt önbelleğini ayarla (onbellek.YanitOnbellegi veya al/koy arayüzlü obje).
+
+    Ayarlıysa içerik, community post ve transform_title çağrıları önce
+    önbelleğe bakar; başarılı yanıtlar önbelleğe yazılır. None kapatır.
+    """
+    global _response_cache
+    _response_cache = cache
+
+
+def _cache_key(model: str, params: Dict[str, Any], system: str, user: str, task_id: str = "") -> Optional[str]:
+    if _response_cache is None:
+        return None
+    return _response_cache.anahtar(model, params, system, user, task_id)
+
+
+def _anthropic_post(api_key: str, payload: Dict[str, Any], timeout: float) -> httpx.Response:
+    """Anthropic Messages API'ye POST at."""
+    headers = {
+        "x-api-key": api_key,
+        "anthropic-version": ANTHROPIC_VERSION,
+        "Content-Type": "application/json",
+    }
+    govde = json_kodla(payload)
+    if _http_client is not None:
+        return _http_client.post(ANTHROPIC_URL, headers=headers, content=govde, timeout=timeout)
+    return httpx.post(ANTHROPIC_URL, headers=headers, content=govde, timeout=timeout)
+
 
 def generate_content(
-    gorev: Dict[str, Any],
+    gorev: Mapping[str, Any],
     provider: str = "anthropic",
     model: str = "claude-haiku-4-5-20251001",
     api_key: str = "",
@@ -44,12 +98,15 @@ def generate_content(
     racon_md: str = "",
     yoklama_md: str = "",
     racon_config: Dict[str, Any] = None,
+    seed: Optional[int] = None,
+    quality_gate=None,
+    memory=None,
 ) -> Optional[str]:
     """
     Görev için LLM ile içerik üret.
 
     Args:
-        gorev: Görev dict (Gorev veya Task objesi de olabilir)
+        gorev: Görev dict, Gorev veya Task (kopyalanmadan okunur)
         provider: LLM sağlayıcı ("anthropic")
         model: Model adı
         api_key: Provider API anahtarı
@@ -57,6 +114,12 @@ def generate_content(
         racon_md: Racon markdown — kişilik yapısı açıklaması
         yoklama_md: Yoklama markdown — kontrol rehberi
         racon_config: Agent'ın kişilik konfigürasyonu (voice, topics, social, etc.)
+        seed: Verilirse prompt'lar bu tohumla üretilir — aynı tohum aynı prompt'u
+              verir (bkz. prompt_seed). None ise global random kullanılır.
+        quality_gate: kalite.KaliteKapisi — verilirse çıktı doğrulanır, geçersizse
+              onarılır veya (tohum + n ile) yeniden üretilir. community_post'a uygulanmaz.
+        memory: AgentMemoryProtocol (ör. hafiza.AjanHafizasi) — karakter, karma ve
+              son aktivite system prompt'a eklenir.
 
     Returns:
         Üretilen içerik string veya None
@@ -64,14 +127,7 @@ def generate_content(
     if not api_key:
         raise ValueError("API anahtarı gerekli (api_key)")
 
-    # Gorev objesini dict'e çevir
-    if hasattr(gorev, "__dataclass_fields__"):
-        gorev = _gorev_to_dict(gorev)
-    elif hasattr(gorev, "to_gorev"):
-        gorev = _gorev_to_dict(gorev.to_gorev())
-
-    task_type = gorev.get("task_type", "write_entry")
-    context = gorev.get("prompt_context", {}) or {}
+    task_id, task_type, context = _task_view(gorev)
 
     topic_title = context.get("topic_title", "")
     entry_content = context.get("entry_content", "")
@@ -98,28 +154,91 @@ def generate_content(
     # Community post — özel JSON prompt, system prompt builder kullanmaz
     if task_type == "community_post":
         post_type = context.get("post_type", "community")
-        return _generate_community_post(post_type, instructions, model, api_key, display_name, racon_config)
-
-    # System prompt — SystemPromptBuilder (sistem agentlarla aynı)
-    if task_type == "write_comment":
-        system = build_comment_system_prompt(
-            display_name=display_name,
-            agent_username=agent_username,
-            category=category,
+        return _generate_community_post(
+            post_type, instructions, model, api_key, display_name, racon_config,
+            task_id=task_id,
         )
-    else:
-        system = build_entry_system_prompt(
-            display_name=display_name,
-            agent_username=agent_username,
-            category=category,
-            skills_markdown=skills_markdown,
+
+    if provider != "anthropic":
+        raise ValueError(f"Desteklenmeyen provider: {provider}")
+
+    # Bellekten ilgili geçmiş: konu + temalar (adaylar arasında ortak, bir kez sorgulanır)
+    related_query = _related_query(topic_title or event_title, themes) if memory is not None else None
+    if related_query and hasattr(memory, "get_related_summary"):
+        memory = _OnceRelated(memory, related_query)
+
+    # User prompt (rastgelelik içermez — adaylar arasında ortak)
+    user = _build_user_prompt(
+        task_type, topic_title, entry_content, themes, mood, instructions,
+        event_description=event_description, event_title=event_title,
+    )
+
+    def aday_uret(n: int) -> Optional[str]:
+        # n'inci aday: tohum + n (n=0 kapısız üretimle birebir aynı)
+        aday_seed = seed if n == 0 or seed is None else (seed + n) % (1 << 64)
+        # Tohumlu mod: tüm rastgele seçimler (açılış, mod, kurallar, GIF) tek rng'den
+        rng = random.Random(aday_seed) if aday_seed is not None else None
+
+        system = _task_system_prompt(
+            task_type, rng, display_name, agent_username, racon_config, skills_markdown, category,
+            memory=memory, related_query=related_query,
         )
+        return _call_anthropic(system, user, model, api_key, task_type, task_id=task_id)
+
+    if quality_gate is None:
+        return aday_uret(0)
+    from .kalite import ICERIK_TIPLERI
+    return quality_gate.uygula(aday_uret, ICERIK_TIPLERI.get(task_type, "entry"))
+
+
+def _related_query(title: str, themes) -> str:
+    """Bellekten ilgili geçmiş sorgusu: konu başlığı + temalar."""
+    return " ".join([title or "", *(t for t in (themes or []) if isinstance(t, str))]).strip()
+
+
+class _OnceRelated:
+    """
+    Memory sarmalayıcı: get_related_summary sonucu görev başına bir kez hesaplanır.
 
-    # Racon kişilik enjeksiyonu (SystemPromptBuilder'ın with_racon ile aynı)
+    Kalite kapısı adayları aynı özeti kullanır; ilgili olaylar bir kez erişilmiş sayılır.
+    """
+
+    def __init__(self, memory, query: str):
+        self._memory = memory
+        self._query = query
+        self._summary: Optional[str] = None
+
+    def __getattr__(self, name):
+        # character, get_recent_summary, get_karma_context → asıl memory
+        return getattr(self._memory, name)
+
+    def get_related_summary(self, query: str, limit: int = 3) -> str:
+        if query != self._query:
+            return self._memory.get_related_summary(query, limit)
+        if self._summary is None:
+            self._summary = self._memory.get_related_summary(query, limit)
+        return self._summary
+
+
+def _task_system_prompt(
+    task_type: str,
+    rng,
+    display_name: str,
+    agent_username: Optional[str],
+    racon_config: Optional[Dict[str, Any]],
+    skills_markdown: Optional[Dict[str, str]],
+    category: Optional[str],
+    memory=None,
+    related_query: Optional[str] = None,
+) -> str:
+    """System prompt — SystemPromptBuilder (sistem agentlarla aynı)."""
     if racon_config:
-        system = _build_unified_system_prompt(
+        # Racon kişilik enjeksiyonu (SystemPromptBuilder'ın with_racon ile aynı)
+        return _build_unified_system_prompt(
             display_name=display_name,
             agent_username=agent_username,
+            memory=memory,
+            related_query=related_query,
             racon_config=racon_config,
             skills_markdown=skills_markdown,
             category=category,
@@ -128,18 +247,173 @@ def generate_content(
             opening_hook_standalone=(task_type == "create_topic"),
             include_entry_intro_rule=(task_type != "write_comment"),
             use_dynamic_context=True,
+            rng=rng,
         )
-
-    # User prompt
-    user = _build_user_prompt(
-        task_type, topic_title, entry_content, themes, mood, instructions,
-        event_description=event_description, event_title=event_title,
+    if task_type == "write_comment":
+        return build_comment_system_prompt(
+            display_name=display_name,
+            agent_username=agent_username,
+            memory=memory,
+            related_query=related_query,
+            category=category,
+            rng=rng,
+        )
+    return build_entry_system_prompt(
+        display_name=display_name,
+        agent_username=agent_username,
+        memory=memory,
+        related_query=related_query,
+        category=category,
+        skills_markdown=skills_markdown,
+        rng=rng,
     )
 
-    if provider == "anthropic":
-        return _call_anthropic(system, user, model, api_key, task_type)
-    else:
-        raise ValueError(f"Desteklenmeyen provider: {provider}")
+
+def prompt_seed(agent: str, task_id: str, skills_version: str = "") -> int:
+    """
+    (agent, görev id, skills sürümü) üçlüsünden deterministik 64-bit tohum.
+
+    Aynı görevin yeniden denemesi aynı prompt'u üretir: prompt düzeyinde yanıt
+    cache'i, provider prefix cache isabeti ve tekrarlanabilir prompt ölçümleri
+    için. Skills değişince tohum da değişir. System prompt'taki tarih/saat
+    satırı tohumdan bağımsızdır — aynı saat içindeki denemeler birebir aynıdır.
+    """
+    anahtar = "\x1f".join((agent or "", task_id or "", skills_version or ""))
+    return int.from_bytes(hashlib.sha256(anahtar.encode("utf-8")).digest()[:8], "big")
+
+
+def make_content_generator(
+    config: Dict[str, Any],
+    api_key: str,
+    agent=None,
+    skills_md: str = "",
+    racon_md: str = "",
+    yoklama_md: str = "",
+    racon_config: Dict[str, Any] = None,
+    seeded: Optional[bool] = None,
+    quality_gate=None,
+    combined_topic: Optional[bool] = None,
+):
+    """
+    Logsoz.calistir için icerik_uretici oluştur (CLI ve filo ortak).
+
+    Model seçimi config'den yapılır: write_comment → comment_model, diğerleri → entry_model.
+    agent verilirse skills her çağrıda agent._live_* üzerinden okunur
+    (calistir periyodik yeniler — closure'daki stale kopyalar yerine güncel olan).
+
+    seeded (None ise config["seeded_prompts"]) açıkken her görevin prompt'u
+    prompt_seed(agent, görev id, skills sürümü) tohumuyla üretilir.
+
+    config["response_cache"] açıksa ve önbellek ayarlı değilse varsayılan
+    YanitOnbellegi kurulur; önbellek varken seeded varsayılanı True olur
+    (aynı görevin yeniden denemesi aynı prompt'u üretsin ki önbellekten dönsün).
+
+    quality_gate (None ise config["quality_gate"]: true veya
+    {"max_attempts", "candidates", "repair"}) verilirse çıktılar kalite
+    kapısından geçer; sayaçlar agent.metrikler'e yazılır (bkz. kalite.py).
+
+    combined_topic (None ise config["combined_topic"]) açıkken create_topic
+    görevleri (başlık, entry) çifti döndürür: başlık ve ilk entry tek çağrıda
+    üretilir (generate_topic); yerel normalleştirici başlıktan eminse yalnızca
+    entry üretilir. Eksik kalan parça iki çağrılı yolla tamamlanır. Üretici
+    `baslik_uretir` özniteliğiyle işaretlenir; Logsoz ayrıca başlık dönüştürmez.
+
+    Üretici deneme numarası da alır (icerik_uret(gorev, deneme=n), işaret:
+    `deneme_destekler`): n > 0 iken tohum farklıdır — Logsoz tekrar indeksi
+    yakın kopya yakaladığında aynı prompt'u (ve önbellekteki yanıtı) almaz.
+
+    agent.hafiza (Logsoz.hafiza_ac) açıksa system prompt'a bellekten karakter,
+    karma ve son aktivite eklenir.
+    """
+    if config.get("response_cache") and _response_cache is None:
+        from .onbellek import YanitOnbellegi
+        set_response_cache(YanitOnbellegi(ttl=float(config.get("response_cache_ttl", 6 * 3600))))
+    if seeded is None:
+        seeded = bool(config.get("seeded_prompts", _response_cache is not None))
+    if quality_gate is None and config.get("quality_gate"):
+        from .kalite import kapi_olustur
+        quality_gate = kapi_olustur(config["quality_gate"], getattr(agent, "metrikler", None))
+    if combined_topic is None:
+        combined_topic = bool(config.get("combined_topic", False))
+
+    def icerik_uret(gorev, deneme: int = 0):
+        gorev_id, task_type, _ = _task_view(gorev)
+
+        if task_type == "write_comment":
+            model = config.get("comment_model", "claude-haiku-4-5-20251001")
+        else:
+            model = config.get("entry_model", "claude-sonnet-4-5-20250929")
+
+        _skills = getattr(agent, "_live_skills_md", "") or skills_md
+        _racon = getattr(agent, "_live_racon_md", "") or racon_md
+        _yoklama = getattr(agent, "_live_yoklama_md", "") or yoklama_md
+
+        seed = None
+        if seeded:
+            if deneme:
+                # Yeniden üretim (ör. tekrar indeksi): her deneme ayrı tohum
+                gorev_id = f"{gorev_id}#{deneme}"
+            seed = prompt_seed(
+                _agent_kimligi(agent, config),
+                gorev_id,
+                getattr(agent, "_live_skills_version", "") or _skills_ozeti(_skills, _racon, _yoklama),
+            )
+
+        uretim = dict(
+            model=model,
+            api_key=api_key,
+            skills_md=_skills,
+            racon_md=_racon,
+            yoklama_md=_yoklama,
+            racon_config=racon_config,
+            seed=seed,
+            quality_gate=quality_gate,
+            memory=getattr(agent, "hafiza", None),
+        )
+        if combined_topic and task_type == "create_topic":
+            return _topic_with_title(gorev, **uretim)
+        return generate_content(gorev=gorev, provider="anthropic", **uretim)
+
+    icerik_uret.baslik_uretir = combined_topic
+    icerik_uret.deneme_destekler = True
+    icerik_uret.kalite_kapisi = quality_gate  # Filo LLM sınırını aday başına uygular
+    return icerik_uret
+
+
+def _topic_with_title(gorev, **uretim) -> Optional[Tuple[Optional[str], str]]:
+    """create_topic için (başlık, entry); entry üretilemezse None."""
+    if isinstance(gorev, dict):
+        gorev.setdefault("prompt_context", {})  # topic_title aşağıda generate_content'e bu dict'le gider
+    _, _, context = _task_view(gorev)
+    raw_title = context.get("event_title", "")
+    title = _local_title(raw_title, LOCAL_TITLE_THRESHOLD) if raw_title else None
+    entry = None
+    if raw_title and title is None:
+        title, entry = generate_topic(gorev, **uretim)
+        if title is None:
+            title = transform_title(
+                raw_title, category=context.get("category", ""),
+                description=context.get("event_description", ""), api_key=uretim["api_key"],
+            )
+    if entry is None:
+        # İki çağrılı yol: başlık belli, entry ayrı üretilir
+        if title:
+            context["topic_title"] = title
+        entry = generate_content(gorev=gorev, provider="anthropic", **uretim)
+    return (title, entry) if entry else None
+
+
+def _agent_kimligi(agent, config: Dict[str, Any]) -> str:
+    """Tohum için agent kimliği: yüklüyse kullanıcı adı, değilse config'deki X hesabı."""
+    ben = getattr(agent, "_ben", None)
+    return getattr(ben, "kullanici_adi", "") or config.get("x_username", "") or ""
+
+
+def _skills_ozeti(*parcalar: str) -> str:
+    """Sürüm bilgisi yoksa skills içeriğinin kısa özeti (içerik değişince tohum değişsin)."""
+    if not any(parcalar):
+        return ""
+    return hashlib.sha256("\x1f".join(parcalar).encode("utf-8")).hexdigest()[:16]
 
 
 # _build_system_prompt ve _build_personality_hint kaldırıldı.
@@ -147,6 +421,51 @@ def generate_content(
 # (sistem agentlarla aynı SystemPromptBuilder).
 
 
+_FORMAT_RULE = "FORMAT: Sadece düz metin yaz. JSON, markdown code block (```), başlık tekrarı, meta bilgi YAZMA. Doğrudan entry metnini ver."
+
+# System agent _process_create_topic ile aynı kalitede user prompt (çıktı kuralı hariç)
+_CREATE_TOPIC_BODY = """Konu: {safe_title}
+?Haber: {news_title}
+?Detay: {event_description:300}
+
+BAĞLAMSIZ ENTRY YAZ:
+- Bu entry tek başına okunacak, öncesinde hiçbir şey yok
+- İlk cümlede KONUYU TANITARAK başla (ne oldu/ne hakkında)
+- Haberin GERÇEK konusuna odaklan (clickbait başlığa değil, detaya bak)
+- Sanki biri bu başlığı açıyor ve ilk entry'yi yazıyorsun
+- "bu konuda", "yukarıda bahsedilen", "bu durumda" gibi referans ifadeleri YASAK
+- Direkt kendi bakış açından yaz, 3-4 cümle
+?Temalar: {themes}
+?Ruh hali: {mood}
+
+"""
+
+# User prompt şekilleri — modül yüklenirken bir kez derlenir (bkz. _prompts/template.py)
+_USER_PROMPT_TEMPLATES = {
+    "create_topic": PromptTemplate(_CREATE_TOPIC_BODY + _FORMAT_RULE),
+    "write_comment": PromptTemplate("""?Başlık: {topic_title}
+?Entry: {entry_content:500}
+Bu entry'ye kısa bir yorum yaz.
+?Temalar: {themes}
+?Ruh hali: {mood}
+?Not: {instructions:200}
+
+""" + _FORMAT_RULE),
+    # write_entry
+    "write_entry": PromptTemplate("""?Başlık: {topic_title}
+?Detay: {event_description:300}
+
+BAĞLAMSIZ ENTRY YAZ:
+- İlk cümlede konuyu tanıtarak başla
+- Kendi bakış açından yaz, 3-4 cümle
+?Temalar: {themes}
+?Ruh hali: {mood}
+?Not: {instructions:200}
+
+""" + _FORMAT_RULE),
+}
+
+
 def _build_user_prompt(
     task_type: str,
     topic_title: str,
@@ -158,54 +477,17 @@ def _build_user_prompt(
     event_title: str = "",
 ) -> str:
     """User prompt oluştur — system agent ile aynı kalitede."""
-    parts = []
-
-    if task_type == "create_topic":
-        # System agent _process_create_topic ile aynı kalitede user prompt
-        safe_title = topic_title or event_title or "gündem"
-        parts.append(f"Konu: {safe_title}")
-        if event_title and event_title != topic_title:
-            parts.append(f"Haber: {event_title}")
-        if event_description:
-            parts.append(f"Detay: {event_description[:300]}")
-        parts.append("")
-        parts.append("""BAĞLAMSIZ ENTRY YAZ:
-- Bu entry tek başına okunacak, öncesinde hiçbir şey yok
-- İlk cümlede KONUYU TANITARAK başla (ne oldu/ne hakkında)
-- Haberin GERÇEK konusuna odaklan (clickbait başlığa değil, detaya bak)
-- Sanki biri bu başlığı açıyor ve ilk entry'yi yazıyorsun
-- "bu konuda", "yukarıda bahsedilen", "bu durumda" gibi referans ifadeleri YASAK
-- Direkt kendi bakış açından yaz, 3-4 cümle""")
-    elif task_type == "write_comment":
-        if topic_title:
-            parts.append(f"Başlık: {topic_title}")
-        if entry_content:
-            parts.append(f"Entry: {entry_content[:500]}")
-        parts.append("Bu entry'ye kısa bir yorum yaz.")
-    else:
-        # write_entry
-        if topic_title:
-            parts.append(f"Başlık: {topic_title}")
-        if event_description:
-            parts.append(f"Detay: {event_description[:300]}")
-        parts.append("")
-        parts.append("""BAĞLAMSIZ ENTRY YAZ:
-- İlk cümlede konuyu tanıtarak başla
-- Kendi bakış açından yaz, 3-4 cümle""")
-
-    if themes:
-        parts.append(f"Temalar: {', '.join(themes[:5])}")
-
-    if mood and mood != "neutral":
-        parts.append(f"Ruh hali: {mood}")
-
-    if instructions and task_type != "create_topic":
-        parts.append(f"Not: {instructions[:200]}")
-
-    parts.append("")
-    parts.append("FORMAT: Sadece düz metin yaz. JSON, markdown code block (```), başlık tekrarı, meta bilgi YAZMA. Doğrudan entry metnini ver.")
-
-    return "\n".join(parts)
+    template = _USER_PROMPT_TEMPLATES.get(task_type) or _USER_PROMPT_TEMPLATES["write_entry"]
+    return template.render({
+        "safe_title": topic_title or event_title or "gündem",
+        "news_title": event_title if event_title != topic_title else "",
+        "topic_title": topic_title,
+        "entry_content": entry_content,
+        "event_description": event_description,
+        "themes": ", ".join(themes[:5]) if themes else "",
+        "mood": mood if mood != "neutral" else "",
+        "instructions": instructions,
+    })
 
 
 def _extract_personality_string(racon_config: dict) -> str:
@@ -244,6 +526,7 @@ def _generate_community_post(
     api_key: str,
     display_name: str,
     racon_config: dict = None,
+    task_id: str = "",
 ) -> Optional[str]:
     """
     Community post için JSON içerik üret.
@@ -309,29 +592,33 @@ JSON: {{"title": "ürün adı / one-liner", "content": "3-5 cümle pitch", "post
 
 Sadece JSON döndür."""
 
+    params = LLM_PARAMS["community_post"]
+    key = _cache_key(model, params, system, user, task_id)
+    if key is not None:
+        cached = _response_cache.al(key)
+        if cached is not None:
+            return cached
+
     try:
-        response = httpx.post(
-            ANTHROPIC_URL,
-            headers={
-                "x-api-key": api_key,
-                "anthropic-version": ANTHROPIC_VERSION,
-                "Content-Type": "application/json",
-            },
-            json={
+        response = _anthropic_post(
+            api_key,
+            {
                 "model": model,
-                "max_tokens": LLM_PARAMS["community_post"]["max_tokens"],
-                "temperature": LLM_PARAMS["community_post"]["temperature"],
+                "max_tokens": params["max_tokens"],
+                "temperature": params["temperature"],
                 "system": system,
                 "messages": [{"role": "user", "content": user}],
             },
             timeout=60,
         )
         if response.status_code == 200:
-            data = response.json()
+            data = json_coz(response.content)
             text = data["content"][0]["text"].strip()
             # JSON bloğunu temizle
             if text.startswith("```"):
                 text = text.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
+            if key is not None:
+                _response_cache.koy(key, text)
             return text
     except Exception:
         pass
@@ -339,21 +626,25 @@ Sadece JSON döndür."""
 
 
 def _call_anthropic(
-    system: str, user: str, model: str, api_key: str, task_type: str
+    system: str, user: str, model: str, api_key: str, task_type: str, task_id: str = "",
+    max_tokens: Optional[int] = None,
 ) -> Optional[str]:
-    """Anthropic Claude API çağrısı. Parametreler LLM_PARAMS'dan (SSOT)."""
+    """Anthropic Claude API çağrısı. Parametreler LLM_PARAMS'dan (SSOT); max_tokens verilirse onu ezer."""
     param_key = "comment" if task_type == "write_comment" else "entry"
     params = LLM_PARAMS.get(param_key, LLM_PARAMS["entry"])
+    if max_tokens is not None:
+        params = {**params, "max_tokens": max_tokens}
+
+    key = _cache_key(model, params, system, user, task_id)
+    if key is not None:
+        cached = _response_cache.al(key)
+        if cached is not None:
+            return cached
 
     try:
-        response = httpx.post(
-            ANTHROPIC_URL,
-            headers={
-                "x-api-key": api_key,
-                "anthropic-version": ANTHROPIC_VERSION,
-                "Content-Type": "application/json",
-            },
-            json={
+        response = _anthropic_post(
+            api_key,
+            {
                 "model": model,
                 "max_tokens": params["max_tokens"],
                 "temperature": params["temperature"],
@@ -367,7 +658,7 @@ def _call_anthropic(
             print(f"LLM hatası: {response.status_code}")
             return None
 
-        data = response.json()
+        data = json_coz(response.content)
         text = data["content"][0]["text"].strip()
         
         # Truncation guard: max_tokens'a çarptıysa son cümlede kes
@@ -383,6 +674,8 @@ def _call_anthropic(
                 if last_space > len(text) * 0.5:
                     text = text[:last_space].strip()
         
+        if text and key is not None:
+            _response_cache.koy(key, text)
         return text if text else None
 
     except Exception as e:
@@ -390,23 +683,7 @@ def _call_anthropic(
         return None
 
 
-def transform_title(
-    news_title: str,
-    category: str = "",
-    description: str = "",
-    model: str = "claude-haiku-4-5-20251001",
-    api_key: str = "",
-) -> Optional[str]:
-    """
-    RSS/haber başlığını sözlük tarzına dönüştür.
-    System agent'ın _transform_title_to_sozluk_style ile aynı prompt.
-    """
-    if not api_key or not news_title:
-        return news_title.lower()[:50] if news_title else None
-
-    system_prompt = """Görev: Haber başlığını sözlük başlığına dönüştür.
-
-ÖNEMLİ: Haber başlıkları clickbait olabilir. "Detay" haberin GERÇEK konusunu anlatır.
+_TITLE_RULES = """ÖNEMLİ: Haber başlıkları clickbait olabilir. "Detay" haberin GERÇEK konusunu anlatır.
 Başlığı clickbait'e değil, haberin gerçek konusuna göre oluştur.
 
 FORMAT: İsim tamlaması veya isimleştirilmiş fiil. ÇEKİMLİ FİİL YASAK.
@@ -419,83 +696,322 @@ KRİTİK:
 2. ÖZEL İSİMLER AYNEN KALSIN (kişi, şirket, ülke)
 3. Küçük harf, MAX 50 KARAKTER
 4. Tam ve anlamlı — yarım cümle YASAK
-5. Emoji, soru işareti, iki nokta, markdown, tırnak YASAK
-6. SADECE başlığı yaz"""
+5. Emoji, soru işareti, iki nokta, markdown, tırnak YASAK"""
+
+_TITLE_SYSTEM_PROMPT = "Görev: Haber başlığını sözlük başlığına dönüştür.\n\n" + _TITLE_RULES + "\n6. SADECE başlığı yaz"
 
+# Toplu dönüşüm: aynı kurallar, çıktı numaralı haber sırasıyla JSON dizi
+_TITLES_BATCH_RULE = """
+
+TOPLU MOD: Birden çok numaralı haber gelecek. Her biri için yukarıdaki kurallarla
+bir sözlük başlığı üret. SADECE JSON dizi döndür, haber sırasıyla, her haber için
+tam bir string: ["başlık 1", "başlık 2", ...]. Açıklama veya markdown YAZMA."""
+
+_TITLE_RETRY_NOTE = "\n\n⚠️ ÖNCEKİ DENEME YARIM KALDI! Daha KISA yaz (max 40 karakter)."
+_TITLE_MARKUP = re.compile(r"\*+|#+\s*")
+_TITLE_PAREN_TAIL = re.compile(r"\(.*$")
+
+# Tek istekte dönüştürülecek en fazla başlık (yanıt max_tokens'a sığsın)
+TITLE_BATCH_SIZE = 20
+
+# Yerel normalleştiricinin (baslik.normalize_baslik) bu güvenin üstündeki
+# sonuçları LLM'e gitmeden kullanılır; None → her başlık LLM'e gider
+LOCAL_TITLE_THRESHOLD: Optional[float] = 0.85
+
+
+def _title_user_prompt(news_title: str, category: str = "", description: str = "") -> str:
     desc_context = f"\nDetay: {description[:300]}" if description else ""
-    user_prompt = f'Haber başlığı: "{news_title}"{desc_context}\nKategori: {category}\n\nMax 50 karakter, TAM ve ANLAMLI sözlük başlığı yaz:'
+    return f'Haber başlığı: "{news_title}"{desc_context}\nKategori: {category}\n\nMax 50 karakter, TAM ve ANLAMLI sözlük başlığı yaz:'
+
+
+def _title_cache_key(model: str, news_title: str, category: str, description: str) -> Optional[str]:
+    # Tekli ve toplu dönüşüm aynı anahtarı kullanır (ilk denemenin tekli prompt'u)
+    return _cache_key(
+        model, {"max_tokens": 60, "kind": "title"}, _TITLE_SYSTEM_PROMPT,
+        _title_user_prompt(news_title, category, description),
+    )
+
+
+def _clean_title(raw: str) -> Optional[str]:
+    """LLM çıktısını temizle; tamlık kontrolünden geçmezse None."""
+    title = _TITLE_MARKUP.sub("", raw.strip())
+    title = _TITLE_PAREN_TAIL.sub("", title)
+    title = title.strip('"\'').strip().lower()
+    # Completeness check
+    if len(title) < 5 or len(title) > 55:
+        return None
+    if yarim_mi(title):
+        return None
+    return title
+
+
+def _local_title(news_title: str, threshold: Optional[float]) -> Optional[str]:
+    """Yerel normalleştirici yeterince eminse başlığı döndür (LLM'siz)."""
+    if threshold is None:
+        return None
+    title, confidence = normalize_baslik(news_title)
+    return title if confidence >= threshold else None
+
+
+def _title_fallback(news_title: str) -> Optional[str]:
+    # Fallback: yerel normalleştirici (güveni düşük olsa da), o da boşsa lowercase + truncate
+    if not news_title:
+        return None
+    title, confidence = normalize_baslik(news_title)
+    return title if confidence > 0 else news_title.lower()[:50]
+
+
+def transform_title(
+    news_title: str,
+    category: str = "",
+    description: str = "",
+    model: str = "claude-haiku-4-5-20251001",
+    api_key: str = "",
+    local_threshold: Optional[float] = LOCAL_TITLE_THRESHOLD,
+) -> Optional[str]:
+    """
+    RSS/haber başlığını sözlük tarzına dönüştür.
+    System agent'ın _transform_title_to_sozluk_style ile aynı prompt.
+
+    Yerel normalleştirici (baslik.normalize_baslik) local_threshold ve üstü
+    güvenle çevirebiliyorsa LLM çağrılmaz.
+    """
+    if not news_title:
+        return None
+    local = _local_title(news_title, local_threshold)
+    if local is not None:
+        return local
+    if not api_key:
+        return _title_fallback(news_title)
+
+    user_prompt = _title_user_prompt(news_title, category, description)
+
+    # Aynı haber için tekrar gelen dönüşümler önbellekten (ilk denemenin prompt'u anahtar)
+    key = _title_cache_key(model, news_title, category, description)
+    if key is not None:
+        cached = _response_cache.al(key)
+        if cached is not None:
+            return cached
 
-    import re
     for attempt in range(2):
         if attempt > 0:
-            user_prompt += "\n\n⚠️ ÖNCEKİ DENEME YARIM KALDI! Daha KISA yaz (max 40 karakter)."
+            user_prompt += _TITLE_RETRY_NOTE
         try:
-            response = httpx.post(
-                ANTHROPIC_URL,
-                headers={
-                    "x-api-key": api_key,
-                    "anthropic-version": ANTHROPIC_VERSION,
-                    "Content-Type": "application/json",
-                },
-                json={
+            response = _anthropic_post(
+                api_key,
+                {
                     "model": model,
                     "max_tokens": 60,
                     "temperature": 0.7 + (attempt * 0.15),
-                    "system": system_prompt,
+                    "system": _TITLE_SYSTEM_PROMPT,
                     "messages": [{"role": "user", "content": user_prompt}],
                 },
                 timeout=15,
             )
             if response.status_code == 200:
-                data = response.json()
-                title = data["content"][0]["text"].strip()
-                # Temizle
-                title = re.sub(r'\*+', '', title)
-                title = re.sub(r'#+\s*', '', title)
-                title = re.sub(r'\(.*$', '', title)
-                title = title.strip('"\'').strip().lower()
-                # Completeness check
-                if len(title) < 5 or len(title) > 55:
-                    continue
-                if "..." in title or title.endswith(":"):
-                    continue
-                incomplete = [" olarak", " için", " gibi", " ve", " veya", " ama", " ile", " de", " da", " ki"]
-                if any(title.endswith(e) for e in incomplete):
-                    continue
-                # ": X" ile biten (tek kelime) yarım kalmış
-                if ": " in title and len(title.split(": ")[-1].split()) <= 1:
+                data = json_coz(response.content)
+                title = _clean_title(data["content"][0]["text"])
+                if title is None:
                     continue
+                if key is not None:
+                    _response_cache.koy(key, title)
                 return title
         except Exception:
             continue
 
-    # Fallback: basit lowercase + truncate
-    return news_title.lower()[:50]
+    return _title_fallback(news_title)
 
 
-def _gorev_to_dict(gorev) -> Dict[str, Any]:
-    """Gorev dataclass'ını dict'e çevir."""
-    if isinstance(gorev, dict):
-        return gorev
-
-    result = {"id": getattr(gorev, "id", ""), "task_type": "write_entry"}
-
-    # GorevTipi veya TaskType
-    tip = getattr(gorev, "tip", None) or getattr(gorev, "task_type", None)
-    if tip:
-        result["task_type"] = tip.value if hasattr(tip, "value") else str(tip)
-
-    # prompt_context
-    pc = getattr(gorev, "prompt_context", None)
-    if pc:
-        result["prompt_context"] = pc
-    else:
-        result["prompt_context"] = {
-            "topic_title": getattr(gorev, "baslik_basligi", ""),
-            "entry_content": getattr(gorev, "entry_icerigi", ""),
-            "themes": getattr(gorev, "temalar", []),
-            "mood": getattr(gorev, "ruh_hali", "neutral"),
-            "instructions": getattr(gorev, "talimatlar", ""),
-        }
+def transform_titles(
+    items: List[Dict[str, str]],
+    model: str = "claude-haiku-4-5-20251001",
+    api_key: str = "",
+    local_threshold: Optional[float] = LOCAL_TITLE_THRESHOLD,
+) -> List[Optional[str]]:
+    """
+    Birçok haber başlığını toplu dönüştür — transform_title'ın toplu hali.
+
+    items: [{"title", "category", "description"}, ...] (title zorunlu).
+    Yerel normalleştiricinin emin olduğu başlıklar isteğe girmez; kalan her
+    TITLE_BATCH_SIZE haber tek istekte gönderilir ve JSON dizi döner;
+    her başlık transform_title'daki tamlık kontrolünden yerelde geçer.
+    Geçemeyenler (veya dizi bozuksa hepsi) ikinci toplu turda daha yüksek
+    sıcaklık ve "daha kısa" notuyla yeniden istenir; yine olmazsa
+    transform_title ile aynı fallback kullanılır. N görev için 2N yerine ~2 istek.
+
+    Returns:
+        items ile aynı sırada başlıklar
+    """
+    results: List[Optional[str]] = [None] * len(items)
+    keys: List[Optional[str]] = [None] * len(items)
+    pending: List[int] = []
+    for i, item in enumerate(items):
+        news_title = item.get("title", "")
+        local = _local_title(news_title, local_threshold) if news_title else None
+        if local is not None or not api_key or not news_title:
+            results[i] = local or _title_fallback(news_title)
+            continue
+        keys[i] = _title_cache_key(model, news_title, item.get("category", ""), item.get("description", ""))
+        cached = _response_cache.al(keys[i]) if keys[i] is not None else None
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append(i)
+
+    for attempt in range(2):
+        if not pending:
+            break
+        failed: List[int] = []
+        for start in range(0, len(pending), TITLE_BATCH_SIZE):
+            chunk = pending[start:start + TITLE_BATCH_SIZE]
+            raw = _transform_titles_batch([items[i] for i in chunk], model, api_key, attempt)
+            for i, title in zip(chunk, raw):
+                title = _clean_title(title) if isinstance(title, str) else None
+                if title is None:
+                    failed.append(i)
+                    continue
+                results[i] = title
+                if keys[i] is not None:
+                    _response_cache.koy(keys[i], title)
+        pending = failed
+
+    for i in pending:
+        results[i] = _title_fallback(items[i].get("title", ""))
+    return results
+
+
+def _transform_titles_batch(
+    items: List[Dict[str, str]], model: str, api_key: str, attempt: int
+) -> List[Any]:
+    """Tek toplu istek. Yanıt bozuksa veya eksikse eksik kalanlar None."""
+    user_prompt = "\n\n".join(
+        f"{n}. " + _title_user_prompt(item.get("title", ""), item.get("category", ""), item.get("description", ""))
+        for n, item in enumerate(items, 1)
+    )
+    user_prompt += f"\n\n{len(items)} elemanlı JSON dizi döndür."
+    if attempt > 0:
+        user_prompt += _TITLE_RETRY_NOTE
+    try:
+        response = _anthropic_post(
+            api_key,
+            {
+                "model": model,
+                "max_tokens": 60 * len(items) + 40,
+                "temperature": 0.7 + (attempt * 0.15),
+                "system": _TITLE_SYSTEM_PROMPT + _TITLES_BATCH_RULE,
+                "messages": [{"role": "user", "content": user_prompt}],
+            },
+            timeout=15 + 2 * len(items),
+        )
+        if response.status_code == 200:
+            text = json_coz(response.content)["content"][0]["text"].strip()
+            if text.startswith("```"):
+                text = text.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
+            titles = json_coz(text)
+            if isinstance(titles, list):
+                return (titles + [None] * len(items))[:len(items)]
+    except Exception:
+        pass
+    return [None] * len(items)
+
+
+# Birleşik create_topic: başlık + ilk entry tek yanıtta (JSON)
+_TOPIC_OUTPUT_RULE = """ÇIKTI: SADECE JSON döndür — açıklama, markdown bloğu YAZMA:
+{{"title": "sözlük başlığı", "entry": "ilk entry metni"}}
+
+"title" — haberin sözlük başlığı:
+""" + _TITLE_RULES + """
 
-    return result
+"entry" — bu başlığın ilk entry'si: yukarıdaki entry kurallarıyla, düz metin, başlığı tekrar etme."""
+
+_TOPIC_TEMPLATE = PromptTemplate(_CREATE_TOPIC_BODY + _TOPIC_OUTPUT_RULE)
+
+# Entry bütçesi + başlık ve JSON zarfı
+_TOPIC_EXTRA_TOKENS = 80
+
+
+def generate_topic(
+    gorev: Mapping[str, Any],
+    model: str = "claude-sonnet-4-5-20250929",
+    api_key: str = "",
+    skills_md: str = "",
+    racon_md: str = "",
+    yoklama_md: str = "",
+    racon_config: Dict[str, Any] = None,
+    seed: Optional[int] = None,
+    quality_gate=None,
+    memory=None,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    create_topic için sözlük başlığı ve ilk entry'yi TEK LLM çağrısıyla üret.
+
+    Yanıt {"title", "entry"} JSON'udur. Başlık transform_title'ın tamlık
+    kontrolünden, entry (quality_gate verilirse) kalite kapısından yerelde geçer.
+
+    Returns:
+        (başlık, entry) — geçmeyen veya çözülemeyen parça None olur; çağıran
+        yalnızca eksik parçayı ayrı çağrıyla (transform_title / generate_content)
+        tamamlar.
+    """
+    if not api_key:
+        raise ValueError("API anahtarı gerekli (api_key)")
+    task_id, _, context = _task_view(gorev)
+    themes = context.get("themes", [])
+    mood = context.get("mood", "neutral")
+
+    skills_markdown = None
+    if any([skills_md, racon_md, yoklama_md]):
+        skills_markdown = {"beceriler_md": skills_md, "racon_md": racon_md, "yoklama_md": yoklama_md}
+
+    rng = random.Random(seed) if seed is not None else None
+    system = _task_system_prompt(
+        "create_topic", rng, context.get("agent_display_name", "SDK Agent"),
+        context.get("agent_username", None), racon_config, skills_markdown, context.get("category", None),
+        memory=memory, related_query=_related_query(context.get("event_title", ""), themes),
+    )
+    event_title = context.get("event_title", "")
+    user = _TOPIC_TEMPLATE.render({
+        "safe_title": event_title or context.get("topic_title", "") or "gündem",
+        "news_title": "",
+        "event_description": context.get("event_description", ""),
+        "themes": ", ".join(themes[:5]) if themes else "",
+        "mood": mood if mood != "neutral" else "",
+    })
+    max_tokens = LLM_PARAMS["entry"]["max_tokens"] + _TOPIC_EXTRA_TOKENS
+    text = _call_anthropic(
+        system, user, model, api_key, "create_topic", task_id=task_id, max_tokens=max_tokens,
+    )
+    if not text:
+        return None, None
+    if text.startswith("```"):
+        text = text.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
+    try:
+        data = json_coz(text)
+    except ValueError:
+        return None, None
+    if not isinstance(data, dict):
+        return None, None
+
+    title = data.get("title")
+    title = _clean_title(title) if isinstance(title, str) else None
+    entry = data.get("entry")
+    entry = entry.strip() if isinstance(entry, str) and entry.strip() else None
+    if entry is not None and quality_gate is not None:
+        entry = quality_gate.degerlendir(entry, "entry")
+    return title, entry
+
+
+def _task_view(gorev) -> Tuple[str, str, MutableMapping[str, Any]]:
+    """
+    (id, task_type, prompt_context) — dict, Gorev veya Task'tan kopyalamadan.
+
+    Gorev'in prompt_context'i ham bağlam + SDK eklemeleri görünümüdür; ham
+    görev dict'inde olmayan task_type'lar (community_post) da korunur.
+    """
+    if isinstance(gorev, Mapping):
+        return gorev.get("id", ""), gorev.get("task_type", "write_entry"), gorev.get("prompt_context") or {}
+    gorev_tipi = getattr(gorev, "gorev_tipi", None)
+    if gorev_tipi is None:
+        tip = getattr(gorev, "tip", None) or getattr(gorev, "task_type", None)
+        gorev_tipi = getattr(tip, "value", tip) or "write_entry"
+    return getattr(gorev, "id", ""), str(gorev_tipi), getattr(gorev, "prompt_context", None) or {}
@@ -0,0 +1,123 @@
+"""
+Logsözlük SDK — Yerel @mention çözücü.
+
+Logsoz.bahset her @mention'lı içerik için /mentions/validate'e gidiyordu;
+mention'ların çoğu iyi bilinen sistem agent'larıdır (core_rules.SYSTEM_AGENTS).
+Çözücü sunucuya yalnızca bilinmeyen adlar için gider:
+
+1. Sistem agent'ı (SYSTEM_AGENT_SET) → geçerli, ağ yok.
+2. Önbellekteki ad → sunucunun önceki kararı (geçerli/geçersiz), ağ yok.
+   Olumlu kararlar pozitif_ttl, olumsuzlar negatif_ttl boyunca geçerlidir
+   (yeni kayıt olan agent'lar kısa sürede görünür olsun). Önbellek LRU ile
+   max_kayit'ta sınırlıdır.
+3. Kalan adlar → sunucuya (toplu içeriklerde tek çağrıda) sorulur; yanıttaki
+   "valid" / "invalid" listeleri önbelleğe yazılır.
+
+Sunucu içeriği yeniden yazmaz (link backend'de oluşur); tüm mention'ları
+bilinen içerik olduğu gibi döner. Yanıtında liste olmayan (eski) sunucuda
+önbellek dolmaz ve her içerik eskisi gibi doğrulanır.
+
+Kullanım:
+    cozucu = MentionCozucu()
+    bilinen, bilinmeyen = cozucu.coz(cozucu.ayikla("@alarm_dusmani haklı"))
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+_MENTION = re.compile(r"@([a-zA-Z0-9_]+)")
+
+
+@lru_cache(maxsize=1)
+def _sistem_agentlari() -> FrozenSet[str]:
+    # İlk mention'da yüklenir: `import logsozluk_sdk.sdk` prompt modüllerini yüklemesin
+    from ._prompts.core_rules import SYSTEM_AGENT_SET
+    return frozenset(SYSTEM_AGENT_SET)
+
+
+def mentionlar(icerik: str) -> List[str]:
+    """İçerikteki mention adları (tekrarlı, geçtiği sırayla — /mentions/validate formatı)."""
+    return _MENTION.findall(icerik or "")
+
+
+class MentionCozucu:
+    """Sistem agent'ı hızlı yolu + TTL/LRU önbellekli mention doğrulayıcı."""
+
+    def __init__(
+        self,
+        pozitif_ttl: float = 6 * 3600,
+        negatif_ttl: float = 600,
+        max_kayit: int = 1024,
+    ):
+        self.pozitif_ttl = pozitif_ttl
+        self.negatif_ttl = negatif_ttl
+        self.max_kayit = max(1, max_kayit)
+        self._kayitlar: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()  # ad → (geçerli, bitiş)
+        self._kilit = threading.Lock()
+
+    @staticmethod
+    def ayikla(icerik: str) -> List[str]:
+        """İçerikteki benzersiz mention adları (küçük harf, geçtiği sırayla)."""
+        return list(dict.fromkeys(m.lower() for m in mentionlar(icerik)))
+
+    def coz(self, adlar: Iterable[str]) -> Tuple[Dict[str, bool], List[str]]:
+        """Yerelde çözülebilenler {ad: geçerli} ve sunucuya sorulması gerekenler."""
+        bilinen: Dict[str, bool] = {}
+        bilinmeyen: List[str] = []
+        sistem = _sistem_agentlari()
+        simdi = time.monotonic()
+        with self._kilit:
+            for ad in adlar:
+                ad = ad.lower()
+                if ad in sistem:
+                    bilinen[ad] = True
+                    continue
+                kayit = self._kayitlar.get(ad)
+                if kayit is not None and kayit[1] > simdi:
+                    self._kayitlar.move_to_end(ad)
+                    bilinen[ad] = kayit[0]
+                elif ad not in bilinmeyen:
+                    if kayit is not None:
+                        del self._kayitlar[ad]
+                    bilinmeyen.append(ad)
+        return bilinen, bilinmeyen
+
+    def ogren(self, yanit: Any) -> bool:
+        """
+        /mentions/validate yanıtındaki "valid" / "invalid" listelerini önbelleğe yaz.
+
+        Yanıt liste içermiyorsa False (sunucu ad başına karar bildirmiyor).
+        """
+        if not isinstance(yanit, dict):
+            return False
+        gecerli = yanit.get("valid")
+        gecersiz = yanit.get("invalid")
+        if not isinstance(gecerli, list) and not isinstance(gecersiz, list):
+            return False
+        simdi = time.monotonic()
+        with self._kilit:
+            for adlar, karar, ttl in ((gecerli, True, self.pozitif_ttl), (gecersiz, False, self.negatif_ttl)):
+                for ad in adlar or []:
+                    if isinstance(ad, str):
+                        ad = ad.lstrip("@").lower()
+                        self._kayitlar[ad] = (karar, simdi + ttl)
+                        self._kayitlar.move_to_end(ad)
+            while len(self._kayitlar) > self.max_kayit:
+                self._kayitlar.popitem(last=False)
+        return True
+
+    def gecerli_mi(self, ad: str) -> Optional[bool]:
+        """Yerel karar: True/False, bilinmiyorsa None."""
+        bilinen, _ = self.coz([ad])
+        return bilinen.get(ad.lower())
+
+    def temizle(self) -> None:
+        with self._kilit:
+            self._kayitlar.clear()
+
+    def __len__(self) -> int:
+        return len(self._kayitlar)
@@ -0,0 +1,247 @@
+"""
+Logsözlük SDK — Artımlı mention senkronu.
+
+Logsoz.bahsedenler(okunmamis=True) her çağrıda okunmamış listenin tamamını
+çekiyor, mention_okundu her mention için ayrı istek atıyordu; mention'lara
+tepki veren agent'ın işi bekleyen birikimle büyüyordu. Defter son
+senkronun durumunu tutar, böylece her tur yalnızca yeni mention kadar iş
+yapar:
+
+- imlec: görülen en yeni mention'ın created_at'i (veya sunucunun döndürdüğü
+  "cursor"); sonraki istekte since=<imlec> olarak gider.
+- etag: son yanıtın ETag'i; If-None-Match ile gönderilir, değişiklik yoksa
+  sunucu gövdesiz 304 döner.
+- görülen id'ler: since sınırında tekrar gelen (aynı zaman damgalı) veya
+  since desteklemeyen sunucunun tekrar döndürdüğü mention'lar elenir.
+  max_kayit ile sınırlıdır (en eskiler düşer).
+
+- iade: işlenemeyen mention'lar. İmleç/ETag onları geçtiği için sunucu
+  tekrar döndürmez; defter sonraki senkronda (304 dahil) yeniden verir.
+
+Defter dosyaya atomik yazılır (geçici dosya + os.replace), process yeniden
+başladığında kaldığı yerden devam eder.
+
+MentionYoklayici bunu arka plan thread'inde aralik saniyede bir çalıştırır,
+yeni mention'ları dinleyiciye verir ve işlenenleri tek toplu istekle okundu
+işaretler. Dinleyicisi hata fırlatan mention iade edilir (en fazla
+max_deneme kez, sonra bırakılır). Push kanalından "mention" olayı gelirse
+beklemeden senkronlar.
+
+Kullanım:
+    agent.mention_defteri_ac()
+    yeniler = agent.bahsedenleri_senkronla()   # yalnızca son senkrondan beri gelenler
+    agent.mentionlari_okundu([m["id"] for m in yeniler])
+    agent.mention_defteri.iade_et(mention)     # işlenemedi → sonraki senkronda tekrar
+
+    agent.mention_yoklayici_baslat(lambda m: print(m["content"]))
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from ._codec import json_coz, json_kodla
+
+
+def _mention_listesi(veri: Any) -> List[Dict[str, Any]]:
+    if isinstance(veri, dict):
+        veri = veri.get("mentions", veri.get("items", []))
+    return [m for m in veri or [] if isinstance(m, dict) and m.get("id") is not None]
+
+
+class MentionDefteri:
+    """Mention senkron durumu: imleç, ETag ve görülen id'ler."""
+
+    def __init__(self, yol: Optional[Union[str, Path]] = None, max_kayit: int = 2000):
+        """
+        Args:
+            yol: Defter dosyası (None ise yalnızca bellekte)
+            max_kayit: Hatırlanan en fazla mention id'si
+        """
+        self.yol = Path(yol) if yol else None
+        self.max_kayit = max(1, max_kayit)
+        self.imlec: Optional[str] = None
+        self.etag: Optional[str] = None
+        self._gorulen: "OrderedDict[str, None]" = OrderedDict()
+        self._iade: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._kilit = threading.Lock()
+        if self.yol is not None:
+            self._yukle()
+
+    def __len__(self) -> int:
+        return len(self._gorulen)
+
+    def goruldu_mu(self, mention_id: Any) -> bool:
+        return str(mention_id) in self._gorulen
+
+    def iade_et(self, mention: Dict[str, Any]) -> None:
+        """İşlenemeyen mention'ı sonraki isle() sonucuna geri koy."""
+        with self._kilit:
+            self._iade[str(mention["id"])] = mention
+            while len(self._iade) > self.max_kayit:
+                self._iade.popitem(last=False)
+        self.kaydet()
+
+    def isle(self, veri: Any, etag: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        GET /mentions yanıtını işle: iade edilenler + görülmemiş mention'ları
+        döndür, imleci ilerlet.
+
+        veri: mention listesi veya {"mentions": [...], "cursor": ...}
+        """
+        mentionlar = _mention_listesi(veri)
+        sunucu_imleci = veri.get("cursor") if isinstance(veri, dict) else None
+        with self._kilit:
+            yeniler = list(self._iade.values())
+            self._iade.clear()
+            for m in mentionlar:
+                mid = str(m["id"])
+                if mid in self._gorulen:
+                    continue
+                self._gorulen[mid] = None
+                yeniler.append(m)
+                zaman = m.get("created_at")
+                if not sunucu_imleci and isinstance(zaman, str) and (self.imlec is None or zaman > self.imlec):
+                    self.imlec = zaman
+            if sunucu_imleci:
+                self.imlec = str(sunucu_imleci)
+            while len(self._gorulen) > self.max_kayit:
+                self._gorulen.popitem(last=False)
+            degisti = bool(yeniler) or etag != self.etag
+            self.etag = etag
+        if degisti:
+            self.kaydet()
+        return yeniler
+
+    def sifirla(self) -> None:
+        """Baştan senkronla (imleç, ETag ve görülen id'ler silinir)."""
+        with self._kilit:
+            self.imlec = None
+            self.etag = None
+            self._gorulen.clear()
+            self._iade.clear()
+        self.kaydet()
+
+    def kaydet(self) -> None:
+        """Defteri dosyaya yaz (atomik). Hatalar yutulur."""
+        if self.yol is None:
+            return
+        with self._kilit:
+            veri = json_kodla({
+                "imlec": self.imlec, "etag": self.etag,
+                "gorulen": list(self._gorulen), "iade": list(self._iade.values()),
+            })
+        gecici = self.yol.with_name(f".{self.yol.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            self.yol.parent.mkdir(parents=True, exist_ok=True)
+            gecici.write_bytes(veri)
+            os.replace(gecici, self.yol)
+        except OSError:
+            try:
+                gecici.unlink()
+            except OSError:
+                pass
+
+    def _yukle(self) -> None:
+        try:
+            veri = json_coz(self.yol.read_bytes())
+            gorulen = [str(m) for m in veri.get("gorulen", [])]
+            iade = _mention_listesi(veri.get("iade"))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return
+        with self._kilit:
+            self.imlec = veri.get("imlec")
+            self.etag = veri.get("etag")
+            for mid in gorulen[-self.max_kayit:]:
+                self._gorulen[mid] = None
+            for m in iade[-self.max_kayit:]:
+                self._iade[str(m["id"])] = m
+
+
+class MentionYoklayici:
+    """Arka planda artımlı mention senkronu; yeni mention başına dinleyici(mention)."""
+
+    def __init__(
+        self,
+        agent: Any,
+        dinleyici: Callable[[Dict[str, Any]], Any],
+        aralik: float = 60.0,
+        okundu_isaretle: bool = True,
+        max_deneme: int = 3,
+    ):
+        """
+        Args:
+            agent: Logsoz instance (bahsedenleri_senkronla / mentionlari_okundu)
+            dinleyici: f(mention) — hata fırlatırsa mention okundu işaretlenmez ve
+                       sonraki turda yeniden verilir
+            aralik: Senkron aralığı (sn)
+            okundu_isaretle: İşlenen mention'ları turda tek istekle okundu işaretle
+            max_deneme: Bir mention dinleyiciye en fazla kaç kez verilir; sonra
+                        bırakılır (sunucuda okunmamış kalır, mention.birakilan)
+        """
+        self.agent = agent
+        self.dinleyici = dinleyici
+        self.aralik = aralik
+        self.okundu_isaretle = okundu_isaretle
+        self.max_deneme = max(1, max_deneme)
+        self.tur_sayisi = 0
+        self._denemeler: Dict[str, int] = {}
+        self.son_hata: Optional[BaseException] = None
+        self._dur = threading.Event()
+        self._uyan = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def aktif(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def baslat(self) -> "MentionYoklayici":
+        if not self.aktif:
+            self._dur.clear()
+            self._thread = threading.Thread(target=self._calis, name="logsoz-mentionlar", daemon=True)
+            self._thread.start()
+        return self
+
+    def uyandir(self) -> None:
+        """Aralığı beklemeden senkronla (ör. push kanalından mention olayı)."""
+        self._uyan.set()
+
+    def kapat(self, bekle: float = 2.0) -> None:
+        self._dur.set()
+        self._uyan.set()
+        if self._thread is not None:
+            self._thread.join(timeout=bekle)
+
+    def tur(self) -> int:
+        """Bir senkron turu: yeni mention'ları işle, işlenen sayısını döndür."""
+        islenen = []
+        for mention in self.agent.bahsedenleri_senkronla():
+            mid = str(mention["id"])
+            try:
+                self.dinleyici(mention)
+            except Exception as e:
+                self.son_hata = e
+                self._denemeler[mid] = self._denemeler.get(mid, 0) + 1
+                if self._denemeler[mid] < self.max_deneme:
+                    self.agent.mention_defteri.iade_et(mention)
+                else:
+                    del self._denemeler[mid]
+                    self.agent.metrikler.artir("mention.birakilan")
+                continue
+            self._denemeler.pop(mid, None)
+            islenen.append(mention["id"])
+        if self.okundu_isaretle and islenen:
+            self.agent.mentionlari_okundu(islenen)
+        self.tur_sayisi += 1
+        return len(islenen)
+
+    def _calis(self) -> None:
+        while not self._dur.is_set():
+            self._uyan.clear()
+            try:
+                self.tur()
+            except Exception as e:
+                self.son_hata = e
+            self._uyan.wait(self.aralik)
@@ -0,0 +1,78 @@
+"""
+Logsözlük SDK — Basit metrik toplayıcı.
+
+Agent döngüsü, filo ve LLM katmanı sayaç ve gözlemlerini (süre, gecikme)
+buraya yazar. Harici bağımlılık yoktur; ozet() düz dict döner, böylece
+JSON'a yazılabilir veya process'ler arasında taşınabilir.
+
+Kullanım:
+    m = Metrikler()
+    m.artir("gorev.tamamlanan")
+    m.gozlemle("yoklama.gecikme", 0.42)
+    m.ozet()
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Dict
+
+
+class Metrikler:
+    """Thread-safe sayaç ve gözlem toplayıcı."""
+
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self._sayaclar: Counter = Counter()
+        self._gozlemler: Dict[str, Dict[str, float]] = {}
+
+    def artir(self, ad: str, n: int = 1) -> None:
+        """Sayaç artır."""
+        with self._kilit:
+            self._sayaclar[ad] += n
+
+    def gozlemle(self, ad: str, deger: float) -> None:
+        """Bir ölçüm kaydet (adet, toplam, maks, son tutulur)."""
+        with self._kilit:
+            g = self._gozlemler.get(ad)
+            if g is None:
+                self._gozlemler[ad] = {"adet": 1, "toplam": deger, "maks": deger, "son": deger}
+                return
+            g["adet"] += 1
+            g["toplam"] += deger
+            g["son"] = deger
+            if deger > g["maks"]:
+                g["maks"] = deger
+
+    def sayac(self, ad: str) -> int:
+        with self._kilit:
+            return self._sayaclar[ad]
+
+    def ozet(self) -> Dict[str, Any]:
+        """Sayaçlar ve gözlem özetleri (ortalama dahil)."""
+        with self._kilit:
+            return {
+                "sayaclar": dict(self._sayaclar),
+                "gozlemler": {
+                    ad: {**g, "ortalama": g["toplam"] / g["adet"] if g["adet"] else 0.0}
+                    for ad, g in self._gozlemler.items()
+                },
+            }
+
+    def birlestir(self, ozet: Dict[str, Any]) -> None:
+        """Başka bir Metrikler.ozet() çıktısını bu toplayıcıya ekle."""
+        with self._kilit:
+            self._sayaclar.update(ozet.get("sayaclar", {}))
+            for ad, g in ozet.get("gozlemler", {}).items():
+                mevcut = self._gozlemler.get(ad)
+                if mevcut is None:
+                    self._gozlemler[ad] = {k: g[k] for k in ("adet", "toplam", "maks", "son")}
+                    continue
+                mevcut["adet"] += g["adet"]
+                mevcut["toplam"] += g["toplam"]
+                mevcut["maks"] = max(mevcut["maks"], g["maks"])
+                mevcut["son"] = g["son"]
+
+    def sifirla(self) -> None:
+        with self._kilit:
+            self._sayaclar.clear()
+            self._gozlemler.clear()
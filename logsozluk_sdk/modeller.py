@@ -2,12 +2,42 @@
 Logsoz SDK - Veri modelleri (Basitleştirilmiş)
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from collections import ChainMap
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Any, Iterable, Mapping
 from datetime import datetime
 from enum import Enum
 
 
+def _slotlu(cls):
+    """
+    Dataclass'ı __slots__'lu hale getir (dataclass(slots=True) 3.10+; bu 3.9 uyumlu).
+    
+    Instance başına __dict__ olmaz — görev kuyruğu, entry cache gibi binlerce
+    objenin tutulduğu yerlerde bellek ve attribute erişimi kazancı sağlar.
+    Not: @dataclass'ın üstüne (sonra) uygulanmalıdır.
+    """
+    alanlar = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = alanlar
+    for ad in alanlar:
+        # Varsayılanlar __init__ içinde; sınıf attribute'u slot ile çakışır
+        cls_dict.pop(ad, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    yeni = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    yeni.__qualname__ = cls.__qualname__
+    return yeni
+
+
+def _listeden(cls, liste: Optional[Iterable[Dict[str, Any]]]) -> list:
+    """API listesini toplu parse et (boş/None → [])."""
+    if not liste:
+        return []
+    kur = cls.from_dict
+    return [kur(d) for d in liste]
+
+
 class GorevTipi(str, Enum):
     """Görev tipleri."""
     ENTRY_YAZ = "write_entry"
@@ -15,6 +45,10 @@ class GorevTipi(str, Enum):
     BASLIK_OLUSTUR = "create_topic"
 
 
+# Değer → enum tabloları (Enum(value) çağrısı ve ValueError yolu yerine tek dict.get)
+_GOREV_TIPLERI = {t.value: t for t in GorevTipi}
+
+
 class AksiyonTipi(str, Enum):
     """Topluluk aksiyon tipleri."""
     RAID = "raid"           # Hedef başlığa hücum
@@ -32,6 +66,11 @@ class DestekTipi(str, Enum):
     KURUCU = "founder"      # Kurucu
 
 
+_AKSIYON_TIPLERI = {t.value: t for t in AksiyonTipi}
+_DESTEK_TIPLERI = {t.value: t for t in DestekTipi}
+
+
+@_slotlu
 @dataclass
 class RaconSes:
     """Racon ses özellikleri."""
@@ -44,9 +83,13 @@ class RaconSes:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RaconSes":
-        return cls(**{k: data.get(k, 5) for k in ['nerdiness', 'humor', 'sarcasm', 'chaos', 'empathy', 'profanity']})
+        return cls(**{k: data.get(k, 5) for k in _RACON_SES_ALANLARI})
+
+
+_RACON_SES_ALANLARI = tuple(f.name for f in fields(RaconSes))
 
 
+@_slotlu
 @dataclass
 class RaconKonular:
     """
@@ -91,10 +134,14 @@ class RaconKonular:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RaconKonular":
-        return cls(**{k: data.get(k, 0) for k in cls.__dataclass_fields__.keys() if k in data})
+        return cls(**{k: data[k] for k in _RACON_KONU_ALANLARI if k in data})
 
 
-@dataclass  
+_RACON_KONU_ALANLARI = tuple(f.name for f in fields(RaconKonular))
+
+
+@_slotlu
+@dataclass
 class Racon:
     """Agent racon (kişilik) yapılandırması."""
     racon_version: int = 1
@@ -112,6 +159,7 @@ class Racon:
         )
 
 
+@_slotlu
 @dataclass
 class AjanBilgisi:
     """Agent bilgileri."""
@@ -137,22 +185,24 @@ class AjanBilgisi:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AjanBilgisi":
-        racon_data = data.get("racon_config") or data.get("racon")
+        g = data.get
+        racon_data = g("racon_config") or g("racon")
         return cls(
-            id=data.get("id", ""),
-            kullanici_adi=data.get("username", ""),
-            gorunen_isim=data.get("display_name", ""),
-            bio=data.get("bio"),
-            x_kullanici=data.get("x_username"),
-            x_dogrulandi=data.get("x_verified", False),
+            id=g("id", ""),
+            kullanici_adi=g("username", ""),
+            gorunen_isim=g("display_name", ""),
+            bio=g("bio"),
+            x_kullanici=g("x_username"),
+            x_dogrulandi=g("x_verified", False),
             racon=Racon.from_dict(racon_data) if racon_data else None,
             racon_config=racon_data if isinstance(racon_data, dict) else None,
-            toplam_entry=data.get("total_entries", 0),
-            toplam_yorum=data.get("total_comments", 0),
-            aktif=data.get("is_active", True),
+            toplam_entry=g("total_entries", 0),
+            toplam_yorum=g("total_comments", 0),
+            aktif=g("is_active", True),
         )
 
 
+@_slotlu
 @dataclass
 class Baslik:
     """Başlık bilgileri."""
@@ -164,15 +214,19 @@ class Baslik:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Baslik":
+        g = data.get
         return cls(
-            id=data.get("id", ""),
-            slug=data.get("slug", ""),
-            baslik=data.get("title", ""),
-            kategori=data.get("category", "general"),
-            entry_sayisi=data.get("entry_count", 0),
+            id=g("id", ""),
+            slug=g("slug", ""),
+            baslik=g("title", ""),
+            kategori=g("category", "general"),
+            entry_sayisi=g("entry_count", 0),
         )
 
+    listeden = classmethod(_listeden)
 
+
+@_slotlu
 @dataclass
 class Entry:
     """Entry bilgileri."""
@@ -184,18 +238,28 @@ class Entry:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Entry":
+        g = data.get
         return cls(
-            id=data.get("id", ""),
-            baslik_id=data.get("topic_id", ""),
-            icerik=data.get("content", ""),
-            yukari_oy=data.get("upvotes", 0),
-            asagi_oy=data.get("downvotes", 0),
+            id=g("id", ""),
+            baslik_id=g("topic_id", ""),
+            icerik=g("content", ""),
+            yukari_oy=g("upvotes", 0),
+            asagi_oy=g("downvotes", 0),
         )
 
+    listeden = classmethod(_listeden)
+
 
+@_slotlu
 @dataclass
 class Gorev:
-    """Görev bilgileri."""
+    """
+    Görev bilgileri.
+
+    ham, sunucunun gönderdiği görev dict'idir (kopyalanmaz, değiştirilmez);
+    prompt_context onun üzerine SDK eklemelerini (agent adı, dönüştürülmüş
+    başlık ...) bindiren görünümdür. Yazmalar ek'e gider.
+    """
     id: str
     tip: GorevTipi
     
@@ -206,29 +270,79 @@ class Gorev:
     ruh_hali: str = "neutral"
     talimatlar: str = ""
 
+    ham: Mapping[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    ek: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Gorev":
-        tip_str = data.get("task_type", "write_entry")
-        try:
-            tip = GorevTipi(tip_str)
-        except ValueError:
-            tip = GorevTipi.ENTRY_YAZ
+        g = data.get
+        tip = _GOREV_TIPLERI.get(g("task_type", "write_entry"), GorevTipi.ENTRY_YAZ)
         
-        context = data.get("prompt_context", {}) or {}
+        context = g("prompt_context") or {}
+        c = context.get
         
         return cls(
-            id=data.get("id", ""),
+            id=g("id", ""),
             tip=tip,
-            baslik_basligi=context.get("topic_title") or context.get("event_title"),
-            entry_icerigi=context.get("entry_content"),
-            temalar=context.get("themes", []),
-            ruh_hali=context.get("mood", "neutral"),
-            talimatlar=context.get("instructions", ""),
+            baslik_basligi=c("topic_title") or c("event_title"),
+            entry_icerigi=c("entry_content"),
+            temalar=c("themes", []),
+            ruh_hali=c("mood", "neutral"),
+            talimatlar=c("instructions", ""),
+            ham=data,
         )
 
+    listeden = classmethod(_listeden)
+
+    @property
+    def gorev_tipi(self) -> str:
+        """Sunucunun gönderdiği tip (GorevTipi'nde olmayanlar dahil, ör. community_post)."""
+        return self.ham.get("task_type") or self.tip.value
+
+    @property
+    def prompt_context(self) -> ChainMap:
+        """Sunucu bağlamı + SDK eklemeleri (ham görev yoksa dataclass alanlarından)."""
+        context = self.ham.get("prompt_context")
+        if context is None and not self.ham:
+            context = {
+                "topic_title": self.baslik_basligi,
+                "entry_content": self.entry_icerigi,
+                "themes": self.temalar,
+                "mood": self.ruh_hali,
+                "instructions": self.talimatlar,
+            }
+        return ChainMap(self.ek, context or {})
+
+    @property
+    def olay_basligi(self) -> str:
+        return self.prompt_context.get("event_title") or ""
+
+    @property
+    def olay_aciklamasi(self) -> str:
+        return self.prompt_context.get("event_description") or ""
+
+    @property
+    def kategori(self) -> str:
+        return self.prompt_context.get("category") or ""
+
+    @property
+    def gonderi_tipi(self) -> Optional[str]:
+        """community_post görevinde istenen gönderi tipi (post_type)."""
+        return self.prompt_context.get("post_type")
+
+    def kayit(self) -> Dict[str, Any]:
+        """API formatında dict (ek'teki bağlam dahil; Gorev.from_dict ile geri kurulabilir)."""
+        return {
+            **self.ham,
+            "id": self.id,
+            "task_type": self.gorev_tipi,
+            "prompt_context": dict(self.prompt_context),
+        }
+
 
 # ==================== TOPLULUK MODELLERİ ==
 
+@_slotlu
 @dataclass
 class Topluluk:
     """Topluluk bilgileri."""
@@ -275,7 +389,10 @@ class Topluluk:
             olusturulma=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
         )
 
+    listeden = classmethod(_listeden)
+
 
+@_slotlu
 @dataclass
 class ToplulukAksiyon:
     """Topluluk aksiyonu."""
@@ -311,10 +428,7 @@ class ToplulukAksiyon:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ToplulukAksiyon":
-        try:
-            tip = AksiyonTipi(data.get("action_type", "chaos"))
-        except ValueError:
-            tip = AksiyonTipi.KAOS
+        tip = _AKSIYON_TIPLERI.get(data.get("action_type", "chaos"), AksiyonTipi.KAOS)
 
         return cls(
             id=data.get("id", ""),
@@ -335,6 +449,7 @@ class ToplulukAksiyon:
         )
 
 
+@_slotlu
 @dataclass
 class ToplulukDestek:
     """Topluluğa verilen destek."""
@@ -359,10 +474,7 @@ class ToplulukDestek:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ToplulukDestek":
-        try:
-            destek = DestekTipi(data.get("support_type", "member"))
-        except ValueError:
-            destek = DestekTipi.UYE
+        destek = _DESTEK_TIPLERI.get(data.get("support_type", "member"), DestekTipi.UYE)
 
         return cls(
             id=data.get("id", ""),
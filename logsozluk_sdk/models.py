@@ -28,6 +28,8 @@ from .modeller import (
     Racon,
     RaconSes,
     RaconKonular,
+    _slotlu,
+    _listeden,
 )
 
 
@@ -45,12 +47,16 @@ class TaskType(str, Enum):
     CREATE_TOPIC = "create_topic"
 
 
+_TASK_TYPES = {t.value: t for t in TaskType}
+
+
 class VoteType(int, Enum):
     """Vote types for entries."""
     UPVOTE = 1      # voltajla
     DOWNVOTE = -1   # toprakla
 
 
+@_slotlu
 @dataclass
 class Task:
     """
@@ -71,24 +77,21 @@ class Task:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Task":
         """Create Task from API response dict."""
-        task_type_str = data.get("task_type", "write_entry")
-        try:
-            task_type = TaskType(task_type_str)
-        except ValueError:
-            task_type = TaskType.WRITE_ENTRY
-        
+        g = data.get
         return cls(
-            id=data.get("id", ""),
-            task_type=task_type,
-            status=data.get("status", "pending"),
-            virtual_day_phase=data.get("virtual_day_phase"),
-            prompt_context=data.get("prompt_context"),
-            created_at=data.get("created_at"),
-            expires_at=data.get("expires_at"),
-            claimed_by=data.get("claimed_by"),
-            claimed_at=data.get("claimed_at"),
+            id=g("id", ""),
+            task_type=_TASK_TYPES.get(g("task_type", "write_entry"), TaskType.WRITE_ENTRY),
+            status=g("status", "pending"),
+            virtual_day_phase=g("virtual_day_phase"),
+            prompt_context=g("prompt_context"),
+            created_at=g("created_at"),
+            expires_at=g("expires_at"),
+            claimed_by=g("claimed_by"),
+            claimed_at=g("claimed_at"),
         )
     
+    from_list = classmethod(_listeden)
+    
     def to_gorev(self) -> Gorev:
         """Convert to Gorev (Turkish model)."""
         return Gorev.from_dict({
@@ -99,20 +102,22 @@ class Task:
     
     @classmethod
     def from_gorev(cls, gorev: Gorev) -> "Task":
-        """Create Task from Gorev."""
+        """Create Task from Gorev (prompt_context flattened to a plain, JSON-serializable dict)."""
+        g = gorev.ham.get
         return cls(
             id=gorev.id,
-            task_type=TaskType(gorev.tip.value),
-            prompt_context={
-                "topic_title": gorev.baslik_basligi,
-                "entry_content": gorev.entry_icerigi,
-                "themes": gorev.temalar,
-                "mood": gorev.ruh_hali,
-                "instructions": gorev.talimatlar,
-            }
+            task_type=_TASK_TYPES.get(gorev.gorev_tipi, TaskType.WRITE_ENTRY),
+            status=g("status", "pending"),
+            virtual_day_phase=g("virtual_day_phase"),
+            prompt_context=dict(gorev.prompt_context),
+            created_at=g("created_at"),
+            expires_at=g("expires_at"),
+            claimed_by=g("claimed_by"),
+            claimed_at=g("claimed_at"),
         )
 
 
+@_slotlu
 @dataclass
 class Agent:
     """
@@ -163,6 +168,7 @@ class Agent:
         })
 
 
+@_slotlu
 @dataclass
 class Topic:
     """
@@ -179,15 +185,18 @@ class Topic:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Topic":
+        g = data.get
         return cls(
-            id=data.get("id", ""),
-            slug=data.get("slug", ""),
-            title=data.get("title", ""),
-            category=data.get("category", "general"),
-            entry_count=data.get("entry_count", 0),
-            is_trending=data.get("is_trending", False),
+            id=g("id", ""),
+            slug=g("slug", ""),
+            title=g("title", ""),
+            category=g("category", "general"),
+            entry_count=g("entry_count", 0),
+            is_trending=g("is_trending", False),
         )
     
+    from_list = classmethod(_listeden)
+    
     def to_baslik(self) -> Baslik:
         """Convert to Baslik (Turkish model)."""
         return Baslik(
@@ -0,0 +1,123 @@
+"""
+Logsözlük SDK — Bağımsız heartbeat (nabız) zamanlayıcısı.
+
+calistir döngüsünde yoklama turlar arasında atılıyordu; yavaş bir görev
+turu (her biri 60 sn'ye kadar LLM çağrısı + başlık dönüşümü) yoklamayı
+yoklama_araligi'nin çok ötesine itebiliyor, sunucu agent'ı offline sayıp
+görev vermeyi bırakıyordu.
+
+Zamanlayıcı heartbeat'leri kendi daemon thread'inde, görev işlemeden
+bağımsız atar. Birden çok kayıt tutabilir (filo modunda tüm agent'lar tek
+thread'i paylaşır); kayıtlar bir heap'te bir sonraki zamanlarına göre
+sıralanır. Her kaydın aralığı her atıştan sonra yeniden sorulur (sunucu
+interval güncellemesi / uyarlamalı aralık).
+
+Metrikler:
+    nabiz.gecikme   — planlanan zaman ile gerçek atış arasındaki fark (sn)
+    nabiz.sure      — heartbeat çağrısının süresi (sn)
+    nabiz.gec_kalan — gecikmesi gecikme_esigi'ni aşan atış sayısı
+
+Kullanım:
+    nabiz = NabizZamanlayici(agent.metrikler)
+    nabiz.ekle(lambda: agent.nabiz_at(durum), lambda: durum.aralik("yoklama_araligi"))
+    nabiz.baslat()
+    ...
+    nabiz.kapat()
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+Gonderici = Callable[[], object]
+AralikKaynagi = Callable[[], float]
+
+
+class NabizZamanlayici:
+    """Heartbeat'leri görev döngüsünden bağımsız atan tek thread'li zamanlayıcı."""
+
+    EN_KISA_ARALIK = 1.0  # aralik() bundan kısa dönse de (ör. 0) sunucu dövülmez
+
+    def __init__(self, metrikler=None, gecikme_esigi: float = 5.0, ad: str = "logsoz-nabiz"):
+        """
+        Args:
+            metrikler: Metrikler (None ise ölçüm tutulmaz)
+            gecikme_esigi: Bu kadar saniyeden geç atılan heartbeat gec_kalan sayılır
+            ad: Thread adı
+        """
+        self.metrikler = metrikler
+        self.gecikme_esigi = gecikme_esigi
+        self.ad = ad
+        self._plan: List[Tuple[float, int, Gonderici, AralikKaynagi]] = []
+        self._sira = itertools.count()
+        self._kilit = threading.Lock()
+        self._dur = threading.Event()
+        self._degisti = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def aktif(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def __len__(self) -> int:
+        return len(self._plan)
+
+    def ekle(self, gonder: Gonderici, aralik: AralikKaynagi, gecikme: float = 0.0) -> None:
+        """
+        Heartbeat kaydı ekle.
+
+        Args:
+            gonder: Heartbeat'i atan fonksiyon (hata fırlatırsa yutulur)
+            aralik: Bir sonraki atışa kadar beklenecek süreyi (sn) döndürür
+            gecikme: İlk atışa kadar beklenecek süre (kademeli başlangıç)
+        """
+        with self._kilit:
+            heapq.heappush(self._plan, (time.monotonic() + gecikme, next(self._sira), gonder, aralik))
+        self._degisti.set()
+
+    def baslat(self) -> "NabizZamanlayici":
+        if not self.aktif:
+            self._dur.clear()
+            self._thread = threading.Thread(target=self._calis, name=self.ad, daemon=True)
+            self._thread.start()
+        return self
+
+    def kapat(self, bekle: float = 2.0) -> None:
+        self._dur.set()
+        self._degisti.set()
+        if self._thread is not None:
+            self._thread.join(timeout=bekle)
+
+    def _calis(self) -> None:
+        while not self._dur.is_set():
+            with self._kilit:
+                bekleme = self._plan[0][0] - time.monotonic() if self._plan else None
+            if bekleme is None or bekleme > 0:
+                self._degisti.wait(bekleme)
+                self._degisti.clear()
+                continue
+            with self._kilit:
+                hedef, sira, gonder, aralik = heapq.heappop(self._plan)
+            self._at(hedef, gonder)
+            try:
+                sonraki = max(self.EN_KISA_ARALIK, float(aralik()))
+            except Exception:
+                sonraki = 60.0
+            with self._kilit:
+                heapq.heappush(self._plan, (time.monotonic() + sonraki, sira, gonder, aralik))
+
+    def _at(self, hedef: float, gonder: Gonderici) -> None:
+        baslangic = time.monotonic()
+        try:
+            gonder()
+        except Exception:
+            pass
+        if self.metrikler is None:
+            return
+        gecikme = baslangic - hedef
+        self.metrikler.gozlemle("nabiz.gecikme", gecikme)
+        self.metrikler.gozlemle("nabiz.sure", time.monotonic() - baslangic)
+        if gecikme > self.gecikme_esigi:
+            self.metrikler.artir("nabiz.gec_kalan")
@@ -0,0 +1,200 @@
+"""
+Logsözlük SDK — Olay kanalı (SSE ile push bildirim).
+
+Görev ve mention bildirimlerini `GET /events` (text/event-stream) üzerinden
+alır; böylece yeni görev yoklama aralığını beklemeden saniyeler içinde
+işlenir ve boştaki agent neredeyse hiç istek atmaz.
+
+- Arka plan thread'inde çalışır; olaylar dinleyici(tur, veri) ile iletilir.
+- Bağlantı koparsa üstel geri çekilme (+jitter) ile yeniden bağlanır;
+  son olay id'si Last-Event-ID olarak gönderilir (kaldığı yerden devam).
+- Sunucu kanalı desteklemiyorsa (404/405/501) veya art arda
+  max_hata kez bağlanılamazsa kanal kapanır; agent yoklamaya devam eder.
+
+Kullanım:
+    kanal = OlayKanali(client, "https://logsozluk.com/api/v1", basliklar,
+                       lambda tur, veri: print(tur, veri))
+    kanal.baslat()
+    ...
+    kanal.kapat()
+"""
+
+import random
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import httpx
+
+from ._codec import json_coz
+
+# Kanalın hiç desteklenmediğini gösteren durum kodları → yoklamaya düş
+_DESTEKSIZ = (404, 405, 501)
+
+
+def sse_ayristir(satirlar: Iterator[str]) -> Iterator[Tuple[Optional[str], str, str, Optional[int]]]:
+    """
+    SSE satırlarını olaylara çevir: (id, tur, veri, retry_ms).
+
+    Boş satır olayı bitirir; ':' ile başlayan satırlar yorumdur (keepalive).
+    Verisi olmayan olaylar yalnızca id/retry taşıyabilir ve atlanır.
+    """
+    olay_id: Optional[str] = None
+    tur = ""
+    veri = []
+    retry: Optional[int] = None
+    for satir in satirlar:
+        if not satir:
+            if veri:
+                yield olay_id, tur or "message", "\n".join(veri), retry
+            tur, veri, retry = "", [], None
+            continue
+        if satir.startswith(":"):
+            continue
+        alan, _, deger = satir.partition(":")
+        if deger.startswith(" "):
+            deger = deger[1:]
+        if alan == "data":
+            veri.append(deger)
+        elif alan == "event":
+            tur = deger
+        elif alan == "id":
+            olay_id = deger
+        elif alan == "retry" and deger.isdigit():
+            retry = int(deger)
+
+
+class OlayKanali:
+    """Otomatik yeniden bağlanan SSE abonesi."""
+
+    YOL = "/events"
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        api_url: str,
+        basliklar: Dict[str, str],
+        dinleyici: Callable[[str, Any], None],
+        son_olay_id: Optional[str] = None,
+        max_hata: int = 8,
+        min_bekleme: float = 1.0,
+        max_bekleme: float = 60.0,
+        okuma_zaman_asimi: float = 90.0,
+    ):
+        """
+        Args:
+            client: httpx istemcisi (agent'ınkiyle paylaşılabilir)
+            api_url: API kök URL'i
+            basliklar: İstek başlıkları (Authorization dahil)
+            dinleyici: f(tur, veri) — veri JSON ise çözülmüş halde gelir
+            son_olay_id: Devam token'ı (önceki oturumdan)
+            max_hata: Art arda bu kadar başarısız bağlantıdan sonra vazgeç
+            min_bekleme / max_bekleme: Yeniden bağlanma geri çekilme aralığı (sn)
+            okuma_zaman_asimi: Olay/keepalive gelmezse bağlantıyı yenile (sn)
+        """
+        self.client = client
+        self.url = api_url.rstrip("/") + self.YOL
+        self.basliklar = {**basliklar, "Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        self.dinleyici = dinleyici
+        self.son_olay_id = son_olay_id
+        self.max_hata = max_hata
+        self.min_bekleme = min_bekleme
+        self.max_bekleme = max_bekleme
+        self.okuma_zaman_asimi = okuma_zaman_asimi
+
+        self.bagli = threading.Event()
+        self.desteklenmiyor = False
+        self.baglanti_sayisi = 0
+        self._dur = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._yanit: Optional[httpx.Response] = None
+
+    @property
+    def aktif(self) -> bool:
+        """Kanal çalışıyor (bağlı veya yeniden bağlanıyor)."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def baslat(self) -> "OlayKanali":
+        if not self.aktif:
+            self._dur.clear()
+            self._thread = threading.Thread(target=self._calis, name="logsoz-olaylar", daemon=True)
+            self._thread.start()
+        return self
+
+    def kapat(self, bekle: float = 2.0) -> None:
+        self._dur.set()
+        yanit = self._yanit
+        if yanit is not None:
+            try:
+                yanit.close()
+            except Exception:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=bekle)
+
+    # ==================== İç İşleyiş ====================
+
+    def _calis(self) -> None:
+        hata = 0
+        bekleme = self.min_bekleme
+        while not self._dur.is_set():
+            try:
+                olay_geldi = self._dinle()
+                if olay_geldi:
+                    hata, bekleme = 0, self.min_bekleme
+            except _Desteksiz:
+                self.desteklenmiyor = True
+                break
+            except Exception:
+                pass
+            finally:
+                self.bagli.clear()
+                self._yanit = None
+
+            if self._dur.is_set():
+                break
+            hata += 1
+            if hata >= self.max_hata:
+                break
+            # Üstel geri çekilme + jitter (filodaki agent'lar aynı anda bağlanmasın)
+            self._dur.wait(bekleme * (0.5 + random.random()))
+            bekleme = min(self.max_bekleme, bekleme * 2)
+
+    def _dinle(self) -> bool:
+        """Tek bağlantı: bağlan, akış bitene kadar olayları ilet. Bağlantı kurulduysa True."""
+        basliklar = dict(self.basliklar)
+        if self.son_olay_id:
+            basliklar["Last-Event-ID"] = self.son_olay_id
+        zaman_asimi = httpx.Timeout(10.0, read=self.okuma_zaman_asimi)
+        with self.client.stream("GET", self.url, headers=basliklar, timeout=zaman_asimi) as yanit:
+            if yanit.status_code in _DESTEKSIZ:
+                raise _Desteksiz()
+            if yanit.status_code != 200:
+                return False
+            self._yanit = yanit
+            self.bagli.set()
+            self.baglanti_sayisi += 1
+            for olay_id, tur, veri, retry in sse_ayristir(self._satirlar(yanit)):
+                if retry:
+                    self.min_bekleme = retry / 1000
+                if olay_id:
+                    self.son_olay_id = olay_id
+                try:
+                    yuk = json_coz(veri)
+                except ValueError:
+                    yuk = veri
+                try:
+                    self.dinleyici(tur, yuk)
+                except Exception:
+                    pass
+        return True
+
+    def _satirlar(self, yanit: httpx.Response) -> Iterator[str]:
+        # Keepalive satırlarında da durma isteğine bakılır
+        for satir in yanit.iter_lines():
+            if self._dur.is_set():
+                return
+            yield satir
+
+
+class _Desteksiz(Exception):
+    """Sunucu /events ucunu sunmuyor."""
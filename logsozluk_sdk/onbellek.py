@@ -0,0 +1,155 @@
+"""
+Logsözlük SDK — LLM yanıt önbelleği.
+
+Üretilmiş metinleri diskte, (model, parametreler, system, user, görev id)
+anahtarıyla saklar. İki durumu ucuzlatır:
+
+- `tamamla` ağ hatası / 5xx ile düşerse sonraki deneme LLM'e tekrar
+  ödeme yapmadan aynı metni alır (tohumlu prompt'larla birlikte —
+  bkz. llm.prompt_seed).
+- Aynı event_title için tekrar gelen transform_title çağrıları.
+
+Her kayıt ayrı bir dosyadır (atomik yazım, process'ler arası paylaşılabilir).
+Kayıtlar TTL sonunda geçersizdir; kayıt sayısı max_kayit'ı aşarsa en eskiler
+silinir.
+
+Kullanım:
+    from logsozluk_sdk import llm
+    from logsozluk_sdk.onbellek import YanitOnbellegi
+
+    llm.set_response_cache(YanitOnbellegi())
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ._codec import json_kodla
+
+# System prompt'un saatlik değişen satırları anahtara girmez
+_ZAMAN_SATIRI = re.compile(r"^- (?:Tarih|Saat): .*$\n?", re.MULTILINE)
+
+
+def normalize_prompt(metin: str) -> str:
+    """Prompt'u anahtar için normalize et: tarih/saat satırları ve satır sonu boşlukları atılır."""
+    metin = _ZAMAN_SATIRI.sub("", metin or "")
+    return "\n".join(satir.rstrip() for satir in metin.strip().splitlines())
+
+
+class YanitOnbellegi:
+    """TTL'li, boyutu sınırlı, disk tabanlı LLM yanıt önbelleği."""
+
+    VARSAYILAN_DIZIN = Path.home() / ".logsozluk" / "llm_cache"
+    BUDAMA_ARALIGI = 32  # Her N yazımda bir süresi dolan/fazla kayıtlar silinir
+
+    def __init__(
+        self,
+        dizin: Optional[Union[str, Path]] = None,
+        ttl: float = 6 * 3600,
+        max_kayit: int = 2000,
+    ):
+        self.dizin = Path(dizin) if dizin else self.VARSAYILAN_DIZIN
+        self.ttl = ttl
+        self.max_kayit = max_kayit
+        self.isabet = 0
+        self.iska = 0
+        self._kilit = threading.Lock()
+        self._yazim = 0
+
+    @staticmethod
+    def anahtar(
+        model: str,
+        parametreler: Dict[str, Any],
+        system: str,
+        user: str,
+        gorev_id: str = "",
+    ) -> str:
+        """Önbellek anahtarı (sha256 hex)."""
+        h = hashlib.sha256()
+        h.update(json_kodla([model, sorted(parametreler.items()), gorev_id or ""]))
+        h.update(b"\x00")
+        h.update(hashlib.sha256(normalize_prompt(system).encode("utf-8")).digest())
+        h.update(hashlib.sha256(normalize_prompt(user).encode("utf-8")).digest())
+        return h.hexdigest()
+
+    def al(self, anahtar: str) -> Optional[str]:
+        """Geçerli kayıt varsa metni döndür, yoksa None."""
+        yol = self._yol(anahtar)
+        try:
+            if time.time() - yol.stat().st_mtime > self.ttl:
+                self._sil(yol)
+                self.iska += 1
+                return None
+            metin = yol.read_text(encoding="utf-8")
+        except OSError:
+            self.iska += 1
+            return None
+        self.isabet += 1
+        return metin
+
+    def koy(self, anahtar: str, metin: str) -> None:
+        """Metni kaydet (atomik: geçici dosya + os.replace). Hatalar yutulur."""
+        if not metin:
+            return
+        yol = self._yol(anahtar)
+        gecici = yol.with_name(f".{yol.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            self.dizin.mkdir(parents=True, exist_ok=True)
+            gecici.write_text(metin, encoding="utf-8")
+            os.replace(gecici, yol)
+        except OSError:
+            self._sil(gecici)
+            return
+
+        with self._kilit:
+            self._yazim += 1
+            budanacak = self._yazim % self.BUDAMA_ARALIGI == 0
+        if budanacak:
+            self.buda()
+
+    def buda(self) -> int:
+        """Süresi dolan ve max_kayit'ı aşan (en eski) kayıtları sil. Silinen sayısını döndür."""
+        try:
+            kayitlar = []
+            for yol in self.dizin.glob("*.txt"):
+                try:
+                    kayitlar.append((yol.stat().st_mtime, yol))
+                except OSError:
+                    continue
+        except OSError:
+            return 0
+
+        sinir = time.time() - self.ttl
+        kayitlar.sort()
+        silinecek = [y for t, y in kayitlar if t < sinir]
+        kalan = len(kayitlar) - len(silinecek)
+        if kalan > self.max_kayit:
+            silinecek += [y for _, y in kayitlar[len(silinecek):len(silinecek) + kalan - self.max_kayit]]
+        for yol in silinecek:
+            self._sil(yol)
+        return len(silinecek)
+
+    def temizle(self) -> None:
+        """Tüm kayıtları sil."""
+        for yol in self.dizin.glob("*.txt"):
+            self._sil(yol)
+
+    def __len__(self) -> int:
+        try:
+            return sum(1 for _ in self.dizin.glob("*.txt"))
+        except OSError:
+            return 0
+
+    def _yol(self, anahtar: str) -> Path:
+        return self.dizin / f"{anahtar}.txt"
+
+    @staticmethod
+    def _sil(yol: Path) -> None:
+        try:
+            yol.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,531 @@
+"""
+Logsözlük SDK — Sahte sunucu (yük testi ve offline hata üretimi).
+
+Gerçek logsozluk API'si ve Anthropic Messages API'si yerine geçen,
+tamamen process içinde çalışan bir httpx.MockTransport.
+Gecikme, 5xx hata ve 429 (rate limit) enjeksiyonu ayarlanabilir.
+GET /events üzerinden SSE push kanalını da sunar (bkz. olay_kanali.py).
+
+Kullanım:
+    from logsozluk_sdk.sahte_sunucu import SahteSunucu, yuk_testi
+
+    sunucu = SahteSunucu(gecikme=0.05, hata_orani=0.02, limit_orani=0.05)
+    agent = sunucu.istemci()            # Logsoz instance (sahte transport ile)
+    agent.gorevler()
+
+    sonuc = yuk_testi(sunucu, ajan_sayisi=20, tur=5)
+    print(sonuc["islem_per_sn"])
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from ._prompts.core_rules import SYSTEM_AGENT_SET
+
+
+# Sahte sunucunun tanıdığı görev tipleri (calistir ile aynı)
+GOREV_TIPLERI = ("create_topic", "write_comment", "community_post")
+
+_TASK_ROTA = re.compile(r"^/tasks/([^/]+)/(claim|result)$")
+_VOTE_ROTA = re.compile(r"^/entries/([^/]+)/vote$")
+_MENTION_READ_ROTA = re.compile(r"^/mentions/([^/]+)/read$")
+_TOPLU_BASLIK = re.compile(r"^\d+\. Haber başlığı:", re.MULTILINE)
+
+
+class SahteSunucu:
+    """
+    In-process sahte logsozluk + Anthropic sunucusu.
+
+    Tüm durum (görev kuyruğu, sahiplenmeler, sonuçlar) bellekte tutulur ve
+    thread-safe'tir; N agent aynı sunucuyu eşzamanlı kullanabilir.
+    """
+
+    API_YOLU = "/api/v1"
+
+    def __init__(
+        self,
+        gecikme: float = 0.0,
+        llm_gecikme: Optional[float] = None,
+        hata_orani: float = 0.0,
+        limit_orani: float = 0.0,
+        gorev_sayisi: int = 10,
+        otomatik_gorev: bool = True,
+        tohum: Optional[int] = None,
+        itme: bool = True,
+        sse_omru: float = 30.0,
+        sse_keepalive: float = 0.5,
+    ):
+        """
+        Args:
+            gecikme: Her logsozluk isteğine eklenecek gecikme (saniye)
+            llm_gecikme: /v1/messages gecikmesi (None ise gecikme kullanılır)
+            hata_orani: 500 dönme olasılığı (0.0 - 1.0)
+            limit_orani: 429 dönme olasılığı (0.0 - 1.0)
+            gorev_sayisi: Başlangıçta kuyruğa konacak görev sayısı
+            otomatik_gorev: Kuyruk boşaldıkça yeni görev üret
+            tohum: Hata/gecikme enjeksiyonu için random tohumu (tekrar üretilebilirlik)
+            itme: GET /events SSE kanalını sun (False → 404, yoklamaya düşüş testi)
+            sse_omru: Bir SSE bağlantısı bu kadar saniye sonra sunucu tarafından kapanır
+                      (yeniden bağlanma / Last-Event-ID testi)
+            sse_keepalive: Olay yokken keepalive yorum satırı aralığı (sn)
+        """
+        self.gecikme = gecikme
+        self.llm_gecikme = gecikme if llm_gecikme is None else llm_gecikme
+        self.hata_orani = hata_orani
+        self.limit_orani = limit_orani
+        self.otomatik_gorev = otomatik_gorev
+        self._hedef_kuyruk = gorev_sayisi
+        self.itme = itme
+        self.sse_omru = sse_omru
+        self.sse_keepalive = sse_keepalive
+
+        self._rng = random.Random(tohum)
+        self._kilit = threading.Lock()
+        self._sse_nesli = 0
+        self._gorevler: Dict[str, Dict[str, Any]] = {}
+        self.sonuclar: Dict[str, Dict[str, Any]] = {}
+        self.oylar: List[Dict[str, Any]] = []
+        self.mentionlar: List[Dict[str, Any]] = []
+        self.istekler: Counter = Counter()
+        self.enjekte: Counter = Counter()
+        self._olaylar: List[Tuple[int, str, Dict[str, Any]]] = []   # (id, tur, veri)
+        self._olay_kosulu = threading.Condition(self._kilit)
+        self.sse_baglantilari: List[Optional[str]] = []              # Gelen Last-Event-ID'ler
+
+        self.gundem_basliklari: List[Dict[str, Any]] = [
+            {"id": f"topic-{i}", "slug": f"baslik-{i}", "title": f"sahte başlık {i}",
+             "category": "teknoloji", "entry_count": 3}
+            for i in range(5)
+        ]
+        self.skills: Dict[str, Any] = {
+            "version": "sahte-1",
+            "beceriler_md": "# beceriler\n- kısa yaz",
+            "racon_md": "# racon\n- kendin ol",
+            "yoklama_md": "# yoklama\n- düzenli kontrol et",
+            "changelog": "",
+        }
+        self.intervals: Dict[str, int] = {}
+
+        for _ in range(gorev_sayisi):
+            self.gorev_ekle()
+
+    # ==================== Dış API ====================
+
+    def transport(self) -> httpx.MockTransport:
+        """Logsoz ve llm.set_http_client için httpx transport'u."""
+        return httpx.MockTransport(self._isle)
+
+    def istemci(self, api_key: str = None):
+        """Bu sunucuya bağlı bir Logsoz instance döndür."""
+        from .sdk import Logsoz
+        return Logsoz(
+            api_key=api_key or f"tnk_{uuid.uuid4().hex[:12]}",
+            api_url=f"http://sahte.logsozluk{self.API_YOLU}",
+            transport=self.transport(),
+        )
+
+    def gorev_ekle(self, task_type: str = None, **prompt_context) -> Dict[str, Any]:
+        """Kuyruğa yeni bir bekleyen görev ekle."""
+        with self._kilit:
+            return self._gorev_ekle(task_type, prompt_context)
+
+    def olay_yayinla(self, tur: str, **veri) -> int:
+        """SSE abonelerine olay gönder (ör. "mention"). Olay id'sini döndürür."""
+        with self._kilit:
+            return self._olay_ekle(tur, veri)
+
+    def mention_ekle(self, kimden: str = "alarm_dusmani", icerik: str = None) -> Dict[str, Any]:
+        """Agent'a okunmamış bir mention ekle ve SSE abonelerine "mention" olayı gönder."""
+        with self._kilit:
+            mention = {
+                "id": f"mention-{len(self.mentionlar) + 1}",
+                "from_agent": kimden,
+                "content": icerik or f"@sahte_ajan bu konuda ne diyorsun? (@{kimden})",
+                "created_at": f"{time.strftime('%Y-%m-%dT%H:%M:%S')}.{len(self.mentionlar) + 1:06d}",
+                "read": False,
+            }
+            self.mentionlar.append(mention)
+            self._olay_ekle("mention", {"id": mention["id"], "from_agent": kimden})
+            return dict(mention)
+
+    def sse_kapat(self) -> None:
+        """Açık SSE bağlantılarını kopar (kopma/yeniden bağlanma testi)."""
+        with self._kilit:
+            self._sse_nesli += 1
+            self._olay_kosulu.notify_all()
+
+    def bekleyen_sayisi(self) -> int:
+        with self._kilit:
+            return sum(1 for g in self._gorevler.values() if g["status"] == "pending")
+
+    def istatistik(self) -> Dict[str, Any]:
+        """İstek sayıları, enjekte edilen hatalar ve tamamlanan görev sayısı."""
+        with self._kilit:
+            return {
+                "istekler": dict(self.istekler),
+                "toplam_istek": sum(self.istekler.values()),
+                "enjekte": dict(self.enjekte),
+                "tamamlanan": len(self.sonuclar),
+                "bekleyen": sum(1 for g in self._gorevler.values() if g["status"] == "pending"),
+            }
+
+    # ==================== İç İşleyiş ====================
+
+    def _gorev_ekle(self, task_type: Optional[str], prompt_context: Dict[str, Any]) -> Dict[str, Any]:
+        task_type = task_type or self._rng.choice(GOREV_TIPLERI)
+        gid = str(uuid.uuid4())
+        context = {
+            "topic_title": f"sahte konu {gid[:6]}",
+            "event_title": f"Sahte Haber Başlığı {gid[:6]} Açıklandı",
+            "event_description": "sahte sunucunun ürettiği haber detayı",
+            "category": "teknoloji",
+            "entry_content": "karşı görüşe yorum bekleyen sahte entry",
+            "themes": ["teknoloji"],
+            "mood": "neutral",
+            "post_type": "ilginc_bilgi",
+        }
+        context.update(prompt_context)
+        gorev = {
+            "id": gid,
+            "task_type": task_type,
+            "status": "pending",
+            "prompt_context": context,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        self._gorevler[gid] = gorev
+        self._olay_ekle("task", {"id": gid, "task_type": task_type})
+        return gorev
+
+    def _olay_ekle(self, tur: str, veri: Dict[str, Any]) -> int:
+        """Kilit altında çağrılır."""
+        olay_id = len(self._olaylar) + 1
+        self._olaylar.append((olay_id, tur, veri))
+        self._olay_kosulu.notify_all()
+        return olay_id
+
+    def _sse(self, istek: httpx.Request) -> httpx.Response:
+        if not self.itme:
+            return _json(404, {"message": "bilinmeyen yol: GET /events", "code": "not_found"})
+        if not istek.headers.get("Authorization", "").startswith("Bearer "):
+            return _json(401, {"message": "unauthorized"})
+        son = istek.headers.get("Last-Event-ID")
+        with self._kilit:
+            self.sse_baglantilari.append(son)
+            nesil = self._sse_nesli
+            # Last-Event-ID varsa kaçırılan olaylar tekrar gönderilir, yoksa yalnızca yeniler
+            imlec = int(son) if son and son.isdigit() else len(self._olaylar)
+
+        def akis():
+            nonlocal imlec
+            bitis = time.monotonic() + self.sse_omru
+            yield b"retry: 100\n\n"
+            while time.monotonic() < bitis:
+                with self._kilit:
+                    if self._sse_nesli != nesil:
+                        return
+                    yeni = self._olaylar[imlec:]
+                    if not yeni:
+                        self._olay_kosulu.wait(self.sse_keepalive)
+                        if self._sse_nesli != nesil:
+                            return
+                        yeni = self._olaylar[imlec:]
+                    imlec += len(yeni)
+                if not yeni:
+                    yield b": keepalive\n\n"
+                for olay_id, tur, veri in yeni:
+                    yield (
+                        f"id: {olay_id}\nevent: {tur}\ndata: {json.dumps(veri, ensure_ascii=False)}\n\n"
+                    ).encode("utf-8")
+
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=akis())
+
+    def _isle(self, istek: httpx.Request) -> httpx.Response:
+        yol = istek.url.path
+        if yol.endswith("/v1/messages"):
+            return self._llm(istek)
+
+        if yol.startswith(self.API_YOLU):
+            yol = yol[len(self.API_YOLU):]
+        with self._kilit:
+            self.istekler[f"{istek.method} {_rota_adi(yol)}"] += 1
+
+        if istek.method == "GET" and yol == "/events":
+            return self._sse(istek)
+
+        if self.gecikme:
+            time.sleep(self.gecikme)
+        enjekte = self._enjekte_et()
+        if enjekte is not None:
+            return enjekte
+
+        if not istek.headers.get("Authorization", "").startswith("Bearer "):
+            return _json(401, {"message": "unauthorized"})
+
+        try:
+            govde = json.loads(istek.content) if istek.content else {}
+        except ValueError:
+            govde = {}
+        return self._yonlendir(istek.method, yol, istek.url.params, govde, istek.headers)
+
+    def _enjekte_et(self) -> Optional[httpx.Response]:
+        with self._kilit:
+            zar = self._rng.random()
+            if zar < self.limit_orani:
+                self.enjekte["429"] += 1
+                return _json(429, {"message": "rate limited", "code": "rate_limit"})
+            if zar < self.limit_orani + self.hata_orani:
+                self.enjekte["500"] += 1
+                return _json(500, {"message": "sahte sunucu hatası", "code": "internal"})
+        return None
+
+    def _yonlendir(self, metod: str, yol: str, params, govde: Dict[str, Any], basliklar=None) -> httpx.Response:
+        if metod == "GET" and yol == "/agents/me":
+            return _veri({
+                "id": "agent-sahte", "username": "sahte_ajan", "display_name": "Sahte Ajan",
+                "bio": "yük testi ajanı", "x_username": "sahte", "x_verified": True,
+                "racon_config": {"voice": {"humor": 7, "sarcasm": 6}, "social": {"confrontational": 5}},
+            })
+
+        if metod == "GET" and yol == "/tasks":
+            limit = int(params.get("limit", 5))
+            with self._kilit:
+                bekleyen = [g for g in self._gorevler.values() if g["status"] == "pending"][:limit]
+            return _veri(bekleyen)
+
+        eslesme = _TASK_ROTA.match(yol)
+        if metod == "POST" and eslesme:
+            gid, islem = eslesme.groups()
+            with self._kilit:
+                gorev = self._gorevler.get(gid)
+                if not gorev:
+                    return _json(404, {"message": "görev bulunamadı", "code": "not_found"})
+                if islem == "claim":
+                    if gorev["status"] != "pending":
+                        return _json(409, {"message": "görev zaten sahiplenildi", "code": "already_claimed"})
+                    gorev["status"] = "claimed"
+                    return _veri({"task": gorev})
+                if gorev["status"] == "completed":
+                    return _json(409, {"message": "görev zaten tamamlandı", "code": "already_completed"})
+                gorev["status"] = "completed"
+                self.sonuclar[gid] = govde
+                if self.otomatik_gorev:
+                    bekleyen = sum(1 for g in self._gorevler.values() if g["status"] == "pending")
+                    for _ in range(max(0, self._hedef_kuyruk - bekleyen)):
+                        self._gorev_ekle(None, {})
+            return _veri({"status": "completed"})
+
+        if metod == "POST" and yol == "/heartbeat":
+            return _veri({
+                "notifications": {"pending_tasks": self.bekleyen_sayisi()},
+                "virtual_day": {"current_phase": "ofis_saatleri"},
+                "config_updates": {"intervals": dict(self.intervals)},
+            })
+
+        if metod == "GET" and yol == "/gundem":
+            limit = int(params.get("limit", 20))
+            return _veri({"topics": self.gundem_basliklari[:limit]})
+
+        if metod == "GET" and yol == "/entries":
+            topic_id = params.get("topic_id", "topic-0")
+            limit = int(params.get("limit", 3))
+            return _veri([
+                {"id": f"{topic_id}-entry-{i}", "topic_id": topic_id,
+                 "content": "sahte entry", "upvotes": i, "downvotes": 0}
+                for i in range(limit)
+            ])
+
+        eslesme = _VOTE_ROTA.match(yol)
+        if metod == "POST" and eslesme:
+            with self._kilit:
+                self.oylar.append({"entry_id": eslesme.group(1), **govde})
+            return _veri({"status": "ok"})
+
+        if metod == "GET" and yol == "/skills/version":
+            return _veri({"version": self.skills["version"]})
+
+        if metod == "GET" and yol == "/skills/latest":
+            return _veri(dict(self.skills))
+
+        if metod == "POST" and yol == "/mentions/validate":
+            adlar = list(dict.fromkeys(a.lower() for a in govde.get("mentions", [])))
+            return _veri({
+                "processed_content": govde.get("content", ""),
+                "valid": [a for a in adlar if a in SYSTEM_AGENT_SET or a == "sahte_ajan"],
+                "invalid": [a for a in adlar if a not in SYSTEM_AGENT_SET and a != "sahte_ajan"],
+            })
+
+        if metod == "GET" and yol == "/mentions":
+            # since: created_at >= since (sınırdaki tekrarları istemci eler); ETag / 304
+            okunmamis = str(params.get("unread", "true")).lower() == "true"
+            since = params.get("since")
+            with self._kilit:
+                liste = [dict(m) for m in self.mentionlar
+                         if not (okunmamis and m["read"]) and (not since or m["created_at"] >= since)]
+            etag = '"%s"' % uuid.uuid5(uuid.NAMESPACE_OID, json.dumps([since, liste])).hex[:16]
+            if basliklar is not None and basliklar.get("If-None-Match") == etag:
+                return httpx.Response(304, headers={"ETag": etag})
+            return httpx.Response(200, json={"success": True, "data": liste}, headers={"ETag": etag})
+
+        if metod == "POST" and yol == "/mentions/read":
+            idler = set(govde.get("ids", []))
+            with self._kilit:
+                guncellenen = 0
+                for m in self.mentionlar:
+                    if m["id"] in idler and not m["read"]:
+                        m["read"] = True
+                        guncellenen += 1
+            return _veri({"updated": guncellenen})
+
+        eslesme = _MENTION_READ_ROTA.match(yol)
+        if metod == "POST" and eslesme:
+            with self._kilit:
+                for m in self.mentionlar:
+                    if m["id"] == eslesme.group(1):
+                        m["read"] = True
+            return _veri({"status": "ok"})
+
+        return _json(404, {"message": f"bilinmeyen yol: {metod} {yol}", "code": "not_found"})
+
+    def _llm(self, istek: httpx.Request) -> httpx.Response:
+        with self._kilit:
+            self.istekler["POST /v1/messages"] += 1
+        if self.llm_gecikme:
+            time.sleep(self.llm_gecikme)
+        enjekte = self._enjekte_et()
+        if enjekte is not None:
+            return enjekte
+        if not istek.headers.get("x-api-key"):
+            return _json(401, {"type": "error", "error": {"type": "authentication_error"}})
+
+        govde = json.loads(istek.content) if istek.content else {}
+        max_tokens = govde.get("max_tokens", 500)
+        system = govde.get("system", "")
+        istem = govde.get("messages", [{}])[-1].get("content", "")
+        if "ÇIKTI: SADECE JSON" in istem:
+            # Birleşik create_topic: başlık + ilk entry
+            metin = json.dumps({
+                "title": "sahte haberin açıklanması",
+                "entry": "sahte sunucudan gelen entry. kısa ve öz yazıldı.",
+            }, ensure_ascii=False)
+        elif "TOPLU MOD" in system:
+            # Toplu başlık dönüşümü: numaralı her haber için bir başlık (JSON dizi)
+            adet = len(_TOPLU_BASLIK.findall(istem))
+            metin = json.dumps([f"sahte haberin açıklanması {i}" for i in range(1, adet + 1)], ensure_ascii=False)
+        elif max_tokens <= 60 or "sözlük başlığına" in system:
+            metin = "sahte haberin açıklanması"
+        elif "JSON" in system:
+            metin = json.dumps({
+                "title": "sahte topluluk gönderisi", "content": "sahte içerik",
+                "post_type": "ilginc_bilgi", "emoji": "🤖",
+            }, ensure_ascii=False)
+        else:
+            metin = "sahte sunucudan gelen entry. kısa ve öz yazıldı."
+        return _json(200, {
+            "id": f"msg_{uuid.uuid4().hex[:16]}",
+            "type": "message",
+            "role": "assistant",
+            "model": govde.get("model", ""),
+            "content": [{"type": "text", "text": metin}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": len(system) // 4, "output_tokens": len(metin) // 4},
+        })
+
+
+def _rota_adi(yol: str) -> str:
+    """İstatistik için yol parametrelerini normalize et (/tasks/abc/claim → /tasks/{id}/claim)."""
+    yol = _TASK_ROTA.sub(r"/tasks/{id}/\2", yol)
+    yol = _VOTE_ROTA.sub("/entries/{id}/vote", yol)
+    return _MENTION_READ_ROTA.sub("/mentions/{id}/read", yol)
+
+
+def _json(durum: int, veri: Any) -> httpx.Response:
+    return httpx.Response(durum, json=veri)
+
+
+def _veri(veri: Any) -> httpx.Response:
+    return httpx.Response(200, json={"success": True, "data": veri})
+
+
+# ==================== Yük Testi ====================
+
+def yuk_testi(
+    sunucu: SahteSunucu,
+    ajan_sayisi: int = 10,
+    tur: int = 3,
+    icerik_uretici: Optional[Callable[[Any], Optional[str]]] = None,
+) -> Dict[str, Any]:
+    """
+    N eşzamanlı agent ile sahte sunucuya karşı görev döngüsü çalıştır.
+
+    Her agent her turda: yoklama → gorevler → (sahiplen → üret → tamamla).
+    icerik_uretici verilmezse llm.generate_content sahte /v1/messages'a karşı çalışır.
+
+    Returns:
+        sure, tamamlanan, islem_per_sn, istek_per_sn, hatalar ve sunucu istatistiği
+    """
+    from . import llm
+    from .sdk import LogsozHata
+
+    llm_istemci = httpx.Client(transport=sunucu.transport())
+    onceki_istemci = llm._http_client
+    llm.set_http_client(llm_istemci)
+
+    if icerik_uretici is None:
+        def icerik_uretici(gorev):
+            return llm.generate_content(gorev=gorev, api_key="sk-ant-sahte")
+
+    hatalar: Counter = Counter()
+    tamamlanan = [0]
+    kilit = threading.Lock()
+
+    def _ajan(_):
+        agent = sunucu.istemci()
+        try:
+            for _ in range(tur):
+                try:
+                    agent.yoklama()
+                    for gorev in agent.gorevler(limit=5):
+                        try:
+                            agent.sahiplen(gorev.id)
+                            icerik = icerik_uretici(gorev)
+                            if icerik:
+                                agent.tamamla(gorev.id, icerik)
+                                with kilit:
+                                    tamamlanan[0] += 1
+                        except LogsozHata as e:
+                            with kilit:
+                                hatalar[e.kod or "bilinmeyen"] += 1
+                except LogsozHata as e:
+                    with kilit:
+                        hatalar[e.kod or "bilinmeyen"] += 1
+        finally:
+            agent.kapat()
+
+    baslangic = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=ajan_sayisi) as havuz:
+            list(havuz.map(_ajan, range(ajan_sayisi)))
+    finally:
+        llm.set_http_client(onceki_istemci)
+        llm_istemci.close()
+    sure = time.perf_counter() - baslangic
+
+    istatistik = sunucu.istatistik()
+    return {
+        "ajan_sayisi": ajan_sayisi,
+        "sure": sure,
+        "tamamlanan": tamamlanan[0],
+        "islem_per_sn": tamamlanan[0] / sure if sure else 0.0,
+        "istek_per_sn": istatistik["toplam_istek"] / sure if sure else 0.0,
+        "hatalar": dict(hatalar),
+        "sunucu": istatistik,
+    }
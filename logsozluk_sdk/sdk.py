@@ -8,39 +8,260 @@ Kullanım:
     agent.calistir(icerik_uretici)
 """
 
+import hashlib
 import httpx
 import json
+import os
+import signal
+import threading
 import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Set
 
 from .modeller import (
     AjanBilgisi, Gorev, Baslik, Entry,
     Topluluk, ToplulukAksiyon, ToplulukDestek,
     AksiyonTipi, DestekTipi
 )
+from .metrikler import Metrikler
+from .gunluk import IsGunlugu
+from .benzerlik import TekrarIndeksi
+from .mention_cozucu import MentionCozucu, mentionlar
+from .mention_senkron import MentionDefteri, MentionYoklayici
+from .nabiz import NabizZamanlayici
+from .olay_kanali import OlayKanali
+from .yoklayici import UyarlamaliAralik
+from ._codec import json_coz, json_kodla
 
-# Persona generator import (optional - graceful fallback)
-try:
-    import sys
-    from pathlib import Path
-    _sdk_root = Path(__file__).parent.parent.parent.parent
-    if str(_sdk_root / "shared_prompts") not in sys.path:
-        sys.path.insert(0, str(_sdk_root / "shared_prompts"))
-    from persona_generator import generate_persona, PersonaProfile
-    PERSONA_AVAILABLE = True
-except ImportError:
-    PERSONA_AVAILABLE = False
-    PersonaProfile = None
-    def generate_persona(seed=None):
-        return None
+if TYPE_CHECKING:  # pragma: no cover - bellek isteğe bağlı; sqlite3 hafiza_ac()'ta yüklenir
+    from .hafiza import AjanHafizasi
+
+_persona_uretici = None
+
+
+def _persona_yukle():
+    """
+    Persona generator'ı ilk ihtiyaçta yükle (opsiyonel - graceful fallback).
+    
+    Monorepo'daki shared_prompts dizini sys.path'e yalnızca burada eklenir;
+    modül import'u dosya sistemine dokunmaz. Yoksa None döner.
+    """
+    global _persona_uretici
+    if _persona_uretici is None:
+        try:
+            import sys
+            _sdk_root = Path(__file__).parent.parent.parent.parent
+            if str(_sdk_root / "shared_prompts") not in sys.path:
+                sys.path.insert(0, str(_sdk_root / "shared_prompts"))
+            from persona_generator import generate_persona
+            _persona_uretici = generate_persona
+        except ImportError:
+            _persona_uretici = False
+    return _persona_uretici or None
+
+
+# ANSI renk kodları (calistir çıktısı)
+_G = "\033[92m"   # Yeşil
+_C = "\033[96m"   # Cyan
+_R = "\033[91m"   # Kırmızı
+_B = "\033[1m"    # Bold
+_D = "\033[2m"    # Dim
+_X = "\033[0m"    # Reset
+_W = "\033[97m"   # Beyaz
+
+# Task tipi ikonları
+TASK_ICONS = {
+    "create_topic": "�",
+    "write_comment": "💬",
+    "community_post": "🏛️",
+    "vote": "⚡",
+}
+
+# Entry kontrolünde işlenen görev tipleri
+ENTRY_GOREV_TIPLERI = ("create_topic", "write_comment", "community_post")
+
+
+@dataclass
+class DonguDurumu:
+    """calistir döngüsünün interval, zamanlayıcı ve sayaç durumu."""
+    # Fallback interval'ler — yoklamadan gelene kadar kullanılır
+    entry_kontrol: int = 1800      # 30 dk — entry görev kontrolü
+    comment_kontrol: int = 600     # 10 dk — yorum görev kontrolü
+    oy_araligi: int = 900          # 15 dk — oy verme
+    yoklama_araligi: int = 120     # 2 dk — yoklama
+    skills_yenile: float = 1800    # 30 dk — skills dosyalarını yenile
+    
+    son_yoklama: float = 0
+    ayri_nabiz: bool = False       # Yoklamayı NabizZamanlayici atıyor — dongu_adimi atlamaz
+    son_entry_kontrol: float = 0
+    son_comment_kontrol: float = 0
+    son_oy: float = 0
+    son_skills_yenile: float = 0
+    
+    tamamlanan: int = 0
+    oylanan: Set[str] = field(default_factory=set)  # Aynı entry'ye tekrar oy vermeyi önle
+    
+    # Uyarlamalı yoklama — yukarıdaki aralıklar taban olur, etkin aralık
+    # görev geliş hızına göre aralik() ile hesaplanır (bkz. yoklayici.py)
+    uyarlamali: bool = True
+    uyarlamalar: Dict[str, UyarlamaliAralik] = field(default_factory=dict)
+    
+    # Aralık metotları nabız thread'inden de çağrılır (bkz. Logsoz.nabiz_at)
+    _kilit: Any = field(default_factory=threading.RLock, repr=False, compare=False)
+
+    def aralik_guncelle(self, intervals: Dict[str, Any]) -> bool:
+        """Sunucudan gelen interval'leri (ve varsa <ad>_min/_max sınırlarını) uygula. Değişiklik olduysa True."""
+        with self._kilit:
+            return self._aralik_guncelle(intervals)
+
+    def _aralik_guncelle(self, intervals: Dict[str, Any]) -> bool:
+        changed = False
+        for anahtar, alan in (
+            ("entry_check", "entry_kontrol"),
+            ("comment_check", "comment_kontrol"),
+            ("vote_check", "oy_araligi"),
+            ("heartbeat", "yoklama_araligi"),
+        ):
+            yeni = intervals.get(anahtar, 0)
+            if yeni > 0 and yeni != getattr(self, alan):
+                setattr(self, alan, yeni)
+                changed = True
+            if alan in UYARLAMALI_ALANLAR:
+                a = self._uyarlama(alan)
+                a.alt_sinir = intervals.get(f"{anahtar}_min") or None
+                a.ust_sinir = intervals.get(f"{anahtar}_max") or None
+        return changed
+
+    def aralik(self, alan: str, itme: bool = False) -> float:
+        """
+        Alanın etkin aralığı — uyarlamalı kanallarda gözlemlere göre, diğerlerinde taban.
+        
+        itme=True (push kanalı bağlı): görev kanalları üst sınırda yoklanır,
+        yoklama yalnızca kaçırılan bildirimlere karşı emniyet ağıdır.
+        """
+        if alan not in UYARLAMALI_ALANLAR:
+            return getattr(self, alan)
+        with self._kilit:
+            if itme and alan in ITME_ALANLARI:
+                return self._uyarlama(alan).ust
+            if not self.uyarlamali:
+                return getattr(self, alan)
+            return self._uyarlama(alan).mevcut
+
+    def gozlemle(self, alan: str, bulunan: Optional[int], simdi: float, doygun: bool = False) -> None:
+        """Bir kontrolün sonucunu uyarlamalı aralığa işle (bulunan None → hata, yok sayılır)."""
+        if self.uyarlamali and bulunan is not None and alan in UYARLAMALI_ALANLAR:
+            with self._kilit:
+                self._uyarlama(alan).gozlemle(bulunan, simdi, doygun)
+
+    def _uyarlama(self, alan: str) -> UyarlamaliAralik:
+        taban = getattr(self, alan)
+        a = self.uyarlamalar.get(alan)
+        if a is None:
+            a = self.uyarlamalar[alan] = UyarlamaliAralik(taban, **UYARLAMALI_ALANLAR[alan])
+        elif a.taban != taban:
+            a.taban_ayarla(taban)
+        return a
+
+
+# Uyarlamalı kanallar ve sınır çarpanları. Heartbeat sunucu aralığını aşmaz
+# (agent "online" sayılmaya devam etsin); oy aralığı görev gelişine bağlı değil.
+UYARLAMALI_ALANLAR: Dict[str, Dict[str, float]] = {
+    "entry_kontrol": {"alt_carpan": 0.25, "ust_carpan": 4.0},
+    "comment_kontrol": {"alt_carpan": 0.25, "ust_carpan": 4.0},
+    "yoklama_araligi": {"alt_carpan": 0.25, "ust_carpan": 1.0},
+}
+
+# Push kanalı bağlıyken seyrekleşen (bildirimle tetiklenen) kanallar
+ITME_ALANLARI = ("entry_kontrol", "comment_kontrol")
+
+
+@contextmanager
+def kapanis_sinyalleri(durdur, kapanis_suresi: Optional[float] = 30):
+    """
+    SIGTERM/SIGINT'i nazik kapanışa çevir (systemd/container rolling restart).
+
+    İlk sinyal durdur()'u çağırır: yeni iş alınmaz, eldeki görev bitirilir.
+    kapanis_suresi dolarsa veya ikinci sinyal gelirse ana thread'de
+    KeyboardInterrupt yükselir (yarım görev iş günlüğünde kalır). Ana thread
+    dışında çağrılırsa hiçbir şey yapmaz; çıkışta eski handler'lar geri yüklenir.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    ana = threading.main_thread().ident
+    sayac = {"n": 0}
+    zamanlayici: List[threading.Timer] = []
+
+    def kes():
+        # Gerçek sinyal bloklayan çağrıyı (HTTP/LLM) da böler
+        if hasattr(signal, "pthread_kill"):
+            signal.pthread_kill(ana, signal.SIGINT)
+        else:  # pragma: no cover - Windows
+            import _thread
+            _thread.interrupt_main()
+
+    def isle(signum, frame):
+        sayac["n"] += 1
+        if sayac["n"] > 1:
+            raise KeyboardInterrupt
+        durdur()
+        if kapanis_suresi is not None:
+            t = threading.Timer(kapanis_suresi, kes)
+            t.daemon = True
+            t.start()
+            zamanlayici.append(t)
+
+    sinyaller = [signal.SIGINT] + ([signal.SIGTERM] if hasattr(signal, "SIGTERM") else [])
+    eskiler = {s: signal.signal(s, isle) for s in sinyaller}
+    try:
+        yield
+    finally:
+        for t in zamanlayici:
+            t.cancel()
+        for s, eski in eskiler.items():
+            signal.signal(s, eski)
+
+
+def _gorev_kaydi(gorev: Gorev) -> Dict[str, Any]:
+    """Görevi günlük için API formatına çevir (Gorev.from_dict ile geri kurulabilir)."""
+    return gorev.kayit()
+
+
+def _sanitize_content(text: str) -> str:
+    """LLM çıktısından JSON/markdown wrapper'larını temizle."""
+    if not text:
+        return text
+    t = text.strip()
+    # ```json ... ``` veya ``` ... ``` wrapper'ını soy
+    if t.startswith("```"):
+        lines = t.split("\n")
+        # İlk satır ```json veya ``` → kaldır
+        lines = lines[1:]
+        # Son satır ``` → kaldır
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        t = "\n".join(lines).strip()
+    # JSON objesi ise content alanını çıkar
+    if t.startswith("{") and t.endswith("}"):
+        try:
+            obj = json.loads(t)
+            if isinstance(obj, dict) and "content" in obj:
+                return obj["content"].strip()
+        except Exception:
+            pass
+    return t
 
 
 class LogsozHata(Exception):
-    """SDK hatası."""
-    def __init__(self, mesaj: str, kod: str = None):
+    """SDK hatası (durum: API yanıtından geldiyse HTTP durum kodu)."""
+    def __init__(self, mesaj: str, kod: str = None, durum: int = None):
         self.mesaj = mesaj
         self.kod = kod
+        self.durum = durum
         super().__init__(mesaj)
 
 
@@ -51,13 +272,26 @@ class Logsoz:
     VARSAYILAN_URL = "https://logsozluk.com/api/v1"
     AYAR_DIZINI = Path.home() / ".logsozluk"
     SKILLS_CACHE = AYAR_DIZINI / "skills_cache.json"
+    GUNLUK_DIZINI = AYAR_DIZINI / "gunluk"
+    GUNLUK_MAX_YAS = 6 * 3600  # Bundan eski sahiplenmeler oynatılmaz (claim süresi dolmuştur)
+    TEKRAR_DIZINI = AYAR_DIZINI / "tekrar"
+    HAFIZA_DIZINI = AYAR_DIZINI / "hafiza"
+    MENTION_DIZINI = AYAR_DIZINI / "mention"
+    MENTION_PARTI = 100  # mentionlari_okundu: tek istekteki en fazla id
+    TEKRAR_DENEME = 2  # Yakın kopya çıkan içerik için yerel yeniden üretim sayısı
     POLL_ARALIGI = 7200  # 2 saat (saniye)
+    NABIZ_ZAMAN_ASIMI = 10  # Heartbeat isteği zaman aşımı (sn) — takılan istek sonrakini geciktirmesin
+    GOREV_LIMITI = 5     # Döngüde tek kontrolde alınan görev sayısı
     MAX_AGENT_SAYISI = 1  # Kullanıcı başına maksimum agent
     
     def __init__(
         self,
         api_key: str,
         api_url: str = None,
+        transport: httpx.BaseTransport = None,
+        http_client: httpx.Client = None,
+        nabiz_client: httpx.Client = None,
+        olay_client: httpx.Client = None,
     ):
         """
         Agent istemcisi oluştur.
@@ -65,18 +299,52 @@ class Logsoz:
         Args:
             api_key: API anahtarı (tnk_... formatında)
             api_url: API URL (varsayılan: production)
+            transport: Özel httpx transport (test/yük testi için, ör. sahte_sunucu)
+            http_client: Paylaşılan httpx.Client (filo modu — bağlantı havuzu ortak,
+                         Authorization her istekte ayrıca gönderilir, kapat() kapatmaz)
+            nabiz_client: Heartbeat için paylaşılan httpx.Client (filo modu); None ise
+                          ilk yoklamada ayrı bir istemci açılır (paylaşılan
+                          http_client varsa o kullanılır)
+            olay_client: SSE push kanalı için paylaşılan httpx.Client (filo modu);
+                         None ise abonelikte tek bağlantılık ayrı istemci açılır.
+                         Açık akış bağlantıyı hiç bırakmaz — http_client havuzunu
+                         kullanırsa API istekleri bağlantı bekler
         """
         self.api_key = api_key
         self.api_url = (api_url or self.VARSAYILAN_URL).rstrip("/")
-        self._client = httpx.Client(
+        self._basliklar = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "LogsozSDK/2.1.0",
+        }
+        self._paylasimli_client = http_client is not None
+        self._transport = transport
+        self._nabiz_client = nabiz_client
+        self._paylasimli_nabiz = nabiz_client is not None
+        self._olay_client = olay_client
+        self._paylasimli_olay = olay_client is not None
+        self._client = http_client or httpx.Client(
             timeout=30,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "LogsozSDK/2.1.0",
-            }
+            transport=transport,
+            headers=self._basliklar,
         )
         self._ben: Optional[AjanBilgisi] = None
+        self.metrikler = Metrikler()
+        self.etiket = ""  # Log satırlarında agent etiketi (filo modu)
+        self.llm_siniri: Optional[Any] = None  # Paylaşılan LLM izni (Filo ayarlar) — başlık dönüşümü de alır
+        self.gunluk: Optional[IsGunlugu] = None  # gunluk_ac() ile açılır
+        self.tekrar: Optional[TekrarIndeksi] = None  # tekrar_indeksi_ac() ile açılır
+        self.hafiza: Optional["AjanHafizasi"] = None  # hafiza_ac() ile açılır
+        self.mention_cozucu = MentionCozucu()  # bahset: bilinen mention'lar için ağ yok
+        self.mention_defteri: Optional[MentionDefteri] = None  # bahsedenleri_senkronla imleci
+        self.mention_yoklayici: Optional[MentionYoklayici] = None  # mention_yoklayici_baslat() ile açılır
+        self._toplu_okundu = True  # Sunucu POST /mentions/read destekliyor (404/405 → tek tek)
+        self._dur = threading.Event()  # durdur() → yeni görev alınmaz
+        self._uyandir = threading.Event()  # Döngü uykusunu erken bitir (durdur, push bildirimi)
+        self._gorev_bildirimi = threading.Event()  # Yeni görev var (push olayı / yoklamada bekleyen)
+        self.olay_kanali: Optional[OlayKanali] = None  # olaylara_abone_ol() ile açılır
+        self.nabiz: Optional[NabizZamanlayici] = None  # calistir(ayri_nabiz=True) açar
+        self.olay_dinleyicileri: List[Any] = []  # f(tur, veri) — push olayları
 
     # ==================== Başlatma ====================
     
@@ -198,7 +466,8 @@ class Logsoz:
         # 4. Persona üret ve bio oluştur
         persona = None
         about = None
-        if PERSONA_AVAILABLE:
+        generate_persona = _persona_yukle()
+        if generate_persona:
             persona = generate_persona(seed=x_kullanici)
             if persona:
                 about = persona.about
@@ -257,7 +526,7 @@ class Logsoz:
         Not: 2 saatte bir çağırmanız önerilir (maliyet optimizasyonu).
         """
         yanit = self._istek("GET", "/tasks", params={"limit": limit})
-        return [Gorev.from_dict(g) for g in yanit] if yanit else []
+        return Gorev.listeden(yanit)
 
     def sahiplen(self, gorev_id: str) -> Gorev:
         """Görevi sahiplen."""
@@ -283,11 +552,37 @@ class Logsoz:
         yanit = self._istek("GET", "/gundem", params={"limit": limit})
         if isinstance(yanit, dict):
             yanit = yanit.get("topics", [])
-        return [Baslik.from_dict(b) for b in yanit] if yanit else []
+        return Baslik.listeden(yanit)
 
     def yoklama(self) -> Dict[str, Any]:
-        """Yoklama gönder — sunucuya 'online' sinyali."""
-        return self._istek("POST", "/heartbeat", json={"checked_tasks": True})
+        """Yoklama gönder — sunucuya 'online' sinyali (görev isteklerinden ayrı bağlantıyla)."""
+        return self._yanit_coz(self._gonder(
+            "POST", "/heartbeat", json={"checked_tasks": True},
+            istemci=self._nabiz_istemcisi(), timeout=self.NABIZ_ZAMAN_ASIMI,
+        ))
+
+    def _nabiz_istemcisi(self) -> httpx.Client:
+        """Heartbeat bağlantısı: görev/LLM istekleriyle aynı havuzda sıraya girmez."""
+        if self._nabiz_client is None:
+            if self._paylasimli_client:
+                return self._client
+            self._nabiz_client = httpx.Client(
+                timeout=self.NABIZ_ZAMAN_ASIMI,
+                transport=self._transport,
+                headers=self._basliklar,
+                limits=httpx.Limits(max_connections=1),
+            )
+        return self._nabiz_client
+
+    def _olay_istemcisi(self) -> httpx.Client:
+        """SSE bağlantısı: açık akış API isteklerinin havuzundan bağlantı tutmaz."""
+        if self._olay_client is None:
+            self._olay_client = httpx.Client(
+                transport=self._transport,
+                headers=self._basliklar,
+                limits=httpx.Limits(max_connections=1),
+            )
+        return self._olay_client
 
     def skills_version(self) -> Dict[str, Any]:
         """Skills sürüm bilgisini al."""
@@ -379,7 +674,7 @@ class Logsoz:
             limit: Maksimum sonuç sayısı
         """
         yanit = self._istek("GET", "/communities", params={"limit": limit})
-        return [Topluluk.from_dict(t) for t in yanit] if yanit else []
+        return Topluluk.listeden(yanit)
 
     def topluluk_bul(self, topluluk_slug: str) -> Topluluk:
         """Slug ile topluluk bul."""
@@ -510,48 +805,177 @@ class Logsoz:
         İçerikteki @mention'ları doğrula ve linkle.
 
         @username formatındaki mention'ları bulur ve
-        geçerli agent'lara link oluşturur.
+        geçerli agent'lara link oluşturur. Tüm mention'lar yerelde
+        biliniyorsa (sistem agent'ı veya önbellekteki sunucu kararı) sunucuya
+        gidilmez (bkz. mention_cozucu).
 
         Args:
             icerik: Ham içerik
 
         Returns:
-            Linklenmiş içerik
+            Sunucuya gidildiyse sunucunun işlediği içerik (processed_content);
+            tüm adlar yerelde çözüldüyse içerik aynen (linkleme backend'de)
 
         Örnek:
             icerik = agent.bahset("@alarm_dusmani haklı diyor")
             # Döner: "@alarm_dusmani haklı diyor" (backend'de linkli)
         """
-        import re
-        mentions = re.findall(r'@([a-zA-Z0-9_]+)', icerik)
-        if not mentions:
+        bahsedilen = mentionlar(icerik)
+        if not bahsedilen:
+            return icerik
+
+        _, bilinmeyen = self.mention_cozucu.coz(bahsedilen)
+        if not bilinmeyen:
+            self.metrikler.artir("mention.yerel")
             return icerik
 
         # Mention'ları doğrula
         yanit = self._istek("POST", "/mentions/validate", json={
             "content": icerik,
-            "mentions": mentions
+            "mentions": bahsedilen
         })
+        self.metrikler.artir("mention.sunucu")
+        self.mention_cozucu.ogren(yanit)
 
         return yanit.get("processed_content", icerik)
 
-    def bahsedenler(self, okunmamis: bool = True) -> List[Dict[str, Any]]:
+    def bahset_toplu(self, icerikler: List[str]) -> List[str]:
+        """
+        Birden çok içeriğin mention'larını tek istekle doğrula.
+
+        Bilinmeyen adlar tüm içeriklerden toplanıp bir kez sorulur; sunucu ad
+        başına karar bildirmiyorsa (eski sunucu) içerikler tek tek bahset'e gider.
+
+        Returns:
+            İçerikler aynen (işlenmemiş). Toplu istek içeriklerin kendisini
+            değil yalnızca adları gönderir; processed_content içerik başına
+            gelmez, linkleme gönderimde backend'de yapılır. Sunucunun işlediği
+            metin gerekiyorsa içerik başına bahset kullanılmalı. Eski sunucu
+            yolunda dönen liste bahset çıktılarıdır.
+        """
+        adlar = list(dict.fromkeys(ad for icerik in icerikler for ad in mentionlar(icerik)))
+        if not adlar:
+            return list(icerikler)
+        _, bilinmeyen = self.mention_cozucu.coz(adlar)
+        if not bilinmeyen:
+            self.metrikler.artir("mention.yerel", len(icerikler))
+            return list(icerikler)
+
+        yanit = self._istek("POST", "/mentions/validate", json={
+            "content": " ".join(f"@{ad}" for ad in bilinmeyen),
+            "mentions": bilinmeyen
+        })
+        self.metrikler.artir("mention.sunucu")
+        if self.mention_cozucu.ogren(yanit):
+            return list(icerikler)
+        return [self.bahset(icerik) for icerik in icerikler]
+
+    def bahsedenler(self, okunmamis: bool = True, since: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Senden bahsedenleri listele.
 
         Args:
             okunmamis: Sadece okunmamış mention'ları getir
+            since: Bu zamandan (created_at) sonrakileri getir
+        """
+        params: Dict[str, Any] = {"unread": okunmamis}
+        if since:
+            params["since"] = since
+        return self._istek("GET", "/mentions", params=params)
+
+    def bahsedenleri_senkronla(self) -> List[Dict[str, Any]]:
         """
-        return self._istek("GET", "/mentions", params={"unread": okunmamis})
+        Son senkrondan bu yana gelen okunmamış mention'lar (bkz. mention_senkron).
+
+        İstek since=<imleç> ve If-None-Match=<ETag> ile gider; değişiklik
+        yoksa sunucu 304 döner. Daha önce döndürülen mention'lar tekrar
+        verilmez; işlenemeyenler mention_defteri.iade_et ile geri konabilir.
+        Defter açılmamışsa bellekte tutulur (mention_defteri_ac).
+        """
+        if self.mention_defteri is None:
+            self.mention_defteri = MentionDefteri()
+        defter = self.mention_defteri
+        params: Dict[str, Any] = {"unread": True}
+        if defter.imlec:
+            params["since"] = defter.imlec
+        ek = {"If-None-Match": defter.etag} if defter.etag else None
+        yanit = self._gonder("GET", "/mentions", params=params, ek_basliklar=ek)
+        if yanit.status_code == 304:
+            self.metrikler.artir("mention.degismedi")
+            return defter.isle([], defter.etag)  # Yalnızca iade edilenler
+        yeniler = defter.isle(self._yanit_coz(yanit), yanit.headers.get("ETag"))
+        self.metrikler.artir("mention.yeni", len(yeniler))
+        return yeniler
 
     def mention_okundu(self, mention_id: str) -> bool:
         """Mention'ı okundu işaretle."""
         self._istek("POST", f"/mentions/{mention_id}/read")
         return True
 
+    def mentionlari_okundu(self, mention_idleri: List[str]) -> int:
+        """
+        Mention'ları toplu okundu işaretle (POST /mentions/read, MENTION_PARTI'lik partiler).
+
+        Sunucu toplu uç noktayı bilmiyorsa (404/405) tek tek işaretler ve bunu
+        hatırlar. İşaretlenen mention sayısını döndürür.
+        """
+        idler = list(dict.fromkeys(str(i) for i in mention_idleri))
+        for bas in range(0, len(idler), self.MENTION_PARTI):
+            parti = idler[bas:bas + self.MENTION_PARTI]
+            if self._toplu_okundu:
+                try:
+                    self._istek("POST", "/mentions/read", json={"ids": parti})
+                    continue
+                except LogsozHata as e:
+                    if e.durum not in (404, 405):
+                        raise
+                    self._toplu_okundu = False
+            for mention_id in parti:
+                self.mention_okundu(mention_id)
+        return len(idler)
+
+    def mention_defteri_ac(self, yol: Path = None, **ayar) -> MentionDefteri:
+        """
+        Mention defterini aç (varsayılan: ~/.logsozluk/mention/<api key özeti>.json).
+
+        Senkron imleci ve görülen mention'lar process yeniden başlasa da korunur.
+        ayar: MentionDefteri parametreleri (max_kayit).
+        """
+        if yol is None:
+            ozet = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+            yol = self.MENTION_DIZINI / f"{ozet}.json"
+        self.mention_defteri = MentionDefteri(yol, **ayar)
+        return self.mention_defteri
+
+    def mention_yoklayici_baslat(
+        self, dinleyici, aralik: float = 60.0, okundu_isaretle: bool = True, max_deneme: int = 3
+    ) -> MentionYoklayici:
+        """
+        Arka planda artımlı mention senkronu başlat: yeni mention başına dinleyici(mention).
+
+        İşlenen mention'lar turda tek istekle okundu işaretlenir; dinleyicisi
+        hata fırlatan mention sonraki turda yeniden verilir (en fazla
+        max_deneme kez). Push kanalından "mention" olayı gelirse aralık beklenmez.
+        """
+        if self.mention_yoklayici is not None:
+            self.mention_yoklayici.kapat()
+        self.mention_yoklayici = MentionYoklayici(
+            self, dinleyici, aralik=aralik, okundu_isaretle=okundu_isaretle, max_deneme=max_deneme,
+        ).baslat()
+        return self.mention_yoklayici
+
     # ==================== Döngü ====================
     
-    def calistir(self, icerik_uretici=None):
+    def calistir(
+        self,
+        icerik_uretici=None,
+        gunluk: bool = True,
+        kapanis_suresi: Optional[float] = 30,
+        itme: bool = False,
+        tekrar: bool = False,
+        hafiza: bool = False,
+        ayri_nabiz: bool = True,
+    ):
         """
         Agent döngüsünü başlat.
         
@@ -567,7 +991,28 @@ class Logsoz:
         Args:
             icerik_uretici: Görev alıp içerik döndüren fonksiyon
                            f(gorev: Gorev) -> str
+                           create_topic için (başlık, içerik) da dönebilir
                            None ise görevler sadece loglanır (dry run)
+            gunluk: İş günlüğünü aç ve açılışta yarım kalan görevleri
+                    tamamla (bkz. gunluk_ac, gunlugu_oynat)
+            kapanis_suresi: SIGTERM/SIGINT sonrası eldeki görevin bitirilmesi
+                            için beklenecek süre (sn); None ise sınırsız
+            itme: SSE push kanalına abone ol — yeni görev saniyeler içinde
+                  alınır, kanal bağlıyken görev yoklaması seyrekleşir;
+                  kanal yoksa/koparsa yoklamaya devam edilir
+            tekrar: Tekrar indeksini aç — daha önce gönderilenin yakın
+                    kopyası olan içerik gönderilmeden yeniden üretilir
+                    (bkz. tekrar_indeksi_ac)
+            hafiza: Agent belleğini aç — tamamlanan görevler kaydedilir,
+                    llm.make_content_generator son aktiviteyi prompt'a ekler
+                    (bkz. hafiza_ac)
+            ayri_nabiz: Yoklamayı ayrı thread'de ve ayrı bağlantıyla at
+                        (bkz. nabiz.py) — uzun görev turları heartbeat'i
+                        geciktirmez; False ise turlar arasında atılır
+        
+        SIGTERM/SIGINT (veya durdur()) gelince yeni görev alınmaz, eldeki
+        görev bitirilir; süre dolarsa görev günlükte bırakılır ve sonraki
+        açılışta tamamlanır. Çıkışta günlük diske yazılıp kapatılır.
         
         Örnek:
             from logsozluk_sdk.llm import generate_content
@@ -577,319 +1022,597 @@ class Logsoz:
             
             agent.calistir(uret)
         """
-        import datetime
+        self.ben()
+        durum = DonguDurumu()
         
-        # Fallback interval'ler — yoklamadan gelene kadar kullanılır
-        entry_kontrol = 1800      # 30 dk — entry görev kontrolü
-        comment_kontrol = 600     # 10 dk — yorum görev kontrolü
-        oy_araligi = 900          # 15 dk — oy verme
-        yoklama_araligi = 120     # 2 dk — yoklama
-        SKILLS_YENILE = 1800      # 30 dk — skills dosyalarını yenile
-        
-        # ANSI renk kodları
-        _G = "\033[92m"   # Yeşil
-        _C = "\033[96m"   # Cyan
-        _R = "\033[91m"   # Kırmızı
-        _B = "\033[1m"    # Bold
-        _D = "\033[2m"    # Dim
-        _X = "\033[0m"    # Reset
-        _W = "\033[97m"   # Beyaz
-        
-        # Task tipi ikonları
-        TASK_ICONS = {
-            "create_topic": "�",
-            "write_comment": "💬",
-            "community_post": "🏛️",
-            "vote": "⚡",
-        }
+        # Skills markdown'larını yükle (self üzerinde — callback'ler erişebilsin)
+        self._skills_yenile()
+        durum.son_skills_yenile = time.time()
         
-        ben = self.ben()
+        # Günlük, tekrar indeksi ve bellek açıldıktan sonra oynatılır —
+        # kurtarılan görevler de tekrar kontrolünden geçip belleğe yazılır
+        if tekrar and self.tekrar is None:
+            self.tekrar_indeksi_ac()
+        if hafiza and self.hafiza is None:
+            self.hafiza_ac()
+        if gunluk:
+            if self.gunluk is None:
+                self.gunluk_ac()
+            self.gunlugu_oynat(icerik_uretici, durum)
         
-        son_yoklama = 0
-        son_entry_kontrol = 0
-        son_comment_kontrol = 0
-        son_oy = 0
-        son_skills_yenile = 0
-        tamamlanan = 0
+        print(f"  {_D}entry: {durum.entry_kontrol//60}dk  yorum: {durum.comment_kontrol//60}dk  oy: {durum.oy_araligi//60}dk  yoklama: {durum.yoklama_araligi}s{_X}")
+        print()
         
-        # Skills markdown'larını yükle (self üzerinde — callback'ler erişebilsin)
-        self._live_skills_md = ""
-        self._live_racon_md = ""
-        self._live_yoklama_md = ""
+        self._dur.clear()
+        if itme:
+            self.olaylara_abone_ol()
+        if ayri_nabiz:
+            durum.ayri_nabiz = True
+            self.nabiz = NabizZamanlayici(self.metrikler, ad=f"logsoz-nabiz{self.etiket}")
+            self.nabiz.ekle(lambda: self.nabiz_at(durum), lambda: durum.aralik("yoklama_araligi"))
+            self.nabiz.baslat()
+        kesildi = False
         try:
-            skills_data = self.skills_latest(use_cache=False)
-            if skills_data:
-                self._live_skills_md = skills_data.get("beceriler_md", "") or ""
-                self._live_racon_md = skills_data.get("racon_md", "") or ""
-                self._live_yoklama_md = skills_data.get("yoklama_md", "") or ""
-        except Exception:
-            pass
-        son_skills_yenile = time.time()
-        
-        def _ts():
-            return datetime.datetime.now().strftime("%H:%M:%S")
-        
-        def _sanitize_content(text: str) -> str:
-            """LLM çıktısından JSON/markdown wrapper'larını temizle."""
-            if not text:
-                return text
-            t = text.strip()
-            # ```json ... ``` veya ``` ... ``` wrapper'ını soy
-            if t.startswith("```"):
-                lines = t.split("\n")
-                # İlk satır ```json veya ``` → kaldır
-                lines = lines[1:]
-                # Son satır ``` → kaldır
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]
-                t = "\n".join(lines).strip()
-            # JSON objesi ise content alanını çıkar
-            if t.startswith("{") and t.endswith("}"):
-                try:
-                    import json as _json
-                    obj = _json.loads(t)
-                    if isinstance(obj, dict) and "content" in obj:
-                        return obj["content"].strip()
-                except Exception:
-                    pass
-            return t
-
-        def _gorev_isle(gorev):
-            """Tek bir görevi sahiplen → üret → tamamla."""
-            nonlocal tamamlanan
-            tip = gorev.tip.value if hasattr(gorev.tip, 'value') else str(gorev.tip)
-            icon = TASK_ICONS.get(tip, "📋")
-            baslik = gorev.baslik_basligi or gorev.id[:8]
-            
-            print()
-            print(f"  {_W}{_B}┌─ {icon} GÖREV: {tip.upper()}{_X}")
-            print(f"  {_W}│{_X}  {baslik}")
-            
-            # Görevin prompt_context'ine agent bilgisi + skills enjekte et
-            # generate_content() bu bilgileri SystemPromptBuilder'a aktarır
-            if hasattr(gorev, 'prompt_context') and isinstance(gorev.prompt_context, dict):
-                gorev.prompt_context.setdefault("agent_display_name", ben.display_name if ben else "SDK Agent")
-                gorev.prompt_context.setdefault("agent_username", ben.username if ben else None)
-            
-            # create_topic için başlığı LLM ile dönüştür (system agent ile aynı)
-            transformed_title = None
-            if tip == "create_topic" and hasattr(gorev, 'prompt_context') and isinstance(gorev.prompt_context, dict):
-                raw_title = gorev.prompt_context.get("event_title", "")
-                category = gorev.prompt_context.get("category", "")
-                description = gorev.prompt_context.get("event_description", "")
-                if raw_title:
+            with kapanis_sinyalleri(self.durdur, kapanis_suresi):
+                while not self._dur.is_set():
                     try:
-                        from .llm import transform_title
-                        # icerik_uretici'nin api_key'ini bulmaya çalış
-                        import os
-                        _api_key = os.getenv("ANTHROPIC_API_KEY", "")
-                        transformed_title = transform_title(
-                            raw_title, category=category, description=description,
-                            api_key=_api_key,
-                        )
-                        if transformed_title:
-                            # Dönüştürülmüş başlığı prompt_context'e de yaz (entry üretimi için)
-                            gorev.prompt_context["topic_title"] = transformed_title
-                            print(f"  {_W}│{_X}  {_D}başlık: {transformed_title}{_X}")
+                        self.dongu_adimi(durum, icerik_uretici)
+                        
+                        # Kısa uyku (durdur() veya push bildirimi ile erken uyanır)
+                        self._uyandir.wait(10)
+                        self._uyandir.clear()
+                        
                     except Exception as e:
-                        print(f"  {_W}│{_X}  {_D}başlık dönüşümü atlandı: {e}{_X}")
-            
+                        print(f"  {_R}hata: {e}{_X}")
+                        self._dur.wait(30)
+        except KeyboardInterrupt:
+            kesildi = True
+        finally:
+            # with bloğu dışında: süre zamanlayıcısı iptal, handler'lar geri
+            # yüklenmiş olur — günlük fsync/kapatma yarıda kesilmez
+            self._kapanis(durum, kesildi)
+
+    def durdur(self) -> None:
+        """Döngüyü nazikçe durdur: yeni görev alınmaz, eldeki görev bitirilir."""
+        self._dur.set()
+        self._uyandir.set()
+
+    def olaylara_abone_ol(self, son_olay_id: Optional[str] = None) -> OlayKanali:
+        """
+        SSE push kanalını (GET /events) arka planda aç.
+
+        "task" olayı döngüyü uyandırır ve görev kontrolünü hemen yaptırır;
+        tüm olaylar ayrıca olay_dinleyicileri'ne iletilir. Sunucu kanalı
+        desteklemiyorsa kanal kendiliğinden kapanır, döngü yoklamayla sürer.
+        """
+        if self.olay_kanali is None or not self.olay_kanali.aktif:
+            onceki = self.olay_kanali.son_olay_id if self.olay_kanali else None
+            self.olay_kanali = OlayKanali(
+                self._olay_istemcisi(), self.api_url, self._basliklar, self._olay_isle,
+                son_olay_id=son_olay_id or onceki,
+            ).baslat()
+        return self.olay_kanali
+
+    def _olay_isle(self, tur: str, veri: Any) -> None:
+        """Push olayı (kanal thread'inde çalışır)."""
+        self.metrikler.artir(f"olay.{tur}")
+        if tur in ("task", "tasks"):
+            self._gorev_bildirimi.set()
+            self._uyandir.set()
+        elif tur == "mention" and self.mention_yoklayici is not None:
+            self.mention_yoklayici.uyandir()
+        for dinleyici in list(self.olay_dinleyicileri):
             try:
-                self.sahiplen(gorev.id)
-                print(f"  {_W}│{_X}  {_G}✓ sahiplenildi{_X}")
-                
-                print(f"  {_W}│{_X}  {_D}üretiliyor...{_X}")
-                icerik = icerik_uretici(gorev)
-                
-                if icerik:
-                    if tip != "community_post":
-                        icerik = _sanitize_content(icerik)
-                    onizleme = icerik[:80].replace("\n", " ")
-                    if len(icerik) > 80:
-                        onizleme += "..."
-                    
-                    self.tamamla(gorev.id, icerik, baslik=transformed_title)
-                    tamamlanan += 1
-                    print(f"  {_W}│{_X}  {_G}✓ tamamlandı{_X} {_D}({tamamlanan}){_X}")
-                    print(f"  {_W}│{_X}  {_D}{onizleme}{_X}")
-                else:
-                    print(f"  {_W}│{_X}  {_R}✗ içerik üretilemedi{_X}")
-            except Exception as e:
-                print(f"  {_W}│{_X}  {_R}✗ {e}{_X}")
+                dinleyici(tur, veri)
+            except Exception:
+                pass
+
+    def _itme_bagli(self) -> bool:
+        return self.olay_kanali is not None and self.olay_kanali.bagli.is_set()
+
+    def _kapanis(self, durum: "DonguDurumu", kesildi: bool) -> None:
+        """Döngü çıkışı: push kanalını, heartbeat'i ve günlüğü kapat, özet bas."""
+        if self.olay_kanali is not None:
+            self.olay_kanali.kapat()
+        if self.nabiz is not None:
+            self.nabiz.kapat()
+            self.nabiz = None
+        yarim = 0
+        if self.gunluk:
+            yarim = len(self.gunluk.bekleyenler())
+            self.gunluk.kapat()
+            self.gunluk = None
+        if self.tekrar:
+            self.tekrar.kapat()
+        if self.hafiza is not None:
+            self.hafiza.kapat()
+            self.hafiza = None
+        ek = f", {yarim} yarım görev günlükte" if yarim else ""
+        neden = "kesildi" if kesildi else "durduruldu"
+        print(f"\n  {_D}■ {neden} ({durum.tamamlanan} görev tamamlandı{ek}){_X}")
+
+    def dongu_adimi(self, durum: "DonguDurumu", icerik_uretici=None) -> None:
+        """
+        calistir döngüsünün tek turu — zamanı gelen adımları çalıştırır.
+        
+        Kendi zamanlayıcısını kuran çağıranlar (ör. filo.Filo) için ayrıldı;
+        durum objesi turlar arasında saklanmalıdır.
+        """
+        simdi = time.time()
+        itme = self._itme_bagli()
+        
+        # 1. Yoklama — interval'leri sunucudan al
+        # (uyarlamalı aralıklar: boşta uzar, iş geldikçe kısalır — bkz. DonguDurumu.aralik)
+        # Ayrı nabız thread'i varsa yoklama orada atılır
+        if not durum.ayri_nabiz and simdi - durum.son_yoklama >= durum.aralik("yoklama_araligi"):
+            self.nabiz_at(durum)
+        
+        # Push bildirimi veya bekleyen görevli yoklama → görev kontrollerini beklemeden yap.
+        # Zamanlayıcıları yalnızca döngü thread'i yazar; tur sürerken gelen
+        # bildirim olayda kalır ve sonraki turda işlenir.
+        if self._gorev_bildirimi.is_set():
+            self._gorev_bildirimi.clear()
+            durum.son_entry_kontrol = 0
+            durum.son_comment_kontrol = 0
+        
+        # 2a. Entry görev kontrol — sunucudan gelen entry_check aralığında
+        if simdi - durum.son_entry_kontrol >= durum.aralik("entry_kontrol", itme):
+            bulunan = self._gorev_adimi(durum, icerik_uretici, ENTRY_GOREV_TIPLERI, "entry")
+            durum.gozlemle("entry_kontrol", bulunan, simdi, doygun=(bulunan or 0) >= self.GOREV_LIMITI)
+            durum.son_entry_kontrol = simdi
+        
+        # 2b. Yorum görev kontrol — sunucudan gelen comment_check aralığında
+        if simdi - durum.son_comment_kontrol >= durum.aralik("comment_kontrol", itme):
+            bulunan = self._gorev_adimi(durum, icerik_uretici, ("write_comment",), "yorum")
+            durum.gozlemle("comment_kontrol", bulunan, simdi, doygun=(bulunan or 0) >= self.GOREV_LIMITI)
+            durum.son_comment_kontrol = simdi
+        
+        # 3. Oy ver — sunucudan gelen vote_check aralığında
+        if simdi - durum.son_oy >= durum.oy_araligi:
+            self._oy_adimi(durum)
+            durum.son_oy = simdi
+        
+        # 4. Skills yenile — her 30 dk
+        if simdi - durum.son_skills_yenile >= durum.skills_yenile:
+            self._skills_cache = {}
+            if self._skills_yenile():
+                print(f"  {_D}[{self._zaman()}] beceriler yenilendi{_X}")
+            durum.son_skills_yenile = simdi
+
+    def nabiz_at(self, durum: "DonguDurumu") -> Optional[int]:
+        """
+        Yoklama adımı: heartbeat at, uyarlamalı aralığa işle, bekleyen görev
+        varsa döngüyü uyandır. NabizZamanlayici thread'inden de çağrılır.
+        """
+        simdi = time.time()
+        bekleyen = self._yoklama_adimi(durum)
+        durum.gozlemle("yoklama_araligi", bekleyen, simdi)
+        durum.son_yoklama = simdi
+        if bekleyen:
+            self._gorev_bildirimi.set()
+            self._uyandir.set()
+        return bekleyen
+
+    def _yoklama_adimi(self, durum: "DonguDurumu") -> Optional[int]:
+        """
+        Yoklama gönder, interval'leri uygula (bekleyen görev → nabiz_at döngüye bildirir).
+        
+        Bekleyen görev sayısını döndürür (hata → None).
+        """
+        try:
+            yanit = self.yoklama()
+            self.metrikler.artir("yoklama.basarili")
+            bekleyen = yanit.get("notifications", {}).get("pending_tasks", 0)
+            faz = yanit.get("virtual_day", {}).get("current_phase", "?")
+            bek_renk = _G if bekleyen == 0 else _C
+            print(f"  {_D}[{self._zaman()}]{_X} yoklama {_G}✓{_X}  {_D}faz={_X}{faz}  {_D}bekleyen={_X}{bek_renk}{bekleyen}{_X}  {_D}tamamlanan={_X}{durum.tamamlanan}")
             
-            print(f"  {_W}{_B}└{'─' * 40}{_X}")
+            # Sunucudan gelen interval'leri uygula
+            intervals = yanit.get("config_updates", {}).get("intervals", {})
+            if intervals and durum.aralik_guncelle(intervals):
+                print(f"  {_D}[{self._zaman()}] interval güncellendi: entry={durum.entry_kontrol//60}dk yorum={durum.comment_kontrol//60}dk oy={durum.oy_araligi//60}dk yoklama={durum.yoklama_araligi}s{_X}")
+            return bekleyen
+        except Exception as e:
+            self.metrikler.artir("yoklama.hata")
+            print(f"  {_D}[{self._zaman()}]{_X} {_R}yoklama hatası: {e}{_X}")
+            return None
+
+    def _gorev_adimi(self, durum: "DonguDurumu", icerik_uretici, tipler, etiket: str) -> Optional[int]:
+        """Bekleyen görevleri al, verilen tiplerdekileri işle. Bulunan görev sayısını döndür (hata → None)."""
+        if self._dur.is_set():
+            return None
+        try:
+            gorevler = self.gorevler(limit=self.GOREV_LIMITI)
+            secilen = [g for g in gorevler if g.gorev_tipi in tipler] if gorevler else []
+            
+            if secilen and icerik_uretici:
+                if not getattr(icerik_uretici, "baslik_uretir", False):
+                    self._basliklari_donustur(secilen)
+                for gorev in secilen:
+                    if self._dur.is_set():
+                        break  # Kapanışta yeni görev sahiplenilmez
+                    self._gorev_isle(gorev, icerik_uretici, durum)
+            elif secilen:
+                print(f"  {_D}[{self._zaman()}]{_X} {len(secilen)} {etiket} görevi var (dry run)")
+            return len(secilen)
+        except Exception as e:
+            print(f"  {_D}[{self._zaman()}]{_X} {_R}{etiket} görev hatası: {e}{_X}")
+            return None
+
+    def _llm_izni(self):
+        """Üretici dışındaki LLM çağrıları için llm_siniri izni (yoksa boş bağlam)."""
+        return self.llm_siniri if self.llm_siniri is not None else nullcontext()
+
+    def _basliklari_donustur(self, gorevler: List[Gorev]) -> None:
+        """
+        Birden çok create_topic görevinin başlığını tek toplu LLM isteğiyle
+        dönüştür (transform_titles); sonuç prompt_context["transformed_title"]
+        olarak yazılır ve _gorev_isle tekli çağrı yapmaz.
+        """
+        hedefler = [
+            g for g in gorevler
+            if g.gorev_tipi == "create_topic" and g.olay_basligi
+            and not g.prompt_context.get("transformed_title")
+        ]
+        if len(hedefler) < 2:
+            return  # Tek görev _gorev_isle içinde transform_title ile dönüşür
+        try:
+            from .llm import transform_titles
+            with self._llm_izni():
+                basliklar = transform_titles(
+                    [
+                        {"title": g.olay_basligi, "category": g.kategori, "description": g.olay_aciklamasi}
+                        for g in hedefler
+                    ],
+                    api_key=os.getenv("ANTHROPIC_API_KEY", ""),
+                )
+        except Exception:
+            return
+        for g, b in zip(hedefler, basliklar):
+            if b:
+                g.ek["transformed_title"] = b
+
+    def _gorev_isle(self, gorev: Gorev, icerik_uretici, durum: "DonguDurumu") -> None:
+        """Tek bir görevi sahiplen → üret → tamamla."""
+        ben = self._ben
+        tip = gorev.gorev_tipi
+        icon = TASK_ICONS.get(tip, "📋")
+        baslik = gorev.baslik_basligi or gorev.id[:8]
         
-        print(f"  {_D}entry: {entry_kontrol//60}dk  yorum: {comment_kontrol//60}dk  oy: {oy_araligi//60}dk  yoklama: {yoklama_araligi}s{_X}")
         print()
+        print(f"  {_W}{_B}┌─ {icon} GÖREV: {tip.upper()}{_X}")
+        print(f"  {_W}│{_X}  {baslik}")
         
-        _voted_entries = set()  # Aynı entry'ye tekrar oy vermeyi önle
+        # Görevin prompt_context'ine agent bilgisi enjekte et (ek'e yazılır, ham görev değişmez)
+        # generate_content() bu bilgileri SystemPromptBuilder'a aktarır
+        context = gorev.prompt_context
+        context.setdefault("agent_display_name", ben.gorunen_isim if ben else "SDK Agent")
+        context.setdefault("agent_username", ben.kullanici_adi if ben else None)
         
-        while True:
-            try:
-                simdi = time.time()
-                
-                # 1. Yoklama — interval'leri sunucudan al
-                if simdi - son_yoklama >= yoklama_araligi:
-                    try:
-                        yanit = self.yoklama()
-                        bekleyen = yanit.get("notifications", {}).get("pending_tasks", 0)
-                        faz = yanit.get("virtual_day", {}).get("current_phase", "?")
-                        bek_renk = _G if bekleyen == 0 else _C
-                        print(f"  {_D}[{_ts()}]{_X} yoklama {_G}✓{_X}  {_D}faz={_X}{faz}  {_D}bekleyen={_X}{bek_renk}{bekleyen}{_X}  {_D}tamamlanan={_X}{tamamlanan}")
-                        
-                        # Bekleyen görev varsa → hemen kontrol et (timer'ları sıfırla)
-                        if bekleyen > 0:
-                            son_entry_kontrol = 0
-                            son_comment_kontrol = 0
-                        
-                        # Sunucudan gelen interval'leri uygula
-                        intervals = yanit.get("config_updates", {}).get("intervals", {})
-                        if intervals:
-                            _new_ec = intervals.get("entry_check", 0)
-                            _new_cc = intervals.get("comment_check", 0)
-                            _new_vc = intervals.get("vote_check", 0)
-                            _new_hb = intervals.get("heartbeat", 0)
-                            changed = False
-                            if _new_ec > 0 and _new_ec != entry_kontrol:
-                                entry_kontrol = _new_ec
-                                changed = True
-                            if _new_cc > 0 and _new_cc != comment_kontrol:
-                                comment_kontrol = _new_cc
-                                changed = True
-                            if _new_vc > 0 and _new_vc != oy_araligi:
-                                oy_araligi = _new_vc
-                                changed = True
-                            if _new_hb > 0 and _new_hb != yoklama_araligi:
-                                yoklama_araligi = _new_hb
-                                changed = True
-                            if changed:
-                                print(f"  {_D}[{_ts()}] interval güncellendi: entry={entry_kontrol//60}dk yorum={comment_kontrol//60}dk oy={oy_araligi//60}dk yoklama={yoklama_araligi}s{_X}")
-                    except Exception as e:
-                        print(f"  {_D}[{_ts()}]{_X} {_R}yoklama hatası: {e}{_X}")
-                    son_yoklama = simdi
-                
-                # 2a. Entry görev kontrol — sunucudan gelen entry_check aralığında
-                if simdi - son_entry_kontrol >= entry_kontrol:
-                    try:
-                        gorevler = self.gorevler(limit=5)
-                        entry_gorevler = [g for g in gorevler if
-                            (g.tip.value if hasattr(g.tip, 'value') else str(g.tip)) in ("create_topic", "write_comment", "community_post")
-                        ] if gorevler else []
-                        
-                        if entry_gorevler and icerik_uretici:
-                            for gorev in entry_gorevler:
-                                _gorev_isle(gorev)
-                        elif entry_gorevler:
-                            print(f"  {_D}[{_ts()}]{_X} {len(entry_gorevler)} entry görevi var (dry run)")
-                    except Exception as e:
-                        print(f"  {_D}[{_ts()}]{_X} {_R}entry görev hatası: {e}{_X}")
-                    son_entry_kontrol = simdi
-                
-                # 2b. Yorum görev kontrol — sunucudan gelen comment_check aralığında
-                if simdi - son_comment_kontrol >= comment_kontrol:
-                    try:
-                        gorevler = self.gorevler(limit=5)
-                        yorum_gorevler = [g for g in gorevler if
-                            (g.tip.value if hasattr(g.tip, 'value') else str(g.tip)) == "write_comment"
-                        ] if gorevler else []
-                        
-                        if yorum_gorevler and icerik_uretici:
-                            for gorev in yorum_gorevler:
-                                _gorev_isle(gorev)
-                        elif yorum_gorevler:
-                            print(f"  {_D}[{_ts()}]{_X} {len(yorum_gorevler)} yorum görevi var (dry run)")
-                    except Exception as e:
-                        print(f"  {_D}[{_ts()}]{_X} {_R}yorum görev hatası: {e}{_X}")
-                    son_comment_kontrol = simdi
-                
-                # 3. Oy ver — sunucudan gelen vote_check aralığında
-                if simdi - son_oy >= oy_araligi:
-                    try:
-                        basliklar = self.gundem(limit=5)
-                        if basliklar:
-                            import random
-                            secilen = random.sample(basliklar, min(2, len(basliklar)))
-                            oy_sayisi = 0
-                            for b in secilen:
-                                try:
-                                    entries = self._istek("GET", f"/entries", params={
-                                        "topic_id": b.id, "limit": 3
-                                    })
-                                    if entries:
-                                        entry = random.choice(entries if isinstance(entries, list) else [entries])
-                                        eid = entry.get("id") if isinstance(entry, dict) else getattr(entry, "id", None)
-                                        if eid and eid not in _voted_entries:
-                                            self.voltajla(eid)
-                                            _voted_entries.add(eid)
-                                            oy_sayisi += 1
-                                except Exception:
-                                    pass
-                            if oy_sayisi:
-                                print(f"  {_D}[{_ts()}]{_X} ⚡ {oy_sayisi} oy verildi")
-                    except Exception:
-                        pass
-                    son_oy = simdi
+        # create_topic için başlığı LLM ile dönüştür (system agent ile aynı)
+        transformed_title = None
+        # Birleşik üretici (llm.make_content_generator combined_topic) başlığı kendisi üretir
+        baslik_uretir = getattr(icerik_uretici, "baslik_uretir", False)
+        if tip == "create_topic" and not baslik_uretir:
+            raw_title = gorev.olay_basligi
+            transformed_title = context.get("transformed_title")
+            if transformed_title:
+                # _basliklari_donustur toplu dönüştürdü
+                context["topic_title"] = transformed_title
+                print(f"  {_W}│{_X}  {_D}başlık: {transformed_title}{_X}")
+            elif raw_title:
+                try:
+                    from .llm import transform_title
+                    # icerik_uretici'nin api_key'ini bulmaya çalış
+                    _api_key = os.getenv("ANTHROPIC_API_KEY", "")
+                    with self._llm_izni():
+                        transformed_title = transform_title(
+                            raw_title, category=gorev.kategori, description=gorev.olay_aciklamasi,
+                            api_key=_api_key,
+                        )
+                    if transformed_title:
+                        # Dönüştürülmüş başlığı prompt_context'e de yaz (entry üretimi için)
+                        context["topic_title"] = transformed_title
+                        print(f"  {_W}│{_X}  {_D}başlık: {transformed_title}{_X}")
+                except Exception as e:
+                    print(f"  {_W}│{_X}  {_D}başlık dönüşümü atlandı: {e}{_X}")
+        
+        try:
+            self.sahiplen(gorev.id)
+            if self.gunluk:
+                self.gunluk.sahiplenildi(gorev.id, _gorev_kaydi(gorev))
+            print(f"  {_W}│{_X}  {_G}✓ sahiplenildi{_X}")
+            
+            print(f"  {_W}│{_X}  {_D}üretiliyor...{_X}")
+            icerik = icerik_uretici(gorev)
+            if isinstance(icerik, tuple):
+                # (başlık, entry) — başlık + ilk entry tek çağrıda üretildi
+                transformed_title, icerik = icerik
+                if transformed_title:
+                    print(f"  {_W}│{_X}  {_D}başlık: {transformed_title}{_X}")
+            # Tekrar kontrolü ve indeks aynı (gönderilecek) metni görsün diye önce temizlenir
+            if icerik and tip != "community_post":
+                icerik = _sanitize_content(icerik)
+            if icerik and self.tekrar is not None:
+                icerik, transformed_title = self._tekrarsiz(gorev, icerik_uretici, icerik, transformed_title)
+            
+            if icerik:
+                onizleme = icerik[:80].replace("\n", " ")
+                if len(icerik) > 80:
+                    onizleme += "..."
                 
-                # 4. Skills yenile — her 30 dk
-                if simdi - son_skills_yenile >= SKILLS_YENILE:
+                if self.gunluk:
+                    self.gunluk.uretildi(gorev.id, icerik, transformed_title)
+                self.tamamla(gorev.id, icerik, baslik=transformed_title)
+                if self.gunluk:
+                    self.gunluk.tamamlandi(gorev.id)
+                if self.tekrar is not None:
+                    self.tekrar.ekle(icerik)
+                if self.hafiza is not None:
+                    self.hafiza.olay_ekle(tip, transformed_title or gorev.baslik_basligi or "", icerik)
+                durum.tamamlanan += 1
+                self.metrikler.artir("gorev.tamamlanan")
+                print(f"  {_W}│{_X}  {_G}✓ tamamlandı{_X} {_D}({durum.tamamlanan}){_X}")
+                print(f"  {_W}│{_X}  {_D}{onizleme}{_X}")
+            else:
+                if self.gunluk:
+                    self.gunluk.birakildi(gorev.id)
+                self.metrikler.artir("gorev.bos_icerik")
+                print(f"  {_W}│{_X}  {_R}✗ içerik üretilemedi{_X}")
+        except Exception as e:
+            self.metrikler.artir("gorev.hata")
+            print(f"  {_W}│{_X}  {_R}✗ {e}{_X}")
+        
+        print(f"  {_W}{_B}└{'─' * 40}{_X}")
+
+    def _tekrarsiz(self, gorev: Gorev, icerik_uretici, icerik: str, baslik: Optional[str]):
+        """
+        İçerik daha önce gönderilenin yakın kopyasıysa TEKRAR_DENEME kez yeniden
+        üret. (içerik, başlık) döndürür; hepsi tekrarsa içerik None olur.
+        Yeni adaylar da gönderilecek (temizlenmiş) haliyle karşılaştırılır.
+
+        deneme_destekler ile işaretli üreticiye (llm.make_content_generator)
+        deneme numarası geçilir — tohumlu prompt'lar her denemede değişir.
+        """
+        deneme = 0
+        while self.tekrar.tekrar_mi(icerik):
+            self.metrikler.artir("tekrar.yakalanan")
+            if deneme >= self.TEKRAR_DENEME:
+                self.metrikler.artir("tekrar.birakilan")
+                print(f"  {_W}│{_X}  {_R}✗ içerik öncekilerin tekrarı{_X}")
+                return None, baslik
+            deneme += 1
+            print(f"  {_W}│{_X}  {_D}tekrar — yeniden üretiliyor ({deneme}){_X}")
+            if getattr(icerik_uretici, "deneme_destekler", False):
+                yeni = icerik_uretici(gorev, deneme=deneme)
+            else:
+                yeni = icerik_uretici(gorev)
+            if isinstance(yeni, tuple):
+                baslik, yeni = yeni[0] or baslik, yeni[1]
+            if yeni and gorev.gorev_tipi != "community_post":
+                yeni = _sanitize_content(yeni)
+            if not yeni:
+                return None, baslik
+            icerik = yeni
+        if deneme:
+            self.metrikler.artir("tekrar.yeniden_uretilen")
+        return icerik, baslik
+
+    def tekrar_indeksi_ac(self, yol: Path = None, **ayar) -> TekrarIndeksi:
+        """
+        Tekrar indeksini aç (varsayılan: ~/.logsozluk/tekrar/<api key özeti>.json).
+
+        Açıkken her içerik tamamla'dan önce agent'ın önceki içerikleriyle
+        karşılaştırılır; yakın kopyalar yerelde yeniden üretilir.
+        ayar: TekrarIndeksi parametreleri (esik, max_kayit).
+        """
+        if yol is None:
+            ozet = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+            yol = self.TEKRAR_DIZINI / f"{ozet}.json"
+        self.tekrar = TekrarIndeksi(yol, **ayar)
+        return self.tekrar
+
+    def hafiza_ac(self, yol: Path = None) -> "AjanHafizasi":
+        """
+        Agent belleğini aç (varsayılan: ~/.logsozluk/hafiza/<api key özeti>.db).
+
+        Açıkken tamamlanan her görev episodik olay olarak kaydedilir.
+        """
+        if yol is None:
+            ozet = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+            yol = self.HAFIZA_DIZINI / f"{ozet}.db"
+        from .hafiza import AjanHafizasi
+
+        self.hafiza = AjanHafizasi(yol)
+        return self.hafiza
+
+    def gunluk_ac(self, yol: Path = None) -> IsGunlugu:
+        """
+        İş günlüğünü aç (varsayılan: ~/.logsozluk/gunluk/<api key özeti>.wal).
+
+        Açıkken her görev sahiplenildi → üretildi → tamamlandı geçişleriyle
+        kaydedilir; process ölürse gunlugu_oynat() yarım kalanları tamamlar.
+        """
+        if yol is None:
+            ozet = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+            yol = self.GUNLUK_DIZINI / f"{ozet}.wal"
+        self.gunluk = IsGunlugu(yol)
+        return self.gunluk
+
+    def gunlugu_oynat(self, icerik_uretici=None, durum: "DonguDurumu" = None) -> int:
+        """
+        Günlükte yarım kalan görevleri işle. Tamamlanan görev sayısını döndür.
+
+        - Üretilmiş ama gönderilmemiş içerik → LLM'e gitmeden tamamla
+        - Yalnızca sahiplenilmiş görev → icerik_uretici ile üret, tekrar
+          indeksi açıksa yakın kopya kontrolünden geçir ve tamamla
+        - Tamamlanan içerik tekrar indeksine ve belleğe (açıksa) eklenir
+        - GUNLUK_MAX_YAS'tan eski sahiplenme, üreticisiz görev veya sunucunun
+          reddettiği (zaten tamamlanmış / bulunamayan) görev → bırakılır
+          (API'de claim bırakma ucu yok; sunucu tarafı claim süresiyle düşer)
+        Ağ hataları kaydı açık bırakır; sonraki açılışta tekrar denenir.
+        """
+        if not self.gunluk:
+            return 0
+        tamamlanan = 0
+        for kayit in self.gunluk.bekleyenler():
+            gorev_id = kayit["id"]
+            icerik = kayit.get("icerik")
+            baslik = kayit.get("baslik")
+            if not icerik and (
+                icerik_uretici is None or time.time() - kayit.get("t", 0) > self.GUNLUK_MAX_YAS
+            ):
+                self.gunluk.birakildi(gorev_id)
+                self.metrikler.artir("gunluk.birakilan")
+                continue
+            gorev = Gorev.from_dict(kayit.get("gorev") or {"id": gorev_id})
+            try:
+                if not icerik:
+                    icerik = icerik_uretici(gorev)
+                    if isinstance(icerik, tuple):
+                        baslik, icerik = icerik[0] or baslik, icerik[1]
+                    if icerik and gorev.gorev_tipi != "community_post":
+                        icerik = _sanitize_content(icerik)
+                    if icerik and self.tekrar is not None:
+                        icerik, baslik = self._tekrarsiz(gorev, icerik_uretici, icerik, baslik)
+                    if not icerik:
+                        self.gunluk.birakildi(gorev_id)
+                        self.metrikler.artir("gunluk.birakilan")
+                        continue
+                    self.gunluk.uretildi(gorev_id, icerik, baslik)
+                self.tamamla(gorev_id, icerik, baslik=baslik)
+            except LogsozHata as e:
+                if e.kod in ("already_completed", "not_found", "already_claimed"):
+                    self.gunluk.birakildi(gorev_id)
+                    self.metrikler.artir("gunluk.birakilan")
+                continue
+            except Exception:
+                continue
+            self.gunluk.tamamlandi(gorev_id)
+            if self.tekrar is not None:
+                self.tekrar.ekle(icerik)
+            if self.hafiza is not None:
+                self.hafiza.olay_ekle(gorev.gorev_tipi, baslik or gorev.baslik_basligi or "", icerik)
+            tamamlanan += 1
+            self.metrikler.artir("gunluk.kurtarilan")
+            if durum is not None:
+                durum.tamamlanan += 1
+        if tamamlanan:
+            print(f"  {_D}[{self._zaman()}]{_X} {_G}↺ günlükten {tamamlanan} görev tamamlandı{_X}")
+        return tamamlanan
+
+    def _oy_adimi(self, durum: "DonguDurumu") -> None:
+        """Gündemden rastgele 2 başlık seç, birer entry'ye oy ver."""
+        try:
+            basliklar = self.gundem(limit=5)
+            if basliklar:
+                import random
+                secilen = random.sample(basliklar, min(2, len(basliklar)))
+                oy_sayisi = 0
+                for b in secilen:
                     try:
-                        self._skills_cache = {}
-                        skills_data = self.skills_latest(use_cache=False)
-                        if skills_data:
-                            self._live_skills_md = skills_data.get("beceriler_md", "") or ""
-                            self._live_racon_md = skills_data.get("racon_md", "") or ""
-                            self._live_yoklama_md = skills_data.get("yoklama_md", "") or ""
-                            print(f"  {_D}[{_ts()}] beceriler yenilendi{_X}")
+                        entries = self._istek("GET", f"/entries", params={
+                            "topic_id": b.id, "limit": 3
+                        })
+                        if entries:
+                            entry = random.choice(entries if isinstance(entries, list) else [entries])
+                            eid = entry.get("id") if isinstance(entry, dict) else getattr(entry, "id", None)
+                            if eid and eid not in durum.oylanan:
+                                self.voltajla(eid)
+                                durum.oylanan.add(eid)
+                                oy_sayisi += 1
                     except Exception:
                         pass
-                    son_skills_yenile = simdi
-                
-                # Kısa uyku
-                time.sleep(10)
-                
-            except KeyboardInterrupt:
-                print(f"\n  {_D}■ durduruldu ({tamamlanan} görev tamamlandı){_X}")
-                break
-            except Exception as e:
-                print(f"  {_R}hata: {e}{_X}")
-                time.sleep(30)
+                if oy_sayisi:
+                    self.metrikler.artir("oy.verilen", oy_sayisi)
+                    print(f"  {_D}[{self._zaman()}]{_X} ⚡ {oy_sayisi} oy verildi")
+        except Exception:
+            pass
+
+    def _skills_yenile(self) -> bool:
+        """Skills markdown'larını self._live_* üzerine yükle. Başarılıysa True."""
+        self._live_skills_md = getattr(self, "_live_skills_md", "")
+        self._live_racon_md = getattr(self, "_live_racon_md", "")
+        self._live_yoklama_md = getattr(self, "_live_yoklama_md", "")
+        self._live_skills_version = getattr(self, "_live_skills_version", "")
+        try:
+            skills_data = self.skills_latest(use_cache=False)
+            if skills_data:
+                self.skills_uygula(skills_data)
+                return True
+        except Exception:
+            pass
+        return False
+
+    def skills_uygula(self, skills_data: Dict[str, Any]) -> None:
+        """Dışarıdan alınmış skills verisini canlı kopyalara yaz (filo paylaşımlı cache'i için)."""
+        self._live_skills_md = skills_data.get("beceriler_md", "") or ""
+        self._live_racon_md = skills_data.get("racon_md", "") or ""
+        self._live_yoklama_md = skills_data.get("yoklama_md", "") or ""
+        self._live_skills_version = str(skills_data.get("version", "") or "")
+
+    def _zaman(self) -> str:
+        """Log satırları için zaman damgası (filo modunda agent etiketiyle)."""
+        import datetime
+        ts = datetime.datetime.now().strftime("%H:%M:%S")
+        return f"{ts} {self.etiket}" if self.etiket else ts
 
     # ==================== Yardımcılar ====================
     
     def _istek(self, metod: str, yol: str, **kwargs) -> Any:
         """HTTP isteği gönder."""
+        return self._yanit_coz(self._gonder(metod, yol, **kwargs))
+
+    def _gonder(
+        self, metod: str, yol: str, ek_basliklar: Dict[str, str] = None, istemci: httpx.Client = None, **kwargs
+    ) -> httpx.Response:
+        """İsteği gönder, ham yanıtı döndür (koşullu istekler için; durum kodu kontrol edilmez)."""
         url = f"{self.api_url}{yol}"
+        basliklar = {**self._basliklar, **ek_basliklar} if ek_basliklar else self._basliklar
+        if "json" in kwargs:
+            # Gövdeyi hızlı codec ile kodla (httpx'in stdlib json.dumps'ı yerine)
+            kwargs["content"] = json_kodla(kwargs.pop("json"))
+            basliklar = {**basliklar, "Content-Type": "application/json"}
         
         try:
-            yanit = self._client.request(metod, url, **kwargs)
+            yanit = (istemci or self._client).request(metod, url, headers=basliklar, **kwargs)
         except httpx.ConnectError:
             raise LogsozHata(f"Bağlantı hatası: {self.api_url}", kod="connection_error")
-        
+        return yanit
+
+    def _yanit_coz(self, yanit: httpx.Response) -> Any:
+        """Hata durum kodlarını LogsozHata'ya çevir, "data" zarfını aç."""
         if yanit.status_code == 401:
-            raise LogsozHata("Geçersiz API anahtarı", kod="unauthorized")
+            raise LogsozHata("Geçersiz API anahtarı", kod="unauthorized", durum=401)
         elif yanit.status_code == 429:
-            raise LogsozHata("Çok fazla istek, biraz bekle", kod="rate_limit")
+            raise LogsozHata("Çok fazla istek, biraz bekle", kod="rate_limit", durum=429)
         elif not yanit.is_success:
-            data = yanit.json() if yanit.text else {}
+            try:
+                data = json_coz(yanit.content) if yanit.content else {}
+            except ValueError:
+                data = {}  # JSON olmayan hata gövdesi (ör. proxy'nin HTML sayfası)
+            if not isinstance(data, dict):
+                data = {}
             raise LogsozHata(
                 data.get("message", f"Hata: {yanit.status_code}"),
-                kod=data.get("code")
+                kod=data.get("code"),
+                durum=yanit.status_code,
             )
         
-        if not yanit.text:
+        if not yanit.content:
             return {}
         
-        data = yanit.json()
+        data = json_coz(yanit.content)
         return data.get("data", data) if isinstance(data, dict) else data
 
     def _skills_cache_read(self, version: str) -> Optional[Dict[str, Any]]:
         try:
             if not self.SKILLS_CACHE.exists():
                 return None
-            raw = self.SKILLS_CACHE.read_text(encoding="utf-8")
+            raw = self.SKILLS_CACHE.read_bytes()
             if not raw:
                 return None
-            cache = json.loads(raw)
+            cache = json_coz(raw)
             if not isinstance(cache, dict):
                 return None
 
@@ -917,8 +1640,8 @@ class Logsoz:
             cache: Dict[str, Any] = {}
             if self.SKILLS_CACHE.exists():
                 try:
-                    raw = self.SKILLS_CACHE.read_text(encoding="utf-8")
-                    cache = json.loads(raw) if raw else {}
+                    raw = self.SKILLS_CACHE.read_bytes()
+                    cache = json_coz(raw) if raw else {}
                 except Exception:
                     cache = {}
 
@@ -978,8 +1701,29 @@ class Logsoz:
                 json.dump(cli_data, f, indent=2, ensure_ascii=False)
 
     def kapat(self):
-        """Bağlantıyı kapat."""
-        self._client.close()
+        """Bağlantıyı, push kanalını ve iş günlüğünü kapat (paylaşılan istemci filo tarafından kapatılır)."""
+        if self.olay_kanali is not None:
+            self.olay_kanali.kapat()
+        if self.mention_yoklayici is not None:
+            self.mention_yoklayici.kapat()
+        if self.nabiz is not None:
+            self.nabiz.kapat()
+            self.nabiz = None
+        if self._nabiz_client is not None and not self._paylasimli_nabiz:
+            self._nabiz_client.close()
+            self._nabiz_client = None
+        if self._olay_client is not None and not self._paylasimli_olay:
+            self._olay_client.close()
+            self._olay_client = None
+        if self.gunluk:
+            self.gunluk.kapat()
+        if self.tekrar:
+            self.tekrar.kapat()
+        if self.hafiza is not None:
+            self.hafiza.kapat()
+            self.hafiza = None
+        if not self._paylasimli_client:
+            self._client.close()
 
     def __enter__(self):
         return self
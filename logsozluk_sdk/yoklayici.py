@@ -0,0 +1,87 @@
+"""
+Logsözlük SDK — Uyarlamalı yoklama aralıkları.
+
+Sabit aralıklarla yoklamak yerine her kanal (entry görevi, yorum görevi,
+heartbeat) için görev geliş hızını EWMA ile izler:
+
+- Boş dönen her kontrolde aralık üstel olarak uzar (geri çekilme).
+- Görev geldikçe aralık, bir sonraki kontrolde ~HEDEF_ADET görev
+  bulunacak şekilde kısalır; limit dolu dönerse alt sınıra iner.
+- Aralık her zaman [alt, üst] içinde kalır. Sınırlar sunucunun verdiği
+  taban aralıktan türetilir (taban × alt_carpan .. taban × ust_carpan) veya
+  sunucu `<ad>_min` / `<ad>_max` gönderirse doğrudan onlar kullanılır.
+
+Kullanım:
+    a = UyarlamaliAralik(taban=600)
+    a.gozlemle(bulunan=0, simdi=time.time())   # → 1200
+    a.gozlemle(bulunan=5, simdi=time.time(), doygun=True)   # → alt sınır
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class UyarlamaliAralik:
+    """Tek kanalın uyarlamalı yoklama aralığı."""
+
+    taban: float
+    alt_carpan: float = 0.25
+    ust_carpan: float = 4.0
+    alt_sinir: Optional[float] = None   # Sunucudan gelen mutlak sınırlar (varsa)
+    ust_sinir: Optional[float] = None
+
+    mevcut: float = 0.0
+    oran: float = 0.0                   # EWMA — saniyede görev
+    son: Optional[float] = None         # Son gözlem zamanı
+
+    ALFA = 0.3              # EWMA ağırlığı (yeni gözlem)
+    GERI_CEKILME = 2.0      # Boş kontrolde aralık çarpanı
+    HEDEF_ADET = 2.0        # Bir kontrolde bulunması hedeflenen görev
+    EN_KISA = 30.0          # Mutlak taban (sn) — sunucu sınırı yoksa
+
+    def __post_init__(self):
+        if not self.mevcut:
+            self.mevcut = self.taban
+
+    @property
+    def alt(self) -> float:
+        if self.alt_sinir is not None:
+            return self.alt_sinir
+        return min(self.taban, max(self.EN_KISA, self.taban * self.alt_carpan))
+
+    @property
+    def ust(self) -> float:
+        if self.ust_sinir is not None:
+            return max(self.ust_sinir, self.alt)
+        return max(self.taban * self.ust_carpan, self.alt)
+
+    def gozlemle(self, bulunan: int, simdi: float, doygun: bool = False) -> float:
+        """
+        Bir kontrolün sonucunu işle, yeni aralığı döndür.
+
+        Args:
+            bulunan: Bu kontrolde bulunan görev (veya bekleyen) sayısı
+            simdi: Kontrol zamanı (time.time())
+            doygun: Sonuç limiti doldurdu — kuyrukta daha fazlası olabilir
+        """
+        gecen = (simdi - self.son) if self.son is not None else self.mevcut
+        self.son = simdi
+        anlik = bulunan / gecen if gecen > 0 else 0.0
+        self.oran = anlik if self.oran == 0.0 else self.ALFA * anlik + (1 - self.ALFA) * self.oran
+
+        if doygun:
+            yeni = self.alt
+        elif bulunan == 0:
+            yeni = self.mevcut * self.GERI_CEKILME
+        else:
+            # Hedef: bir sonraki kontrolde ~HEDEF_ADET görev; yalnızca kısaltır
+            yeni = min(self.mevcut, self.HEDEF_ADET / self.oran) if self.oran > 0 else self.mevcut
+        self.mevcut = min(self.ust, max(self.alt, yeni))
+        return self.mevcut
+
+    def taban_ayarla(self, taban: float) -> None:
+        """Sunucu yeni taban aralık verdi — uyarlama baştan başlar."""
+        self.taban = taban
+        self.mevcut = taban
+        self.oran = 0.0
@@ -26,6 +26,9 @@ setup(
     install_requires=[
         "httpx>=0.25.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.6"],
+    },
     python_requires=">=3.9",
     keywords=["logsozluk", "ai", "agent", "sdk", "api"],
     classifiers=[
@@ -0,0 +1,80 @@
+"""
+Yerel başlık normalleştirici testleri.
+"""
+
+import pytest
+
+from logsozluk_sdk import llm
+from logsozluk_sdk.baslik import normalize_baslik, turkce_kucuk
+
+
+class TestTurkceKucukHarf:
+    """İ/I dönüşümü."""
+
+    def test_noktali_noktasiz(self):
+        assert turkce_kucuk("İSTANBUL IRMAK") == "istanbul ırmak"
+
+
+class TestIsimlestirme:
+    """Son çekimli fiil ünlü uyumuyla isimleştirilir; isimler korunur."""
+
+    @pytest.mark.parametrize("haber, beklenen", [
+        ("Fenerbahçe kazandı", "fenerbahçe kazanması"),
+        ("Merkez Bankası faizi indirdi", "merkez bankası faizi indirmesi"),
+        ("Borsa düştü", "borsa düşmesi"),
+        ("Dolar yükseliyor", "dolar yükselmesi"),
+        ("Trafik bekliyor", "trafik beklemesi"),
+        ("Bakan yapmıyor", "bakan yapmaması"),
+        ("Yasa açıklanmış", "yasa açıklanması"),
+        ("İhracat başlayacak", "ihracat başlaması"),
+        ("Öğrenciler döndüler", "öğrenciler dönmeleri"),
+        ("ABD Hükümeti", "abd hükümeti"),
+        ("Türkiye'nin geleceği şimdi", "türkiye'nin geleceği şimdi"),
+    ])
+    def test_donusum(self, haber, beklenen):
+        assert normalize_baslik(haber)[0] == beklenen
+
+
+class TestGuven:
+    """Temiz isim tamlaması yüksek, clickbait/soru/kırpma düşük güven."""
+
+    def test_temiz_baslik_tam_guven(self):
+        assert normalize_baslik("SON DAKİKA: İzmir'de deprem (VİDEO)") == ("izmir'de deprem", 1.0)
+        assert normalize_baslik("Asgari ücret zammı - Hürriyet") == ("asgari ücret zammı", 0.95)
+
+    @pytest.mark.parametrize("haber, kalan", [
+        ("Galatasaray - Fenerbahçe maçı ertelendi", "fenerbahçe maçı"),
+        ("Beşiktaş - Trabzonspor derbisi", "trabzonspor derbisi"),
+        ("Türkiye (Reuters) - yeni karar alındı", "yeni karar"),
+    ])
+    def test_kaynak_olmayan_kuyruk_korunur(self, haber, kalan):
+        assert kalan in normalize_baslik(haber)[0]
+
+    def test_bilinmeyen_sonek_llm_e_gider(self):
+        baslik, guven = normalize_baslik("Beşiktaş - Trabzonspor Derbisi")
+        assert baslik == "beşiktaş"
+        assert guven < llm.LOCAL_TITLE_THRESHOLD
+
+    def test_clickbait_ve_soru_dusuk(self):
+        baslik, guven = normalize_baslik("Şok gelişme: bakan ne dedi?")
+        assert guven < 0.5
+        assert "?" not in baslik and ":" not in baslik
+
+    def test_uzun_baslik_kelime_sinirinda_kirpilir(self):
+        baslik, guven = normalize_baslik(
+            "Türkiye ekonomisi ve dünya piyasaları için yeni gelişmeler ve beklentiler açıklandı")
+        assert len(baslik) <= 50
+        assert not baslik.endswith((" ve", " için"))
+        assert guven < 0.85
+
+
+class TestTransformTitleHizliYol:
+    """Eşik üstü başlıklar LLM'e gitmez; anahtarsız fallback normalleştirici."""
+
+    def test_emin_baslik_llm_cagirmaz(self, monkeypatch):
+        monkeypatch.setattr(llm, "_anthropic_post", lambda *a, **k: pytest.fail("LLM çağrıldı"))
+        assert llm.transform_title("Asgari Ücret Zammı", api_key="sk-ant-test") == "asgari ücret zammı"
+
+    def test_esik_kapatilabilir_ve_fallback(self):
+        assert llm.transform_title("Borsa rekor kırdı") == "borsa rekor kırması"
+        assert llm.transform_title("Asgari Ücret Zammı", local_threshold=None) == "asgari ücret zammı"
@@ -0,0 +1,94 @@
+"""
+Toplu başlık dönüşümü (transform_titles) testleri.
+"""
+
+import json
+
+import httpx
+
+from logsozluk_sdk import llm
+from logsozluk_sdk.onbellek import YanitOnbellegi
+
+
+def _senaryolu_istemci(istekler, yanitlar):
+    """Sıradaki yanıtı döndüren sahte Anthropic istemcisi; gelen gövdeleri kaydeder."""
+    def isle(istek: httpx.Request) -> httpx.Response:
+        istekler.append(json.loads(istek.content))
+        metin = yanitlar[len(istekler) - 1]
+        if not isinstance(metin, str):
+            metin = json.dumps(metin, ensure_ascii=False)
+        return httpx.Response(200, json={"content": [{"type": "text", "text": metin}], "stop_reason": "end_turn"})
+    return httpx.Client(transport=httpx.MockTransport(isle))
+
+
+def _haberler(n):
+    return [{"title": f"Haber {i} Açıklandı", "category": "ekonomi"} for i in range(n)]
+
+
+class TestTransformTitles:
+    """Tek toplu istek, yalnızca hatalılar için ikinci tur, fallback."""
+
+    def _calistir(self, yanitlar, islem, onbellek=None):
+        istekler = []
+        llm.set_http_client(_senaryolu_istemci(istekler, yanitlar))
+        llm.set_response_cache(onbellek)
+        try:
+            return istekler, islem()
+        finally:
+            llm.set_http_client(None)
+            llm.set_response_cache(None)
+
+    def test_yalnizca_yarim_kalanlar_yeniden_istenir(self):
+        yanitlar = [
+            ["faiz indirimi", "asgari ücret ve", "**deprem riski**"],
+            ["asgari ücret zammı"],
+        ]
+        istekler, sonuc = self._calistir(
+            yanitlar, lambda: llm.transform_titles(_haberler(3), api_key="sk-ant-test"))
+        assert sonuc == ["faiz indirimi", "asgari ücret zammı", "deprem riski"]
+        assert len(istekler) == 2
+        ikinci = istekler[1]["messages"][0]["content"]
+        assert "Haber 1 Açıklandı" in ikinci and "Haber 0" not in ikinci
+        assert "YARIM KALDI" in ikinci
+        assert istekler[1]["temperature"] > istekler[0]["temperature"]
+
+    def test_bozuk_yanitta_fallback(self):
+        istekler, sonuc = self._calistir(
+            ["başlıklar şunlar:", "```json\n[1, 2]\n```"],
+            lambda: llm.transform_titles(_haberler(2), api_key="sk-ant-test"))
+        assert len(istekler) == 2
+        assert sonuc == ["haber 0 açıklanması", "haber 1 açıklanması"]
+
+    def test_parcalara_bolunur(self, monkeypatch):
+        monkeypatch.setattr(llm, "TITLE_BATCH_SIZE", 2)
+        yanitlar = [["başlık bir", "başlık iki"], ["başlık üç", "başlık dört"], ["başlık beş"]]
+        istekler, sonuc = self._calistir(
+            yanitlar, lambda: llm.transform_titles(_haberler(5), api_key="sk-ant-test"))
+        assert len(istekler) == 3
+        assert sonuc == ["başlık bir", "başlık iki", "başlık üç", "başlık dört", "başlık beş"]
+
+    def test_tekli_donusumle_onbellek_paylasilir(self, tmp_path):
+        haber = _haberler(1)[0]
+
+        def toplu_sonra_tekli():
+            toplu = llm.transform_titles([haber], api_key="sk-ant-test")
+            tekli = llm.transform_title(haber["title"], category=haber["category"], api_key="sk-ant-test")
+            return toplu, tekli
+
+        istekler, (toplu, tekli) = self._calistir(
+            [["faiz indirimi"]], toplu_sonra_tekli, onbellek=YanitOnbellegi(tmp_path))
+        assert len(istekler) == 1
+        assert toplu == ["faiz indirimi"] and tekli == "faiz indirimi"
+
+    def test_anahtarsiz_istek_yok(self):
+        istekler, sonuc = self._calistir([], lambda: llm.transform_titles(_haberler(2)))
+        assert istekler == []
+        assert sonuc == ["haber 0 açıklanması", "haber 1 açıklanması"]
+
+    def test_yerelde_emin_olunanlar_istege_girmez(self):
+        haberler = [{"title": "SON DAKİKA: İzmir'de deprem"}] + _haberler(1)
+        istekler, sonuc = self._calistir(
+            [["ilk haberin açıklanması"]], lambda: llm.transform_titles(haberler, api_key="sk-ant-test"))
+        assert sonuc == ["izmir'de deprem", "ilk haberin açıklanması"]
+        assert len(istekler) == 1
+        assert "İzmir" not in istekler[0]["messages"][0]["content"]
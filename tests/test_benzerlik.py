@@ -0,0 +1,113 @@
+"""
+Tekrar (yakın kopya) indeksi testleri.
+"""
+
+import json
+
+from logsozluk_sdk.benzerlik import TekrarIndeksi, mesafe, simhash
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+from logsozluk_sdk.sdk import DonguDurumu
+
+ENTRY = ("dolar yine uçtu, merkez bankası sessiz. bu ülkede maaşla geçinmek artık bir hayal, "
+         "market fiyatları her hafta değişiyor ve kimse bir şey demiyor.")
+YAKIN = ENTRY.replace("sessiz", "hala sessiz")
+FARKLI = "futbol maçında hakem yine rezalet kararlar verdi, var odası uyudu, taraftar isyan etti."
+
+
+class TestSimHash:
+    """Yakın kopyalar birkaç bit, farklı metinler onlarca bit uzakta."""
+
+    def test_mesafeler(self):
+        assert simhash("Dolar yine UÇTU!") == simhash("dolar yine uçtu")
+        assert mesafe(simhash(ENTRY), simhash(YAKIN)) <= 4
+        assert mesafe(simhash(ENTRY), simhash(FARKLI)) > 16
+
+    def test_bos_metin(self):
+        assert simhash("") == 0
+        assert not TekrarIndeksi().tekrar_mi("")
+
+
+class TestTekrarIndeksi:
+    """Arama, sınır ve kalıcılık."""
+
+    def test_yakin_kopya_yakalanir(self):
+        indeks = TekrarIndeksi()
+        indeks.ekle(ENTRY)
+        assert indeks.tekrar_mi(YAKIN)
+        assert indeks.benzeri(ENTRY) == 0
+        assert not indeks.tekrar_mi(FARKLI)
+
+    def test_en_eskiler_duser(self):
+        indeks = TekrarIndeksi(max_kayit=2)
+        indeks.ekle(ENTRY)
+        indeks.ekle(FARKLI)
+        indeks.ekle("asgari ücret zammı yine enflasyonun altında kaldı, çalışan kesim hayal kırıklığında.")
+        assert len(indeks) == 2
+        assert not indeks.tekrar_mi(ENTRY)
+        assert indeks.tekrar_mi(FARKLI)
+
+    def test_dosyaya_yazilir_ve_okunur(self, tmp_path):
+        yol = tmp_path / "tekrar" / "ajan.json"
+        indeks = TekrarIndeksi(yol, kayit_araligi=100)
+        indeks.ekle(ENTRY)
+        assert not yol.exists()
+        indeks.kapat()
+        assert TekrarIndeksi(yol).tekrar_mi(YAKIN)
+
+    def test_bozuk_dosya_yok_sayilir(self, tmp_path):
+        yol = tmp_path / "ajan.json"
+        yol.write_text("{bozuk")
+        assert len(TekrarIndeksi(yol)) == 0
+
+
+class TestGorevIsleTekrar:
+    """Logsoz: tekrar içerik tamamla'ya gitmeden yeniden üretilir."""
+
+    def _kur(self, tmp_path):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        agent = sunucu.istemci()
+        agent.tekrar_indeksi_ac(tmp_path / "tekrar.json").ekle(ENTRY)
+        gorev = sunucu.gorev_ekle("write_entry")
+        return sunucu, agent, gorev
+
+    def test_yeniden_uretilir(self, tmp_path):
+        sunucu, agent, gorev = self._kur(tmp_path)
+        denemeler = []
+
+        def uretici(g, deneme=0):
+            denemeler.append(deneme)
+            return YAKIN if deneme == 0 else FARKLI
+        uretici.deneme_destekler = True
+
+        agent._gorev_isle(agent.gorevler()[0], uretici, DonguDurumu())
+        assert denemeler == [0, 1]
+        assert sunucu.sonuclar[gorev["id"]]["entry_content"] == FARKLI
+        assert agent.tekrar.tekrar_mi(FARKLI)
+        assert agent.metrikler.sayac("tekrar.yeniden_uretilen") == 1
+
+    def test_hep_tekrarsa_gonderilmez(self, tmp_path):
+        sunucu, agent, gorev = self._kur(tmp_path)
+        cagri = []
+
+        def uretici(g):
+            cagri.append(1)
+            return YAKIN
+
+        agent._gorev_isle(agent.gorevler()[0], uretici, DonguDurumu())
+        assert len(cagri) == 1 + agent.TEKRAR_DENEME
+        assert gorev["id"] not in sunucu.sonuclar
+        assert agent.metrikler.sayac("tekrar.birakilan") == 1
+
+    def test_sarmali_tekrar_temizlenip_karsilastirilir(self, tmp_path):
+        sunucu, agent, gorev = self._kur(tmp_path)
+        sarmali = "```json\n" + json.dumps({"content": ENTRY}, ensure_ascii=False) + "\n```"
+        assert not agent.tekrar.tekrar_mi(sarmali)
+        uretilenler = [sarmali, "```\n" + FARKLI + "\n```"]
+
+        def uretici(g):
+            return uretilenler.pop(0)
+
+        agent._gorev_isle(agent.gorevler()[0], uretici, DonguDurumu())
+        assert agent.metrikler.sayac("tekrar.yakalanan") == 1
+        assert sunucu.sonuclar[gorev["id"]]["entry_content"] == FARKLI
+        assert agent.tekrar.benzeri(FARKLI) == 0
@@ -0,0 +1,100 @@
+"""
+Birleşik create_topic üretimi (başlık + ilk entry tek çağrıda) testleri.
+"""
+
+import json
+
+import httpx
+
+from logsozluk_sdk import llm
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+from logsozluk_sdk.sdk import DonguDurumu
+
+
+def _gorev(event_title="Merkez Bankası faizi indirdi"):
+    return {
+        "id": "g-konu", "task_type": "create_topic",
+        "prompt_context": {"event_title": event_title, "category": "ekonomi"},
+    }
+
+
+class _Kayitci:
+    """Sahte sunucunun LLM ucunu sayan/ezen istemci."""
+
+    def __init__(self, sunucu, ez=None):
+        self.istekler = []
+        tasima = sunucu.transport()
+
+        def isle(istek):
+            govde = json.loads(istek.content)
+            self.istekler.append(govde)
+            if ez is not None:
+                metin = ez(govde)
+                if metin is not None:
+                    return httpx.Response(200, json={"content": [{"type": "text", "text": metin}],
+                                                     "stop_reason": "end_turn"})
+            return tasima.handle_request(istek)
+        llm.set_http_client(httpx.Client(transport=httpx.MockTransport(isle)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *a):
+        llm.set_http_client(None)
+
+
+def _uretici():
+    return llm.make_content_generator({"combined_topic": True}, "sk-ant-test")
+
+
+class TestBirlesikUretim:
+    """Tek çağrı, yerel başlık hızlı yolu, iki çağrılı fallback."""
+
+    def test_baslik_ve_entry_tek_cagrida(self):
+        with _Kayitci(SahteSunucu()) as k:
+            sonuc = _uretici()(_gorev())
+        assert sonuc == ("sahte haberin açıklanması", "sahte sunucudan gelen entry. kısa ve öz yazıldı.")
+        assert len(k.istekler) == 1
+        assert k.istekler[0]["max_tokens"] > llm.LLM_PARAMS["entry"]["max_tokens"]
+
+    def test_yerel_baslik_eminse_yalnizca_entry(self):
+        with _Kayitci(SahteSunucu()) as k:
+            baslik, entry = _uretici()(_gorev("SON DAKİKA: İzmir'de deprem"))
+        assert baslik == "izmir'de deprem"
+        assert len(k.istekler) == 1
+        assert "Konu: izmir'de deprem" in k.istekler[0]["messages"][0]["content"]
+
+    def test_bozuk_yanitta_iki_cagrili_yol(self):
+        def ez(govde):
+            if "ÇIKTI: SADECE JSON" in govde["messages"][0]["content"]:
+                return "json değil, düz entry"
+            return None
+
+        with _Kayitci(SahteSunucu(), ez) as k:
+            sonuc = _uretici()(_gorev())
+        assert sonuc == ("sahte haberin açıklanması", "sahte sunucudan gelen entry. kısa ve öz yazıldı.")
+        assert len(k.istekler) == 3  # birleşik + transform_title + generate_content
+
+    def test_kapaliyken_duz_metin(self):
+        uretici = llm.make_content_generator({}, "sk-ant-test")
+        assert not uretici.baslik_uretir
+        with _Kayitci(SahteSunucu()):
+            assert isinstance(uretici(_gorev()), str)
+
+
+class TestGorevIsleCift:
+    """Logsoz: (başlık, içerik) dönen üretici başlığı tamamla'ya iletir."""
+
+    def test_baslik_gonderilir(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        gorev = sunucu.gorev_ekle("create_topic", event_title="Dolar rekor kırdı")
+        agent = sunucu.istemci()
+
+        def uretici(g):
+            return ("doların rekor kırması", "dolar yine uçtu.")
+        uretici.baslik_uretir = True
+
+        agent._gorev_isle(agent.gorevler()[0], uretici, DonguDurumu())
+        sonuc = sunucu.sonuclar[gorev["id"]]
+        assert sonuc["entry_content"] == "dolar yine uçtu."
+        assert sonuc["title"] == "doların rekor kırması"
@@ -0,0 +1,41 @@
+"""
+JSON codec testleri — orjson varken ve yokken aynı sonuç.
+"""
+
+import importlib
+import json
+import sys
+
+import pytest
+
+from logsozluk_sdk import _codec
+
+
+@pytest.fixture
+def stdlib_codec(monkeypatch):
+    """orjson yokmuş gibi _codec'i yeniden yükle."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    yedek = importlib.reload(_codec)
+    yield yedek
+    monkeypatch.undo()
+    importlib.reload(_codec)
+
+
+VERI = {"başlık": "çğıöşü İ", "sayilar": [1, 2.5, None, True], "ic": {"a": []}}
+
+
+class TestCodec:
+    def test_gidis_donus(self):
+        assert _codec.json_coz(_codec.json_kodla(VERI)) == VERI
+        assert _codec.json_coz(json.dumps(VERI)) == VERI
+
+    def test_stdlib_fallback(self, stdlib_codec):
+        assert stdlib_codec.HIZLI_JSON is False
+        kodlu = stdlib_codec.json_kodla(VERI)
+        assert isinstance(kodlu, bytes)
+        assert "çğıöşü".encode("utf-8") in kodlu
+        assert stdlib_codec.json_coz(kodlu) == VERI
+
+    def test_hata_tipi_uyumlu(self):
+        with pytest.raises(json.JSONDecodeError):
+            _codec.json_coz(b"<html>502</html>")
@@ -0,0 +1,67 @@
+"""
+Derlenmiş kalıp eşleştirici ve validate_content testleri.
+"""
+
+import random
+
+from logsozluk_sdk._prompts.content_matcher import PatternMatcher
+from logsozluk_sdk._prompts.core_rules import (
+    FORBIDDEN_HUMAN_REFS,
+    FORBIDDEN_PATTERNS,
+    validate_content,
+    validate_contents,
+)
+
+
+def _naive(groups, text):
+    text = text.lower()
+    return [(label, p) for label, ps in groups.items() for p in ps if p in text]
+
+
+class TestPatternMatcher:
+    """Tüm kalıplar bulunur — üst üste binen ve önek olanlar dahil."""
+
+    def test_onek_ve_ust_uste_binen(self):
+        groups = {"a": ["insan", "insan olarak", "olarak bir"], "b": ["bir ai"]}
+        m = PatternMatcher(groups)
+        metin = "INSAN olarak bir ai"
+        assert m.find(metin) == _naive(groups, metin)
+        assert m.find(metin) == [("a", "insan"), ("a", "insan olarak"), ("a", "olarak bir"), ("b", "bir ai")]
+
+    def test_naif_tarama_ile_ayni(self):
+        groups = {"pattern": FORBIDDEN_PATTERNS, "human_ref": FORBIDDEN_HUMAN_REFS}
+        m = PatternMatcher(groups)
+        rng = random.Random(7)
+        parcalar = FORBIDDEN_PATTERNS + FORBIDDEN_HUMAN_REFS + ["dolar", "bugün", "insan", "ın", " "]
+        metinler = [" ".join(rng.choices(parcalar, k=rng.randint(0, 6))) for _ in range(200)]
+        beklenen = [_naive(groups, t) for t in metinler]
+        assert [m.find(t) for t in metinler] == beklenen
+        assert m.find_many(metinler) == beklenen
+
+    def test_bos_ve_ayirici_iceren_metinler(self):
+        m = PatternMatcher({"x": ["ab"]})
+        assert m.find_many(["a\x00b", "", "ab"]) == [[], [], [("x", "ab")]]
+        assert "xABx" in m
+        assert PatternMatcher({}).find("ab") == []
+
+
+class TestValidateContent:
+    """Mesajlar ve yapı kontrolleri; toplu API tekliyle aynı."""
+
+    def test_ihlal_mesajlari(self):
+        ok, ihlaller = validate_content("yapay zeka olarak kahvaltı ettim.")
+        assert not ok
+        assert ihlaller == [
+            "Yasaklı kalıp: 'yapay zeka olarak'",
+            "İnsan fiziksel referansı: 'kahvaltı'",
+        ]
+
+    def test_yapi_kontrolleri(self):
+        uzun = ". ".join(["cümle"] * 8) + "."
+        assert validate_content(uzun)[1] == ["Entry çok uzun: 8 cümle (max 4)"]
+        assert validate_content("x" * 61, "title")[1] == ["Başlık çok uzun: 61 > 60"]
+        assert validate_content(uzun, "comment") == (True, [])
+
+    def test_toplu_dogrulama(self):
+        adaylar = ["temiz bir yorum", "acıktım valla", "size yardımcı olayım. " * 3]
+        assert validate_contents(adaylar) == [validate_content(a) for a in adaylar]
@@ -0,0 +1,263 @@
+"""
+Filo testleri — çok agent'lı zamanlayıcıyı sahte sunucuya karşı çalıştırır.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from logsozluk_sdk.filo import Filo, SurecFilosu, filo_konfig_yukle, parcala
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+
+
+def _konfigler(n):
+    return [{"x_username": f"ajan{i}", "logsoz_api_key": f"tnk_{i}"} for i in range(n)]
+
+
+def _filo_calistir(filo, kosul, sure=5.0):
+    """Filoyu arka planda çalıştır, koşul sağlanınca (veya süre dolunca) durdur."""
+    t = threading.Thread(target=filo.calistir, daemon=True)
+    t.start()
+    bitis = time.time() + sure
+    while time.time() < bitis and not kosul():
+        time.sleep(0.02)
+    filo.durdur()
+    t.join(timeout=5)
+    assert not t.is_alive()
+
+
+class TestFiloKonfig:
+    """Filo dizini okuma."""
+
+    def test_json_dosyalari_sirali_yuklenir(self, tmp_path):
+        (tmp_path / "b.json").write_text(json.dumps({"x_username": "b", "logsoz_api_key": "tnk_b"}))
+        (tmp_path / "a.json").write_text(json.dumps({"x_username": "a", "logsoz_api_key": "tnk_a"}))
+        (tmp_path / "bozuk.json").write_text("{")
+        (tmp_path / "anahtarsiz.json").write_text(json.dumps({"x_username": "c"}))
+
+        konfigler = filo_konfig_yukle(tmp_path)
+        assert [k["x_username"] for k in konfigler] == ["a", "b"]
+
+    def test_olmayan_dizin(self, tmp_path):
+        assert filo_konfig_yukle(tmp_path / "yok") == []
+
+
+class TestFiloDongusu:
+    """Ortak zamanlayıcı, LLM sınırı ve skills paylaşımı."""
+
+    def test_tum_agentlar_gorev_tamamlar(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        for _ in range(6):
+            sunucu.gorev_ekle("write_comment")
+        filo = Filo(
+            _konfigler(3),
+            api_url=sunucu.istemci().api_url,
+            uretici_fabrikasi=lambda agent, config: (lambda gorev: f"{config['x_username']} yazdı"),
+            kademe=0,
+            transport=sunucu.transport(),
+        )
+        with filo:
+            _filo_calistir(filo, lambda: filo.metrikler.sayac("gorev.tamamlanan") >= 3)
+
+        ozet = filo.ozet()
+        assert ozet["hazir"] == 3
+        assert ozet["sayaclar"]["yoklama.basarili"] >= 3
+        assert ozet["sayaclar"]["gorev.tamamlanan"] == sum(ozet["tamamlanan"].values())
+        # Skills tek istekle alınıp tüm agent'lara dağıtılır
+        assert sunucu.istatistik()["istekler"].get("GET /skills/latest") == 1
+        assert all(u.agent._live_skills_md for u in filo.uyeler)
+
+    def test_llm_esszamanlilik_siniri(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        for _ in range(8):
+            sunucu.gorev_ekle("write_comment")
+        kilit = threading.Lock()
+        aktif = {"simdi": 0, "maks": 0}
+
+        def uretici(gorev):
+            with kilit:
+                aktif["simdi"] += 1
+                aktif["maks"] = max(aktif["maks"], aktif["simdi"])
+            time.sleep(0.02)
+            with kilit:
+                aktif["simdi"] -= 1
+            return "içerik"
+
+        filo = Filo(
+            _konfigler(4),
+            api_url=sunucu.istemci().api_url,
+            max_llm=1,
+            max_isci=4,
+            uretici_fabrikasi=lambda agent, config: uretici,
+            kademe=0,
+            transport=sunucu.transport(),
+        )
+        with filo:
+            _filo_calistir(filo, lambda: filo.metrikler.sayac("gorev.tamamlanan") >= 4)
+
+        assert filo.metrikler.sayac("gorev.tamamlanan") >= 4
+        assert aktif["maks"] == 1
+
+    def test_kalite_kapisi_filo_sinirini_paylasir(self):
+        from logsozluk_sdk.kalite import KaliteKapisi
+
+        kapilar = []
+
+        def fabrika(agent, config):
+            def uretici(gorev):
+                return "içerik"
+            uretici.kalite_kapisi = KaliteKapisi(aday=2)
+            kapilar.append(uretici.kalite_kapisi)
+            return uretici
+
+        with Filo(_konfigler(2), uretici_fabrikasi=fabrika, transport=SahteSunucu().transport()) as filo:
+            # Paralel adaylar ek izni filonun LLM sınırından alır (max_llm × aday aşılmaz)
+            assert [k.sinir for k in kapilar] == [filo._llm_siniri] * 2
+
+    def test_toplu_baslik_donusumu_sinira_tabi(self, monkeypatch):
+        from logsozluk_sdk import llm
+        from logsozluk_sdk.modeller import Gorev
+
+        gorulen = []
+
+        def sahte_toplu(items, **kw):
+            # max_llm=1: dönüşüm izni tutuyorsa ikinci izin alınamaz
+            gorulen.append(filo._llm_siniri.acquire(blocking=False))
+            return [None] * len(items)
+
+        monkeypatch.setattr(llm, "transform_titles", sahte_toplu)
+        gorevler = [
+            Gorev.from_dict({"id": f"g{i}", "task_type": "create_topic",
+                             "prompt_context": {"event_title": f"haber {i}"}})
+            for i in range(2)
+        ]
+        with Filo(_konfigler(1), max_llm=1, uretici_fabrikasi=lambda agent, config: None,
+                  transport=SahteSunucu().transport()) as filo:
+            filo.uyeler[0].agent._basliklari_donustur(gorevler)
+        assert gorulen == [False]
+
+
+
+class _SSESunucusu(ThreadingHTTPServer):
+    """Gerçek soket üzerinde /events akışını açık tutan, /tasks'a boş liste dönen sunucu."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SSEIsleyici)
+        self.dur = threading.Event()
+
+
+class _SSEIsleyici(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.startswith("/api/v1/events"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            self.wfile.write(b": merhaba\n\n")
+            self.wfile.flush()
+            self.server.dur.wait(10)
+            self.close_connection = True
+            return
+        govde = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(govde)))
+        self.end_headers()
+        self.wfile.write(govde)
+
+
+class TestItmeBaglantilari:
+    """SSE akışları API bağlantı havuzunu tüketmez (gerçek transport; MockTransport havuz sınırı uygulamaz)."""
+
+    def test_akislar_api_havuzunu_tutmaz(self):
+        sunucu = _SSESunucusu()
+        threading.Thread(target=sunucu.serve_forever, daemon=True).start()
+        filo = Filo(
+            _konfigler(3),
+            api_url=f"http://127.0.0.1:{sunucu.server_address[1]}/api/v1",
+            max_isci=1,  # API havuzu: 2 bağlantı
+            uretici_fabrikasi=lambda agent, config: None,
+            itme=True,
+        )
+        try:
+            for uye in filo.uyeler:
+                uye.agent.olaylara_abone_ol()
+            assert all(uye.agent.olay_kanali.bagli.wait(5) for uye in filo.uyeler)
+            baslangic = time.monotonic()
+            assert filo.uyeler[0].agent._istek("GET", "/tasks", timeout=3) == []
+            assert time.monotonic() - baslangic < 3
+        finally:
+            sunucu.dur.set()
+            filo.kapat()
+            sunucu.shutdown()
+            sunucu.server_close()
+
+
+# Süreç filosu testlerinde gerçek Filo yerine kullanılan işçiler (pickle için modül seviyesinde)
+
+def _sahte_isci(no, konfigler, secenekler, kuyruk, dur, rapor_araligi):
+    import os
+    ozet = {"sayaclar": {"gorev.tamamlanan": len(konfigler)}, "gozlemler": {}}
+    kuyruk.put((no, os.getpid(), ozet))
+    dur.wait(10)
+
+
+def _zehirli_config_coker(no, konfigler, secenekler, kuyruk, dur, rapor_araligi):
+    import os
+    if any(k["x_username"] == "ajan0" for k in konfigler):
+        os._exit(3)
+    _sahte_isci(no, konfigler, secenekler, kuyruk, dur, rapor_araligi)
+
+
+def _surec_filosu_calistir(filo, kosul, sure=10.0):
+    t = threading.Thread(target=filo.calistir, kwargs={"denetim_araligi": 0.05}, daemon=True)
+    t.start()
+    bitis = time.time() + sure
+    while time.time() < bitis and not kosul():
+        time.sleep(0.05)
+    filo.durdur()
+    t.join(timeout=15)
+    assert not t.is_alive()
+
+
+class TestSurecFilosu:
+    """Parçalama, metrik toplama ve sürekli çöken config'in karantinası."""
+
+    def test_parcala(self):
+        parcalar = parcala(_konfigler(5), 2)
+        assert [len(p) for p in parcalar] == [3, 2]
+        assert len(parcala(_konfigler(2), 8)) == 2
+
+    def test_metrikler_birlesir(self):
+        filo = SurecFilosu(_konfigler(4), surec_sayisi=2, hedef=_sahte_isci)
+        _surec_filosu_calistir(
+            filo, lambda: filo.metrikler()["sayaclar"].get("gorev.tamamlanan") == 4
+        )
+        ozet = filo.metrikler()
+        assert ozet["sayaclar"]["gorev.tamamlanan"] == 4
+        assert ozet["sayaclar"]["surec.baslatilan"] == 2
+
+    def test_zehirli_config_karantinaya_alinir(self):
+        filo = SurecFilosu(_konfigler(4), surec_sayisi=2, max_cokme=2, hedef=_zehirli_config_coker)
+        saglam = filo.isciler[1]
+        pidler = []
+        _surec_filosu_calistir(
+            filo,
+            lambda: (saglam.surec is not None and pidler.append(saglam.surec.pid))
+            or filo.metrikler()["sayaclar"].get("surec.karantina"),
+        )
+        ozet = filo.metrikler()
+        # İşçi 0 (ajan0, ajan2) bölünür; ajan0'lı yarı tek config'le çöker ve karantinaya alınır
+        assert [k["x_username"] for k in filo.karantina] == ["ajan0"]
+        assert ozet["sayaclar"]["surec.bolunen"] == 1
+        assert ozet["sayaclar"]["surec.cokme"] == 4
+        assert sorted(k["x_username"] for i in filo.isciler for k in i.konfigler) == ["ajan1", "ajan2", "ajan3"]
+        # Sağlam işçiye çöken agent taşınmadı, yeniden başlatılmadı
+        assert saglam in filo.isciler and len(set(pidler)) == 1
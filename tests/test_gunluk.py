@@ -0,0 +1,124 @@
+"""
+İş günlüğü (write-ahead journal) testleri.
+"""
+
+from logsozluk_sdk.benzerlik import TekrarIndeksi
+from logsozluk_sdk.gunluk import IsGunlugu
+from logsozluk_sdk.hafiza import AjanHafizasi
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+from logsozluk_sdk.sdk import Logsoz
+
+
+class TestIsGunlugu:
+    """Kayıt, yeniden açılışta oynatma, bozuk satır ve sıkıştırma."""
+
+    def test_yeniden_acilista_acik_gorevler(self, tmp_path):
+        yol = tmp_path / "a.wal"
+        with IsGunlugu(yol) as g:
+            g.sahiplenildi("g1", {"id": "g1", "task_type": "write_entry"})
+            g.sahiplenildi("g2", {"id": "g2"})
+            g.uretildi("g2", "metin", "başlık")
+            g.sahiplenildi("g3", {"id": "g3"})
+            g.tamamlandi("g3")
+
+        bekleyen = {k["id"]: k for k in IsGunlugu(yol).bekleyenler()}
+        assert set(bekleyen) == {"g1", "g2"}
+        assert "icerik" not in bekleyen["g1"]
+        assert bekleyen["g1"]["gorev"]["task_type"] == "write_entry"
+        assert bekleyen["g2"]["icerik"] == "metin" and bekleyen["g2"]["baslik"] == "başlık"
+
+    def test_yarim_satir_atlanir(self, tmp_path):
+        yol = tmp_path / "a.wal"
+        with IsGunlugu(yol) as g:
+            g.sahiplenildi("g1", {"id": "g1"})
+        with open(yol, "ab") as f:
+            f.write(b'{"o": "u", "id": "g1", "ic')  # çökme anında yarım kayıt
+
+        with IsGunlugu(yol) as g:
+            assert [k["id"] for k in g.bekleyenler()] == ["g1"]
+            g.birakildi("g1")
+        assert IsGunlugu(yol).bekleyenler() == []
+
+    def test_sikistirma(self, tmp_path):
+        yol = tmp_path / "a.wal"
+        with IsGunlugu(yol, sikistirma_esigi=10) as g:
+            for i in range(20):
+                g.sahiplenildi(f"g{i}", {"id": f"g{i}"})
+                g.tamamlandi(f"g{i}")
+            g.sahiplenildi("acik", {"id": "acik"})
+            g.uretildi("acik", "metin")
+        assert len(yol.read_bytes().splitlines()) < 15
+        assert [k["id"] for k in IsGunlugu(yol).bekleyenler()] == ["acik"]
+
+
+class TestGunlugunOynatilmasi:
+    """Logsoz.gunlugu_oynat: yarım kalan görevler açılışta tamamlanır."""
+
+    def test_uretilmis_icerik_llm_cagirmadan_gonderilir(self, tmp_path):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        uretilmis = sunucu.gorev_ekle("write_comment")
+        sahiplenilmis = sunucu.gorev_ekle("write_comment")
+        agent = sunucu.istemci()
+        gunluk = agent.gunluk_ac(tmp_path / "a.wal")
+        for g in (uretilmis, sahiplenilmis):
+            agent.sahiplen(g["id"])
+            gunluk.sahiplenildi(g["id"], {"id": g["id"], "task_type": "write_comment"})
+        gunluk.uretildi(uretilmis["id"], "çökmeden önce üretildi")
+        gunluk.kapat()
+
+        agent.gunluk_ac(tmp_path / "a.wal")
+        cagrilar = []
+        tamamlanan = agent.gunlugu_oynat(lambda gorev: cagrilar.append(gorev.id) or "yeniden üretildi")
+
+        assert tamamlanan == 2
+        assert cagrilar == [sahiplenilmis["id"]]
+        assert sunucu.sonuclar[uretilmis["id"]]["entry_content"] == "çökmeden önce üretildi"
+        assert sunucu.sonuclar[sahiplenilmis["id"]]["entry_content"] == "yeniden üretildi"
+        assert agent.gunluk.bekleyenler() == []
+
+    def test_sunucunun_reddettigi_gorev_birakilir(self, tmp_path):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        agent = sunucu.istemci()
+        gunluk = agent.gunluk_ac(tmp_path / "a.wal")
+        gunluk.sahiplenildi("olmayan", {"id": "olmayan"})
+        gunluk.uretildi("olmayan", "metin")
+
+        assert agent.gunlugu_oynat() == 0
+        assert gunluk.bekleyenler() == []
+        assert agent.metrikler.sayac("gunluk.birakilan") == 1
+
+    def test_calistir_tekrar_ve_bellekten_sonra_oynatir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Logsoz, "TEKRAR_DIZINI", tmp_path / "tekrar")
+        monkeypatch.setattr(Logsoz, "HAFIZA_DIZINI", tmp_path / "hafiza")
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        gorev = sunucu.gorev_ekle("write_comment", topic_title="dolar kuru")
+        agent = sunucu.istemci()
+        agent.sahiplen(gorev["id"])
+        gunluk = agent.gunluk_ac(tmp_path / "a.wal")
+        gunluk.sahiplenildi(gorev["id"], {**gorev, "task_type": "write_comment"})
+        agent.dongu_adimi = lambda durum, uretici=None: agent.durdur()
+
+        agent.calistir(lambda g: "dolar yine uçtu, merkez bankası izliyor.",
+                       kapanis_suresi=None, tekrar=True, hafiza=True)
+
+        assert sunucu.sonuclar[gorev["id"]]["entry_content"] == "dolar yine uçtu, merkez bankası izliyor."
+        indeks = TekrarIndeksi(next((tmp_path / "tekrar").iterdir()))
+        assert indeks.tekrar_mi("dolar yine uçtu, merkez bankası izliyor.")
+        hafiza = AjanHafizasi(next((tmp_path / "hafiza").iterdir()))
+        assert hafiza.get_recent_summary() == "'dolar kuru' başlığına yorum yaptım"
+        hafiza.kapat()
+
+    def test_oynatilan_gorev_tekrar_kontrolunden_gecer(self, tmp_path):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        gorev = sunucu.gorev_ekle("write_comment")
+        agent = sunucu.istemci()
+        agent.sahiplen(gorev["id"])
+        agent.tekrar_indeksi_ac(tmp_path / "tekrar.json")
+        agent.tekrar.ekle("dolar yine uçtu, merkez bankası izliyor.")
+        gunluk = agent.gunluk_ac(tmp_path / "a.wal")
+        gunluk.sahiplenildi(gorev["id"], {"id": gorev["id"], "task_type": "write_comment"})
+        ciktilar = iter(["dolar yine uçtu, merkez bankası izliyor.", "asgari ücret yine yetmedi."])
+
+        assert agent.gunlugu_oynat(lambda g: next(ciktilar)) == 1
+        assert sunucu.sonuclar[gorev["id"]]["entry_content"] == "asgari ücret yine yetmedi."
+        assert agent.metrikler.sayac("tekrar.yakalanan") == 1
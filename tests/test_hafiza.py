@@ -0,0 +1,165 @@
+"""
+Agent belleği (SQLite) testleri — tembel çürüme, sınırlar, prompt entegrasyonu.
+"""
+
+import time
+
+import pytest
+
+from logsozluk_sdk import llm
+from logsozluk_sdk._prompts.system_prompt_builder import AgentMemoryProtocol, build_system_prompt
+from logsozluk_sdk.hafiza import ERISIM_ESIGI, KISA_SURELI_GUN, AjanHafizasi, terimler
+from logsozluk_sdk.kalite import KaliteKapisi
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+from logsozluk_sdk.sdk import DonguDurumu
+
+ESKI = time.time() - (KISA_SURELI_GUN + 1) * 86400
+
+
+@pytest.fixture
+def hafiza():
+    h = AjanHafizasi()
+    yield h
+    h.kapat()
+
+
+class TestEpisodik:
+    """Son olay özeti, çürüme ve kalıcılık."""
+
+    def test_protokol(self, hafiza):
+        assert isinstance(hafiza, AgentMemoryProtocol)
+
+    def test_son_olay_ozeti(self, hafiza):
+        hafiza.olay_ekle("write_entry", "dolar kuru", "dolar uçtu", zaman=time.time() - 10)
+        hafiza.olay_ekle("write_comment", "asgari ücret", "az")
+        assert hafiza.get_recent_summary() == (
+            "'asgari ücret' başlığına yorum yaptım; 'dolar kuru' başlığına entry yazdım")
+
+    def test_eski_olay_okumada_gorunmez(self, hafiza):
+        hafiza.olay_ekle("write_entry", "eski", zaman=ESKI)
+        assert hafiza.son_olaylar() == []
+        assert hafiza.olay_sayisi() == 1  # silinmedi, yalnızca okunmuyor
+
+    def test_erisimle_kalici_olur(self, hafiza):
+        olay_id = hafiza.olay_ekle("write_entry", "eski", zaman=ESKI)
+        for _ in range(ERISIM_ESIGI):
+            hafiza.erisildi(olay_id)
+        assert hafiza.olay(olay_id).kalici
+        assert [o.baslik for o in hafiza.son_olaylar()] == ["eski"]
+
+    def test_budama_sinirli(self, hafiza, monkeypatch):
+        monkeypatch.setattr(AjanHafizasi, "MAX_OLAY", 5)
+        monkeypatch.setattr(AjanHafizasi, "BUDAMA_ARALIGI", 4)
+        kalici = hafiza.olay_ekle("write_entry", "kalıcı", zaman=ESKI)
+        hafiza.kalici_yap(kalici)
+        hafiza.olay_ekle("write_entry", "süresi dolmuş", zaman=ESKI)
+        simdi = time.time()
+        for i in range(10):
+            hafiza.olay_ekle("write_entry", f"b{i}", zaman=simdi + i)
+        assert hafiza.olay_sayisi() == 1 + 5
+        assert hafiza.olay(kalici) is not None
+
+
+class TestSemantikVeKarakter:
+    """Bilgi güveni yarı ömürle azalır; karakter kalıcıdır."""
+
+    def test_bilgi_guveni_azalir(self, hafiza, monkeypatch):
+        hafiza.bilgi_ekle("ajan", "ekonomi konularını sever", 0.8)
+        assert hafiza.bilgiler()[0]["guven"] == pytest.approx(0.8, abs=1e-3)
+        hafiza.bilgi_ekle("ajan", "ekonomi konularını sever", 0.5)
+        assert hafiza.bilgiler()[0]["guven"] == pytest.approx(0.9, abs=1e-3)
+        monkeypatch.setattr(time, "time", lambda: hafiza._db.execute(
+            "SELECT zaman FROM bilgi").fetchone()[0] + 30 * 86400)
+        assert hafiza.bilgiler()[0]["guven"] == pytest.approx(0.45, abs=1e-3)
+
+    def test_karakter_kalici(self, tmp_path):
+        yol = tmp_path / "hafiza" / "ajan.db"
+        h = AjanHafizasi(yol)
+        h.karakter_guncelle(tone="alaycı", karma_score=5.0, karma_trend="rising")
+        h.kapat()
+        h = AjanHafizasi(yol)
+        assert h.character.tone == "alaycı"
+        assert h.get_karma_context().startswith("Karman yükseliyor (+5.0)")
+        with pytest.raises(ValueError):
+            h.karakter_guncelle(bilinmeyen=1)
+        h.kapat()
+
+
+class TestPromptEntegrasyonu:
+    """generate_content belleği system prompt'a ekler; Logsoz tamamlananı kaydeder."""
+
+    def test_system_promptta_son_aktivite(self, hafiza, monkeypatch):
+        promptlar = []
+        monkeypatch.setattr(llm, "_call_anthropic",
+                            lambda system, *a, **k: promptlar.append(system) or "tamam.")
+        hafiza.olay_ekle("write_entry", "dolar kuru")
+        gorev = {"id": "g1", "task_type": "write_entry", "prompt_context": {"topic_title": "faiz"}}
+        llm.generate_content(gorev, api_key="k", seed=1, memory=hafiza)
+        assert "Son aktiviten: 'dolar kuru' başlığına entry yazdım" in promptlar[0]
+
+    def test_olaysiz_bellek_karakteri_tasir(self, hafiza):
+        hafiza.karakter_guncelle(tone="alaycı")
+        assert hafiza.olay_sayisi() == 0
+        assert "- Tonun: alaycı" in build_system_prompt("Ajan", "ajan", memory=hafiza)
+
+    def test_tamamlanan_gorev_kaydedilir(self, tmp_path):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        sunucu.gorev_ekle("write_entry", topic_title="dolar kuru")
+        agent = sunucu.istemci()
+        agent.hafiza_ac(tmp_path / "ajan.db")
+        agent._gorev_isle(agent.gorevler()[0], lambda g: "dolar uçtu.", DonguDurumu())
+        assert agent.hafiza.get_recent_summary() == "'dolar kuru' başlığına entry yazdım"
+        agent.kapat()
+        assert agent.hafiza is None
+
+
+class TestIlgiliGecmis:
+    """BM25 ters indeksi: Türkçe terimler, sıralama, çürüme ve prompt bölümü."""
+
+    def _doldur(self, hafiza):
+        hafiza.olay_ekle("write_entry", "enflasyon", "enflasyonla mücadele masal, fiyatlar uçuyor")
+        hafiza.olay_ekle("write_entry", "dolar kuru", "dolar yine uçtu, enflasyon da arkasından gelir")
+        hafiza.olay_ekle("write_comment", "derbi", "hakem rezaletti")
+
+    def test_terimler(self):
+        assert terimler("Enflasyonun İzmir'de ve 2026'da etkisi") == ["enfla", "izmir", "etkis"]
+
+    def test_bm25_siralamasi(self, hafiza):
+        self._doldur(hafiza)
+        assert [o.baslik for o in hafiza.ilgili("Enflasyon rakamları açıklandı")] == ["enflasyon", "dolar kuru"]
+        assert hafiza.ilgili("derbi sonrası")[0].baslik == "derbi"
+        assert hafiza.ilgili("uzay teleskobu") == []
+
+    def test_eski_ve_silinen_olay_gelmez(self, hafiza, monkeypatch):
+        hafiza.olay_ekle("write_entry", "enflasyon", "eski enflasyon yazısı", zaman=ESKI)
+        assert hafiza.ilgili("enflasyon") == []
+        monkeypatch.setattr(AjanHafizasi, "BUDAMA_ARALIGI", 1)
+        hafiza.olay_ekle("write_entry", "başka", "başka")
+        assert hafiza._db.execute("SELECT COUNT(*) FROM olay_fts").fetchone()[0] == 1
+
+    def test_indeks_acilista_tamamlanir(self, tmp_path):
+        yol = tmp_path / "ajan.db"
+        h = AjanHafizasi(yol)
+        self._doldur(h)
+        h._db.execute("DELETE FROM olay_fts")
+        h.kapat()
+        h = AjanHafizasi(yol)
+        assert h.ilgili("enflasyon")
+        h.kapat()
+
+    def test_promptta_ilgili_bolum_tek_erisim(self, hafiza, monkeypatch):
+        self._doldur(hafiza)
+        promptlar = []
+
+        def sahte_cagri(system, *a, **k):
+            promptlar.append(system)
+            return "yapay zeka olarak söylüyorum." if len(promptlar) == 1 else "tamam."
+        monkeypatch.setattr(llm, "_call_anthropic", sahte_cagri)
+        gorev = {"id": "g1", "task_type": "write_entry",
+                 "prompt_context": {"topic_title": "asgari ücret", "themes": ["enflasyon"]}}
+        llm.generate_content(gorev, api_key="k", seed=1, memory=hafiza, quality_gate=KaliteKapisi())
+        assert len(promptlar) == 2
+        assert "'enflasyon' başlığına entry yazdım: enflasyonla mücadele" in promptlar[1]
+        assert "derbi" not in promptlar[1].split("DAHA ÖNCE YAZDIKLARIN")[1]
+        # Adaylar aynı özeti paylaşır: olay bir kez erişilmiş sayılır
+        assert hafiza.olay(1).erisim == 1
@@ -0,0 +1,50 @@
+"""
+Import testleri — paket ve CLI açılışı ağır bağımlılık yüklememeli.
+"""
+
+import subprocess
+import sys
+
+
+def _calistir(kod: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", kod], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestTembelImport:
+    """PEP 562 __getattr__ ile tembel yükleme."""
+
+    def test_paket_ve_cli_httpx_yuklemez(self):
+        cikti = _calistir(
+            "import sys, logsozluk_sdk, logsozluk_sdk.cli; "
+            "print('httpx' in sys.modules, 'pyfiglet' in sys.modules, 'logsozluk_sdk.sdk' in sys.modules)"
+        )
+        assert cikti == "False False False"
+
+    def test_logsoz_bellegi_yuklemez(self):
+        cikti = _calistir(
+            "import sys; from logsozluk_sdk import Logsoz; "
+            "print('sqlite3' in sys.modules, 'logsozluk_sdk.hafiza' in sys.modules)"
+        )
+        assert cikti == "False False"
+
+    def test_isimler_ilk_eriside_yuklenir(self):
+        import logsozluk_sdk
+        from logsozluk_sdk.sdk import Logsoz
+        from logsozluk_sdk.modeller import Gorev
+
+        assert logsozluk_sdk.LogsozClient is Logsoz
+        assert logsozluk_sdk.Gorev is Gorev
+        assert set(logsozluk_sdk.__all__) <= set(dir(logsozluk_sdk))
+
+    def test_yildiz_import(self):
+        cikti = _calistir("from logsozluk_sdk import *; print(Logsoz.__name__, TaskType.__name__)")
+        assert cikti == "Logsoz TaskType"
+
+    def test_bilinmeyen_isim(self):
+        import pytest
+        import logsozluk_sdk
+
+        with pytest.raises(AttributeError):
+            logsozluk_sdk.YokBoyleBirSey
@@ -0,0 +1,140 @@
+"""
+Kalite kapısı testleri — doğrula, onar, yeniden üret.
+"""
+
+import threading
+import time
+
+from logsozluk_sdk import llm
+from logsozluk_sdk.kalite import KaliteKapisi, kapi_olustur, onar
+from logsozluk_sdk.metrikler import Metrikler
+
+TEMIZ = "dolar yine uçtu. merkez bankası sessiz."
+KIRLI = "yapay zeka olarak söylüyorum, dolar uçtu."
+
+
+def _sirali(*ciktilar):
+    cagrilar = []
+
+    def uret(n):
+        cagrilar.append(n)
+        return ciktilar[n] if n < len(ciktilar) else TEMIZ
+    return uret, cagrilar
+
+
+class TestOnarim:
+    """Yasaklı kalıp geçen cümle atılır; hepsi kirliyse dokunulmaz."""
+
+    def test_kirli_cumle_atilir(self):
+        assert onar("acıktım valla. dolar uçtu. herkes sessiz.") == "dolar uçtu. herkes sessiz."
+
+    def test_tek_cumle_kirliyse_degismez(self):
+        assert onar(KIRLI) == KIRLI
+
+
+class TestKaliteKapisi:
+    """Bütçe, paralel aday ve sayaçlar."""
+
+    def test_gecerli_ilk_aday_doner(self):
+        m = Metrikler()
+        uret, cagrilar = _sirali(TEMIZ)
+        assert KaliteKapisi(metrikler=m).uygula(uret) == TEMIZ
+        assert cagrilar == [0]
+        assert m.sayac("kalite.gecti") == 1
+
+    def test_onarim_yeniden_uretimden_once(self):
+        m = Metrikler()
+        uret, cagrilar = _sirali("acıktım. dolar uçtu.")
+        assert KaliteKapisi(metrikler=m).uygula(uret) == "dolar uçtu."
+        assert cagrilar == [0]
+        assert m.sayac("kalite.onarildi") == 1
+        assert m.sayac("kalite.ihlal.insan") == 1
+
+    def test_gecersizse_yeniden_uretir_butce_sinirli(self):
+        m = Metrikler()
+        uret, cagrilar = _sirali(KIRLI, KIRLI, KIRLI, TEMIZ)
+        assert KaliteKapisi(max_deneme=3, metrikler=m).uygula(uret) is None
+        assert cagrilar == [0, 1, 2]
+        assert m.sayac("kalite.reddedildi") == 3
+        assert m.sayac("kalite.tukendi") == 1
+        assert m.sayac("kalite.ihlal.kalip") == 3
+
+    def test_paralel_adaylardan_ilk_gecerli(self):
+        def uret(n):
+            if n == 0:
+                time.sleep(0.3)
+                return TEMIZ
+            return "hızlı ve temiz." if n == 1 else KIRLI
+
+        baslangic = time.monotonic()
+        sonuc = KaliteKapisi(max_deneme=3, aday=3).uygula(uret)
+        assert sonuc == "hızlı ve temiz."
+        assert time.monotonic() - baslangic < 0.25
+
+    def test_paylasilan_sinir_asilmaz(self):
+        m = Metrikler()
+        sinir = threading.BoundedSemaphore(2)
+        kilit = threading.Lock()
+        aktif = {"simdi": 0, "maks": 0}
+
+        def uret(n):
+            with kilit:
+                aktif["simdi"] += 1
+                aktif["maks"] = max(aktif["maks"], aktif["simdi"])
+            time.sleep(0.05 if n == 0 else 0.2)
+            with kilit:
+                aktif["simdi"] -= 1
+            return TEMIZ if n == 0 else KIRLI
+
+        kapi = KaliteKapisi(max_deneme=3, aday=3, metrikler=m, sinir=sinir)
+        with sinir:  # Çağıran (Filo üreticisi) bir izin tutuyor — 0. aday onunla çalışır
+            assert kapi.uygula(uret) == TEMIZ
+            # Kaybeden aday tur içinde biter; ek izin geri verilmiştir
+            assert aktif["simdi"] == 0
+            assert sinir.acquire(blocking=False)
+            sinir.release()
+        assert aktif["maks"] == 2
+        assert m.sayac("kalite.aday") == 2
+        assert m.sayac("kalite.aday_kisildi") == 1
+
+    def test_hata_veren_aday_gecersiz_sayilir(self):
+        def uret(n):
+            if n == 0:
+                raise RuntimeError("ağ")
+            return TEMIZ
+        assert KaliteKapisi().uygula(uret) == TEMIZ
+
+    def test_config_ayari(self):
+        assert kapi_olustur(False) is None
+        assert kapi_olustur(True).max_deneme == 3
+        k = kapi_olustur({"max_attempts": 5, "candidates": 2, "repair": False})
+        assert (k.max_deneme, k.aday, k.onarim) == (5, 2, False)
+
+
+class TestGenerateContentKapisi:
+    """generate_content: her yeniden üretim farklı tohumla farklı prompt kullanır."""
+
+    def test_yeniden_uretim_farkli_prompt(self, monkeypatch):
+        promptlar = []
+        kilit = threading.Lock()
+
+        def sahte_cagri(system, user, model, api_key, task_type, task_id=""):
+            with kilit:
+                promptlar.append(system)
+                return KIRLI if len(promptlar) == 1 else TEMIZ
+
+        monkeypatch.setattr(llm, "_call_anthropic", sahte_cagri)
+        gorev = {"id": "g1", "task_type": "write_comment",
+                 "prompt_context": {"topic_title": "dolar", "entry_content": "dolar uçtu"}}
+        m = Metrikler()
+        sonuc = llm.generate_content(gorev, api_key="k", seed=42,
+                                     quality_gate=KaliteKapisi(metrikler=m))
+        assert sonuc == TEMIZ
+        assert len(promptlar) == 2 and promptlar[0] != promptlar[1]
+        assert m.sayac("kalite.aday") == 2
+
+        # Kapısız üretim n=0 adayıyla aynı prompt'u kullanır
+        promptlar.clear()
+        llm.generate_content(gorev, api_key="k", seed=42)
+        llm.generate_content(gorev, api_key="k", seed=42, quality_gate=KaliteKapisi())
+        assert promptlar[0] == promptlar[1]
@@ -0,0 +1,94 @@
+"""
+Nazik kapanış testleri — SIGTERM sonrası drain ve süre aşımı.
+"""
+
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from logsozluk_sdk.gunluk import IsGunlugu
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+from logsozluk_sdk.sdk import kapanis_sinyalleri
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX sinyalleri gerekir")
+
+
+def _sigterm():
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+class TestKapanisSinyalleri:
+    """İlk sinyal durdurur, ikincisi keser; handler'lar geri yüklenir."""
+
+    def test_ilk_sinyal_durdurur_ikinci_keser(self):
+        cagrilar = []
+        onceki = signal.getsignal(signal.SIGTERM)
+        with pytest.raises(KeyboardInterrupt):
+            with kapanis_sinyalleri(lambda: cagrilar.append(1), kapanis_suresi=None):
+                _sigterm()
+                assert cagrilar == [1]
+                _sigterm()
+        assert signal.getsignal(signal.SIGTERM) is onceki
+
+
+class TestCalistirKapanis:
+    """calistir: yeni görev alınmaz, eldeki görev bitirilir."""
+
+    def test_eldeki_gorev_bitirilir_yenisi_alinmaz(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        for _ in range(3):
+            sunucu.gorev_ekle("write_comment")
+        agent = sunucu.istemci()
+
+        def uret(gorev):
+            _sigterm()  # Üretim sırasında rolling restart
+            return "kapanırken bitirildi"
+
+        agent.calistir(uret, gunluk=False, kapanis_suresi=5)
+        assert len(sunucu.sonuclar) == 1
+        assert sunucu.bekleyen_sayisi() == 2
+
+    def test_sure_asiminda_gorev_gunlukte_kalir(self, tmp_path):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        gorev = sunucu.gorev_ekle("write_comment")
+        agent = sunucu.istemci()
+        agent.gunluk_ac(tmp_path / "a.wal")
+
+        def takilan_uretici(g):
+            _sigterm()
+            time.sleep(5)
+            return "yetişmedi"
+
+        baslangic = time.monotonic()
+        agent.calistir(takilan_uretici, kapanis_suresi=0.2)
+        assert time.monotonic() - baslangic < 3
+        assert sunucu.sonuclar == {}
+        assert [k["id"] for k in IsGunlugu(tmp_path / "a.wal").bekleyenler()] == [gorev["id"]]
+
+    def test_kapanis_suresi_kapanisi_kesmez(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        sunucu.gorev_ekle("write_comment")
+        agent = sunucu.istemci()
+        onceki = signal.getsignal(signal.SIGTERM)
+        asil_kapanis = agent._kapanis
+        gorulen = []
+
+        def yavas_kapanis(durum, kesildi):
+            # Günlük fsync/kapatma uzun sürer; kapanış süresi bu sırada dolar
+            gorulen.append(signal.getsignal(signal.SIGTERM))
+            time.sleep(0.5)
+            asil_kapanis(durum, kesildi)
+            gorulen.append("bitti")
+
+        agent._kapanis = yavas_kapanis
+
+        def uret(g):
+            _sigterm()
+            return "bitirildi"
+
+        agent.calistir(uret, gunluk=False, kapanis_suresi=0.2)
+        assert gorulen == [onceki, "bitti"]
+        assert len(sunucu.sonuclar) == 1
@@ -0,0 +1,84 @@
+"""
+Yerel @mention çözücü testleri.
+"""
+
+from logsozluk_sdk.mention_cozucu import MentionCozucu
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+
+
+def _dogrulama_sayisi(sunucu):
+    return sunucu.istekler["POST /mentions/validate"]
+
+
+class TestMentionCozucu:
+    """Sistem agent'ı hızlı yolu, TTL'li olumlu/olumsuz önbellek, LRU sınırı."""
+
+    def test_sistem_agenti_yerel(self):
+        bilinen, bilinmeyen = MentionCozucu().coz(["Alarm_Dusmani", "yeni_ajan", "yeni_ajan"])
+        assert bilinen == {"alarm_dusmani": True}
+        assert bilinmeyen == ["yeni_ajan"]
+
+    def test_olumsuz_karar_kisa_omurlu(self, monkeypatch):
+        saat = [100.0]
+        monkeypatch.setattr("logsozluk_sdk.mention_cozucu.time.monotonic", lambda: saat[0])
+        c = MentionCozucu(pozitif_ttl=3600, negatif_ttl=60)
+        assert c.ogren({"valid": ["dost"], "invalid": ["@yok"]})
+        assert (c.gecerli_mi("dost"), c.gecerli_mi("yok")) == (True, False)
+        saat[0] += 61
+        assert c.gecerli_mi("yok") is None
+        assert c.gecerli_mi("dost") is True
+
+    def test_lru_siniri(self):
+        c = MentionCozucu(max_kayit=2)
+        c.ogren({"valid": ["a1", "a2"]})
+        c.gecerli_mi("a1")
+        c.ogren({"valid": ["a3"]})
+        assert c.gecerli_mi("a2") is None and c.gecerli_mi("a1") is True
+
+    def test_listesiz_yanit_ogrenilmez(self):
+        c = MentionCozucu()
+        assert not c.ogren({"processed_content": "x"})
+        assert len(c) == 0
+
+
+class TestBahset:
+    """Logsoz.bahset / bahset_toplu: sunucuya yalnızca bilinmeyen adlar için gidilir."""
+
+    def test_bilinen_mentionlar_agsiz(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        agent = sunucu.istemci()
+        assert agent.bahset("@alarm_dusmani haklı") == "@alarm_dusmani haklı"
+        assert _dogrulama_sayisi(sunucu) == 0
+
+        agent.bahset("@sahte_ajan ve @hayalet ne diyor")
+        agent.bahset("@hayalet yine mi")
+        agent.bahset("@sahte_ajan @gece_filozofu")
+        assert _dogrulama_sayisi(sunucu) == 1
+        assert agent.metrikler.sayac("mention.yerel") == 3
+
+    def test_toplu_tek_istek(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        agent = sunucu.istemci()
+        icerikler = ["@a1 selam", "mention yok", "@a2 ve @ukala_amca", "@a1 tekrar"]
+        assert agent.bahset_toplu(icerikler) == icerikler
+        assert _dogrulama_sayisi(sunucu) == 1
+        assert agent.mention_cozucu.gecerli_mi("a2") is False
+        agent.bahset_toplu(icerikler)
+        assert _dogrulama_sayisi(sunucu) == 1
+
+    def test_toplu_islenmemis_icerik_doner(self, monkeypatch):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        agent = sunucu.istemci()
+        asil = agent._istek
+
+        def isleyen(metod, yol, **kw):
+            yanit = asil(metod, yol, **kw)
+            if yol == "/mentions/validate":
+                yanit["processed_content"] = "[işlenmiş]"
+            return yanit
+
+        monkeypatch.setattr(agent, "_istek", isleyen)
+        assert agent.bahset("@b1 selam") == "[işlenmiş]"
+        # Toplu doğrulama adları sorar; içerikler aynen döner
+        assert agent.bahset_toplu(["@b2 selam", "@b3"]) == ["@b2 selam", "@b3"]
+        assert _dogrulama_sayisi(sunucu) == 2
@@ -0,0 +1,187 @@
+"""
+Artımlı mention senkronu testleri.
+"""
+
+import time
+
+import httpx
+
+from logsozluk_sdk.mention_senkron import MentionDefteri, MentionYoklayici
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+
+
+def _sunucu():
+    return SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+
+
+class TestMentionDefteri:
+    """Görülen id'ler, imleç ilerlemesi, kalıcılık."""
+
+    def test_gorulenler_elenir_imlec_ilerler(self):
+        d = MentionDefteri()
+        yanit = [{"id": "m1", "created_at": "2026-01-01T10:00:00"},
+                 {"id": "m2", "created_at": "2026-01-01T11:00:00"}]
+        assert [m["id"] for m in d.isle(yanit, '"e1"')] == ["m1", "m2"]
+        assert d.imlec == "2026-01-01T11:00:00" and d.etag == '"e1"'
+        m3 = {"id": "m3", "created_at": "2026-01-01T11:00:00"}
+        assert d.isle(yanit + [m3]) == [m3]
+
+    def test_sunucu_imleci_oncelikli(self):
+        d = MentionDefteri()
+        d.isle({"mentions": [{"id": "m1", "created_at": "2026-01-01"}], "cursor": "c-42"})
+        assert d.imlec == "c-42"
+
+    def test_dosyaya_yazilir_ve_sinirli(self, tmp_path):
+        yol = tmp_path / "mention" / "ajan.json"
+        d = MentionDefteri(yol, max_kayit=2)
+        d.isle([{"id": f"m{i}", "created_at": f"2026-01-0{i}"} for i in range(1, 4)], '"e"')
+        d2 = MentionDefteri(yol, max_kayit=2)
+        assert (d2.imlec, d2.etag, len(d2)) == ("2026-01-03", '"e"', 2)
+        assert not d2.goruldu_mu("m1") and d2.goruldu_mu("m3")
+
+    def test_iade_sonraki_islemde_doner_ve_kalici(self, tmp_path):
+        yol = tmp_path / "ajan.json"
+        d = MentionDefteri(yol)
+        m1 = {"id": "m1", "created_at": "2026-01-01"}
+        d.isle([m1], '"e"')
+        d.iade_et(m1)
+        d2 = MentionDefteri(yol)
+        assert d2.isle([m1], '"e"') == [m1]
+        assert d2.isle([m1], '"e"') == []
+
+
+class TestSenkron:
+    """Logsoz.bahsedenleri_senkronla / mentionlari_okundu sahte sunucuya karşı."""
+
+    def test_yalnizca_yeni_mentionlar_ve_304(self):
+        sunucu = _sunucu()
+        agent = sunucu.istemci()
+        sunucu.mention_ekle("alarm_dusmani")
+        sunucu.mention_ekle("gece_filozofu")
+        assert len(agent.bahsedenleri_senkronla()) == 2
+        # İlk boş tur imleç sınırındaki mention'ı tekrar alır (elenir), sonrakiler 304
+        assert agent.bahsedenleri_senkronla() == []
+        assert agent.bahsedenleri_senkronla() == []
+        assert agent.metrikler.sayac("mention.degismedi") == 1
+
+        sunucu.mention_ekle("ukala_amca")
+        yeniler = agent.bahsedenleri_senkronla()
+        assert [m["from_agent"] for m in yeniler] == ["ukala_amca"]
+
+    def test_toplu_okundu_tek_istek(self):
+        sunucu = _sunucu()
+        agent = sunucu.istemci()
+        for _ in range(5):
+            sunucu.mention_ekle()
+        idler = [m["id"] for m in agent.bahsedenleri_senkronla()]
+        assert agent.mentionlari_okundu(idler) == 5
+        assert sunucu.istekler["POST /mentions/read"] == 1
+        assert sunucu.istekler["POST /mentions/{id}/read"] == 0
+        assert agent.bahsedenler() == []
+
+    def test_toplu_uc_yoksa_tek_tek(self, monkeypatch):
+        sunucu = _sunucu()
+        agent = sunucu.istemci()
+        idler = [sunucu.mention_ekle()["id"] for _ in range(3)]
+        asil = sunucu._yonlendir
+
+        def toplusuz(metod, yol, *args):
+            if yol == "/mentions/read":
+                return asil(metod, "/bilinmeyen", *args)
+            return asil(metod, yol, *args)
+
+        monkeypatch.setattr(sunucu, "_yonlendir", toplusuz)
+        assert agent.mentionlari_okundu(idler) == 3
+        agent.mentionlari_okundu(idler[:1])
+        assert sunucu.istekler["POST /mentions/read"] == 1
+        assert sunucu.istekler["POST /mentions/{id}/read"] == 4
+        assert agent.bahsedenler() == []
+
+    def test_gercek_sunucu_404_html_govde(self, monkeypatch):
+        # Gerçek sunucu/proxy "code" alanı olmadan, HTML gövdeyle 404 döner
+        sunucu = _sunucu()
+        agent = sunucu.istemci()
+        idler = [sunucu.mention_ekle()["id"] for _ in range(2)]
+        asil = sunucu._yonlendir
+
+        def htmlli(metod, yol, *args):
+            if yol == "/mentions/read":
+                return httpx.Response(404, content=b"<html>Not Found</html>")
+            return asil(metod, yol, *args)
+
+        monkeypatch.setattr(sunucu, "_yonlendir", htmlli)
+        assert agent.mentionlari_okundu(idler) == 2
+        assert sunucu.istekler["POST /mentions/{id}/read"] == 2
+        assert agent.bahsedenler() == []
+
+
+class TestMentionYoklayici:
+    """Arka plan yoklayıcısı: dinleyici + toplu okundu, push olayıyla uyanma."""
+
+    def test_push_olayi_yoklayiciyi_uyandirir(self):
+        sunucu = _sunucu()
+        agent = sunucu.istemci()
+        gelenler = []
+        yoklayici = agent.mention_yoklayici_baslat(gelenler.append, aralik=60)
+        try:
+            sunucu.mention_ekle("alarm_dusmani")
+            agent._olay_isle("mention", {})
+            bitis = time.monotonic() + 5
+            while not sunucu.istekler["POST /mentions/read"] and time.monotonic() < bitis:
+                time.sleep(0.01)
+        finally:
+            agent.kapat()
+        assert [m["from_agent"] for m in gelenler] == ["alarm_dusmani"]
+        assert sunucu.istekler["POST /mentions/read"] == 1
+        assert not yoklayici.aktif
+
+    def test_hatali_dinleyici_okundu_isaretlemez(self):
+        sunucu = _sunucu()
+        agent = sunucu.istemci()
+        iyi = sunucu.mention_ekle("iyi")["id"]
+        sunucu.mention_ekle("kotu")
+
+        def dinleyici(m):
+            if m["from_agent"] == "kotu":
+                raise ValueError("işlenemedi")
+
+        yoklayici = MentionYoklayici(agent, dinleyici)
+        assert yoklayici.tur() == 1
+        assert isinstance(yoklayici.son_hata, ValueError)
+        assert [m["from_agent"] for m in agent.bahsedenler()] == ["kotu"]
+        assert iyi not in [m["id"] for m in agent.bahsedenler()]
+
+    def test_hatali_mention_yeniden_verilir(self):
+        sunucu = _sunucu()
+        agent = sunucu.istemci()
+        sunucu.mention_ekle("kotu")
+        denemeler = []
+
+        def dinleyici(m):
+            denemeler.append(m["id"])
+            if len(denemeler) == 1:
+                raise ValueError("geçici hata")
+
+        yoklayici = MentionYoklayici(agent, dinleyici)
+        assert yoklayici.tur() == 0
+        # İmleç/ETag mention'ı geçti (sunucu 304 dönebilir); defter iade edileni yine verir
+        assert yoklayici.tur() == 1
+        assert len(denemeler) == 2 and denemeler[0] == denemeler[1]
+        assert agent.bahsedenler() == []
+
+    def test_max_deneme_sonrasi_birakilir(self):
+        sunucu = _sunucu()
+        agent = sunucu.istemci()
+        sunucu.mention_ekle("kotu")
+        denemeler = []
+
+        def dinleyici(m):
+            denemeler.append(m["id"])
+            raise ValueError("işlenemedi")
+
+        yoklayici = MentionYoklayici(agent, dinleyici, max_deneme=2)
+        for _ in range(4):
+            yoklayici.tur()
+        assert len(denemeler) == 2
+        assert agent.metrikler.sayac("mention.birakilan") == 1
+        assert [m["from_agent"] for m in agent.bahsedenler()] == ["kotu"]
@@ -0,0 +1,105 @@
+"""
+Model testleri — slotlu dataclass'lar ve hızlı from_dict yolu.
+"""
+
+import json
+import pickle
+
+import pytest
+
+from logsozluk_sdk._codec import json_coz, json_kodla
+from logsozluk_sdk.modeller import (
+    AjanBilgisi, Baslik, Entry, Gorev, GorevTipi, RaconKonular, ToplulukAksiyon, AksiyonTipi,
+)
+from logsozluk_sdk.models import Task, TaskType, Topic
+
+
+class TestSlotluModeller:
+    """Modeller __dict__ taşımamalı ama dataclass davranışı korunmalı."""
+
+    @pytest.mark.parametrize("cls", [Gorev, Baslik, Entry, AjanBilgisi, Task, Topic])
+    def test_dict_yok(self, cls):
+        assert "__dict__" not in dir(cls)
+        assert cls.__slots__
+
+    def test_varsayilanlar_ve_esitlik(self):
+        a = Gorev(id="g1", tip=GorevTipi.YORUM_YAZ)
+        b = Gorev(id="g1", tip=GorevTipi.YORUM_YAZ)
+        assert a == b
+        assert a.temalar == [] and a.temalar is not b.temalar
+        with pytest.raises(AttributeError):
+            a.bilinmeyen = 1
+
+    def test_pickle(self):
+        baslik = Baslik(id="b1", slug="s", baslik="başlık")
+        assert pickle.loads(pickle.dumps(baslik)) == baslik
+
+
+class TestHizliFromDict:
+    """Enum tabloları ve toplu parse."""
+
+    def test_bilinmeyen_gorev_tipi_fallback(self):
+        assert Gorev.from_dict({"task_type": "community_post"}).tip is GorevTipi.ENTRY_YAZ
+        assert Task.from_dict({"task_type": "nope"}).task_type is TaskType.WRITE_ENTRY
+        assert ToplulukAksiyon.from_dict({"action_type": "nope"}).tip is AksiyonTipi.KAOS
+
+    def test_gorev_prompt_context(self):
+        gorev = Gorev.from_dict({
+            "id": "g1", "task_type": "create_topic", "prompt_context": None,
+        })
+        assert gorev.tip is GorevTipi.BASLIK_OLUSTUR
+        assert gorev.baslik_basligi is None and gorev.ruh_hali == "neutral"
+
+    def test_listeden(self):
+        assert Baslik.listeden(None) == []
+        entryler = Entry.listeden([{"id": "e1", "topic_id": "b1", "content": "x"}, {"id": "e2"}])
+        assert [e.id for e in entryler] == ["e1", "e2"]
+        assert entryler[1].icerik == ""
+
+    def test_racon_konular_sadece_gelen_alanlar(self):
+        konular = RaconKonular.from_dict({"technology": 3, "bilinmeyen": 9})
+        assert konular.technology == 3 and konular.absurd == 0
+
+
+class TestGorevHamBaglam:
+    """Gorev sunucu yanıtını kopyalamadan tutar; SDK eklemeleri ek'e yazılır."""
+
+    def _ham(self):
+        return {
+            "id": "g1", "task_type": "community_post", "status": "pending",
+            "prompt_context": {"event_title": "Dolar rekor kırdı", "category": "ekonomi",
+                               "event_description": "detay", "post_type": "ilginc_bilgi"},
+        }
+
+    def test_baglam_kaybolmaz(self):
+        ham = self._ham()
+        gorev = Gorev.from_dict(ham)
+        assert gorev.ham is ham
+        assert gorev.gorev_tipi == "community_post"
+        assert (gorev.olay_basligi, gorev.kategori, gorev.olay_aciklamasi, gorev.gonderi_tipi) == (
+            "Dolar rekor kırdı", "ekonomi", "detay", "ilginc_bilgi")
+
+    def test_yazmalar_ham_yaniti_degistirmez(self):
+        ham = self._ham()
+        gorev = Gorev.from_dict(ham)
+        gorev.prompt_context["topic_title"] = "doların rekor kırması"
+        assert gorev.prompt_context["topic_title"] == "doların rekor kırması"
+        assert "topic_title" not in ham["prompt_context"]
+        kayit = gorev.kayit()
+        assert Gorev.from_dict(kayit).prompt_context["topic_title"] == "doların rekor kırması"
+        assert kayit["task_type"] == "community_post"
+
+    def test_task_baglami_duz_dict_ve_serilesir(self):
+        gorev = Gorev.from_dict(self._ham())
+        gorev.ek["agent_username"] = "sahte_ajan"
+        task = Task.from_gorev(gorev)
+        assert type(task.prompt_context) is dict
+        assert task.prompt_context["agent_username"] == "sahte_ajan"
+        assert task.prompt_context["category"] == "ekonomi"
+        assert json.loads(json.dumps(task.prompt_context)) == task.prompt_context
+        assert json_coz(json_kodla(task.prompt_context)) == task.prompt_context
+
+    def test_hamsiz_gorev_alanlardan_baglam(self):
+        gorev = Gorev(id="g2", tip=GorevTipi.YORUM_YAZ, entry_icerigi="karşı görüş")
+        assert gorev.gorev_tipi == "write_comment"
+        assert gorev.prompt_context["entry_content"] == "karşı görüş"
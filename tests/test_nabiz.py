@@ -0,0 +1,112 @@
+"""
+Bağımsız heartbeat (nabız) zamanlayıcısı testleri.
+"""
+
+import threading
+import time
+
+from logsozluk_sdk.metrikler import Metrikler
+from logsozluk_sdk.nabiz import NabizZamanlayici
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+from logsozluk_sdk.sdk import DonguDurumu
+
+
+def _bekle(kosul, sure=5.0):
+    bitis = time.monotonic() + sure
+    while not kosul() and time.monotonic() < bitis:
+        time.sleep(0.01)
+    return kosul()
+
+
+class TestNabizZamanlayici:
+    """Kayıtlar kendi aralıklarında atılır, hatalar thread'i durdurmaz, gecikme ölçülür."""
+
+    def test_kayitlar_ve_metrikler(self, monkeypatch):
+        monkeypatch.setattr(NabizZamanlayici, "EN_KISA_ARALIK", 0.0)
+        metrikler = Metrikler()
+        atislar = {"a": 0, "b": 0}
+
+        def b_gonder():
+            atislar["b"] += 1
+            raise RuntimeError("bağlantı yok")
+
+        nabiz = NabizZamanlayici(metrikler)
+        nabiz.ekle(lambda: atislar.__setitem__("a", atislar["a"] + 1), lambda: 0.05)
+        nabiz.ekle(b_gonder, lambda: 0.05, gecikme=0.02)
+        nabiz.baslat()
+        try:
+            assert _bekle(lambda: atislar["a"] >= 3 and atislar["b"] >= 3)
+        finally:
+            nabiz.kapat()
+        assert not nabiz.aktif
+        gozlemler = metrikler.ozet()["gozlemler"]
+        assert gozlemler["nabiz.gecikme"]["adet"] >= 6
+        assert gozlemler["nabiz.sure"]["maks"] < 1.0
+
+    def test_kapat_bekleyen_thread_i_uyandirir(self):
+        nabiz = NabizZamanlayici().baslat()
+        baslangic = time.monotonic()
+        nabiz.kapat()
+        assert not nabiz.aktif and time.monotonic() - baslangic < 1.0
+
+
+class TestAyriNabiz:
+    """calistir: uzun görev üretimi sürerken heartbeat atılmaya devam eder."""
+
+    def test_uzun_uretimde_heartbeat_surer(self):
+        sunucu = SahteSunucu(gorev_sayisi=1, otomatik_gorev=False)
+        sunucu.intervals = {"heartbeat": 1}
+        agent = sunucu.istemci()
+        uretimde = threading.Event()
+        birak = threading.Event()
+
+        def yavas_uretici(gorev):
+            uretimde.set()
+            birak.wait(10)
+            return "uzun süren entry"
+
+        dongu = threading.Thread(target=agent.calistir, args=(yavas_uretici,), kwargs={"gunluk": False})
+        dongu.start()
+        try:
+            assert uretimde.wait(5)
+            onceki = sunucu.istekler["POST /heartbeat"]
+            assert _bekle(lambda: sunucu.istekler["POST /heartbeat"] >= onceki + 2)
+            assert agent.nabiz is not None and agent.nabiz.aktif
+        finally:
+            agent.durdur()
+            birak.set()
+            dongu.join(10)
+        assert not dongu.is_alive()
+        assert agent.nabiz is None
+        assert agent.metrikler.sayac("yoklama.basarili") >= 2
+
+    def test_ayri_nabizda_dongu_yoklamaz(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        agent = sunucu.istemci()
+        agent.dongu_adimi(DonguDurumu(ayri_nabiz=True))
+        assert sunucu.istekler["POST /heartbeat"] == 0
+        agent.dongu_adimi(DonguDurumu())
+        assert sunucu.istekler["POST /heartbeat"] == 1
+        agent.kapat()
+
+    def test_tur_sirasinda_bekleyen_gorev_kaybolmaz(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        sunucu.gorev_ekle("write_comment")
+        agent = sunucu.istemci()
+        durum = DonguDurumu(ayri_nabiz=True, son_comment_kontrol=time.time())
+
+        def uretici(gorev):
+            if durum.tamamlanan == 0:
+                # Uzun tur sürerken yeni görev gelir, nabız thread'i bekleyen=1 görür
+                sunucu.gorev_ekle("write_comment")
+                t = threading.Thread(target=agent.nabiz_at, args=(durum,))
+                t.start()
+                t.join()
+            return "içerik"
+
+        agent.dongu_adimi(durum, uretici)
+        assert durum.tamamlanan == 1
+        # Tur sonu zamanlayıcıyı yazsa da bildirim kalır; sonraki tur hemen kontrol eder
+        agent.dongu_adimi(durum, uretici)
+        assert durum.tamamlanan == 2
+        agent.kapat()
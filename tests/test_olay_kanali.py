@@ -0,0 +1,105 @@
+"""
+SSE push kanalı testleri — sahte sunucunun /events ucuna karşı.
+"""
+
+import threading
+import time
+
+from logsozluk_sdk.olay_kanali import OlayKanali, sse_ayristir
+from logsozluk_sdk.sahte_sunucu import SahteSunucu
+
+
+def _bekle(kosul, sure=3.0):
+    bitis = time.time() + sure
+    while time.time() < bitis:
+        if kosul():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _kanal(sunucu, olaylar, **kwargs):
+    agent = sunucu.istemci()
+    kanal = OlayKanali(
+        agent._client, agent.api_url, agent._basliklar,
+        lambda tur, veri: olaylar.append((tur, veri)),
+        min_bekleme=0.05, **kwargs,
+    )
+    return kanal.baslat()
+
+
+class TestSSEAyristirma:
+    """Satır → olay dönüşümü."""
+
+    def test_alanlar_yorumlar_ve_cok_satirli_veri(self):
+        satirlar = [
+            "retry: 500", "", ": keepalive", "",
+            "id: 7", "event: task", "data: {\"a\":", "data: 1}", "",
+            "data: düz", "",
+        ]
+        assert list(sse_ayristir(iter(satirlar))) == [
+            ("7", "task", "{\"a\":\n1}", None),
+            ("7", "message", "düz", None),
+        ]
+
+
+class TestOlayKanali:
+    """Abonelik, yeniden bağlanma ve yoklamaya düşüş."""
+
+    def test_yeni_gorev_bildirilir(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        olaylar = []
+        kanal = _kanal(sunucu, olaylar)
+        try:
+            assert kanal.bagli.wait(2)
+            gorev = sunucu.gorev_ekle("write_comment")
+            assert _bekle(lambda: olaylar)
+            assert olaylar[0] == ("task", {"id": gorev["id"], "task_type": "write_comment"})
+        finally:
+            kanal.kapat()
+
+    def test_kopunca_kaldigi_yerden_devam(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False, sse_keepalive=0.05)
+        olaylar = []
+        kanal = _kanal(sunucu, olaylar)
+        try:
+            assert kanal.bagli.wait(2)
+            sunucu.olay_yayinla("mention", id="m1")
+            assert _bekle(lambda: len(olaylar) == 1)
+            sunucu.sse_kapat()
+            sunucu.olay_yayinla("mention", id="m2")  # kopukken yayınlandı
+            assert _bekle(lambda: len(olaylar) == 2)
+            assert [v["id"] for _, v in olaylar] == ["m1", "m2"]
+            assert kanal.baglanti_sayisi >= 2
+            assert sunucu.sse_baglantilari[-1] == "1"
+        finally:
+            kanal.kapat()
+
+    def test_desteklenmiyorsa_kapanir(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, itme=False)
+        kanal = _kanal(sunucu, [])
+        assert _bekle(lambda: not kanal.aktif)
+        assert kanal.desteklenmiyor
+
+
+class TestItmeliDongu:
+    """calistir(itme=True): bildirilen görev yoklama aralığını beklemeden alınır."""
+
+    def test_gorev_saniyeler_icinde_tamamlanir(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        agent = sunucu.istemci()
+        t = threading.Thread(
+            target=agent.calistir,
+            kwargs={"icerik_uretici": lambda g: "push ile geldi", "gunluk": False, "itme": True},
+            daemon=True,
+        )
+        t.start()
+        try:
+            assert _bekle(lambda: agent.olay_kanali is not None and agent.olay_kanali.bagli.is_set())
+            gorev = sunucu.gorev_ekle("write_comment")
+            assert _bekle(lambda: gorev["id"] in sunucu.sonuclar, sure=5)
+        finally:
+            agent.durdur()
+            t.join(timeout=5)
+        assert not t.is_alive()
+        assert sunucu.istatistik()["istekler"]["GET /tasks"] <= 4
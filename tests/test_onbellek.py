@@ -0,0 +1,95 @@
+"""
+LLM yanıt önbelleği testleri.
+"""
+
+import os
+import time
+
+import httpx
+
+from logsozluk_sdk import llm
+from logsozluk_sdk.onbellek import YanitOnbellegi, normalize_prompt
+
+
+def _sayan_istemci(sayac, metin="tamam bu bir entry."):
+    """Çağrıları sayan sahte Anthropic istemcisi."""
+    def isle(istek: httpx.Request) -> httpx.Response:
+        sayac.append(istek)
+        return httpx.Response(200, json={
+            "content": [{"type": "text", "text": metin}],
+            "stop_reason": "end_turn",
+        })
+    return httpx.Client(transport=httpx.MockTransport(isle))
+
+
+class TestYanitOnbellegi:
+    """Anahtar, TTL ve budama."""
+
+    def test_anahtar_tarih_saatten_bagimsiz(self):
+        a = YanitOnbellegi.anahtar("m", {"t": 1}, "CONTEXT:\n- Tarih: 01 Ocak\n- Saat: 9:00\nx", "u", "g")
+        b = YanitOnbellegi.anahtar("m", {"t": 1}, "CONTEXT:\n- Tarih: 02 Ocak\n- Saat: 23:00\nx  ", "u", "g")
+        assert a == b
+        assert a != YanitOnbellegi.anahtar("m", {"t": 1}, "CONTEXT:\nx", "u", "g2")
+        assert a != YanitOnbellegi.anahtar("m", {"t": 2}, "CONTEXT:\nx", "u", "g")
+        assert normalize_prompt("a  \n- Saat: 3:00\nb") == "a\nb"
+
+    def test_al_koy_ve_ttl(self, tmp_path):
+        c = YanitOnbellegi(tmp_path, ttl=60)
+        c.koy("k", "metin")
+        assert c.al("k") == "metin"
+        eski = time.time() - 120
+        os.utime(tmp_path / "k.txt", (eski, eski))
+        assert c.al("k") is None
+        assert len(c) == 0
+
+    def test_budama_en_eskileri_siler(self, tmp_path):
+        c = YanitOnbellegi(tmp_path, max_kayit=3)
+        for i in range(5):
+            c.koy(f"k{i}", str(i))
+            os.utime(tmp_path / f"k{i}.txt", (1e9 + i, time.time() - 100 + i))
+        assert c.buda() == 2
+        assert c.al("k0") is None and c.al("k1") is None
+        assert c.al("k4") == "4"
+
+
+class TestLLMOnbellek:
+    """generate_content ve transform_title önbellekten döner."""
+
+    def _calistir(self, tmp_path, islem):
+        sayac = []
+        llm.set_http_client(_sayan_istemci(sayac))
+        llm.set_response_cache(YanitOnbellegi(tmp_path))
+        try:
+            sonuclar = islem()
+        finally:
+            llm.set_http_client(None)
+            llm.set_response_cache(None)
+        return sayac, sonuclar
+
+    def test_tohumlu_yeniden_deneme_llm_cagirmaz(self, tmp_path):
+        gorev = {"id": "g-1", "task_type": "write_entry", "prompt_context": {"topic_title": "dolar"}}
+
+        def iki_deneme():
+            return [llm.generate_content(gorev=gorev, api_key="sk-ant-test", seed=7) for _ in range(2)]
+
+        sayac, sonuclar = self._calistir(tmp_path, iki_deneme)
+        assert len(sayac) == 1
+        assert sonuclar[0] == sonuclar[1] == "tamam bu bir entry."
+
+    def test_farkli_gorev_ayri_kayit(self, tmp_path):
+        def iki_gorev():
+            for gid in ("g-1", "g-2"):
+                gorev = {"id": gid, "task_type": "write_entry", "prompt_context": {"topic_title": "dolar"}}
+                llm.generate_content(gorev=gorev, api_key="sk-ant-test", seed=7)
+
+        sayac, _ = self._calistir(tmp_path, iki_gorev)
+        assert len(sayac) == 2
+
+    def test_ayni_haber_basligi_tek_cagri(self, tmp_path):
+        def iki_donusum():
+            return [llm.transform_title("Merkez Bankası faizi indirdi", category="ekonomi",
+                                        api_key="sk-ant-test") for _ in range(2)]
+
+        sayac, sonuclar = self._calistir(tmp_path, iki_donusum)
+        assert len(sayac) == 1
+        assert sonuclar[0] == sonuclar[1]
@@ -0,0 +1,81 @@
+"""
+Tohumlu (tekrarlanabilir) prompt üretimi testleri.
+"""
+
+import httpx
+
+from logsozluk_sdk import llm
+from logsozluk_sdk._codec import json_coz
+
+
+def _kaydeden_istemci(kayit):
+    """/v1/messages gövdelerini kaydeden sahte Anthropic istemcisi."""
+    def isle(istek: httpx.Request) -> httpx.Response:
+        kayit.append(json_coz(istek.content))
+        return httpx.Response(200, json={
+            "content": [{"type": "text", "text": "tamam."}],
+            "stop_reason": "end_turn",
+        })
+    return httpx.Client(transport=httpx.MockTransport(isle))
+
+
+def _gorev(gorev_id="g-1", tip="write_entry"):
+    return {
+        "id": gorev_id,
+        "task_type": tip,
+        "prompt_context": {"topic_title": "dolar kuru", "agent_display_name": "test"},
+    }
+
+
+class TestPromptSeed:
+    """prompt_seed: (agent, görev, skills sürümü) → sabit tohum."""
+
+    def test_deterministik(self):
+        assert llm.prompt_seed("a", "g-1", "v1") == llm.prompt_seed("a", "g-1", "v1")
+
+    def test_her_bilesen_tohumu_degistirir(self):
+        taban = llm.prompt_seed("a", "g-1", "v1")
+        assert llm.prompt_seed("b", "g-1", "v1") != taban
+        assert llm.prompt_seed("a", "g-2", "v1") != taban
+        assert llm.prompt_seed("a", "g-1", "v2") != taban
+        # Ayraç sayesinde birleşik anahtar çakışmaz
+        assert llm.prompt_seed("ab", "c") != llm.prompt_seed("a", "bc")
+
+
+class TestTohumluUretim:
+    """Aynı tohum → birebir aynı system ve user prompt."""
+
+    def _uret(self, tekrar, **kwargs):
+        kayit = []
+        llm.set_http_client(_kaydeden_istemci(kayit))
+        try:
+            for _ in range(tekrar):
+                llm.generate_content(api_key="sk-ant-test", **kwargs)
+        finally:
+            llm.set_http_client(None)
+        return kayit
+
+    def test_ayni_tohum_ayni_prompt(self):
+        for tip in ("write_entry", "write_comment", "create_topic"):
+            kayit = self._uret(3, gorev=_gorev(tip=tip), seed=42,
+                               racon_config={"voice": {"humor": 8}} if tip == "create_topic" else None)
+            assert kayit[0] == kayit[1] == kayit[2]
+
+    def test_farkli_tohum_farkli_prompt(self):
+        sistemler = {
+            self._uret(1, gorev=_gorev(), seed=s)[0]["system"] for s in range(8)
+        }
+        assert len(sistemler) > 1
+
+    def test_uretici_tohumu_gorevden_turetir(self):
+        kayit = []
+        llm.set_http_client(_kaydeden_istemci(kayit))
+        try:
+            uret = llm.make_content_generator({"x_username": "ajan"}, "sk-ant-test", seeded=True)
+            uret(_gorev("g-1"))
+            uret(_gorev("g-1"))
+            uret(_gorev("g-2"))
+        finally:
+            llm.set_http_client(None)
+        assert kayit[0] == kayit[1]
+        assert kayit[0]["system"] != kayit[2]["system"]
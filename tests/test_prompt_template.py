@@ -0,0 +1,54 @@
+"""
+Derlenmiş prompt şablonu testleri.
+"""
+
+from logsozluk_sdk._prompts.template import PromptTemplate
+from logsozluk_sdk._prompts.prompt_builder import add_mention_awareness
+from logsozluk_sdk.llm import _build_user_prompt
+
+
+class TestPromptTemplate:
+    """Sözdizimi: slot, limit, kaçış, koşullu satır."""
+
+    def test_slot_ve_limit(self):
+        t = PromptTemplate("Konu: {baslik}\nDetay: {detay:5}")
+        assert t.slots == ("baslik", "detay")
+        assert t.render(baslik="dolar", detay="0123456789") == "Konu: dolar\nDetay: 01234"
+
+    def test_eksik_ve_none_bos_string(self):
+        t = PromptTemplate("a={a} b={b:3}")
+        assert t.render(a=None) == "a= b="
+
+    def test_kacis_ve_tirnaklar(self):
+        t = PromptTemplate("""{{sabit}} 'tek' "çift" \\ {x}""")
+        assert t.render(x="{deger}") == """{sabit} 'tek' "çift" \\ {deger}"""
+
+    def test_kosullu_satir(self):
+        t = PromptTemplate("A\n?Temalar: {temalar}\n?İkisi: {x} {y}\nB")
+        assert t.render(temalar="", x="1", y="2") == "A\nİkisi: 1 2\nB"
+        assert t.render(temalar="t", x="1") == "A\nTemalar: t\nB"
+
+    def test_sozluk_ve_kwargs(self):
+        t = PromptTemplate("{a}-{b}")
+        assert t.render({"a": 1, "b": 2}, b=3) == "1-3"
+
+
+class TestPromptBuilderSablonlari:
+    """Şablona taşınan builder'lar eski çıktıyı korumalı."""
+
+    def test_user_prompt_yorum(self):
+        prompt = _build_user_prompt(
+            "write_comment", "başlık", "e" * 600, ["a", "b"], "neutral", "", "", ""
+        )
+        assert prompt.split("\n")[:3] == ["Başlık: başlık", "Entry: " + "e" * 500, "Bu entry'ye kısa bir yorum yaz."]
+        assert "Ruh hali" not in prompt and "Not:" not in prompt
+        assert prompt.endswith("Doğrudan entry metnini ver.")
+
+    def test_user_prompt_konu(self):
+        prompt = _build_user_prompt("create_topic", "", "", [], "huysuz", "not", "", "haber başlığı")
+        assert prompt.startswith("Konu: haber başlığı\nHaber: haber başlığı\n\nBAĞLAMSIZ ENTRY YAZ:")
+        assert "Ruh hali: huysuz" in prompt
+        assert "Not:" not in prompt
+
+    def test_mention_blogu(self):
+        assert add_mention_awareness("x", ["a", "b"]).endswith("Tanıdıkların: @a, @b")
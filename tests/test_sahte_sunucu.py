@@ -0,0 +1,110 @@
+"""
+Sahte sunucu testleri — SDK'nın gerçek HTTP yolunu (httpx transport) sahte sunucuya karşı çalıştırır.
+"""
+
+import pytest
+import httpx
+
+from logsozluk_sdk import LogsozHata
+from logsozluk_sdk.sahte_sunucu import SahteSunucu, yuk_testi
+from logsozluk_sdk.sdk import DonguDurumu
+
+
+class TestSahteSunucuRotalari:
+    """Temel endpoint'ler SDK modelleriyle uyumlu yanıt dönmeli."""
+
+    def test_ben(self):
+        agent = SahteSunucu().istemci()
+        ben = agent.ben()
+        assert ben.kullanici_adi == "sahte_ajan"
+        assert ben.x_dogrulandi is True
+
+    def test_gorev_dongusu(self):
+        sunucu = SahteSunucu(gorev_sayisi=3, otomatik_gorev=False)
+        agent = sunucu.istemci()
+
+        gorevler = agent.gorevler(limit=5)
+        assert len(gorevler) == 3
+
+        agent.sahiplen(gorevler[0].id)
+        agent.tamamla(gorevler[0].id, "sahte içerik")
+
+        assert sunucu.sonuclar[gorevler[0].id]["entry_content"] == "sahte içerik"
+        assert sunucu.bekleyen_sayisi() == 2
+
+    def test_agent_bilgisi_ve_ham_gorev(self):
+        sunucu = SahteSunucu(gorev_sayisi=0, otomatik_gorev=False)
+        gorev = sunucu.gorev_ekle("community_post", post_type="ilginc_bilgi")
+        agent = sunucu.istemci()
+        agent.ben()
+        gorulen = []
+
+        def uretici(g):
+            gorulen.append((g.gorev_tipi, dict(g.prompt_context)))
+            return "sahte gönderi"
+
+        secilen = agent.gorevler()[0]
+        agent._gorev_isle(secilen, uretici, DonguDurumu())
+        tip, baglam = gorulen[0]
+        assert tip == "community_post" and baglam["post_type"] == "ilginc_bilgi"
+        assert baglam["agent_display_name"] == "Sahte Ajan" and baglam["agent_username"] == "sahte_ajan"
+        assert "agent_username" not in secilen.ham["prompt_context"]
+        assert sunucu.sonuclar[gorev["id"]]
+
+    def test_cift_sahiplenme_reddedilir(self):
+        sunucu = SahteSunucu(gorev_sayisi=1)
+        a, b = sunucu.istemci(), sunucu.istemci()
+        gorev = a.gorevler()[0]
+        a.sahiplen(gorev.id)
+        with pytest.raises(LogsozHata) as exc:
+            b.sahiplen(gorev.id)
+        assert exc.value.kod == "already_claimed"
+
+    def test_gundem_ve_skills(self):
+        agent = SahteSunucu().istemci()
+        assert len(agent.gundem(limit=3)) == 3
+        assert agent.skills_latest(use_cache=False)["version"] == "sahte-1"
+
+
+class TestHataEnjeksiyonu:
+    """429 ve 5xx enjeksiyonu SDK hata kodlarına dönüşmeli."""
+
+    def test_rate_limit(self):
+        agent = SahteSunucu(limit_orani=1.0).istemci()
+        with pytest.raises(LogsozHata) as exc:
+            agent.gorevler()
+        assert exc.value.kod == "rate_limit"
+
+    def test_sunucu_hatasi(self):
+        sunucu = SahteSunucu(hata_orani=1.0)
+        with pytest.raises(LogsozHata):
+            sunucu.istemci().yoklama()
+        assert sunucu.istatistik()["enjekte"]["500"] == 1
+
+
+class TestLLMSahtesi:
+    """llm.generate_content sahte /v1/messages'a karşı çalışmalı."""
+
+    def test_generate_content(self):
+        from logsozluk_sdk import llm
+
+        sunucu = SahteSunucu(gorev_sayisi=1)
+        llm.set_http_client(httpx.Client(transport=sunucu.transport()))
+        try:
+            gorev = sunucu.istemci().gorevler()[0]
+            icerik = llm.generate_content(gorev=gorev, api_key="sk-ant-test")
+        finally:
+            llm.set_http_client(None)
+        assert icerik
+        assert sunucu.istatistik()["istekler"]["POST /v1/messages"] == 1
+
+
+class TestYukTesti:
+    """yuk_testi N agent'la görev tamamlamalı."""
+
+    def test_eszamanli_ajanlar(self):
+        sunucu = SahteSunucu(gorev_sayisi=10)
+        sonuc = yuk_testi(sunucu, ajan_sayisi=4, tur=2)
+        assert sonuc["tamamlanan"] > 0
+        assert sonuc["islem_per_sn"] > 0
+        assert sonuc["sunucu"]["istekler"]["POST /heartbeat"] == 8
@@ -0,0 +1,67 @@
+"""
+Uyarlamalı yoklama testleri.
+"""
+
+from logsozluk_sdk.sdk import DonguDurumu
+from logsozluk_sdk.yoklayici import UyarlamaliAralik
+
+
+class TestUyarlamaliAralik:
+    """Boşta geri çekilme, yükte sıkılaşma, sınırlar."""
+
+    def test_bosta_ustel_geri_cekilme_ve_ust_sinir(self):
+        a = UyarlamaliAralik(taban=600)
+        t = 0.0
+        araliklar = []
+        for _ in range(4):
+            t += a.mevcut
+            araliklar.append(a.gozlemle(0, t))
+        assert araliklar == [1200, 2400, 2400, 2400]
+
+    def test_doygun_sonuc_alt_sinira_iner(self):
+        a = UyarlamaliAralik(taban=600)
+        assert a.gozlemle(5, 600, doygun=True) == 150
+
+    def test_is_geldikce_kisalir(self):
+        a = UyarlamaliAralik(taban=600)
+        t = 0.0
+        for _ in range(5):
+            t += a.mevcut
+            a.gozlemle(4, t)
+        assert a.alt <= a.mevcut < 600
+        # Akış kesilince tekrar uzar
+        t += a.mevcut
+        onceki = a.mevcut
+        assert a.gozlemle(0, t) == 2 * onceki
+
+    def test_kucuk_tabanda_alt_sinir_tabani_gecmez(self):
+        a = UyarlamaliAralik(taban=10)
+        assert a.alt == 10
+
+
+class TestDonguDurumuUyarlama:
+    """Sunucu aralıkları taban, <ad>_min/_max sınır olur."""
+
+    def test_sunucu_sinirlari_ve_taban_degisimi(self):
+        d = DonguDurumu(comment_kontrol=600)
+        d.aralik_guncelle({"comment_check": 600, "comment_check_min": 60, "comment_check_max": 900})
+        d.gozlemle("comment_kontrol", 5, 600, doygun=True)
+        assert d.aralik("comment_kontrol") == 60
+        for t in (1000, 2000, 3000, 4000):
+            d.gozlemle("comment_kontrol", 0, t)
+        assert d.aralik("comment_kontrol") == 900
+
+        d.aralik_guncelle({"comment_check": 300})
+        assert d.aralik("comment_kontrol") == 300
+
+    def test_heartbeat_sunucu_araligini_asmaz(self):
+        d = DonguDurumu(yoklama_araligi=120)
+        for t in (120, 240, 360):
+            d.gozlemle("yoklama_araligi", 0, t)
+        assert d.aralik("yoklama_araligi") == 120
+
+    def test_kapaliyken_taban_kullanilir(self):
+        d = DonguDurumu(entry_kontrol=1800, uyarlamali=False)
+        d.gozlemle("entry_kontrol", 0, 1800)
+        assert d.aralik("entry_kontrol") == 1800
+        assert d.aralik("oy_araligi") == d.oy_araligi